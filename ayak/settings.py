@@ -217,9 +217,46 @@ SIMPLE_JWT = {
 }
 
 # Celery 설정
+from celery.schedules import crontab
 CELERY_BROKER_URL = config('REDIS_URL', default='redis://localhost:6379/0')
 CELERY_RESULT_BACKEND = config('REDIS_URL', default='redis://localhost:6379/0')
+CELERY_TIMEZONE = TIME_ZONE
+CELERY_BEAT_SCHEDULE = {
+    'evaluate-patient-dur-alerts': {
+        'task': 'bokyak.tasks.evaluate_patient_dur_alerts',
+        'schedule': crontab(hour=3, minute=0),
+    },
+    'refresh-medication-prescription-counts': {
+        'task': 'bokyak.tasks.refresh_medication_prescription_counts',
+        'schedule': crontab(hour=3, minute=30),
+    },
+}
+
+
+
+# 캐시 - reference: 참조 데이터 2단 캐시의 공유 계층 (common.reference_cache)
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+    },
+    'reference': {
+        'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+        'LOCATION': config('REFERENCE_CACHE_URL', default='redis://localhost:6379/1'),
+        'TIMEOUT': 60 * 60 * 24,
+        'OPTIONS': {
+            # 캐시 장애 시 DB 조회로 빨리 넘어가도록
+            'socket_connect_timeout': 0.5,
+            'socket_timeout': 0.5,
+        },
+    },
+}
 
+# 참조 데이터 mmap 스냅샷 (common/scripts/build_reference_snapshot.py 로 생성, 워커 간 페이지 캐시 공유)
+REFERENCE_SNAPSHOT_PATH = config('REFERENCE_SNAPSHOT_PATH', default=str(BASE_DIR / 'var' / 'reference.snapshot'))
+# 모바일 오프라인 번들/패치 파일 디렉터리 (common/scripts/build_reference_bundle.py)
+REFERENCE_BUNDLE_DIR = config('REFERENCE_BUNDLE_DIR', default=str(BASE_DIR / 'var' / 'bundles'))
+# 의약품/주성분 목록 전체 내보내기 gzip 파일 디렉터리 (세대별로 한 번 생성)
+REFERENCE_EXPORT_DIR = config('REFERENCE_EXPORT_DIR', default=str(BASE_DIR / 'var' / 'exports'))
 
 
 # 파일 인코딩 설정
@@ -14,3 +14,16 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
 
 application = get_wsgi_application()
+
+# 워커 시작 시 메모리 자동완성 인덱스 적재 (실패해도 첫 요청 때 다시 빌드)
+try:
+    from user.services.disease_autocomplete import disease_index
+    disease_index.get()
+except Exception as e:
+    import logging
+    logging.getLogger(__name__).warning(f"자동완성 인덱스 사전 적재 실패: {e}")
+finally:
+    # 적재에 쓴 DB 연결을 닫음 - gunicorn --preload 면 마스터에서 실행되므로
+    # 열어 둔 소켓을 fork 된 워커들이 나눠 쓰게 된다 (워커는 첫 쿼리 때 각자 연결)
+    from django.db import connections
+    connections.close_all()
@@ -0,0 +1,135 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:08
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_active_ingredients(apps, schema_editor):
+    PrescriptionMedication = apps.get_model("bokyak", "PrescriptionMedication")
+    UserActiveIngredient = apps.get_model("bokyak", "UserActiveIngredient")
+    MedicationIngredient = apps.get_model("user", "MedicationIngredient")
+
+    medications = PrescriptionMedication.objects.filter(
+        prescription__is_active=True
+    ).values_list("id", "medication_id", "group__medical_info__user_id")
+
+    batch = []
+    for prescription_medication_id, medication_id, user_id in medications.iterator(chunk_size=1000):
+        if user_id is None:
+            continue
+        ingredients = MedicationIngredient.objects.filter(
+            medication_id=medication_id, is_main=True
+        ).values_list(
+            "main_ingredient_id",
+            "main_ingredient__name_kr_key",
+            "main_ingredient__name_en_key",
+            "main_ingredient__atc_code",
+        )
+        for ingr_code, name_kr_key, name_en_key, atc_code in ingredients:
+            batch.append(
+                UserActiveIngredient(
+                    user_id=user_id,
+                    prescription_medication_id=prescription_medication_id,
+                    ingr_code=ingr_code,
+                    ingredient_key=name_kr_key or name_en_key or ingr_code,
+                    atc_class=atc_code[:5] if len(atc_code) >= 5 else "",
+                )
+            )
+        if len(batch) >= 1000:
+            UserActiveIngredient.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        UserActiveIngredient.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("bokyak", "0002_initial"),
+        ("user", "0014_atc_classes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="UserActiveIngredient",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+                (
+                    "ingr_code",
+                    models.CharField(max_length=20, verbose_name="성분 고유 코드"),
+                ),
+                (
+                    "ingredient_key",
+                    models.CharField(
+                        help_text="염/함량/제형과 무관한 동일 성분 판단용 (정규화 성분명)",
+                        max_length=200,
+                        verbose_name="성분 비교 키",
+                    ),
+                ),
+                (
+                    "atc_class",
+                    models.CharField(
+                        blank=True, max_length=5, verbose_name="ATC 4단계 분류"
+                    ),
+                ),
+                (
+                    "prescription_medication",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="active_ingredients",
+                        to="bokyak.prescriptionmedication",
+                        verbose_name="처방 의약품",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="active_ingredients",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "복용 중 주성분",
+                "verbose_name_plural": "복용 중 주성분들",
+                "db_table": "user_active_ingredients",
+                "indexes": [
+                    models.Index(
+                        fields=["user", "ingredient_key"],
+                        name="idx_active_ingr_user_key",
+                    ),
+                    models.Index(
+                        fields=["user", "atc_class"], name="idx_active_ingr_user_atc"
+                    ),
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="useractiveingredient",
+            constraint=models.UniqueConstraint(
+                fields=("prescription_medication", "ingr_code"),
+                name="unique_active_ingredient",
+            ),
+        ),
+        migrations.RunPython(populate_active_ingredients, migrations.RunPython.noop),
+    ]
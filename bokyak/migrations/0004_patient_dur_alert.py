@@ -0,0 +1,104 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:13
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_dur_codes(apps, schema_editor):
+    from user.models.dur import dur_ingredient_code
+
+    UserActiveIngredient = apps.get_model("bokyak", "UserActiveIngredient")
+    batch = []
+    for active in UserActiveIngredient.objects.only("pk", "ingr_code").iterator(chunk_size=1000):
+        active.dur_code = dur_ingredient_code(active.ingr_code)
+        batch.append(active)
+        if len(batch) >= 1000:
+            UserActiveIngredient.objects.bulk_update(batch, ["dur_code"])
+            batch = []
+    if batch:
+        UserActiveIngredient.objects.bulk_update(batch, ["dur_code"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0016_dur_patient_rule"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ("bokyak", "0003_user_active_ingredient"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="useractiveingredient",
+            name="dur_code",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="일반명코드 앞 4자리 - DUR 규칙 테이블 조회용",
+                max_length=4,
+                verbose_name="DUR 성분코드",
+            ),
+        ),
+        migrations.CreateModel(
+            name="PatientDurAlert",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+                (
+                    "active_ingredient",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="patient_dur_alerts",
+                        to="bokyak.useractiveingredient",
+                        verbose_name="복용 중 성분",
+                    ),
+                ),
+                (
+                    "rule",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="alerts",
+                        to="user.durpatientrule",
+                        verbose_name="DUR 규칙",
+                    ),
+                ),
+                (
+                    "user",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="patient_dur_alerts",
+                        to=settings.AUTH_USER_MODEL,
+                        verbose_name="사용자",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "환자특성 DUR 경고",
+                "verbose_name_plural": "환자특성 DUR 경고들",
+                "db_table": "patient_dur_alerts",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="patientduralert",
+            constraint=models.UniqueConstraint(
+                fields=("active_ingredient", "rule"), name="unique_patient_dur_alert"
+            ),
+        ),
+        migrations.RunPython(populate_dur_codes, migrations.RunPython.noop),
+    ]
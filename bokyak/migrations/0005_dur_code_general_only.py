@@ -0,0 +1,46 @@
+# Generated by Django 4.2.22 on 2026-10-19 00:02
+
+from django.db import migrations
+
+
+def is_general_code(code):
+    # 일반명코드 형식 (숫자 4자리로 시작) - user.models.dur.dur_ingredient_code 와 같은 판정
+    prefix = (code or "").strip()[:4]
+    return len(prefix) == 4 and prefix.isdigit()
+
+
+def clear_invalid_dur_codes(apps, schema_editor):
+    """일반명코드가 아닌 코드를 앞 4자리로 잘라 둔 DUR 비교 코드/규칙 정리"""
+    UserActiveIngredient = apps.get_model("bokyak", "UserActiveIngredient")
+    DurPatientRule = apps.get_model("user", "DurPatientRule")
+    DurContraindication = apps.get_model("user", "DurContraindication")
+
+    invalid = [
+        active.pk
+        for active in UserActiveIngredient.objects.exclude(dur_code="").only("pk", "dur_code").iterator(chunk_size=1000)
+        if not is_general_code(active.dur_code)
+    ]
+    for start in range(0, len(invalid), 500):
+        UserActiveIngredient.objects.filter(pk__in=invalid[start:start + 500]).update(dur_code="")
+
+    DurPatientRule.objects.filter(
+        pk__in=[rule.pk for rule in DurPatientRule.objects.only("pk", "ingredient_code") if not is_general_code(rule.ingredient_code)]
+    ).delete()
+    DurContraindication.objects.filter(
+        pk__in=[
+            row.pk for row in DurContraindication.objects.only("pk", "ingredient_code_a", "ingredient_code_b")
+            if not (is_general_code(row.ingredient_code_a) and is_general_code(row.ingredient_code_b))
+        ]
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0023_main_ingredient_name_keys_recompute"),
+        ("bokyak", "0004_patient_dur_alert"),
+    ]
+
+    operations = [
+        migrations.RunPython(clear_invalid_dur_codes, migrations.RunPython.noop),
+    ]
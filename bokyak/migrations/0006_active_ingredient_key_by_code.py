@@ -0,0 +1,86 @@
+# Generated by Django 4.2.22 on 2026-10-19 00:10
+
+from django.db import migrations, models
+from django.db.models import Q
+
+
+def is_general_code(code):
+    # 일반명코드 형식 (숫자 4자리로 시작) - user.models.dur.dur_ingredient_code 와 같은 판정
+    prefix = (code or "").strip()[:4]
+    return len(prefix) == 4 and prefix.isdigit()
+
+
+def active_ingredient_id(code):
+    # user.services.ingredient_lookup.active_ingredient_id 와 같은 규칙
+    code = (code or "").strip().upper()
+    return code[:4] if code[:4].isdigit() else code
+
+
+def recompute_ingredient_keys(apps, schema_editor):
+    """정규화 성분명이던 성분 비교 키를 주성분 코드로 다시 계산"""
+    UserActiveIngredient = apps.get_model("bokyak", "UserActiveIngredient")
+    MainIngredient = apps.get_model("user", "MainIngredient")
+
+    # 일반명코드가 아닌 성분은 이름(한글/영문 정규화 키)이 일반명코드 성분 하나로 모일 때만 그 코드로
+    other_codes = set(
+        code for code in UserActiveIngredient.objects.values_list("ingr_code", flat=True).distinct()
+        if not is_general_code(code)
+    )
+    names = {
+        ingr_code: {name_kr_key, name_en_key} - {""}
+        for ingr_code, name_kr_key, name_en_key in MainIngredient.objects.filter(
+            ingr_code__in=other_codes
+        ).values_list("ingr_code", "name_kr_key", "name_en_key")
+    }
+    name_keys = set().union(*names.values()) if names else set()
+    codes_by_key = {}
+    if name_keys:
+        rows = MainIngredient.objects.filter(
+            Q(name_kr_key__in=name_keys) | Q(name_en_key__in=name_keys)
+        ).values_list("ingr_code", "name_kr_key", "name_en_key")
+        for ingr_code, name_kr_key, name_en_key in rows:
+            if is_general_code(ingr_code):
+                for key in {name_kr_key, name_en_key} & name_keys:
+                    codes_by_key.setdefault(key, set()).add(active_ingredient_id(ingr_code))
+    resolved = {key: next(iter(codes)) for key, codes in codes_by_key.items() if len(codes) == 1}
+
+    def ingredient_key(ingr_code):
+        if is_general_code(ingr_code):
+            return active_ingredient_id(ingr_code)
+        for key in sorted(names.get(ingr_code, ())):
+            if key in resolved:
+                return resolved[key]
+        return active_ingredient_id(ingr_code)
+
+    batch = []
+    for active in UserActiveIngredient.objects.only("pk", "ingr_code", "ingredient_key").iterator(chunk_size=1000):
+        key = ingredient_key(active.ingr_code)
+        if key == active.ingredient_key:
+            continue
+        active.ingredient_key = key
+        batch.append(active)
+        if len(batch) >= 1000:
+            UserActiveIngredient.objects.bulk_update(batch, ["ingredient_key"])
+            batch = []
+    if batch:
+        UserActiveIngredient.objects.bulk_update(batch, ["ingredient_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("bokyak", "0005_dur_code_general_only"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="useractiveingredient",
+            name="ingredient_key",
+            field=models.CharField(
+                help_text="함량/제형과 무관한 동일 성분 판단용 (주성분 코드 - 일반명코드 앞 4자리)",
+                max_length=200,
+                verbose_name="성분 비교 키",
+            ),
+        ),
+        migrations.RunPython(recompute_ingredient_keys, migrations.RunPython.noop),
+    ]
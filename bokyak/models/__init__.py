@@ -4,6 +4,8 @@ from .medication_group import MedicationGroup
 from .medication_record import MedicationRecord
 from .prescription import Prescription
 from .prescription_medication import PrescriptionMedication
+from .user_active_ingredient import UserActiveIngredient
+from .patient_dur_alert import PatientDurAlert
 
 # 시그널 임포트 (signals.py가 있는 경우)
 try:
@@ -13,5 +15,6 @@ except ImportError:
 
 __all__ = [
     'Prescription', 'PrescriptionMedication', 'MedicationGroup',
-    'MedicationDetail', 'MedicationRecord', 'MedicationAlert'
+    'MedicationDetail', 'MedicationRecord', 'MedicationAlert', 'UserActiveIngredient',
+    'PatientDurAlert'
 ]
\ No newline at end of file
@@ -0,0 +1,44 @@
+from django.db import models
+
+from bokyak.models.user_active_ingredient import UserActiveIngredient
+from common.models.base_model import BaseModel
+
+
+class PatientDurAlert(BaseModel):
+    """
+    환자 특성 DUR 경고 (복용 중 성분 x 연령/임부/노인 규칙 평가 결과)
+    복용 중 성분이 지워지면(처방전 비활성화/처방 의약품 변경) 함께 삭제된다.
+    """
+
+    class Meta:
+        db_table = 'patient_dur_alerts'
+        verbose_name = '환자특성 DUR 경고'
+        verbose_name_plural = '환자특성 DUR 경고들'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['active_ingredient', 'rule'],
+                name='unique_patient_dur_alert'
+            )
+        ]
+
+    user = models.ForeignKey(
+        'user.AyakUser',
+        on_delete=models.CASCADE,
+        related_name='patient_dur_alerts',
+        verbose_name='사용자'
+    )
+    active_ingredient = models.ForeignKey(
+        UserActiveIngredient,
+        on_delete=models.CASCADE,
+        related_name='patient_dur_alerts',
+        verbose_name='복용 중 성분'
+    )
+    rule = models.ForeignKey(
+        'user.DurPatientRule',
+        on_delete=models.CASCADE,
+        related_name='alerts',
+        verbose_name='DUR 규칙'
+    )
+
+    def __str__(self):
+        return f"{self.user_id} - {self.rule_id}"
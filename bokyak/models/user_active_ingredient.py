@@ -0,0 +1,64 @@
+from django.db import models
+
+from bokyak.models.prescription_medication import PrescriptionMedication
+from common.models.base_model import BaseModel
+
+
+class UserActiveIngredient(BaseModel):
+    """
+    사용자별 복용 중인 주성분 집합 (활성 처방전의 처방 의약품 -> 주성분 전개)
+    처방 의약품 생성/처방전 갱신/비활성화 시 시그널로 갱신되며,
+    새 처방의 중복 검사는 이 테이블에 대한 (사용자, 성분 키/ATC 4단계) 인덱스 조회 한 번으로 끝난다.
+    """
+
+    class Meta:
+        db_table = 'user_active_ingredients'
+        verbose_name = '복용 중 주성분'
+        verbose_name_plural = '복용 중 주성분들'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['prescription_medication', 'ingr_code'],
+                name='unique_active_ingredient'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['user', 'ingredient_key'], name='idx_active_ingr_user_key'),
+            models.Index(fields=['user', 'atc_class'], name='idx_active_ingr_user_atc'),
+        ]
+
+    user = models.ForeignKey(
+        'user.AyakUser',
+        on_delete=models.CASCADE,
+        related_name='active_ingredients',
+        verbose_name='사용자'
+    )
+    prescription_medication = models.ForeignKey(
+        PrescriptionMedication,
+        on_delete=models.CASCADE,
+        related_name='active_ingredients',
+        verbose_name='처방 의약품'
+    )
+    ingr_code = models.CharField(
+        max_length=20,
+        verbose_name='성분 고유 코드'
+    )
+    ingredient_key = models.CharField(
+        max_length=200,
+        verbose_name='성분 비교 키',
+        help_text='함량/제형과 무관한 동일 성분 판단용 (주성분 코드 - 일반명코드 앞 4자리)'
+    )
+    atc_class = models.CharField(
+        max_length=5,
+        blank=True,
+        verbose_name='ATC 4단계 분류'
+    )
+    dur_code = models.CharField(
+        max_length=4,
+        blank=True,
+        default='',
+        verbose_name='DUR 성분코드',
+        help_text='일반명코드 앞 4자리 - DUR 규칙 테이블 조회용'
+    )
+
+    def __str__(self):
+        return f"{self.user_id} - {self.ingredient_key}"
@@ -0,0 +1,223 @@
+# bokyak/services/duplication_service.py
+"""
+치료 중복(동일 성분 / 동일 ATC 4단계 분류) 검사 서비스
+
+여러 병원에서 받은 활성 처방 의약품을 UserActiveIngredient 로 미리 주성분 단위로 전개해 두고,
+새 처방 검사는 (사용자, 성분 키 IN / ATC 분류 IN) 조회 한 번과 집합 교집합으로 처리한다.
+- 성분 키: 주성분 코드 (일반명코드 앞 4자리) - 함량/제형/복합제 여부가 달라도 같은 성분이면 같은 키
+  일반명코드가 아닌 성분만 정규화 성분명(한글/영문)으로 일반명코드를 찾되, 이름이 주성분 하나로 모일 때만 쓴다
+  (정규화 성분명은 서로 다른 성분이 같은 키가 될 수 있어 그대로 비교하면 거짓 중복이 난다)
+- ATC 4단계: atc_code 앞 5자리 (예: N06AB - SSRI) - 염만 다른 성분(일반명코드가 다름)은 여기서 걸린다
+"""
+from typing import Any, Dict, Iterable, List, NamedTuple, Set
+
+from django.db import transaction
+from django.db.models import Q
+
+from bokyak.models import MedicationGroup, PrescriptionMedication, UserActiveIngredient
+from user.models import MainIngredient, MedicationIngredient
+from user.models.dur import dur_ingredient_code
+from user.services.ingredient_lookup import active_ingredient_id
+
+ATC_CLASS_LENGTH = 5
+
+DUPLICATE_INGREDIENT = 'INGREDIENT'
+DUPLICATE_ATC_CLASS = 'ATC_CLASS'
+
+
+class IngredientEntry(NamedTuple):
+    medication_id: int
+    medication_name: str
+    ingr_code: str
+    ingredient_key: str
+    atc_class: str
+    prescription_id: str = None  # 복용 중인 의약품이면 처방전 코드, 새 의약품이면 None
+
+
+def atc_class_of(atc_code: str) -> str:
+    """ATC 4단계 분류 코드 (5자리 미만이면 빈 문자열)"""
+    return atc_code[:ATC_CLASS_LENGTH] if len(atc_code or '') >= ATC_CLASS_LENGTH else ''
+
+
+def resolve_name_keys(name_keys: Iterable[str]) -> Dict[str, str]:
+    """정규화 성분명 -> 주성분 코드 (일반명코드 성분 중 하나로만 모이는 이름만, 쿼리 1회)"""
+    name_keys = {key for key in name_keys if key}
+    if not name_keys:
+        return {}
+
+    codes_by_key: Dict[str, Set[str]] = {}
+    rows = MainIngredient.objects.filter(
+        Q(name_kr_key__in=name_keys) | Q(name_en_key__in=name_keys)
+    ).values_list('ingr_code', 'name_kr_key', 'name_en_key')
+    for ingr_code, name_kr_key, name_en_key in rows:
+        if not dur_ingredient_code(ingr_code):
+            continue
+        for key in {name_kr_key, name_en_key} & name_keys:
+            codes_by_key.setdefault(key, set()).add(active_ingredient_id(ingr_code))
+
+    return {key: next(iter(codes)) for key, codes in codes_by_key.items() if len(codes) == 1}
+
+
+class DuplicationService:
+    """치료 중복 검사 서비스"""
+
+    @staticmethod
+    def expand_medications(medication_ids: Iterable[int]) -> List[IngredientEntry]:
+        """의약품 목록을 주성분 단위로 전개 (쿼리 1회)"""
+        rows = MedicationIngredient.objects.filter(
+            medication_id__in=list(medication_ids),
+            is_main=True
+        ).values_list(
+            'medication_id',
+            'medication__medication_name',
+            'main_ingredient_id',
+            'main_ingredient__name_kr_key',
+            'main_ingredient__name_en_key',
+            'main_ingredient__atc_code',
+        )
+
+        # 일반명코드가 아닌 성분만 이름으로 주성분 코드를 찾음 (한글/영문 키 중 하나만 있어도 같은 코드로 모임)
+        resolved = resolve_name_keys(
+            key
+            for _, _, ingr_code, name_kr_key, name_en_key, _ in rows
+            if not dur_ingredient_code(ingr_code)
+            for key in (name_kr_key, name_en_key)
+        )
+
+        entries = []
+        for medication_id, medication_name, ingr_code, name_kr_key, name_en_key, atc_code in rows:
+            ingredient_key = active_ingredient_id(ingr_code)
+            if not dur_ingredient_code(ingr_code):
+                ingredient_key = resolved.get(name_kr_key) or resolved.get(name_en_key) or ingredient_key
+            entries.append(IngredientEntry(
+                medication_id=medication_id,
+                medication_name=medication_name,
+                ingr_code=ingr_code,
+                ingredient_key=ingredient_key,
+                atc_class=atc_class_of(atc_code),
+            ))
+        return entries
+
+    @staticmethod
+    def sync_prescription_medication(prescription_medication) -> int:
+        """처방 의약품 하나의 복용 중 성분 재생성 (처방전이 비활성이면 삭제만)"""
+        with transaction.atomic():
+            UserActiveIngredient.objects.filter(prescription_medication=prescription_medication).delete()
+
+            if not prescription_medication.prescription.is_active or not prescription_medication.group_id:
+                return 0
+
+            user_id = MedicationGroup.objects.filter(
+                group_id=prescription_medication.group_id
+            ).values_list('medical_info__user_id', flat=True).first()
+            if user_id is None:
+                return 0
+
+            rows = [
+                UserActiveIngredient(
+                    user_id=user_id,
+                    prescription_medication=prescription_medication,
+                    ingr_code=entry.ingr_code,
+                    ingredient_key=entry.ingredient_key,
+                    atc_class=entry.atc_class,
+                    dur_code=dur_ingredient_code(entry.ingr_code),
+                )
+                for entry in DuplicationService.expand_medications([prescription_medication.medication_id])
+            ]
+            UserActiveIngredient.objects.bulk_create(rows, ignore_conflicts=True)
+            return len(rows)
+
+    @staticmethod
+    def sync_prescription(prescription) -> int:
+        """처방전 단위 갱신 (활성: 처방 의약품별 재생성, 비활성: 삭제)"""
+        if not prescription.is_active:
+            return DuplicationService.deactivate_prescription(prescription.prescription_id)
+
+        medications = PrescriptionMedication.objects.filter(
+            prescription=prescription
+        ).select_related('prescription')
+        return sum(DuplicationService.sync_prescription_medication(medication) for medication in medications)
+
+    @staticmethod
+    def deactivate_prescription(prescription_id: str) -> int:
+        """처방전 비활성화 시 해당 처방 의약품의 복용 중 성분 삭제 (queryset.update 경로용)"""
+        deleted, _ = UserActiveIngredient.objects.filter(
+            prescription_medication__prescription_id=prescription_id
+        ).delete()
+        return deleted
+
+    @staticmethod
+    def check_medications(user_id, medication_ids: Iterable[int], exclude_prescription_id: str = None) -> Dict[str, Any]:
+        """
+        새로 처방받을 의약품들과 복용 중인 의약품 사이의 치료 중복 검사
+        - 같은 성분 키: INGREDIENT
+        - 성분은 다르지만 같은 ATC 4단계 분류: ATC_CLASS
+        새 의약품끼리의 중복도 함께 보고한다.
+        """
+        candidates = DuplicationService.expand_medications(medication_ids)
+        keys = {entry.ingredient_key for entry in candidates}
+        atc_classes = {entry.atc_class for entry in candidates if entry.atc_class}
+
+        active = UserActiveIngredient.objects.filter(user_id=user_id).filter(
+            Q(ingredient_key__in=keys) | Q(atc_class__in=atc_classes)
+        )
+        if exclude_prescription_id:
+            active = active.exclude(prescription_medication__prescription_id=exclude_prescription_id)
+
+        current = [
+            IngredientEntry(*row)
+            for row in active.values_list(
+                'prescription_medication__medication_id',
+                'prescription_medication__medication__medication_name',
+                'ingr_code',
+                'ingredient_key',
+                'atc_class',
+                'prescription_medication__prescription_id',
+            )
+        ]
+
+        by_key = {}
+        by_class = {}
+        for entry in current + candidates:
+            by_key.setdefault(entry.ingredient_key, []).append(entry)
+            if entry.atc_class:
+                by_class.setdefault(entry.atc_class, []).append(entry)
+
+        duplicates = []
+        seen = set()
+        for entry in candidates:
+            matches = [(DUPLICATE_INGREDIENT, other) for other in by_key.get(entry.ingredient_key, [])]
+            matches += [
+                (DUPLICATE_ATC_CLASS, other) for other in by_class.get(entry.atc_class, [])
+                if other.ingredient_key != entry.ingredient_key
+            ]
+            for duplicate_type, other in matches:
+                if other.medication_id == entry.medication_id and other.prescription_id is None:
+                    continue
+                # 새 의약품끼리는 (A, B) / (B, A) 한 번만
+                pair = frozenset([(entry.medication_id, entry.ingr_code, None),
+                                  (other.medication_id, other.ingr_code, other.prescription_id)])
+                if (duplicate_type, pair) in seen:
+                    continue
+                seen.add((duplicate_type, pair))
+                duplicates.append({
+                    'type': duplicate_type,
+                    'ingredient_key': entry.ingredient_key,
+                    'atc_class': entry.atc_class,
+                    'medication': {
+                        'medication_id': entry.medication_id,
+                        'medication_name': entry.medication_name,
+                        'ingr_code': entry.ingr_code,
+                    },
+                    'conflicts_with': {
+                        'medication_id': other.medication_id,
+                        'medication_name': other.medication_name,
+                        'ingr_code': other.ingr_code,
+                        'prescription_id': other.prescription_id,
+                    },
+                })
+
+        return {
+            'has_duplicates': bool(duplicates),
+            'duplicates': duplicates,
+        }
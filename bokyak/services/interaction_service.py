@@ -0,0 +1,69 @@
+# bokyak/services/interaction_service.py
+"""
+DUR 병용금기 검사 서비스
+
+사용자의 복용 중 성분(UserActiveIngredient)과 새로 처방받을 의약품의 성분을 모아
+DurPairIndex 해시 조회로 금기 쌍을 찾는다. DB 조회는 복용 중 성분 1회 + 새 의약품 전개 1회.
+"""
+from typing import Any, Dict, Iterable, List
+
+from bokyak.models import UserActiveIngredient
+from bokyak.services.duplication_service import DuplicationService
+from user.models.dur import dur_ingredient_code
+from user.services.dur_index import dur_index
+
+
+class InteractionService:
+    """병용금기 검사 서비스"""
+
+    @staticmethod
+    def check_medications(user_id, medication_ids: Iterable[int] = (), exclude_prescription_id: str = None) -> Dict[str, Any]:
+        """
+        복용 중인 의약품 + 새 의약품 전체 조합의 병용금기 검사
+        new_medication 이 아닌 쌍은 이미 복용 중인 의약품끼리의 금기다.
+        """
+        sources = {}
+
+        active = UserActiveIngredient.objects.filter(user_id=user_id)
+        if exclude_prescription_id:
+            active = active.exclude(prescription_medication__prescription_id=exclude_prescription_id)
+        for dur_code, medication_id, medication_name, prescription_id in active.values_list(
+            'dur_code',
+            'prescription_medication__medication_id',
+            'prescription_medication__medication__medication_name',
+            'prescription_medication__prescription_id',
+        ):
+            sources.setdefault(dur_code, []).append({
+                'medication_id': medication_id,
+                'medication_name': medication_name,
+                'prescription_id': prescription_id,
+            })
+
+        medication_ids = list(medication_ids or ())
+        if medication_ids:
+            for entry in DuplicationService.expand_medications(medication_ids):
+                sources.setdefault(dur_ingredient_code(entry.ingr_code), []).append({
+                    'medication_id': entry.medication_id,
+                    'medication_name': entry.medication_name,
+                    'prescription_id': None,
+                })
+
+        index = dur_index.get()
+        interactions: List[Dict[str, Any]] = []
+        for _, _, row in index.find_pairs(sources):
+            contraindication = index.describe(row)
+            medications_a = sources[contraindication['ingredient_code_a']]
+            medications_b = sources[contraindication['ingredient_code_b']]
+            interactions.append({
+                **contraindication,
+                'medications_a': medications_a,
+                'medications_b': medications_b,
+                'new_medication': any(
+                    medication['prescription_id'] is None for medication in medications_a + medications_b
+                ),
+            })
+
+        return {
+            'has_interactions': bool(interactions),
+            'interactions': interactions,
+        }
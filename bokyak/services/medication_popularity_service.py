@@ -0,0 +1,61 @@
+# bokyak/services/medication_popularity_service.py
+"""
+의약품 처방 건수 집계 (검색 순위 가중치)
+
+Medication.prescription_count 에 PrescriptionMedication 건수를 비정규화해 두어
+검색/자동완성 정렬 시 조인이나 집계 없이 컬럼 하나로 순위를 매긴다.
+- 처방 의약품 생성/삭제 시그널에서 F() 로 증감 (즉시 반영)
+- 매일 새벽 전체 재집계로 bulk_create/update 등 시그널을 거치지 않은 변경을 보정
+"""
+from typing import Dict
+
+from django.db.models import Count, F
+from django.db.models.functions import Greatest
+
+from bokyak.models import PrescriptionMedication
+from user.models import Medication
+
+REFRESH_BATCH_SIZE = 1000
+
+
+class MedicationPopularityService:
+    """의약품 처방 건수 집계 서비스"""
+
+    @staticmethod
+    def increment(medication_id: int, delta: int = 1) -> None:
+        """처방 의약품 생성(+1)/삭제(-1) 시 처방 건수 증감"""
+        Medication.objects.filter(medication_id=medication_id).update(
+            prescription_count=Greatest(F('prescription_count') + delta, 0)
+        )
+
+    @staticmethod
+    def refresh_counts() -> Dict[str, int]:
+        """전체 재집계 - 값이 달라진 의약품만 갱신"""
+        counts = dict(
+            PrescriptionMedication.objects.values('medication_id').annotate(
+                count=Count('id')
+            ).values_list('medication_id', 'count')
+        )
+
+        # 집계 대상 = 새로 처방된 의약품 + 기존에 처방 건수가 있던 의약품
+        medication_ids = set(counts)
+        medication_ids.update(
+            Medication.objects.filter(prescription_count__gt=0).values_list('medication_id', flat=True)
+        )
+        medication_ids = sorted(medication_ids)
+
+        updated = 0
+        for start in range(0, len(medication_ids), REFRESH_BATCH_SIZE):
+            changed = []
+            medications = Medication.objects.filter(
+                medication_id__in=medication_ids[start:start + REFRESH_BATCH_SIZE]
+            ).only('medication_id', 'prescription_count')
+            for medication in medications:
+                count = counts.get(medication.medication_id, 0)
+                if medication.prescription_count != count:
+                    medication.prescription_count = count
+                    changed.append(medication)
+            if changed:
+                updated += Medication.objects.bulk_update(changed, ['prescription_count'])
+
+        return {'prescribed_medications': len(counts), 'updated': updated}
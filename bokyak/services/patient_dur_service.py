@@ -0,0 +1,151 @@
+# bokyak/services/patient_dur_service.py
+"""
+환자 특성 DUR(연령금기/임부금기/노인주의) 평가 서비스
+
+사용자 묶음 단위로 (사용자 정보, 복용 중 성분, 해당 성분의 규칙) 을 각각 쿼리 한 번씩 읽어 메모리에서 평가하고,
+PatientDurAlert 와의 차이만 삭제/추가한다. 사용자 수와 무관하게 쿼리 수가 고정된다.
+"""
+from datetime import date, timedelta
+from functools import reduce
+from operator import or_
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from bokyak.models import PatientDurAlert, UserActiveIngredient
+from user.models import AyakUser, DurPatientRule
+from user.models.dur import age_in_months, latest_birth_date
+
+FEMALE = 'F'
+_FEMALE_VALUES = {'F', 'FEMALE', 'W', 'WOMAN', '여', '여성', '여자'}
+
+REFRESH_CHUNK_SIZE = 1000
+
+
+def normalize_gender(gender: Optional[str]) -> str:
+    value = (gender or '').strip().upper()
+    return FEMALE if value in _FEMALE_VALUES else value
+
+
+class PatientDurService:
+    """환자 특성 DUR 평가 서비스"""
+
+    @staticmethod
+    def evaluate(user_ids: Iterable[str], on_date: date = None) -> Set[Tuple[str, int, int]]:
+        """적용되는 (사용자, 복용 중 성분 id, 규칙 id) 집합"""
+        on_date = on_date or timezone.localdate()
+        user_ids = list(user_ids)
+
+        profiles = {
+            user_id: (
+                age_in_months(birth_date, on_date) if birth_date else None,
+                normalize_gender(gender),
+            )
+            for user_id, birth_date, gender in AyakUser.objects.filter(
+                user_id__in=user_ids
+            ).values_list('user_id', 'birth_date', 'gender')
+        }
+
+        active = list(UserActiveIngredient.objects.filter(
+            user_id__in=user_ids
+        ).exclude(dur_code='').values_list('id', 'user_id', 'dur_code'))
+        if not active:
+            return set()
+
+        rules = {}
+        for rule in DurPatientRule.objects.filter(ingredient_code__in={code for _, _, code in active}):
+            rules.setdefault(rule.ingredient_code, []).append(rule)
+
+        result = set()
+        for active_id, user_id, dur_code in active:
+            age_months, gender = profiles.get(user_id, (None, ''))
+            for rule in rules.get(dur_code, ()):
+                if rule.applies_to(age_months, gender):
+                    result.add((user_id, active_id, rule.id))
+        return result
+
+    @staticmethod
+    def refresh_users(user_ids: Iterable[str], on_date: date = None) -> Dict[str, int]:
+        """사용자 묶음의 경고를 다시 평가해 바뀐 것만 반영"""
+        stats = {'created': 0, 'deleted': 0}
+        user_ids = list(user_ids)
+
+        for start in range(0, len(user_ids), REFRESH_CHUNK_SIZE):
+            chunk = user_ids[start:start + REFRESH_CHUNK_SIZE]
+            expected = PatientDurService.evaluate(chunk, on_date)
+
+            with transaction.atomic():
+                existing = {
+                    (user_id, active_id, rule_id): alert_id
+                    for alert_id, user_id, active_id, rule_id in PatientDurAlert.objects.filter(
+                        user_id__in=chunk
+                    ).values_list('id', 'user_id', 'active_ingredient_id', 'rule_id')
+                }
+
+                stale = [alert_id for key, alert_id in existing.items() if key not in expected]
+                if stale:
+                    PatientDurAlert.objects.filter(id__in=stale).delete()
+
+                new_alerts = [
+                    PatientDurAlert(user_id=user_id, active_ingredient_id=active_id, rule_id=rule_id)
+                    for user_id, active_id, rule_id in expected - existing.keys()
+                ]
+                PatientDurAlert.objects.bulk_create(new_alerts, ignore_conflicts=True)
+
+            stats['created'] += len(new_alerts)
+            stats['deleted'] += len(stale)
+        return stats
+
+    @staticmethod
+    def age_boundaries() -> Set[int]:
+        """규칙에 쓰인 나이 경계(개월) 목록"""
+        boundaries = set()
+        for min_age, max_age in DurPatientRule.objects.values_list('min_age_months', 'max_age_months').distinct():
+            boundaries.update(value for value in (min_age, max_age) if value)
+        return boundaries
+
+    @staticmethod
+    def users_with_changed_age_band(on_date: date = None) -> List[str]:
+        """
+        on_date 에 규칙 나이 경계를 넘은 사용자 (쿼리 1회)
+        경계 m 개월을 넘은 사람 = 어제 기준 m 개월 미만이고 오늘 기준 m 개월 이상인 생년월일 범위
+        """
+        on_date = on_date or timezone.localdate()
+        yesterday = on_date - timedelta(days=1)
+
+        ranges = [
+            Q(birth_date__gt=latest_birth_date(months, yesterday), birth_date__lte=latest_birth_date(months, on_date))
+            for months in sorted(PatientDurService.age_boundaries())
+        ]
+        if not ranges:
+            return []
+
+        # 복용 중인 약이 있는 사용자만
+        return list(AyakUser.objects.filter(
+            reduce(or_, ranges),
+            active_ingredients__isnull=False
+        ).values_list('user_id', flat=True).distinct())
+
+    @staticmethod
+    def get_user_alerts(user_id: str) -> List[Dict[str, Any]]:
+        """사용자의 환자 특성 DUR 경고 목록"""
+        alerts = PatientDurAlert.objects.filter(user_id=user_id).select_related(
+            'rule', 'active_ingredient__prescription_medication__medication'
+        ).order_by('rule__rule_type', 'active_ingredient__prescription_medication_id')
+
+        return [
+            {
+                'rule_type': alert.rule.rule_type,
+                'rule_type_name': alert.rule.get_rule_type_display(),
+                'ingredient_code': alert.rule.ingredient_code,
+                'ingredient_name': alert.rule.ingredient_name,
+                'grade': alert.rule.grade,
+                'reason': alert.rule.reason,
+                'medication_id': alert.active_ingredient.prescription_medication.medication_id,
+                'medication_name': alert.active_ingredient.prescription_medication.medication.medication_name,
+                'prescription_id': alert.active_ingredient.prescription_medication.prescription_id,
+            }
+            for alert in alerts
+        ]
@@ -8,6 +8,7 @@ from bokyak.models.medication_detail import MedicationDetail
 from bokyak.models.medication_group import MedicationGroup
 from bokyak.models.prescription import Prescription
 from bokyak.models.prescription_medication import PrescriptionMedication
+from bokyak.services.duplication_service import DuplicationService
 from user.models import UserMedicalInfo
 
 
@@ -39,6 +40,8 @@ class PrescriptionRenewalService:
                 Prescription.objects.filter(
                     prescription_id=old_prescription_id
                 ).update(is_active=False)
+                # update() 는 시그널을 타지 않으므로 복용 중 성분을 직접 정리
+                DuplicationService.deactivate_prescription(old_prescription_id)
 
             # 3. 의료 정보 업데이트/생성
             medical_info, created = UserMedicalInfo.objects.get_or_create(
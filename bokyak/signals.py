@@ -1,9 +1,11 @@
 # bokyak/signals.py 파일 생성
-from django.db.models.signals import post_save, pre_delete
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
 from .models.medication_record import MedicationRecord
 from .models.prescription import Prescription
+from .models.prescription_medication import PrescriptionMedication
+from .models.user_active_ingredient import UserActiveIngredient
 
 
 @receiver(post_save, sender=MedicationRecord)
@@ -24,3 +26,47 @@ def deactivate_previous_prescriptions(sender, instance, created, **kwargs):
     #         medical_info=instance.medical_info,
     #         is_active=True
     #     ).exclude(prescription_id=instance.prescription_id).update(is_active=False)
+
+
+@receiver(post_save, sender=PrescriptionMedication)
+def increment_medication_prescription_count(sender, instance, created, **kwargs):
+    """처방 의약품 생성 시 의약품 처방 건수 증가 (검색 순위 가중치)"""
+    if created:
+        from .services.medication_popularity_service import MedicationPopularityService
+        MedicationPopularityService.increment(instance.medication_id, 1)
+
+
+@receiver(post_delete, sender=PrescriptionMedication)
+def decrement_medication_prescription_count(sender, instance, **kwargs):
+    """처방 의약품 삭제 시 의약품 처방 건수 감소"""
+    from .services.medication_popularity_service import MedicationPopularityService
+    MedicationPopularityService.increment(instance.medication_id, -1)
+
+
+@receiver(post_save, sender=PrescriptionMedication)
+def sync_active_ingredients(sender, instance, **kwargs):
+    """처방 의약품 생성/수정 시 사용자 복용 중 성분 갱신 (치료 중복 검사용)"""
+    from .services.duplication_service import DuplicationService
+    from .services.patient_dur_service import PatientDurService
+    DuplicationService.sync_prescription_medication(instance)
+    PatientDurService.refresh_users(
+        UserActiveIngredient.objects.filter(
+            prescription_medication=instance
+        ).values_list('user_id', flat=True).distinct()
+    )
+
+
+@receiver(post_save, sender=Prescription)
+def sync_prescription_active_ingredients(sender, instance, created, **kwargs):
+    """처방전 비활성화(갱신)/재활성화 시 복용 중 성분 갱신"""
+    if created:
+        return
+    from .services.duplication_service import DuplicationService
+    from .services.patient_dur_service import PatientDurService
+    DuplicationService.sync_prescription(instance)
+    if instance.is_active:
+        PatientDurService.refresh_users(
+            UserActiveIngredient.objects.filter(
+                prescription_medication__prescription=instance
+            ).values_list('user_id', flat=True).distinct()
+        )
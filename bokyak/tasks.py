@@ -3,6 +3,8 @@
 from celery import shared_task
 from django.utils import timezone
 from user.models.ayakuser import AyakUser
+from .services.medication_popularity_service import MedicationPopularityService
+from .services.patient_dur_service import PatientDurService
 from .services.reminder_service import MedicationReminderService
 
 
@@ -54,4 +56,22 @@ def send_refill_notification(user_id, medication_count):
     """처방전 갱신 알림 전송"""
     message = f"잔여량이 부족한 약물 {medication_count}개가 있습니다. 처방전 갱신이 필요합니다."
     # 실제 알림 전송 로직 구현
-    pass
\ No newline at end of file
+    pass
+
+
+@shared_task
+def evaluate_patient_dur_alerts():
+    """매일 새벽 연령/임부/노인 DUR 경고 재평가 (오늘 규칙 나이 경계를 넘은 사용자만)"""
+    today = timezone.localdate()
+    user_ids = PatientDurService.users_with_changed_age_band(today)
+    if not user_ids:
+        return {'users': 0, 'created': 0, 'deleted': 0}
+
+    stats = PatientDurService.refresh_users(user_ids, today)
+    return {'users': len(user_ids), **stats}
+
+
+@shared_task
+def refresh_medication_prescription_counts():
+    """매일 새벽 의약품 처방 건수 재집계 (시그널을 거치지 않은 변경 보정)"""
+    return MedicationPopularityService.refresh_counts()
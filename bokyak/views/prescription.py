@@ -6,6 +6,9 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.utils import timezone
 from bokyak.models.prescription_medication import Prescription, PrescriptionMedication
+from bokyak.services.duplication_service import DuplicationService
+from bokyak.services.interaction_service import InteractionService
+from bokyak.services.patient_dur_service import PatientDurService
 from user.models import UserMedicalInfo
 
 
@@ -212,4 +215,81 @@ class PrescriptionViewSet(viewsets.ModelViewSet):
             return Response({
                 'success': False,
                 'message': f'공유 처방전 생성 중 오류가 발생했습니다: {str(e)}'
-            }, status=status.HTTP_400_BAD_REQUEST)
\ No newline at end of file
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['post'])
+    def check_duplication(self, request):
+        """
+        새 처방 의약품과 복용 중인 의약품의 치료 중복(동일 성분/동일 ATC 4단계) 검사
+        - medication_ids: 검사할 의약품 코드 목록
+        - prescription_id: 갱신 대상 처방전 (선택, 해당 처방전의 의약품은 비교에서 제외)
+        """
+        try:
+            medication_ids = request.data.get('medication_ids')
+            if not medication_ids:
+                return Response({
+                    'success': False,
+                    'message': 'medication_ids는 필수 입력 항목입니다.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            result = DuplicationService.check_medications(
+                user_id=request.user.user_id,
+                medication_ids=medication_ids,
+                exclude_prescription_id=request.data.get('prescription_id')
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'중복 처방 검사 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['post'])
+    def check_interactions(self, request):
+        """
+        DUR 병용금기 검사 (복용 중인 의약품 전체 + 새 의약품)
+        - medication_ids: 새로 추가할 의약품 코드 목록 (선택, 없으면 복용 중인 의약품끼리만 검사)
+        - prescription_id: 갱신 대상 처방전 (선택, 해당 처방전의 의약품은 제외)
+        """
+        try:
+            result = InteractionService.check_medications(
+                user_id=request.user.user_id,
+                medication_ids=request.data.get('medication_ids') or [],
+                exclude_prescription_id=request.data.get('prescription_id')
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'병용금기 검사 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'])
+    def patient_dur_alerts(self, request):
+        """복용 중인 의약품의 연령/임부/노인 DUR 경고 목록"""
+        try:
+            alerts = PatientDurService.get_user_alerts(request.user.user_id)
+
+            return Response({
+                'success': True,
+                'data': {
+                    'has_alerts': bool(alerts),
+                    'alerts': alerts
+                }
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'DUR 경고 조회 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
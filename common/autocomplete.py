@@ -0,0 +1,140 @@
+# common/autocomplete.py
+"""
+메모리 상주 자동완성 인덱스
+
+- PrefixIndex: 정렬된 키 배열 + 이진 탐색(bisect) 기반 읽기 전용 접두 검색 인덱스
+- VersionedIndexHolder: ReferenceDataVersion 세대를 주기적으로 확인해 인덱스를 통째로 교체
+  (PrefixIndex 외에 common.fuzzy.SymSpellIndex 등 읽기 전용 인덱스면 무엇이든 보관)
+
+인덱스는 한 번 만들면 수정하지 않으므로 요청 스레드 간 잠금 없이 공유하고,
+재생성 시에는 새 인덱스를 만든 뒤 참조만 바꿔치기한다.
+"""
+import logging
+import re
+import threading
+import time
+from array import array
+from bisect import bisect_left
+from typing import Any, Callable, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 세대 확인 주기 (초) - 요청마다 DB 를 조회하지 않도록
+VERSION_CHECK_INTERVAL = 30
+
+_WHITESPACE = re.compile(r'\s+')
+
+
+def normalize_key(text: str) -> str:
+    """인덱스 키/검색어 정규화 (소문자, 공백 제거)"""
+    return _WHITESPACE.sub('', text or '').lower()
+
+
+class PrefixIndex:
+    """
+    읽기 전용 접두 검색 인덱스
+    tier 가 낮은 키(이름 전체 접두)를 먼저, 같은 tier 안에서는 키 사전순으로 반환한다.
+    """
+
+    def __init__(self, tiers: List[Tuple[List[str], array]], documents: list):
+        self.tiers = tiers
+        self.documents = documents
+
+    @classmethod
+    def build(cls, documents: list, entries: Iterable[Tuple[int, str, int]], tier_count: int = 2) -> 'PrefixIndex':
+        """
+        :param documents: 검색 결과로 돌려줄 문서 목록
+        :param entries: (tier, 키, 문서 번호) 목록
+        """
+        buckets = [set() for _ in range(tier_count)]
+        for tier, key, doc_id in entries:
+            key = normalize_key(key)
+            if key:
+                buckets[tier].add((key, doc_id))
+
+        tiers = []
+        for bucket in buckets:
+            pairs = sorted(bucket)
+            tiers.append(([key for key, _ in pairs], array('I', (doc_id for _, doc_id in pairs))))
+        return cls(tiers, documents)
+
+    def __len__(self):
+        return len(self.documents)
+
+    def search_ids(self, prefix: str, limit: int, exclude: Optional[set] = None) -> List[int]:
+        """접두 매칭 문서 번호 상위 limit 개 (O(log n + limit))"""
+        prefix = normalize_key(prefix)
+        if not prefix or limit <= 0:
+            return []
+
+        seen = set(exclude or ())
+        result = []
+        for keys, doc_ids in self.tiers:
+            index = bisect_left(keys, prefix)
+            while index < len(keys) and keys[index].startswith(prefix):
+                doc_id = doc_ids[index]
+                if doc_id not in seen:
+                    seen.add(doc_id)
+                    result.append(doc_id)
+                    if len(result) >= limit:
+                        return result
+                index += 1
+        return result
+
+    def search(self, prefix: str, limit: int) -> list:
+        return [self.documents[doc_id] for doc_id in self.search_ids(prefix, limit)]
+
+
+class VersionedIndexHolder:
+    """
+    프로세스 단위로 공유되는 인덱스 보관소
+    - 최초 접근(또는 워커 시작 시 warm_up) 때 빌드
+    - VERSION_CHECK_INTERVAL 마다 세대 번호를 확인해 바뀌었으면 재빌드 후 교체
+    - 재빌드 중 다른 요청은 기존 인덱스를 그대로 사용
+    """
+
+    def __init__(self, name: str, builder: Callable[[], Any], generation_getter: Callable[[str], int]):
+        self.name = name
+        self.builder = builder
+        self.generation_getter = generation_getter
+        self.index = None
+        self.generation = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def get(self):
+        if self.index is None:
+            with self.lock:
+                if self.index is None:
+                    self.rebuild()
+        elif time.monotonic() - self.checked_at > VERSION_CHECK_INTERVAL:
+            self.refresh_if_stale()
+        return self.index
+
+    def refresh_if_stale(self):
+        # 이미 다른 스레드가 확인/재빌드 중이면 기존 인덱스 사용
+        if not self.lock.acquire(blocking=False):
+            return
+        try:
+            self.checked_at = time.monotonic()
+            if self.generation_getter(self.name) != self.generation:
+                self.rebuild()
+        finally:
+            self.lock.release()
+
+    def rebuild(self):
+        generation = self.generation_getter(self.name)
+        started = time.monotonic()
+        index = self.builder()
+
+        self.index = index
+        self.generation = generation
+        self.checked_at = time.monotonic()
+        logger.info(
+            f"{self.name} 메모리 인덱스 빌드: {len(index):,}건, 세대 {generation}, "
+            f"{(self.checked_at - started) * 1000:.0f}ms"
+        )
+
+    def invalidate(self):
+        """다음 접근 시 세대를 즉시 확인하도록 표시"""
+        self.checked_at = 0.0
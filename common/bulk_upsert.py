@@ -0,0 +1,106 @@
+# common/bulk_upsert.py
+"""
+배치 단위 upsert (INSERT ... ON CONFLICT DO UPDATE)
+
+update_or_create 는 행마다 SELECT + INSERT/UPDATE 를 보내므로, 페이지 단위로
+- 기존 행을 유니크 키 IN 조회 한 번으로 읽어 생성/변경/동일을 구분하고
+- 생성/변경 행만 bulk_create(update_conflicts=True) 한 번으로 쓴다.
+동일한 행은 쓰지 않으므로 인덱스와 auto_now 필드도 바뀌지 않는다.
+
+fingerprint_field 를 주면 (ContentFingerprintMixin 모델) 기존 행은 키와 지문만 읽어 비교하고,
+아니면 compare_fields 값을 모두 읽어 비교한다.
+
+bulk_create 는 save() 를 거치지 않으므로 검색키/지오해시/지문 같은 저장 시 계산 필드는
+호출 측에서 미리 채워 넘긴다.
+"""
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence
+
+from django.db import connections, router, transaction
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class UpsertResult(NamedTuple):
+    created: int
+    updated: int
+    unchanged: int
+    # 실제로 INSERT/UPDATE 한 행의 유니크 키
+    written_keys: List[Any]
+
+
+def _comparable(field, value):
+    return None if value is None else field.to_python(value)
+
+
+def bulk_upsert(model, objects: Iterable, unique_field: str, update_fields: Sequence[str],
+                compare_fields: Sequence[str] = None, fingerprint_field: str = None,
+                batch_size: int = DEFAULT_BATCH_SIZE) -> UpsertResult:
+    """
+    :param objects: 저장하지 않은 모델 인스턴스 (같은 키는 마지막 것 사용)
+    :param update_fields: 충돌 시 갱신할 필드
+    :param compare_fields: 변경 여부 판단 필드 (기본 update_fields, 기준일자/수정일시 등은 빼고 넘긴다)
+    :param fingerprint_field: 지문 필드 - 주면 compare_fields 대신 이 필드만 비교
+    """
+    if fingerprint_field:
+        compare_fields = [fingerprint_field]
+        if fingerprint_field not in update_fields:
+            update_fields = [*update_fields, fingerprint_field]
+    compare_fields = list(compare_fields or update_fields)
+    fields = [model._meta.get_field(name) for name in compare_fields]
+    key_attname = model._meta.get_field(unique_field).attname
+
+    unique = {}
+    for obj in objects:
+        unique[getattr(obj, key_attname)] = obj
+    keys = list(unique)
+
+    using = router.db_for_write(model)
+    # MySQL 은 충돌 대상 컬럼 지정을 지원하지 않음 (모든 유니크 키 충돌 시 갱신)
+    target = {'unique_fields': [unique_field]} \
+        if connections[using].features.supports_update_conflicts_with_target else {}
+
+    created = updated = unchanged = 0
+    written_keys = []
+    with transaction.atomic(using=using):
+        for start in range(0, len(keys), batch_size):
+            batch_keys = keys[start:start + batch_size]
+            existing = {
+                row[0]: row[1:]
+                for row in model._default_manager.using(using)
+                .filter(**{f'{unique_field}__in': batch_keys})
+                .values_list(unique_field, *compare_fields)
+            }
+
+            rows = []
+            for key in batch_keys:
+                obj = unique[key]
+                current = existing.get(key)
+                if current is None:
+                    created += 1
+                elif all(
+                    _comparable(field, getattr(obj, field.attname)) == _comparable(field, value)
+                    for field, value in zip(fields, current)
+                ):
+                    unchanged += 1
+                    continue
+                else:
+                    updated += 1
+                rows.append(obj)
+                written_keys.append(key)
+
+            if rows:
+                model._default_manager.using(using).bulk_create(
+                    rows,
+                    update_conflicts=True,
+                    update_fields=list(update_fields),
+                    **target
+                )
+
+    return UpsertResult(created, updated, unchanged, written_keys)
+
+
+def count_result(stats: Dict[str, int], result: UpsertResult) -> None:
+    """임포터 통계(created/updated/unchanged)에 합산"""
+    stats['created'] += result.created
+    stats['updated'] += result.updated
+    stats['unchanged'] = stats.get('unchanged', 0) + result.unchanged
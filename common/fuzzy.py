@@ -0,0 +1,164 @@
+# common/fuzzy.py
+"""
+오타 허용 검색 (SymSpell 대칭 삭제 사전)
+
+용어와 검색어 양쪽에서 글자를 최대 max_distance 개 지운 변형이 겹치면 후보로 보고,
+후보만 실제 편집거리(Damerau-Levenshtein)로 검증한다.
+한글은 자모 단위로 비교하므로 받침 하나 틀린 것도 거리 1 이다.
+
+메모리를 줄이기 위해
+- 삭제 변형은 앞 prefix_length 글자에서만 만들고 (SymSpell prefix 방식)
+- 변형 문자열 대신 crc32 해시와 용어 번호를 64비트 정수 하나로 묶어 정렬 배열에 보관한다.
+해시 충돌은 편집거리 검증 단계에서 걸러진다.
+"""
+import zlib
+from array import array
+from bisect import bisect_left
+from typing import Iterable, List, NamedTuple, Set
+
+from common.hangul import to_jamo
+
+DEFAULT_MAX_DISTANCE = 2
+# 자모 기준 약 3음절 - 짧으면 후보 검증이 늘고 길면 삭제 변형이 늘어난다
+DEFAULT_PREFIX_LENGTH = 9
+
+_TERM_ID_BITS = 32
+_TERM_ID_MASK = (1 << _TERM_ID_BITS) - 1
+
+
+def fuzzy_key(text: str) -> str:
+    """비교용 키 (한글 자모 분해, 영문 소문자, 공백/기호 제거)"""
+    return to_jamo(text)
+
+
+def deletes(key: str, max_distance: int) -> Set[str]:
+    """key 에서 글자를 0 ~ max_distance 개 지운 모든 변형"""
+    result = {key}
+    level = {key}
+    for _ in range(max_distance):
+        level = {
+            variant[:index] + variant[index + 1:]
+            for variant in level
+            for index in range(len(variant))
+        }
+        result |= level
+    return result
+
+
+def edit_distance(source: str, target: str, max_distance: int) -> int:
+    """
+    제한 Damerau-Levenshtein 거리 (인접 전치 포함)
+    max_distance 를 넘으면 max_distance + 1 반환
+    """
+    if abs(len(source) - len(target)) > max_distance:
+        return max_distance + 1
+
+    previous_previous = None
+    previous = list(range(len(target) + 1))
+    for i in range(1, len(source) + 1):
+        current = [i] + [0] * len(target)
+        row_min = current[0]
+        for j in range(1, len(target) + 1):
+            cost = 0 if source[i - 1] == target[j - 1] else 1
+            value = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + cost)
+            if (previous_previous is not None and i > 1 and j > 1
+                    and source[i - 1] == target[j - 2] and source[i - 2] == target[j - 1]):
+                value = min(value, previous_previous[j - 2] + 1)
+            current[j] = value
+            row_min = min(row_min, value)
+        if row_min > max_distance:
+            return max_distance + 1
+        previous_previous, previous = previous, current
+
+    return previous[-1] if previous[-1] <= max_distance else max_distance + 1
+
+
+def _hash(value: str) -> int:
+    return zlib.crc32(value.encode('utf-8'))
+
+
+class Suggestion(NamedTuple):
+    term: str
+    distance: int
+    weight: int
+    source: str
+
+
+class SymSpellIndex:
+    """읽기 전용 대칭 삭제 사전"""
+
+    def __init__(self, terms: List[str], keys: List[str], weights: array, sources: List[str],
+                 postings: array, max_distance: int, prefix_length: int):
+        self.terms = terms
+        self.keys = keys
+        self.weights = weights
+        self.sources = sources
+        self.postings = postings
+        self.max_distance = max_distance
+        self.prefix_length = prefix_length
+
+    @classmethod
+    def build(cls, entries: Iterable[tuple], max_distance: int = DEFAULT_MAX_DISTANCE,
+              prefix_length: int = DEFAULT_PREFIX_LENGTH) -> 'SymSpellIndex':
+        """
+        :param entries: (표시 용어, 출처) 목록 - 같은 용어가 여러 번 나오면 가중치(빈도)로 합산
+        """
+        term_ids = {}
+        terms, keys, sources = [], [], []
+        weights = array('I')
+        for term, source in entries:
+            key = fuzzy_key(term)
+            if not key:
+                continue
+            term_id = term_ids.get(key)
+            if term_id is None:
+                term_id = term_ids[key] = len(terms)
+                terms.append(term)
+                keys.append(key)
+                sources.append(source)
+                weights.append(0)
+            weights[term_id] += 1
+
+        postings = array('Q', sorted(
+            (_hash(variant) << _TERM_ID_BITS) | term_id
+            for term_id, key in enumerate(keys)
+            for variant in deletes(key[:prefix_length], max_distance)
+        ))
+        return cls(terms, keys, weights, sources, postings, max_distance, prefix_length)
+
+    def __len__(self):
+        return len(self.terms)
+
+    def _candidates(self, variant: str) -> Iterable[int]:
+        low = _hash(variant) << _TERM_ID_BITS
+        index = bisect_left(self.postings, low)
+        high = low | _TERM_ID_MASK
+        while index < len(self.postings) and self.postings[index] <= high:
+            yield self.postings[index] & _TERM_ID_MASK
+            index += 1
+
+    def lookup(self, text: str, limit: int = 5, max_distance: int = None) -> List[Suggestion]:
+        """편집거리 오름차순, 같은 거리면 빈도 높은 순 추천"""
+        key = fuzzy_key(text)
+        if not key:
+            return []
+        max_distance = self.max_distance if max_distance is None else min(max_distance, self.max_distance)
+        # 짧은 검색어는 허용 거리를 줄여 후보 폭증 방지 (자모 3개당 1)
+        max_distance = min(max_distance, len(key) // 3)
+
+        checked = set()
+        found = []
+        for variant in deletes(key[:self.prefix_length], max_distance):
+            for term_id in self._candidates(variant):
+                if term_id in checked:
+                    continue
+                checked.add(term_id)
+                distance = edit_distance(key, self.keys[term_id], max_distance)
+                if distance <= max_distance:
+                    found.append((distance, -self.weights[term_id], self.terms[term_id], term_id))
+
+        found.sort()
+        return [
+            Suggestion(term, distance, -negative_weight, self.sources[term_id])
+            for distance, negative_weight, term, term_id in found[:limit]
+        ]
@@ -0,0 +1,118 @@
+# common/geo.py
+"""
+위치 검색 유틸리티 (geohash, 경계 상자, 하버사인 거리)
+
+geohash 는 같은 접두를 가진 점들이 같은 격자 셀에 들어가므로
+문자열 컬럼 인덱스의 접두 범위 스캔으로 반경 후보를 추릴 수 있다.
+"""
+import math
+from typing import List, Set, Tuple
+
+EARTH_RADIUS_KM = 6371.0088
+KM_PER_LAT_DEGREE = 111.32
+
+GEOHASH_BASE32 = '0123456789bcdefghjkmnpqrstuvwxyz'
+GEOHASH_MAX_PRECISION = 12
+
+# 반경 검색 시 덮개 셀이 이 개수를 넘지 않는 가장 정밀한 자리수 사용
+MAX_COVER_CELLS = 16
+
+
+def validate_coordinates(latitude: float, longitude: float) -> None:
+    """위경도 검증 (NaN/inf 나 범위 밖 좌표는 ValueError)"""
+    if not (math.isfinite(latitude) and math.isfinite(longitude)):
+        raise ValueError('위도/경도는 유한한 숫자여야 합니다.')
+    if not -90.0 <= latitude <= 90.0:
+        raise ValueError(f'위도는 -90 ~ 90 사이여야 합니다: {latitude}')
+    if not -180.0 <= longitude <= 180.0:
+        raise ValueError(f'경도는 -180 ~ 180 사이여야 합니다: {longitude}')
+
+
+def geohash_encode(latitude: float, longitude: float, precision: int = 9) -> str:
+    """위경도를 geohash 문자열로 변환"""
+    lat_range = [-90.0, 90.0]
+    lon_range = [-180.0, 180.0]
+    result = []
+    bits = 0
+    bit_count = 0
+    even = True  # 짝수 번째 비트는 경도
+
+    while len(result) < precision:
+        target, value = (lon_range, longitude) if even else (lat_range, latitude)
+        mid = (target[0] + target[1]) / 2
+        if value >= mid:
+            bits = (bits << 1) | 1
+            target[0] = mid
+        else:
+            bits <<= 1
+            target[1] = mid
+        even = not even
+
+        bit_count += 1
+        if bit_count == 5:
+            result.append(GEOHASH_BASE32[bits])
+            bits = 0
+            bit_count = 0
+
+    return ''.join(result)
+
+
+def geohash_cell_size(precision: int) -> Tuple[float, float]:
+    """자리수별 셀 크기 (위도 각도, 경도 각도)"""
+    lon_bits = math.ceil(precision * 5 / 2)
+    lat_bits = math.floor(precision * 5 / 2)
+    return 180.0 / (2 ** lat_bits), 360.0 / (2 ** lon_bits)
+
+
+def bounding_box(latitude: float, longitude: float, radius_km: float) -> Tuple[float, float, float, float]:
+    """중심점 반경을 감싸는 경계 상자 (min_lat, max_lat, min_lon, max_lon)"""
+    lat_delta = radius_km / KM_PER_LAT_DEGREE
+    lon_delta = radius_km / (KM_PER_LAT_DEGREE * max(math.cos(math.radians(latitude)), 1e-6))
+    return latitude - lat_delta, latitude + lat_delta, longitude - lon_delta, longitude + lon_delta
+
+
+def cover_cells(min_lat: float, max_lat: float, min_lon: float, max_lon: float, precision: int,
+                max_cells: int = None) -> Set[str]:
+    """
+    경계 상자를 덮는 geohash 셀 목록
+    반복 횟수는 상자 크기/셀 크기로 미리 정하고, max_cells 를 넘으면 그 자리에서 멈춘다 (호출 측은 초과 여부만 봄).
+    """
+    if not all(math.isfinite(value) for value in (min_lat, max_lat, min_lon, max_lon)):
+        raise ValueError('경계 상자 좌표는 유한한 숫자여야 합니다.')
+
+    lat_step, lon_step = geohash_cell_size(precision)
+    lat_count = max(0, math.ceil((max_lat - min_lat) / lat_step)) + 1
+    lon_count = max(0, math.ceil((max_lon - min_lon) / lon_step)) + 1
+    cells = set()
+
+    for lat_index in range(lat_count):
+        lat = min(min_lat + lat_index * lat_step, max_lat)
+        for lon_index in range(lon_count):
+            lon = min(min_lon + lon_index * lon_step, max_lon)
+            cells.add(geohash_encode(lat, lon, precision))
+            if max_cells is not None and len(cells) > max_cells:
+                return cells
+
+    return cells
+
+
+def cover_radius(latitude: float, longitude: float, radius_km: float) -> List[str]:
+    """반경 검색용 geohash 접두 목록 (셀 수가 MAX_COVER_CELLS 이하인 가장 정밀한 자리수)"""
+    box = bounding_box(latitude, longitude, radius_km)
+
+    cells = {geohash_encode(latitude, longitude, 1)}
+    for precision in range(1, GEOHASH_MAX_PRECISION + 1):
+        candidate = cover_cells(*box, precision, max_cells=MAX_COVER_CELLS)
+        if len(candidate) > MAX_COVER_CELLS:
+            break
+        cells = candidate
+    return sorted(cells)
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """두 좌표 사이 대원 거리 (km)"""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    d_phi = phi2 - phi1
+    d_lambda = math.radians(lon2 - lon1)
+    a = math.sin(d_phi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(d_lambda / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
@@ -0,0 +1,97 @@
+# common/hangul.py
+"""
+한글 자모 분해 유틸리티
+
+- to_chosung: 초성 검색키 ("타이레놀" -> "ㅌㅇㄹㄴ")
+- to_jamo: 자모 검색키 ("타이레놀" -> "ㅌㅏㅇㅣㄹㅔㄴㅗㄹ")
+  입력 중인 글자("타일" -> "ㅌㅏㅇㅣㄹ")도 접두 비교로 매칭된다.
+
+영문/숫자는 소문자로 유지하고 공백과 기호는 제거한다.
+"""
+
+HANGUL_BASE = 0xAC00
+HANGUL_LAST = 0xD7A3
+JUNGSUNG_COUNT = 21
+JONGSUNG_COUNT = 28
+
+CHOSUNG = [
+    'ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+]
+JUNGSUNG = [
+    'ㅏ', 'ㅐ', 'ㅑ', 'ㅒ', 'ㅓ', 'ㅔ', 'ㅕ', 'ㅖ', 'ㅗ', 'ㅘ',
+    'ㅙ', 'ㅚ', 'ㅛ', 'ㅜ', 'ㅝ', 'ㅞ', 'ㅟ', 'ㅠ', 'ㅡ', 'ㅢ', 'ㅣ',
+]
+JONGSUNG = [
+    '', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ',
+    'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ', 'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ',
+    'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ',
+]
+
+# 겹모음/겹받침은 입력 순서대로 분해 (입력 중 접두 비교를 위해)
+COMPOUND_JAMO = {
+    'ㅘ': 'ㅗㅏ', 'ㅙ': 'ㅗㅐ', 'ㅚ': 'ㅗㅣ', 'ㅝ': 'ㅜㅓ', 'ㅞ': 'ㅜㅔ',
+    'ㅟ': 'ㅜㅣ', 'ㅢ': 'ㅡㅣ',
+    'ㄳ': 'ㄱㅅ', 'ㄵ': 'ㄴㅈ', 'ㄶ': 'ㄴㅎ', 'ㄺ': 'ㄹㄱ', 'ㄻ': 'ㄹㅁ',
+    'ㄼ': 'ㄹㅂ', 'ㄽ': 'ㄹㅅ', 'ㄾ': 'ㄹㅌ', 'ㄿ': 'ㄹㅍ', 'ㅀ': 'ㄹㅎ',
+    'ㅄ': 'ㅂㅅ',
+}
+
+CONSONANTS = set(CHOSUNG) | {jong for jong in JONGSUNG if jong}
+
+# 인덱스 컬럼 길이 - 접두 검색에는 앞부분만 있으면 충분
+SEARCH_KEY_MAX_LENGTH = 255
+
+
+def is_hangul_syllable(char: str) -> bool:
+    return HANGUL_BASE <= ord(char) <= HANGUL_LAST
+
+
+def is_hangul_jamo(char: str) -> bool:
+    return 0x3131 <= ord(char) <= 0x3163
+
+
+def has_hangul(text: str) -> bool:
+    return any(is_hangul_syllable(char) or is_hangul_jamo(char) for char in text or '')
+
+
+def is_chosung_query(text: str) -> bool:
+    """검색어가 초성(자음)으로만 이루어졌는지 여부"""
+    chars = [char for char in text or '' if not char.isspace()]
+    return bool(chars) and all(char in CONSONANTS for char in chars)
+
+
+def _keep(char: str) -> bool:
+    return char.isalnum() and char.isascii()
+
+
+def to_chosung(text: str) -> str:
+    """초성 검색키 생성"""
+    result = []
+    for char in text or '':
+        if is_hangul_syllable(char):
+            result.append(CHOSUNG[(ord(char) - HANGUL_BASE) // (JUNGSUNG_COUNT * JONGSUNG_COUNT)])
+        elif is_hangul_jamo(char):
+            result.append(COMPOUND_JAMO.get(char, char))
+        elif _keep(char):
+            result.append(char.lower())
+    return ''.join(result)[:SEARCH_KEY_MAX_LENGTH]
+
+
+def to_jamo(text: str) -> str:
+    """자모 검색키 생성 (겹모음/겹받침 분해)"""
+    result = []
+    for char in text or '':
+        if is_hangul_syllable(char):
+            offset = ord(char) - HANGUL_BASE
+            cho, rest = divmod(offset, JUNGSUNG_COUNT * JONGSUNG_COUNT)
+            jung, jong = divmod(rest, JONGSUNG_COUNT)
+            result.append(CHOSUNG[cho])
+            result.append(COMPOUND_JAMO.get(JUNGSUNG[jung], JUNGSUNG[jung]))
+            if jong:
+                result.append(COMPOUND_JAMO.get(JONGSUNG[jong], JONGSUNG[jong]))
+        elif is_hangul_jamo(char):
+            result.append(COMPOUND_JAMO.get(char, char))
+        elif _keep(char):
+            result.append(char.lower())
+    return ''.join(result)[:SEARCH_KEY_MAX_LENGTH]
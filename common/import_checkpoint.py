@@ -0,0 +1,103 @@
+# common/import_checkpoint.py
+"""
+임포트 체크포인트 (ImportCheckpoint 테이블) 기록/복원
+
+임포터는 페이지를 DB 에 저장한 뒤 page_done() 을 호출하고, --resume 으로 다시 실행하면
+- 완료된 검색 조건(시도코드/알파벳/성분명)은 건너뛰고
+- 진행 중이던 조건은 완료하지 않은 페이지만 PublicDataFetcher.fetch_pages(completed=...) 로 받는다.
+--resume 없이 실행하면 해당 조건의 체크포인트를 지우고 처음부터 기록한다.
+page_done() 은 resultCode 00(조회 결과 없음 03 포함) 응답에만 호출한다 - 오류 응답을 빈 페이지로 기록하면
+--resume 이 그 조건을 영영 다시 받지 않는다 (PublicDataXmlStream.is_error 참고).
+"""
+import logging
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from user.models import ImportCheckpoint
+
+logger = logging.getLogger(__name__)
+
+
+def partition_key(query: Optional[Hashable]) -> str:
+    """검색 조건 -> 체크포인트 키 (전국 조회 None 은 빈 문자열)"""
+    return '' if query is None else str(query)
+
+
+class ImportCheckpointTracker:
+    """임포터 한 번 실행의 체크포인트"""
+
+    def __init__(self, importer: str, num_of_rows: int, resume: bool = False):
+        self.importer = importer
+        self.num_of_rows = num_of_rows
+        self.resume = resume
+        self.checkpoints: Dict[str, ImportCheckpoint] = {}
+        # 이전 실행에서 이미 저장한 페이지가 있는지 (세대 갱신 판단용)
+        self.resumed_pages = 0
+
+    def start(self, queries: Iterable[Hashable]) -> Tuple[List[Hashable], Dict[Hashable, Tuple[int, Set[int]]]]:
+        """
+        이번에 수집할 검색 조건과, 이어받을 조건별 (전체 건수, 완료 페이지) 반환
+        """
+        queries = list(queries)
+        keys = {partition_key(query): query for query in queries}
+        existing = ImportCheckpoint.objects.filter(importer=self.importer, partition__in=list(keys))
+
+        if not self.resume:
+            existing.delete()
+            return queries, {}
+
+        completed = {}
+        skipped = []
+        for checkpoint in existing:
+            if checkpoint.num_of_rows != self.num_of_rows:
+                logger.warning(
+                    f"체크포인트 페이지 크기가 달라 처음부터 수집: {checkpoint.partition or '전체'} "
+                    f"({checkpoint.num_of_rows} -> {self.num_of_rows})"
+                )
+                checkpoint.delete()
+                continue
+
+            pages = set(checkpoint.completed_pages)
+            self.resumed_pages += len(pages)
+            if checkpoint.is_completed or (checkpoint.total_pages and len(pages) >= checkpoint.total_pages):
+                skipped.append(keys[checkpoint.partition])
+                continue
+            self.checkpoints[checkpoint.partition] = checkpoint
+            if checkpoint.total_count is not None:
+                completed[keys[checkpoint.partition]] = (checkpoint.total_count, pages)
+
+        if skipped:
+            logger.info(f"⏩ 완료된 검색 조건 {len(skipped)}개 건너뜀")
+        if completed:
+            logger.info(
+                f"🔁 진행 중이던 검색 조건 {len(completed)}개 이어받기 "
+                f"(완료 페이지 {sum(len(pages) for _, pages in completed.values()):,}개)"
+            )
+        return [query for query in queries if query not in skipped], completed
+
+    def remaining_pages(self, completed: Dict[Hashable, Tuple[int, Set[int]]]) -> Dict[Hashable, int]:
+        """이어받는 조건별 남은 페이지 수 (1페이지를 다시 받지 않으므로 미리 계산)"""
+        remaining = {}
+        for query, (total_count, pages) in completed.items():
+            total_pages = max(1, (total_count + self.num_of_rows - 1) // self.num_of_rows)
+            remaining[query] = total_pages - len(pages)
+        return remaining
+
+    def page_done(self, query: Optional[Hashable], page_no: int, total_count: int) -> bool:
+        """페이지 저장 완료 기록, 검색 조건의 모든 페이지가 끝났으면 True"""
+        key = partition_key(query)
+        checkpoint = self.checkpoints.get(key)
+        if checkpoint is None:
+            checkpoint, _ = ImportCheckpoint.objects.get_or_create(
+                importer=self.importer,
+                partition=key,
+                defaults={'num_of_rows': self.num_of_rows}
+            )
+            self.checkpoints[key] = checkpoint
+
+        if checkpoint.total_count is None or page_no == 1:
+            checkpoint.total_count = total_count
+        if page_no not in checkpoint.completed_pages:
+            checkpoint.completed_pages = sorted([*checkpoint.completed_pages, page_no])
+        checkpoint.is_completed = len(checkpoint.completed_pages) >= checkpoint.total_pages
+        checkpoint.save(update_fields=['total_count', 'completed_pages', 'is_completed', 'updated_at'])
+        return checkpoint.is_completed
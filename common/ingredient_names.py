@@ -0,0 +1,103 @@
+# common/ingredient_names.py
+"""
+주성분명 정규화 (염/수화물 형태 제거)
+
+같은 성분이 "설트랄린염산염", "설트랄린", "Sertraline Hydrochloride", "sertraline HCl"
+처럼 제각각 표기되므로, 비교는 항상 normalize_ingredient_name() 결과(정규화 키)로 한다.
+
+정규화 규칙 (결정적)
+1. 괄호 안 내용 제거, 소문자 변환
+2. 수화물 표기는 항상 제거
+3. 염/짝이온(나트륨, 칼륨 ...) 은 실제 활성 성분(염기)이 남을 때만 제거
+   - 영문: 단어 단위, 위치 무관 ("sodium valproate" == "valproate sodium")
+   - 한글: 끝에 붙은 접미어를 반복 제거 (남는 길이가 2글자 미만이면 제거하지 않음)
+   - 남는 것이 염 단어나 음이온("carbonate", "탄산", "염화" ...) 뿐이면 짝이온이 곧 활성 성분이므로
+     제거하지 않는다 (탄산칼슘 != 탄산마그네슘, 염화칼륨 != 염화나트륨)
+4. 공백/기호 제거
+"""
+import re
+
+# 긴 것부터 비교해야 "브롬화수소산염" 이 "산염" 류보다 먼저 잘린다
+KR_HYDRATE_SUFFIXES = sorted([
+    '수화물', '일수화물', '이수화물', '삼수화물', '오수화물', '육수화물', '칠수화물', '반수화물', '무수물',
+], key=len, reverse=True)
+
+KR_SALT_SUFFIXES = sorted([
+    '염산염', '황산염', '질산염', '인산염', '초산염', '아세트산염', '구연산염', '시트르산염',
+    '옥살산염', '말레산염', '푸마르산염', '숙신산염', '타르타르산염', '주석산염',
+    '베실산염', '메실산염', '토실산염', '브롬화수소산염', '브롬화물', '염화물',
+    '나트륨', '칼륨', '칼슘', '마그네슘',
+], key=len, reverse=True)
+
+# 짝이온과 만나 염을 이루는 음이온 어간 - 이것만 남으면 짝이온을 떼지 않는다
+KR_ANION_STEMS = frozenset([
+    '탄산', '탄산수소', '염화', '브롬화', '요오드화', '불화', '황산', '인산', '질산',
+    '산화', '수산화', '구연산', '시트르산', '초산', '아세트산', '글루콘산', '젖산', '락트산',
+    '아스파르트산', '규산', '삼규산', '글리세로인산',
+])
+
+EN_HYDRATE_WORDS = frozenset([
+    'hydrate', 'monohydrate', 'dihydrate', 'trihydrate', 'pentahydrate', 'hexahydrate', 'heptahydrate',
+    'hemihydrate', 'sesquihydrate', 'anhydrous',
+])
+
+EN_SALT_WORDS = frozenset([
+    'hydrochloride', 'hcl', 'dihydrochloride', 'hydrobromide', 'hbr',
+    'sulfate', 'sulphate', 'bisulfate', 'nitrate', 'phosphate', 'acetate',
+    'citrate', 'oxalate', 'maleate', 'fumarate', 'succinate', 'tartrate', 'bitartrate',
+    'besylate', 'besilate', 'mesylate', 'mesilate', 'tosylate', 'tosilate',
+    'bromide', 'chloride', 'sodium', 'potassium', 'calcium', 'magnesium',
+])
+
+# 영문 음이온 단어 (염 단어 외) - 염기 없이 이것과 짝이온만 있으면 그대로 둔다
+EN_ANION_WORDS = frozenset([
+    'carbonate', 'bicarbonate', 'hydrogencarbonate', 'hydroxide', 'oxide', 'iodide', 'fluoride',
+    'gluconate', 'lactate', 'aspartate', 'silicate', 'trisilicate', 'glycerophosphate',
+])
+
+NORMALIZED_NAME_MAX_LENGTH = 200
+
+_PARENTHESES = re.compile(r'\([^)]*\)|\[[^\]]*\]')
+_EN_WORD = re.compile(r'[a-z0-9]+')
+_NON_WORD = re.compile(r'[^0-9a-z가-힣]')
+
+
+def _strip_kr_suffixes(name: str, suffixes, min_length: int) -> str:
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in suffixes:
+            if name.endswith(suffix) and len(name) - len(suffix) >= min_length:
+                name = name[:-len(suffix)].rstrip()
+                stripped = True
+                break
+    return name
+
+
+def strip_kr_salt(name: str, min_length: int = 2) -> str:
+    """한글 성분명 끝의 수화물 접미어와 (활성 염기가 남을 때만) 염/짝이온 접미어 반복 제거"""
+    name = _strip_kr_suffixes(name, KR_HYDRATE_SUFFIXES, min_length)
+    base = _strip_kr_suffixes(name, KR_SALT_SUFFIXES, min_length)
+    # 음이온 어간만 남으면 짝이온이 곧 성분 (예: 탄산칼슘)
+    if base in KR_ANION_STEMS:
+        return name
+    return base
+
+
+def normalize_ingredient_name(name: str) -> str:
+    """성분명 정규화 키 (한글/영문 공통)"""
+    if not name:
+        return ''
+
+    text = _PARENTHESES.sub(' ', name).lower().strip()
+
+    words = _EN_WORD.findall(text) if text.isascii() else None
+    if words:
+        words = [word for word in words if word not in EN_HYDRATE_WORDS] or words
+        base = [word for word in words if word not in EN_SALT_WORDS and word not in EN_ANION_WORDS]
+        # 염/음이온 단어뿐이면 (예: "sodium chloride", "calcium carbonate") 그대로 둔다
+        text = ''.join(base or words)
+    else:
+        text = strip_kr_salt(_NON_WORD.sub('', text))
+
+    return _NON_WORD.sub('', text)[:NORMALIZED_NAME_MAX_LENGTH]
@@ -1,9 +1,14 @@
+import hashlib
+import json
 import random
 import string
+from decimal import Decimal
 
 from django.core.exceptions import ValidationError
 from django.db import models
 
+from common.hangul import to_chosung, to_jamo
+
 class BaseModel(models.Model):
     """공통 필드를 포함하는 추상 모델"""
     created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일')
@@ -27,3 +32,74 @@ class CodeGeneratorMixin:
                 return code
 
         raise ValidationError(f"고유한 {field_name} 생성에 실패했습니다.")
+
+
+class HangulSearchKeyMixin:
+    """
+    이름 필드의 초성/자모 검색키를 저장 시 함께 갱신하는 믹스인
+    search_key_fields = {원본 필드: (초성 필드, 자모 필드)}
+    """
+    search_key_fields = {}
+
+    def refresh_search_keys(self):
+        for source, (chosung_field, jamo_field) in self.search_key_fields.items():
+            value = getattr(self, source) or ''
+            setattr(self, chosung_field, to_chosung(value))
+            setattr(self, jamo_field, to_jamo(value))
+
+    def save(self, *args, **kwargs):
+        self.refresh_search_keys()
+
+        # update_or_create 등 update_fields 지정 저장 시 검색키도 함께 저장
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            extra_fields = [
+                field
+                for source, key_fields in self.search_key_fields.items()
+                if source in update_fields
+                for field in key_fields
+            ]
+            kwargs['update_fields'] = [*update_fields, *extra_fields]
+
+        super().save(*args, **kwargs)
+
+
+FINGERPRINT_LENGTH = 32
+
+
+def _fingerprint_value(value):
+    """지문 계산용 정규화 (Decimal 은 뒤 0 제거, 날짜는 ISO 문자열)"""
+    if isinstance(value, Decimal):
+        return format(value.normalize(), 'f')
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+class ContentFingerprintMixin:
+    """
+    원본 데이터 필드의 정규화 값으로 내용 지문(content_hash)을 저장 시 함께 갱신하는 믹스인
+    fingerprint_fields = (원본 필드, ...)  # 검색키 등 파생 필드와 기준일자/수정일시는 제외
+    재임포트 시 지문만 비교해 바뀐 행만 쓴다 (common.bulk_upsert).
+    """
+    fingerprint_fields = ()
+
+    def compute_fingerprint(self):
+        values = [
+            _fingerprint_value(field.to_python(getattr(self, field.attname)))
+            for field in (self._meta.get_field(name) for name in self.fingerprint_fields)
+        ]
+        payload = json.dumps(values, ensure_ascii=False, sort_keys=True, separators=(',', ':'), default=str)
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=FINGERPRINT_LENGTH // 2).hexdigest()
+
+    def refresh_fingerprint(self):
+        self.content_hash = self.compute_fingerprint()
+
+    def save(self, *args, **kwargs):
+        self.refresh_fingerprint()
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and 'content_hash' not in update_fields:
+            kwargs['update_fields'] = [*update_fields, 'content_hash']
+
+        super().save(*args, **kwargs)
@@ -1,8 +1,115 @@
 # common/pagination.py
+import base64
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.db.models import Q
 from rest_framework.pagination import PageNumberPagination
 
+# 검색 결과 건수는 이 값까지만 센다 (그 이상은 "1000+" 로 표시)
+SEARCH_TOTAL_COUNT_CAP = 1000
+
+# 검색 API limit/offset 범위 (offset 은 깊은 페이지 OFFSET 스캔 방지 - 더 넘기려면 cursor 사용)
+MAX_SEARCH_LIMIT = 100
+MAX_SEARCH_OFFSET = 1000
+
 
 class StandardResultsSetPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = 'page_size'
-    max_page_size = 100
\ No newline at end of file
+    max_page_size = 100
+
+
+def bounded_int_param(value: Optional[str], default: int, minimum: int, maximum: int, name: str) -> int:
+    """
+    쿼리 파라미터 정수 변환 후 [minimum, maximum] 으로 제한
+    정수가 아니면 ValueError (뷰에서 400 으로 응답)
+    """
+    if value is None or value == '':
+        return default
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise ValueError(f'{name} 은(는) 정수여야 합니다: {value}')
+    return max(minimum, min(number, maximum))
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 값 목록 -> 커서 토큰"""
+    raw = json.dumps(values, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: str) -> List[Any]:
+    """커서 토큰 -> 정렬 키 값 목록 (형식이 틀리면 ValueError)"""
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, UnicodeError) as e:
+        raise ValueError(f'잘못된 커서입니다: {token}') from e
+    if not isinstance(values, list):
+        raise ValueError(f'잘못된 커서입니다: {token}')
+    return values
+
+
+def keyset_filter(ordering: List[str], values: List[Any]) -> Q:
+    """
+    정렬 키 기준 "마지막 항목 다음" 조건
+    (a, b, pk) > (va, vb, vpk) -> a > va OR (a = va AND b > vb) OR (a = va AND b = vb AND pk > vpk)
+    """
+    if len(ordering) != len(values):
+        raise ValueError('커서와 정렬 조건이 맞지 않습니다.')
+
+    condition = Q()
+    equal = Q()
+    for field, value in zip(ordering, values):
+        name = field.lstrip('-')
+        lookup = 'lt' if field.startswith('-') else 'gt'
+        condition |= equal & Q(**{f'{name}__{lookup}': value})
+        equal &= Q(**{name: value})
+    return condition
+
+
+def paginate_search(
+    queryset,
+    ordering: List[str],
+    limit: int,
+    offset: int = 0,
+    cursor: Optional[str] = None,
+    with_total: bool = False,
+    total_cap: int = SEARCH_TOTAL_COUNT_CAP
+) -> Tuple[list, Dict[str, Any]]:
+    """
+    count() 없는 검색 페이지네이션
+    - limit + 1 개를 가져와 다음 페이지 여부(has_more) 판단
+    - cursor 가 있으면 OFFSET 대신 정렬 키 조건(keyset)으로 이어서 조회
+    - with_total 이면 total_cap 까지만 센 건수를 함께 반환
+    정렬 키는 null 이 없어야 하며, 마지막에 pk 를 붙여 순서를 고정한다.
+    """
+    if ordering[-1].lstrip('-') != 'pk':
+        ordering = [*ordering, 'pk']
+    queryset = queryset.order_by(*ordering)
+
+    if cursor:
+        page = queryset.filter(keyset_filter(ordering, decode_cursor(cursor)))[:limit + 1]
+    else:
+        page = queryset[offset:offset + limit + 1]
+
+    items = list(page)
+    has_more = len(items) > limit
+    items = items[:limit]
+
+    meta = {
+        'has_more': has_more,
+        'next_offset': offset + len(items) if has_more and not cursor else None,
+        'next_cursor': encode_cursor([
+            getattr(items[-1], field.lstrip('-')) for field in ordering
+        ]) if has_more else None,
+    }
+
+    if with_total:
+        counted = queryset[:total_cap + 1].count()
+        meta['total_count'] = min(counted, total_cap)
+        meta['total_count_capped'] = counted > total_cap
+
+    return items, meta
@@ -0,0 +1,221 @@
+# common/public_data.py
+"""
+공공데이터포털 API 페이지 병렬 수집기
+
+임포트 스크립트(병원/질병/의약품)가 페이지를 한 장씩 sleep 하며 받던 것을
+- 스레드 풀로 동시에 요청하고 (동시 요청 수 max_workers 로 제한)
+- 토큰 버킷으로 초당 요청 수를 API 할당량 이하로 맞추며
+- 스레드별 keep-alive 세션(연결 재사용)으로 보내고
+- 연결 오류/타임아웃/429/5xx 는 지수 백오프 + 지터로 재시도한다.
+
+HTTP 요청만 작업 스레드에서 하고 XML 파싱과 DB 저장은 호출 스레드에서 하므로
+임포터의 통계/트랜잭션 코드는 그대로 쓸 수 있다.
+"""
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Collection, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_WORKERS = 4
+# 초당 요청 수 (공공데이터포털 운영 계정 트래픽 기준보다 낮게)
+DEFAULT_RATE = 10.0
+DEFAULT_TIMEOUT = 30
+DEFAULT_RETRIES = 3
+DEFAULT_BACKOFF = 0.5
+MAX_BACKOFF = 30.0
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class TokenBucket:
+    """
+    스레드 안전 토큰 버킷
+    초당 rate 개씩 채워지고 최대 capacity 개까지 모아 둘 수 있다 (순간 동시 요청 허용량).
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError('rate 는 0보다 커야 합니다.')
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """토큰 하나를 얻을 때까지 대기, 기다린 시간(초) 반환"""
+        waited = 0.0
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class PageResult(NamedTuple):
+    """fetch_pages 결과 한 페이지"""
+    query: Hashable
+    page_no: int
+    items: Optional[List[Any]]
+    total_count: int
+    error: Optional[str]
+
+
+class PublicDataFetcher:
+    """
+    공공데이터포털 XML API 수집기
+    parse(query, body) 는 임포터의 parse_xml_response 와 같은 (items, total_count, error) 를 반환한다.
+    body 는 응답 바이트 그대로 (XML 선언의 인코딩으로 파서가 디코딩)
+    """
+
+    def __init__(self, base_url: str, max_workers: int = DEFAULT_MAX_WORKERS, rate: float = DEFAULT_RATE,
+                 timeout: float = DEFAULT_TIMEOUT, retries: int = DEFAULT_RETRIES,
+                 backoff: float = DEFAULT_BACKOFF, verify: bool = True, headers: Optional[Dict[str, str]] = None):
+        self.base_url = base_url
+        self.max_workers = max(1, max_workers)
+        self.bucket = TokenBucket(rate, capacity=min(rate, self.max_workers) if rate >= 1 else 1)
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.verify = verify
+        self.headers = headers or {}
+        self.local = threading.local()
+        self.sessions = []
+        self.sessions_lock = threading.Lock()
+        self.stats = {'requests': 0, 'retries': 0, 'failures': 0, 'throttled_seconds': 0.0}
+        self.stats_lock = threading.Lock()
+
+    def _count(self, key: str, value=1):
+        with self.stats_lock:
+            self.stats[key] += value
+
+    def session(self) -> requests.Session:
+        """스레드별 keep-alive 세션"""
+        session = getattr(self.local, 'session', None)
+        if session is None:
+            session = requests.Session()
+            session.verify = self.verify
+            session.headers.update(self.headers)
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=1, max_retries=0)
+            session.mount('http://', adapter)
+            session.mount('https://', adapter)
+            self.local.session = session
+            with self.sessions_lock:
+                self.sessions.append(session)
+        return session
+
+    def _retry_delay(self, attempt: int, response: Optional[requests.Response]) -> float:
+        """지수 백오프 + full jitter (429 의 Retry-After 가 있으면 그 이상)"""
+        delay = random.uniform(0, min(MAX_BACKOFF, self.backoff * 2 ** attempt))
+        if response is not None and response.headers.get('Retry-After', '').isdigit():
+            delay = max(delay, float(response.headers['Retry-After']))
+        return delay
+
+    def get(self, params: Dict[str, Any]) -> bytes:
+        """GET 한 번 (할당량 대기 + 재시도) 응답 본문, 최종 실패 시 requests 예외"""
+        attempt = 0
+        while True:
+            self._count('throttled_seconds', self.bucket.acquire())
+            self._count('requests')
+            response = None
+            try:
+                response = self.session().get(self.base_url, params=params, timeout=self.timeout)
+                if response.status_code not in RETRY_STATUS_CODES:
+                    response.raise_for_status()
+                    return response.content
+                error = requests.exceptions.HTTPError(f'HTTP {response.status_code}', response=response)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                error = e
+
+            if attempt >= self.retries:
+                self._count('failures')
+                raise error
+            delay = self._retry_delay(attempt, response)
+            logger.warning(f"API 재시도 {attempt + 1}/{self.retries} ({delay:.1f}초 후): {error}")
+            self._count('retries')
+            time.sleep(delay)
+            attempt += 1
+
+    def fetch_pages(self, queries: Iterable[Hashable],
+                    build_params: Callable[[Hashable, int, int], Dict[str, Any]],
+                    parse: Callable[[Hashable, bytes], Tuple[Optional[List[Any]], int, Optional[str]]],
+                    num_of_rows: int,
+                    completed: Optional[Dict[Hashable, Tuple[int, Collection[int]]]] = None) -> Iterator[PageResult]:
+        """
+        검색 조건(query)별 전체 페이지 수집 (완료 순서대로 반환)
+        모든 조건의 1페이지를 먼저 요청하고, 1페이지의 totalCount 로 나머지 페이지를 이어서 요청한다.
+        completed: 이어받을 조건별 (totalCount, 이미 처리한 페이지 번호) - 그 페이지는 요청하지 않는다.
+        """
+        completed = completed or {}
+        queue = deque()
+        for query in queries:
+            total_count, done_pages = completed.get(query, (None, ()))
+            if 1 in done_pages:
+                total_pages = (total_count + num_of_rows - 1) // num_of_rows
+                queue.extend((query, page_no) for page_no in range(2, total_pages + 1) if page_no not in done_pages)
+            else:
+                queue.append((query, 1))
+        pending = {}
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix='public-data')
+        try:
+            while queue or pending:
+                # 결과를 처리하는 속도보다 많이 받아 두지 않도록 대기열 제한
+                while queue and len(pending) < self.max_workers * 2:
+                    query, page_no = queue.popleft()
+                    future = executor.submit(self.get, build_params(query, page_no, num_of_rows))
+                    pending[future] = (query, page_no)
+
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    query, page_no = pending.pop(future)
+                    try:
+                        body = future.result()
+                    except requests.exceptions.RequestException as e:
+                        logger.error(f"API 호출 실패 ({query}, 페이지 {page_no}): {e}")
+                        yield PageResult(query, page_no, None, 0, f"API 호출 실패: {e}")
+                        continue
+
+                    items, total_count, error = parse(query, body)
+                    if page_no == 1 and not error:
+                        total_pages = (total_count + num_of_rows - 1) // num_of_rows
+                        done_pages = completed.get(query, (None, ()))[1]
+                        queue.extend(
+                            (query, next_page) for next_page in range(2, total_pages + 1) if next_page not in done_pages
+                        )
+                    yield PageResult(query, page_no, items, total_count, error)
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def close(self):
+        with self.sessions_lock:
+            for session in self.sessions:
+                session.close()
+            self.sessions.clear()
+
+
+def add_fetcher_arguments(parser, base_url: bool = True):
+    """임포트 스크립트 공통 인자 (--workers, --rate, --delay, --base-url)"""
+    parser.add_argument('--workers', type=int, default=DEFAULT_MAX_WORKERS, help='동시 요청 수')
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help='초당 최대 요청 수 (API 할당량)')
+    parser.add_argument('--delay', type=float, help='API 호출 간 최소 간격(초) - 지정하면 --rate 대신 1/delay')
+    if base_url:
+        parser.add_argument('--base-url', type=str, help='API 주소 변경 (mock_public_data_server 등)')
+
+
+def fetcher_options(args) -> Dict[str, Any]:
+    """add_fetcher_arguments 로 받은 인자 -> PublicDataFetcher 키워드 인자"""
+    rate = 1 / args.delay if args.delay else args.rate
+    return {'max_workers': args.workers, 'rate': rate}
@@ -0,0 +1,169 @@
+# common/reference_cache.py
+"""
+참조 데이터 2단 읽기 캐시 (프로세스 LRU -> 공유 캐시 -> DB)
+
+- 1단: 프로세스 메모리 LRU (네트워크 왕복 없음)
+- 2단: Django 캐시 백엔드 (settings.CACHES 의 REFERENCE_CACHE_ALIAS, 워커 간 공유)
+- 키에 ReferenceDataVersion 세대 번호를 넣으므로 임포트가 세대를 올리면
+  이전 세대 항목은 한꺼번에 무효화된다 (공유 캐시의 옛 키는 만료로 정리).
+
+세대 번호는 VersionedIndexHolder 와 같이 VERSION_CHECK_INTERVAL 마다만 확인한다.
+공유 캐시 장애(연결 실패, redis 패키지 없음 등) 시에는 한 번만 로그를 남기고
+SHARED_RETRY_INTERVAL 동안 2단을 건너뛰어 (조회마다 소켓 타임아웃을 기다리지 않도록) DB 조회로 대체한다.
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+from django.core.cache import caches
+
+from common.autocomplete import VERSION_CHECK_INTERVAL
+
+logger = logging.getLogger(__name__)
+
+REFERENCE_CACHE_ALIAS = 'reference'
+DEFAULT_LOCAL_SIZE = 2048
+# 세대가 바뀌면 키가 달라지므로 만료는 옛 키 정리용
+DEFAULT_TIMEOUT = 60 * 60 * 24
+# 공유 캐시 장애 후 다시 시도하기까지 (초)
+SHARED_RETRY_INTERVAL = 60
+
+# 캐시 별칭 -> 2단을 다시 시도할 시각 (같은 백엔드를 쓰는 캐시끼리 공유)
+_shared_disabled_until: Dict[str, float] = {}
+_shared_lock = threading.Lock()
+
+_MISSING = object()
+
+
+class LruCache:
+    """스레드 안전 LRU (OrderedDict 순서 = 최근 사용 순)"""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.items = OrderedDict()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.items)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self.lock:
+            value = self.items.get(key, _MISSING)
+            if value is _MISSING:
+                return default
+            self.items.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self.lock:
+            self.items[key] = value
+            self.items.move_to_end(key)
+            if len(self.items) > self.maxsize:
+                self.items.popitem(last=False)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.items.clear()
+
+
+class ReferenceCache:
+    """
+    읽기 전용 참조 데이터 조회 캐시
+    loader(key) 는 직렬화 가능한 값(포맷팅된 dict 등)을 반환하고, 없으면 예외(DoesNotExist 등)를 던진다.
+    예외는 캐시하지 않는다.
+    """
+
+    def __init__(self, name: str, generation_name: str, loader: Callable[[Any], Any],
+                 generation_getter: Callable[[str], int], local_size: int = DEFAULT_LOCAL_SIZE,
+                 timeout: int = DEFAULT_TIMEOUT, cache_alias: str = REFERENCE_CACHE_ALIAS):
+        self.name = name
+        self.generation_name = generation_name
+        self.loader = loader
+        self.generation_getter = generation_getter
+        self.timeout = timeout
+        self.cache_alias = cache_alias
+        self.local = LruCache(local_size)
+        self.generation = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+        self.stats = {'local_hits': 0, 'shared_hits': 0, 'misses': 0, 'shared_errors': 0}
+
+    def current_generation(self) -> int:
+        if self.generation is None or time.monotonic() - self.checked_at > VERSION_CHECK_INTERVAL:
+            with self.lock:
+                if self.generation is None or time.monotonic() - self.checked_at > VERSION_CHECK_INTERVAL:
+                    generation = self.generation_getter(self.generation_name)
+                    if generation != self.generation:
+                        self.local.clear()
+                        self.generation = generation
+                    self.checked_at = time.monotonic()
+        return self.generation
+
+    def shared_key(self, generation: int, key: Any) -> str:
+        return f'ref:{self.name}:{generation}:{key}'
+
+    def shared_available(self) -> bool:
+        return time.monotonic() >= _shared_disabled_until.get(self.cache_alias, 0.0)
+
+    def disable_shared(self, error: Exception) -> None:
+        """공유 캐시 장애 - SHARED_RETRY_INTERVAL 동안 2단을 끄고 처음 한 번만 로그"""
+        self.stats['shared_errors'] += 1
+        with _shared_lock:
+            if not self.shared_available():
+                return
+            _shared_disabled_until[self.cache_alias] = time.monotonic() + SHARED_RETRY_INTERVAL
+        logger.error(
+            f"공유 캐시({self.cache_alias}) 장애, {SHARED_RETRY_INTERVAL}초 동안 DB 조회로 대체합니다: "
+            f"{type(error).__name__}: {error}"
+        )
+
+    def get(self, key: Any) -> Any:
+        generation = self.current_generation()
+
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            self.stats['local_hits'] += 1
+            return value
+
+        shared_key = self.shared_key(generation, key)
+        value = _MISSING
+        if self.shared_available():
+            try:
+                value = caches[self.cache_alias].get(shared_key, _MISSING)
+            except Exception as e:
+                self.disable_shared(e)
+
+        if value is not _MISSING:
+            self.stats['shared_hits'] += 1
+        else:
+            self.stats['misses'] += 1
+            value = self.loader(key)
+            if self.shared_available():
+                try:
+                    caches[self.cache_alias].set(shared_key, value, self.timeout)
+                except Exception as e:
+                    self.disable_shared(e)
+
+        self.local.set(key, value)
+        return value
+
+    def invalidate(self) -> None:
+        """다음 조회 시 세대를 즉시 확인하도록 표시"""
+        self.checked_at = 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """프로세스 단위 적중률 (local/shared 적중 합 / 전체 조회)"""
+        stats = dict(self.stats)
+        lookups = stats['local_hits'] + stats['shared_hits'] + stats['misses']
+        stats.update({
+            'name': self.name,
+            'generation': self.generation,
+            'shared_available': self.shared_available(),
+            'local_size': len(self.local),
+            'lookups': lookups,
+            'hit_rate': round((stats['local_hits'] + stats['shared_hits']) / lookups, 4) if lookups else None,
+            'local_hit_rate': round(stats['local_hits'] / lookups, 4) if lookups else None,
+        })
+        return stats
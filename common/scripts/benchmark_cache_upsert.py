@@ -0,0 +1,135 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+병원/질병 캐시 저장 방식 벤치마크 (행마다 update_or_create vs 페이지 단위 bulk upsert)
+
+mock_public_data_server 와 같은 형식의 가상 응답 --rows 건을 임포터의 process_batch 로
+--batch-size 페이지씩 저장하고, 다음 세 번의 실행을 저장 방식별로 측정한다.
+- 최초: 모든 행 생성
+- 재실행: 내용이 같은 행 (bulk 는 쓰지 않음)
+- 변경: 이름이 바뀐 행
+가상 행의 코드는 BENCH 로 시작하며 측정 전후에 삭제한다.
+
+사용법:
+python benchmark_cache_upsert.py
+python benchmark_cache_upsert.py --rows 20000 --batch-size 500 --target disease
+"""
+
+import os
+import sys
+import time
+import django
+import logging
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from django.db import connection
+
+from mock_public_data_server import disease_item, hospital_item
+from populate_disease_cache import DiseaseDataImporter
+from populate_hospital_cache import HospitalDataImporter
+from user.models import DiseaseCache, HospitalCache
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+CODE_PREFIX = 'BENCH'
+
+
+def hospital_rows(importer, count, name_suffix=''):
+    """임포터가 파싱한 것과 같은 형식의 가상 병원 데이터"""
+    rows = []
+    for index in range(count):
+        values = hospital_item(index)
+        values.update({'ykiho': f'{CODE_PREFIX}{index:08d}', 'clCd': '21', 'clCdNm': '병원'})
+        values['yadmNm'] += name_suffix
+        rows.append(importer.extract_hospital_data(values))
+    return rows
+
+
+def disease_rows(importer, count, name_suffix=''):
+    """임포터가 파싱한 것과 같은 형식의 가상 질병 데이터"""
+    rows = []
+    for index in range(count):
+        values = disease_item('Z', index)
+        values.update({'sickCd': f'{CODE_PREFIX}{index:06d}'})
+        values['sickNm'] += name_suffix
+        rows.append(importer.extract_disease_data(values))
+    return rows
+
+
+TARGETS = {
+    'hospital': (HospitalCache, 'hospital_code', lambda mode: HospitalDataImporter('BENCH', ['21'], write_mode=mode),
+                 hospital_rows),
+    'disease': (DiseaseCache, 'disease_code', lambda mode: DiseaseDataImporter('BENCH', write_mode=mode),
+                disease_rows),
+}
+
+
+def run_pass(importer, rows, batch_size):
+    """process_batch 를 페이지 단위로 호출, (초, 쿼리 수) 반환"""
+    query_count = 0
+
+    def count_query(execute, sql, params, many, context):
+        nonlocal query_count
+        query_count += 1
+        return execute(sql, params, many, context)
+
+    with connection.execute_wrapper(count_query):
+        started = time.perf_counter()
+        for start in range(0, len(rows), batch_size):
+            importer.process_batch(rows[start:start + batch_size])
+        elapsed = time.perf_counter() - started
+    return elapsed, query_count
+
+
+def benchmark(target, count, batch_size):
+    model, code_field, make_importer, make_rows = TARGETS[target]
+    cleanup = model.objects.filter(**{f'{code_field}__startswith': CODE_PREFIX})
+    results = {}
+
+    for mode in ('row', 'bulk'):
+        cleanup.delete()
+        for label, suffix in (('최초', ''), ('재실행', ''), ('변경', ' 변경')):
+            importer = make_importer(mode)
+            rows = make_rows(importer, count, suffix)
+            elapsed, query_count = run_pass(importer, rows, batch_size)
+            stats = importer.stats
+            results[(mode, label)] = elapsed
+            logger.info(
+                f"[{target}/{mode}] {label}: {count:,}건 {elapsed:.2f}초 ({count / elapsed:,.0f}건/초), "
+                f"쿼리 {query_count:,}회, 생성 {stats['created']:,} / 업데이트 {stats['updated']:,} / "
+                f"변경 없음 {stats['unchanged']:,} / 오류 {stats['errors']:,}"
+            )
+    cleanup.delete()
+
+    for label in ('최초', '재실행', '변경'):
+        logger.info(f"✅ [{target}] {label}: bulk 가 {results[('row', label)] / results[('bulk', label)]:.1f}배 빠름")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='병원/질병 캐시 저장 방식 벤치마크')
+    parser.add_argument('--rows', type=int, default=5000, help='가상 행 수')
+    parser.add_argument('--batch-size', type=int, default=100, help='페이지(배치) 크기')
+    parser.add_argument('--target', choices=['hospital', 'disease', 'all'], default='all', help='측정 대상')
+    args = parser.parse_args()
+
+    for target in (TARGETS if args.target == 'all' else [args.target]):
+        benchmark(target, args.rows, args.batch_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+DUR 병용금기 검사 벤치마크
+
+DB 의 DurContraindication 전체(또는 --synthetic 개수만큼 만든 가상 쌍)로 DurPairIndex 를 만들고,
+금기 목록에 있는 성분 --drugs 개를 무작위로 골라 find_pairs() 한 번의 소요 시간을 측정한다.
+목표: 20개 동시 복용 기준 1ms 미만.
+
+사용법:
+python benchmark_dur_check.py
+python benchmark_dur_check.py --synthetic 300000 --drugs 20 --iterations 5000
+"""
+
+import os
+import sys
+import time
+import random
+import django
+import logging
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from user.services.dur_index import DurPairIndex, build_dur_index
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def synthetic_rows(count, ingredient_count=3000, seed=0):
+    """가상 병용금기 쌍 (성분 ingredient_count 개 사이에서 count 쌍)"""
+    rng = random.Random(seed)
+    codes = [f"{number:04d}" for number in range(ingredient_count)]
+    for _ in range(count):
+        code_a, code_b = rng.sample(codes, 2)
+        yield code_a, f"성분{code_a}", code_b, f"성분{code_b}", '병용금기'
+
+
+def percentile(values, ratio):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * ratio))]
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='DUR 병용금기 검사 벤치마크')
+    parser.add_argument('--synthetic', type=int, default=0, help='DB 대신 가상 쌍 개수로 인덱스 생성')
+    parser.add_argument('--drugs', type=int, default=20, help='동시 복용 성분 수')
+    parser.add_argument('--iterations', type=int, default=2000, help='반복 횟수')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    index = DurPairIndex.build(synthetic_rows(args.synthetic)) if args.synthetic else build_dur_index()
+    logger.info(f"인덱스 빌드: {len(index):,}쌍, 성분 {len(index.code_ids):,}개, "
+                f"{(time.perf_counter() - started) * 1000:.0f}ms")
+
+    codes = list(index.code_ids)
+    if len(codes) < args.drugs:
+        logger.error(f"성분이 {len(codes)}개뿐이라 {args.drugs}개 조합을 만들 수 없습니다")
+        return
+
+    rng = random.Random(1)
+    timings = []
+    found = 0
+    for _ in range(args.iterations):
+        sample = rng.sample(codes, args.drugs)
+        began = time.perf_counter()
+        found += len(index.find_pairs(sample))
+        timings.append((time.perf_counter() - began) * 1_000_000)
+
+    logger.info(
+        f"성분 {args.drugs}개 검사 {args.iterations:,}회: "
+        f"p50 {percentile(timings, 0.5):.1f}µs, p99 {percentile(timings, 0.99):.1f}µs, "
+        f"최대 {max(timings):.1f}µs (평균 금기 쌍 {found / args.iterations:.2f}개)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+모바일 오프라인 참조 데이터 번들 생성 스크립트
+
+의약품/주성분/질병정보를 gzip 압축 열 단위 JSON 번들로 만들고 직전 버전과의 행 단위 패치를 함께 만든다.
+데이터가 바뀌지 않았으면 버전을 올리지 않는다. 의약품/주성분/질병 임포트 스크립트가 끝나면 자동으로 호출된다.
+
+사용법:
+python build_reference_bundle.py
+"""
+
+import os
+import sys
+import time
+import django
+import logging
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from user.services.reference_bundle import build_reference_bundle
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """메인 실행 함수"""
+    logger.info("📱 오프라인 참조 데이터 번들 생성 시작")
+    started = time.monotonic()
+
+    result = build_reference_bundle()
+
+    if not result['created']:
+        logger.info(f"✅ 변경 없음: 현재 버전 v{result['version']} 유지 ({time.monotonic() - started:.1f}초)")
+        return
+
+    patch = f", 패치 {result['patch_size']:,} bytes" if result['patch_size'] else ''
+    logger.info(
+        f"✅ 완료: v{result['version']} 번들 {result['size']:,} bytes{patch} "
+        f"({time.monotonic() - started:.1f}초)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+참조 데이터 mmap 스냅샷 생성 스크립트
+
+의약품/주성분/질병정보 상세를 정렬된 키 + 오프셋 + 문자열 풀 형태의 읽기 전용 파일로 쓴다.
+임시 파일에 쓴 뒤 원자적으로 교체하므로 실행 중인 워커는 기존 파일을 계속 읽다가
+다음 확인 주기에 새 파일을 연다. 의약품/주성분/질병 임포트 스크립트가 끝나면 자동으로 호출된다.
+
+사용법:
+python build_reference_snapshot.py
+python build_reference_snapshot.py --output /srv/ayak/reference.snapshot
+"""
+
+import os
+import sys
+import time
+import argparse
+import django
+import logging
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from user.services.reference_snapshot import build_reference_snapshot
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='참조 데이터 mmap 스냅샷 생성')
+    parser.add_argument('--output', help='스냅샷 파일 경로 (기본값: settings.REFERENCE_SNAPSHOT_PATH)')
+    args = parser.parse_args()
+
+    logger.info("📦 참조 데이터 스냅샷 생성 시작")
+    started = time.monotonic()
+
+    result = build_reference_snapshot(args.output)
+
+    counts = ', '.join(f"{name} {count:,}건" for name, count in result['counts'].items())
+    logger.info(
+        f"✅ 완료: {result['path']} ({result['size']:,} bytes) - {counts} "
+        f"({time.monotonic() - started:.1f}초)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -21,6 +21,7 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
 django.setup()
 
 # 개별 임포터 클래스들 import
+from common.public_data import add_fetcher_arguments, fetcher_options
 from populate_hospital_cache import HospitalDataImporter
 from populate_disease_cache import DiseaseDataImporter
 from user.models import HospitalCache, DiseaseCache
@@ -39,10 +40,12 @@ logger = logging.getLogger(__name__)
 class UnifiedCacheImporter:
     """통합 캐시 데이터 임포터"""
 
-    def __init__(self, api_key, hospital_type_filters=None):
+    def __init__(self, api_key, hospital_type_filters=None, write_mode='bulk', **fetcher_options):
         self.api_key = api_key
-        self.hospital_importer = HospitalDataImporter(api_key, hospital_type_filters)
-        self.disease_importer = DiseaseDataImporter(api_key)
+        self.hospital_importer = HospitalDataImporter(
+            api_key, hospital_type_filters, write_mode=write_mode, **fetcher_options
+        )
+        self.disease_importer = DiseaseDataImporter(api_key, write_mode=write_mode, **fetcher_options)
 
         self.total_stats = {
             'start_time': None,
@@ -52,7 +55,7 @@ class UnifiedCacheImporter:
             'total_errors': 0
         }
 
-    def import_hospital_data(self, batch_size=100, delay_seconds=1, sido_codes=None):
+    def import_hospital_data(self, batch_size=100, sido_codes=None, resume=False):
         """병원 데이터 임포트"""
         logger.info("🏥 병원정보 임포트 시작")
 
@@ -62,8 +65,8 @@ class UnifiedCacheImporter:
 
             self.hospital_importer.import_all_hospitals(
                 batch_size=batch_size,
-                delay_seconds=delay_seconds,
-                sido_codes=sido_codes
+                sido_codes=sido_codes,
+                resume=resume
             )
 
             final_count = HospitalCache.objects.count()
@@ -82,7 +85,7 @@ class UnifiedCacheImporter:
             self.total_stats['total_errors'] += 1
             return False
 
-    def import_disease_data(self, batch_size=100, delay_seconds=1, search_letters=None):
+    def import_disease_data(self, batch_size=100, search_letters=None, resume=False):
         """질병 데이터 임포트 (A-Z 검색)"""
         logger.info("🦠 질병정보 임포트 시작 (A-Z 전체 검색)")
 
@@ -99,7 +102,7 @@ class UnifiedCacheImporter:
 
             self.disease_importer.import_all_diseases(
                 batch_size=batch_size,
-                delay_seconds=delay_seconds
+                resume=resume
             )
 
             final_count = DiseaseCache.objects.count()
@@ -133,8 +136,8 @@ class UnifiedCacheImporter:
             total_tasks += 1
             if self.import_hospital_data(
                     batch_size=kwargs.get('batch_size', 100),
-                    delay_seconds=kwargs.get('delay', 1),
-                    sido_codes=kwargs.get('sido_codes')
+                    sido_codes=kwargs.get('sido_codes'),
+                    resume=kwargs.get('resume', False)
             ):
                 success_count += 1
 
@@ -148,8 +151,8 @@ class UnifiedCacheImporter:
             total_tasks += 1
             if self.import_disease_data(
                     batch_size=kwargs.get('batch_size', 100),
-                    delay_seconds=kwargs.get('delay', 1),
-                    search_letters=kwargs.get('disease_letters')
+                    search_letters=kwargs.get('disease_letters'),
+                    resume=kwargs.get('resume', False)
             ):
                 success_count += 1
         else:
@@ -185,6 +188,7 @@ class UnifiedCacheImporter:
             logger.info(f"   API 수신: {api_stats['total_received']:,}개")
             logger.info(f"   생성: {api_stats['created']:,}개")
             logger.info(f"   업데이트: {api_stats['updated']:,}개")
+            logger.info(f"   변경 없음: {api_stats['unchanged']:,}개")
             logger.info(f"   오류: {api_stats['errors']:,}개")
 
         # 질병 데이터 요약
@@ -199,6 +203,7 @@ class UnifiedCacheImporter:
             logger.info(f"   API 수신: {api_stats['total_received']:,}개")
             logger.info(f"   생성: {api_stats['created']:,}개")
             logger.info(f"   업데이트: {api_stats['updated']:,}개")
+            logger.info(f"   변경 없음: {api_stats['unchanged']:,}개")
             logger.info(f"   오류: {api_stats['errors']:,}개")
 
         # 전체 통계
@@ -237,7 +242,10 @@ def main():
 
     # 공통 옵션
     parser.add_argument('--batch-size', type=int, default=100, help='배치 크기 (최대 1000)')
-    parser.add_argument('--delay', type=float, default=1.0, help='API 호출 간 딜레이(초)')
+    add_fetcher_arguments(parser, base_url=False)
+    parser.add_argument('--write-mode', choices=['bulk', 'row'], default='bulk',
+                        help='저장 방식 (bulk: 페이지 단위 upsert, row: 행마다 update_or_create)')
+    parser.add_argument('--resume', action='store_true', help='중단된 임포트를 체크포인트부터 이어서 수집')
 
     # 병원 데이터 옵션
     parser.add_argument('--skip-hospital', action='store_true', help='병원 데이터 임포트 건너뛰기')
@@ -267,7 +275,9 @@ def main():
         args.batch_size = 1000
 
     # 임포터 생성
-    importer = UnifiedCacheImporter(args.api_key)
+    importer = UnifiedCacheImporter(
+        args.api_key, args.hospital_types, write_mode=args.write_mode, **fetcher_options(args)
+    )
 
     try:
         if args.hospital_only:
@@ -275,8 +285,8 @@ def main():
             logger.info("병원 데이터만 임포트합니다.")
             success = importer.import_hospital_data(
                 batch_size=args.batch_size,
-                delay_seconds=args.delay,
-                sido_codes=args.sido_codes
+                sido_codes=args.sido_codes,
+                resume=args.resume
             )
 
         elif args.disease_only:
@@ -284,20 +294,20 @@ def main():
             logger.info("질병 데이터만 임포트합니다.")
             success = importer.import_disease_data(
                 batch_size=args.batch_size,
-                delay_seconds=args.delay,
-                search_letters=args.disease_letters
+                search_letters=args.disease_letters,
+                resume=args.resume
             )
 
         else:
             # 통합 임포트 실행
             success = importer.run_full_import(
                 batch_size=args.batch_size,
-                delay=args.delay,
                 sido_codes=args.sido_codes if not args.skip_hospital else None,
                 search_letters=args.disease_letters if not args.skip_disease else None,
                 disease_full_import=args.disease_full_import if not args.skip_disease else False,
                 skip_hospital=args.skip_hospital,
-                skip_disease=args.skip_disease
+                skip_disease=args.skip_disease,
+                resume=args.resume
             )
 
         if success:
@@ -0,0 +1,161 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+DUR 병용금기 성분 임포트 스크립트
+
+공공데이터포털 DUR 병용금기 CSV(UTF-8 또는 CP949)를 읽어 DurContraindication 테이블을 통째로 교체한다.
+성분 코드는 일반명코드 앞 4자리(주성분)로 정규화하고, 같은 성분 쌍이 여러 제품/제형으로 반복되면 한 행만 남긴다.
+
+사용법:
+python import_dur_contraindications.py --file "DUR병용금기.csv"
+"""
+
+import os
+import sys
+import csv
+import django
+import logging
+import argparse
+from datetime import datetime
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from django.db import transaction
+from user.models import DurContraindication, ReferenceDataVersion
+from user.services.ingredient_lookup import DurCodeResolver
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+# 배포본마다 헤더명이 조금씩 달라 후보 중 먼저 있는 컬럼을 사용
+DUR_COLUMNS = {
+    'code_a': ('일반명코드A', '성분코드A', '성분코드1', 'INGR_CODE_A'),
+    'name_a': ('성분명A', '성분명1', 'INGR_NAME_A'),
+    'code_b': ('일반명코드B', '성분코드B', '성분코드2', 'INGR_CODE_B'),
+    'name_b': ('성분명B', '성분명2', 'INGR_NAME_B'),
+    'reason': ('금기내용', '상세정보', '금기사유', 'PROHBT_CONTENT'),
+    'notice_date': ('고시일자', 'NOTIFICATION_DATE'),
+}
+ENCODINGS = ('utf-8-sig', 'cp949')
+
+
+class DurContraindicationImporter:
+    """DUR 병용금기 임포터"""
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.stats = {
+            'rows_read': 0,
+            'skipped': 0,
+            'duplicates': 0,
+            'imported': 0,
+        }
+        self.code_resolver = DurCodeResolver()
+
+    def read_rows(self, file_path):
+        """CSV 행 읽기 (인코딩 자동 선택)"""
+        for encoding in ENCODINGS:
+            try:
+                with open(file_path, encoding=encoding, newline='') as f:
+                    return list(csv.DictReader(f))
+            except UnicodeDecodeError:
+                logger.debug(f"{encoding} 디코딩 실패, 다음 인코딩 시도")
+        raise ValueError(f"지원하지 않는 인코딩입니다: {file_path}")
+
+    def resolve_columns(self, header):
+        columns = {}
+        for field, candidates in DUR_COLUMNS.items():
+            columns[field] = next((name for name in candidates if name in header), None)
+        missing = [field for field in ('code_a', 'code_b') if not columns[field]]
+        if missing:
+            raise ValueError(f"필수 컬럼을 찾을 수 없습니다: {missing} (헤더: {list(header)})")
+        return columns
+
+    def parse_date(self, value):
+        value = (value or '').strip().replace('-', '').replace('.', '')
+        try:
+            return datetime.strptime(value[:8], '%Y%m%d').date()
+        except ValueError:
+            return None
+
+    def build_records(self, rows):
+        if not rows:
+            return []
+        columns = self.resolve_columns(rows[0].keys())
+
+        def value(row, field):
+            return (row.get(columns[field]) or '').strip() if columns[field] else ''
+
+        records = {}
+        for row in rows:
+            self.stats['rows_read'] += 1
+            code_a = self.code_resolver.resolve(value(row, 'code_a'), value(row, 'name_a'))
+            code_b = self.code_resolver.resolve(value(row, 'code_b'), value(row, 'name_b'))
+            if not code_a or not code_b or code_a == code_b:
+                self.stats['skipped'] += 1
+                continue
+
+            name_a, name_b = value(row, 'name_a'), value(row, 'name_b')
+            if code_a > code_b:
+                code_a, code_b, name_a, name_b = code_b, code_a, name_b, name_a
+
+            if (code_a, code_b) in records:
+                self.stats['duplicates'] += 1
+                continue
+
+            records[(code_a, code_b)] = DurContraindication(
+                ingredient_code_a=code_a,
+                ingredient_name_a=name_a[:200],
+                ingredient_code_b=code_b,
+                ingredient_name_b=name_b[:200],
+                reason=value(row, 'reason'),
+                notice_date=self.parse_date(value(row, 'notice_date')),
+            )
+        return list(records.values())
+
+    def import_file(self, file_path):
+        logger.info(f"💊 DUR 병용금기 임포트 시작: {file_path}")
+        records = self.build_records(self.read_rows(file_path))
+        resolver = self.code_resolver
+        if resolver.mapped or resolver.unmapped:
+            logger.info(f"DUR성분코드 변환: 성분명으로 일반명코드 매칭 {resolver.mapped:,}건, 매칭 실패(건너뜀) {resolver.unmapped:,}건")
+
+        with transaction.atomic():
+            DurContraindication.objects.all().delete()
+            DurContraindication.objects.bulk_create(records, batch_size=self.batch_size)
+            generation = ReferenceDataVersion.bump(ReferenceDataVersion.DUR_CONTRAINDICATION)
+
+        self.stats['imported'] = len(records)
+        logger.info(f"✅ 완료 (세대 {generation})")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='DUR 병용금기 성분 임포트 스크립트')
+    parser.add_argument('--file', type=str, required=True, help='DUR 병용금기 CSV 파일 경로')
+    parser.add_argument('--batch-size', type=int, default=1000, help='배치 크기')
+    args = parser.parse_args()
+
+    importer = DurContraindicationImporter(batch_size=args.batch_size)
+    importer.import_file(args.file)
+
+    stats = importer.stats
+    logger.info(
+        f"읽음: {stats['rows_read']:,}행, 건너뜀: {stats['skipped']:,}행, "
+        f"중복 쌍: {stats['duplicates']:,}행, 저장: {stats['imported']:,}쌍"
+    )
+
+
+if __name__ == "__main__":
+    main()
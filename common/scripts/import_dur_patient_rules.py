@@ -0,0 +1,208 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+DUR 환자 특성 규칙(연령금기/임부금기/노인주의) 임포트 스크립트
+
+공공데이터포털 DUR 성분 CSV(UTF-8 또는 CP949)를 읽어 해당 유형의 DurPatientRule 을 통째로 교체하고,
+복용 중인 약이 있는 전체 사용자의 경고(PatientDurAlert)를 사용자 묶음 단위로 다시 평가한다.
+성분 코드는 일반명코드 앞 4자리로 정규화하며, 같은 유형에서 성분이 반복되면 첫 행만 사용한다.
+DUR성분코드(D000027 등)만 있는 파일은 성분명으로 일반명코드를 찾고, 찾지 못한 행은 건너뛴다.
+
+- 연령금기: 특정연령 + 특정연령단위("세 미만", "개월 미만", "세 이하", "세 이상" 등)로 나이 구간 계산
+- 노인주의: 65세 이상
+- 임부금기: 가임기(15~49세) 여성
+
+사용법:
+python import_dur_patient_rules.py --type age --file "DUR연령금기.csv"
+python import_dur_patient_rules.py --type pregnancy --file "DUR임부금기.csv"
+python import_dur_patient_rules.py --type elderly --file "DUR노인주의.csv"
+"""
+
+import os
+import re
+import sys
+import csv
+import django
+import logging
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from django.db import transaction
+from bokyak.models import UserActiveIngredient
+from bokyak.services.patient_dur_service import FEMALE, PatientDurService
+from user.models import DurPatientRule
+from user.services.ingredient_lookup import DurCodeResolver
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+RULE_TYPES = {
+    'age': DurPatientRule.RuleType.AGE,
+    'pregnancy': DurPatientRule.RuleType.PREGNANCY,
+    'elderly': DurPatientRule.RuleType.ELDERLY,
+}
+
+ELDERLY_MIN_AGE_MONTHS = 65 * 12
+CHILDBEARING_AGE_MONTHS = (15 * 12, 50 * 12)
+
+# 배포본마다 헤더명이 조금씩 달라 후보 중 먼저 있는 컬럼을 사용
+DUR_RULE_COLUMNS = {
+    'code': ('일반명코드', '성분코드', 'INGR_CODE', 'DUR성분코드'),
+    'name': ('성분명', 'INGR_NAME', 'DUR성분명'),
+    'age': ('특정연령', 'AGE_BASE'),
+    'age_unit': ('특정연령단위', 'AGE_UNIT'),
+    'grade': ('금기등급', '등급', 'GRADE'),
+    'reason': ('금기내용', '상세정보', '금기사유', 'PROHBT_CONTENT'),
+}
+ENCODINGS = ('utf-8-sig', 'cp949')
+
+_NUMBER = re.compile(r'\d+')
+
+
+def parse_age_limit(age, unit):
+    """
+    "12" + "세 미만" -> (None, 144), "6" + "개월 미만" -> (None, 6), "65" + "세 이상" -> (780, None)
+    단위가 비어 있으면 "세 미만" 으로 본다.
+    """
+    text = f"{age or ''} {unit or ''}"
+    match = _NUMBER.search(text)
+    if not match:
+        return None, None
+
+    per_unit = 1 if '개월' in text else 12
+    months = int(match.group()) * per_unit
+    if '이하' in text:
+        return None, months + per_unit
+    if '이상' in text:
+        return months, None
+    if '초과' in text:
+        return months + per_unit, None
+    return None, months
+
+
+class DurPatientRuleImporter:
+    """DUR 환자 특성 규칙 임포터"""
+
+    def __init__(self, rule_type, batch_size=1000):
+        self.rule_type = rule_type
+        self.batch_size = batch_size
+        self.stats = {
+            'rows_read': 0,
+            'skipped': 0,
+            'duplicates': 0,
+            'imported': 0,
+            'alerts_created': 0,
+            'alerts_deleted': 0,
+        }
+        self.code_resolver = DurCodeResolver()
+
+    def read_rows(self, file_path):
+        """CSV 행 읽기 (인코딩 자동 선택)"""
+        for encoding in ENCODINGS:
+            try:
+                with open(file_path, encoding=encoding, newline='') as f:
+                    return list(csv.DictReader(f))
+            except UnicodeDecodeError:
+                logger.debug(f"{encoding} 디코딩 실패, 다음 인코딩 시도")
+        raise ValueError(f"지원하지 않는 인코딩입니다: {file_path}")
+
+    def resolve_columns(self, header):
+        columns = {}
+        for field, candidates in DUR_RULE_COLUMNS.items():
+            columns[field] = next((name for name in candidates if name in header), None)
+        if not columns['code']:
+            raise ValueError(f"성분코드 컬럼을 찾을 수 없습니다 (헤더: {list(header)})")
+        return columns
+
+    def limits(self, age, age_unit):
+        """규칙 유형별 적용 대상 (최소 개월, 최대 개월, 성별)"""
+        if self.rule_type == DurPatientRule.RuleType.ELDERLY:
+            return ELDERLY_MIN_AGE_MONTHS, None, ''
+        if self.rule_type == DurPatientRule.RuleType.PREGNANCY:
+            return (*CHILDBEARING_AGE_MONTHS, FEMALE)
+        return (*parse_age_limit(age, age_unit), '')
+
+    def build_rules(self, rows):
+        if not rows:
+            return []
+        columns = self.resolve_columns(rows[0].keys())
+
+        def value(row, field):
+            return (row.get(columns[field]) or '').strip() if columns[field] else ''
+
+        rules = {}
+        for row in rows:
+            self.stats['rows_read'] += 1
+            code = self.code_resolver.resolve(value(row, 'code'), value(row, 'name'))
+            min_age, max_age, gender = self.limits(value(row, 'age'), value(row, 'age_unit'))
+            if not code or (self.rule_type == DurPatientRule.RuleType.AGE and min_age is None and max_age is None):
+                self.stats['skipped'] += 1
+                continue
+            if code in rules:
+                self.stats['duplicates'] += 1
+                continue
+
+            rules[code] = DurPatientRule(
+                rule_type=self.rule_type,
+                ingredient_code=code,
+                ingredient_name=value(row, 'name')[:200],
+                min_age_months=min_age,
+                max_age_months=max_age,
+                gender=gender,
+                grade=value(row, 'grade')[:20],
+                reason=value(row, 'reason'),
+            )
+        return list(rules.values())
+
+    def import_file(self, file_path):
+        logger.info(f"💊 DUR {self.rule_type.label} 임포트 시작: {file_path}")
+        rules = self.build_rules(self.read_rows(file_path))
+        resolver = self.code_resolver
+        if resolver.mapped or resolver.unmapped:
+            logger.info(f"DUR성분코드 변환: 성분명으로 일반명코드 매칭 {resolver.mapped:,}건, 매칭 실패(건너뜀) {resolver.unmapped:,}건")
+
+        with transaction.atomic():
+            DurPatientRule.objects.filter(rule_type=self.rule_type).delete()
+            DurPatientRule.objects.bulk_create(rules, batch_size=self.batch_size)
+        self.stats['imported'] = len(rules)
+
+        # 규칙이 바뀌었으므로 복용 중인 약이 있는 사용자 전체 재평가 (사용자 묶음 단위)
+        user_ids = list(UserActiveIngredient.objects.values_list('user_id', flat=True).distinct())
+        alert_stats = PatientDurService.refresh_users(user_ids)
+        self.stats['alerts_created'] = alert_stats['created']
+        self.stats['alerts_deleted'] = alert_stats['deleted']
+        logger.info(f"✅ 완료 (재평가 사용자 {len(user_ids):,}명)")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='DUR 환자 특성 규칙 임포트 스크립트')
+    parser.add_argument('--type', type=str, required=True, choices=list(RULE_TYPES), help='규칙 유형')
+    parser.add_argument('--file', type=str, required=True, help='DUR 성분 CSV 파일 경로')
+    parser.add_argument('--batch-size', type=int, default=1000, help='배치 크기')
+    args = parser.parse_args()
+
+    importer = DurPatientRuleImporter(RULE_TYPES[args.type], batch_size=args.batch_size)
+    importer.import_file(args.file)
+
+    stats = importer.stats
+    logger.info(
+        f"읽음: {stats['rows_read']:,}행, 건너뜀: {stats['skipped']:,}행, 중복: {stats['duplicates']:,}행, "
+        f"저장: {stats['imported']:,}건, 경고 추가 {stats['alerts_created']:,}건 / 삭제 {stats['alerts_deleted']:,}건"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -15,9 +15,13 @@ from decimal import Decimal
 
 from django.db import models
 
+from user.models import ReferenceDataVersion
 from user.models.medication import Medication
 from user.models.medication_ingredient import MedicationIngredient
-from user.models.main_ingredient import MainIngredient
+from user.services.ingredient_lookup import IngredientNameLookup
+from user.services.atc_service import rebuild_atc_classes
+from user.services.medication_facets import rebuild_medication_facets
+from user.services.reference_artifacts import rebuild_reference_artifacts
 
 
 # 로깅 설정
@@ -44,6 +48,10 @@ class MedicationIngredientMatcher:
         }
         self.error_details = []
 
+        # 정규화 성분명 사전 (실행당 한 번 적재)
+        self.ingredient_lookup = IngredientNameLookup()
+        logger.info(f"성분명 사전 적재: {len(self.ingredient_lookup):,}개 키")
+
     def match_ingredients(self):
         """모든 의약품에 대해 주성분 매칭 수행"""
         from django.db import transaction
@@ -95,32 +103,11 @@ class MedicationIngredientMatcher:
         return matched_count > 0
 
     def find_matching_ingredient(self, ingredient_name):
-        """성분명으로 MainIngredient 찾기"""
+        """성분명으로 MainIngredient 찾기 (정규화 키, 없으면 한글명 부분 일치)"""
         if not ingredient_name:
             return None
 
-        # 정확히 일치하는 한글명 찾기
-        ingredient = MainIngredient.objects.filter(
-            main_ingr_name_kr__iexact=ingredient_name.strip()
-        ).first()
-
-        if ingredient:
-            return ingredient
-
-        # 영문명으로 찾기
-        ingredient = MainIngredient.objects.filter(
-            main_ingr_name_en__iexact=ingredient_name.strip()
-        ).first()
-
-        if ingredient:
-            return ingredient
-
-        # 부분 일치로 찾기
-        ingredient = MainIngredient.objects.filter(
-            main_ingr_name_kr__icontains=ingredient_name.strip()
-        ).first()
-
-        return ingredient
+        return self.ingredient_lookup.find(ingredient_name)
 
     def extract_ingredients_from_material(self, material_text):
         """원료성분 텍스트에서 성분 정보 추출"""
@@ -193,6 +180,21 @@ def run_ingredient_matching():
     matcher.match_ingredients()
     matcher.print_summary()
 
+    # 약효분류/복합제 여부 패싯은 성분 연결 기준이므로 매칭 후 재집계
+    facet_stats = rebuild_medication_facets()
+    print(f"의약품 패싯 재생성: 패싯 값 {facet_stats['facet_values']:,}개")
+    # ATC 노드별 의약품 수도 성분 연결 기준
+    atc_stats = rebuild_atc_classes()
+    print(f"ATC 분류 트리 재생성: 노드 {atc_stats['nodes']:,}개, 의약품 {atc_stats['medications']:,}건")
+
+    # 의약품 상세(format_medication)에 성분 연결이 들어가므로 캐시/스냅샷/번들/내보내기 세대 교체
+    generation = ReferenceDataVersion.bump(ReferenceDataVersion.MEDICATION)
+    artifacts = rebuild_reference_artifacts()
+    print(
+        f"의약품 참조데이터 세대 갱신: {generation}, 스냅샷 {artifacts['snapshot']['size']:,} bytes, "
+        f"오프라인 번들 v{artifacts['bundle']['version']}"
+    )
+
     # 매칭 결과 검증
     print("\n매칭 결과 검증:")
 
@@ -0,0 +1,323 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+공공데이터포털 XML API 로컬 mock 서버
+
+병원정보(getHospBasisList) / 질병정보(getDissNameCodeList1) / 의약품 허가정보(getDrugPrdtPrmsnDtlInq05)
+세 API 를 같은 응답 형식으로 흉내 내어, 임포트 스크립트의 병렬 수집 속도를 오프라인에서 측정한다.
+응답 지연(--latency), 초당 할당량 초과 시 429(--max-rps), 임의 503(--error-rate)을 설정할 수 있다.
+--parse-benchmark 는 큰 페이지 하나를 ET.fromstring 과 PublicDataXmlStream 으로 파싱해 속도/메모리를 비교한다.
+
+사용법:
+python common/scripts/mock_public_data_server.py --port 8765 --latency 0.2
+python common/scripts/mock_public_data_server.py --benchmark --workers 8 --rate 20
+python common/scripts/mock_public_data_server.py --parse-benchmark --batch-size 50000
+"""
+
+import os
+import sys
+import argparse
+import logging
+import random
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+from common.public_data import PublicDataFetcher
+from common.xml_stream import PublicDataXmlStream
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[logging.StreamHandler()]
+)
+logger = logging.getLogger(__name__)
+
+HOSPITAL_PATH = '/B551182/hospInfoServicev2/getHospBasisList'
+DISEASE_PATH = '/B551182/diseaseInfoService1/getDissNameCodeList1'
+MEDICATION_PATH = '/1471000/DrugPrdtPrmsnInfoService06/getDrugPrdtPrmsnDtlInq05'
+
+HOSPITAL_TYPES = [('01', '상급종합병원'), ('11', '종합병원'), ('21', '병원'), ('31', '의원')]
+SIDO_NAMES = {'11': '서울', '26': '부산', '27': '대구', '28': '인천', '29': '광주', '30': '대전', '31': '울산'}
+
+
+def hospital_item(index):
+    type_code, type_name = HOSPITAL_TYPES[index % len(HOSPITAL_TYPES)]
+    sido_code = list(SIDO_NAMES)[index % len(SIDO_NAMES)]
+    return {
+        'ykiho': f'MOCK{index:08d}',
+        'yadmNm': f'모의병원{index}',
+        'clCd': type_code,
+        'clCdNm': type_name,
+        'sidoCd': sido_code,
+        'sidoCdNm': SIDO_NAMES[sido_code],
+        'sgguCd': f'{sido_code}0001',
+        'sgguCdNm': '중구',
+        'addr': f'{SIDO_NAMES[sido_code]} 중구 모의로 {index}',
+        'telno': f'02-000-{index % 10000:04d}',
+        'XPos': f'{126.9 + index % 100 / 1000:.6f}',
+        'YPos': f'{37.5 + index % 100 / 1000:.6f}',
+        'drTotCnt': str(index % 50),
+    }
+
+
+def disease_item(letter, index):
+    return {
+        'sickCd': f'{letter}{index:03d}',
+        'sickNm': f'모의질병 {letter}{index:03d}',
+        'sickEngNm': f'Mock disease {letter}{index:03d}',
+    }
+
+
+def medication_item(ingredient, index):
+    return {
+        'ITEM_SEQ': str(100000000 + zlib.crc32(ingredient.encode('utf-8')) % 90000 * 1000 + index),
+        'ITEM_NAME': f'{ingredient}정{index}밀리그램',
+        'ENTP_NAME': f'모의제약{index % 20}',
+        'ETC_OTC_CODE': '전문의약품',
+        'MAIN_ITEM_INGR': f'[M000000]{ingredient}',
+        'MAIN_INGR_ENG': ingredient,
+    }
+
+
+class MockDataset:
+    """요청 조건별 전체 건수와 페이지 항목"""
+
+    def __init__(self, hospitals, diseases_per_letter, medications_per_ingredient):
+        self.hospitals = hospitals
+        self.diseases_per_letter = diseases_per_letter
+        self.medications_per_ingredient = medications_per_ingredient
+
+    def page(self, path, params, page_no, num_of_rows):
+        start = (page_no - 1) * num_of_rows
+        if path == HOSPITAL_PATH:
+            total = self.hospitals
+            items = [hospital_item(index) for index in range(start, min(start + num_of_rows, total))]
+        elif path == DISEASE_PATH:
+            letter = (params.get('searchText') or 'A')[:1].upper()
+            total = self.diseases_per_letter
+            items = [disease_item(letter, index) for index in range(start, min(start + num_of_rows, total))]
+        elif path == MEDICATION_PATH:
+            ingredient = params.get('item_name') or '모의성분'
+            total = self.medications_per_ingredient
+            items = [medication_item(ingredient, index) for index in range(start, min(start + num_of_rows, total))]
+        else:
+            return None
+        return total, items
+
+
+def render_xml(total_count, page_no, num_of_rows, items):
+    item_xml = ''.join(
+        '<item>' + ''.join(f'<{key}>{escape(value)}</{key}>' for key, value in item.items()) + '</item>'
+        for item in items
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<response><header><resultCode>00</resultCode><resultMsg>NORMAL SERVICE.</resultMsg></header>'
+        f'<body><items>{item_xml}</items><numOfRows>{num_of_rows}</numOfRows><pageNo>{page_no}</pageNo>'
+        f'<totalCount>{total_count}</totalCount></body></response>'
+    ).encode('utf-8')
+
+
+class RateWindow:
+    """초 단위 요청 수 (할당량 초과 판정)"""
+
+    def __init__(self, max_rps):
+        self.max_rps = max_rps
+        self.second = 0
+        self.count = 0
+        self.lock = threading.Lock()
+
+    def allow(self):
+        if not self.max_rps:
+            return True
+        with self.lock:
+            second = int(time.monotonic())
+            if second != self.second:
+                self.second, self.count = second, 0
+            self.count += 1
+            return self.count <= self.max_rps
+
+
+def make_handler(dataset, latency, rate_window, error_rate):
+    class MockHandler(BaseHTTPRequestHandler):
+        protocol_version = 'HTTP/1.1'  # keep-alive
+
+        def do_GET(self):
+            url = urlparse(self.path)
+            params = {key: values[0] for key, values in parse_qs(url.query).items()}
+            page_no = int(params.get('pageNo', 1))
+            num_of_rows = int(params.get('numOfRows', 10))
+
+            if not rate_window.allow():
+                return self.send_body(429, b'LIMITED NUMBER OF SERVICE REQUESTS PER SECOND EXCEEDS ERROR.',
+                                      {'Retry-After': '1'})
+            time.sleep(latency)
+            if error_rate and random.random() < error_rate:
+                return self.send_body(503, b'SERVICE UNAVAILABLE')
+
+            result = dataset.page(url.path, params, page_no, num_of_rows)
+            if result is None:
+                return self.send_body(404, b'NOT FOUND')
+            total_count, items = result
+            self.send_body(200, render_xml(total_count, page_no, num_of_rows, items),
+                           {'Content-Type': 'application/xml; charset=utf-8'})
+
+        def send_body(self, status, body, headers=None):
+            self.send_response(status)
+            for key, value in (headers or {}).items():
+                self.send_header(key, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            logger.debug(format % args)
+
+    return MockHandler
+
+
+def start_server(host, port, dataset, latency, max_rps=0, error_rate=0.0):
+    server = ThreadingHTTPServer((host, port), make_handler(dataset, latency, RateWindow(max_rps), error_rate))
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    return server
+
+
+def parse_page(query, body):
+    """벤치마크용 최소 파싱 (임포터 parse_xml_response 와 같은 반환 형식)"""
+    stream = PublicDataXmlStream(body)
+    items = list(stream)
+    return items, stream.total_count, None
+
+
+def parse_tree(body):
+    """기존 방식: 전체 트리 생성 후 findall"""
+    root = ET.fromstring(body)
+    items = [{child.tag: (child.text or '').strip() for child in item} for item in root.findall('.//item')]
+    return len(items), int(root.findtext('.//totalCount') or 0)
+
+
+def parse_stream(body):
+    """스트리밍 방식: 항목을 받는 대로 소비 (임포터처럼 보관하지 않음)"""
+    stream = PublicDataXmlStream(body)
+    count = sum(1 for _ in stream)
+    return count, stream.total_count
+
+
+def run_fetch(base_url, queries, workers, rate, num_of_rows):
+    fetcher = PublicDataFetcher(base_url, max_workers=workers, rate=rate)
+    started_at = time.perf_counter()
+    pages = items = errors = 0
+    for page in fetcher.fetch_pages(queries, lambda query, page_no, rows: {
+        'serviceKey': 'MOCK', 'pageNo': page_no, 'numOfRows': rows, 'searchText': query,
+    }, parse_page, num_of_rows):
+        pages += 1
+        items += len(page.items or [])
+        errors += bool(page.error)
+    elapsed = time.perf_counter() - started_at
+    fetcher.close()
+    return {'pages': pages, 'items': items, 'errors': errors, 'seconds': elapsed, 'stats': fetcher.stats}
+
+
+def run_benchmark(args):
+    dataset = MockDataset(args.hospitals, args.diseases_per_letter, args.medications_per_ingredient)
+    server = start_server('127.0.0.1', 0, dataset, args.latency, args.max_rps, args.error_rate)
+    base_url = f'http://127.0.0.1:{server.server_address[1]}{DISEASE_PATH}'
+    letters = list('ABCDEFGHIJ')
+
+    logger.info(f"🧪 질병정보 mock API: 알파벳 {len(letters)}개 x {args.diseases_per_letter}건, "
+                f"응답 지연 {args.latency}초, 할당량 {f'{args.max_rps}회/초' if args.max_rps else '무제한'}")
+    serial = run_fetch(base_url, letters, workers=1, rate=1000, num_of_rows=args.batch_size)
+    logger.info(f"순차 수집: {serial['pages']}페이지 {serial['items']:,}건 {serial['seconds']:.2f}초 "
+                f"({serial['pages'] / serial['seconds']:.1f} 페이지/초)")
+    concurrent = run_fetch(base_url, letters, workers=args.workers, rate=args.rate, num_of_rows=args.batch_size)
+    logger.info(f"병렬 수집 (동시 {args.workers}, 초당 {args.rate}회): {concurrent['pages']}페이지 "
+                f"{concurrent['items']:,}건 {concurrent['seconds']:.2f}초 "
+                f"({concurrent['pages'] / concurrent['seconds']:.1f} 페이지/초), 요청 통계 {concurrent['stats']}")
+    logger.info(f"✅ 속도 향상: {serial['seconds'] / concurrent['seconds']:.1f}배")
+    server.shutdown()
+
+
+def measure_parse(parse, body):
+    """(초, 최대 추가 메모리 바이트, 항목 수) - tracemalloc 이 느리므로 시간은 따로 잰다"""
+    started = time.perf_counter()
+    count, _ = parse(body)
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    parse(body)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, count
+
+
+def run_parse_benchmark(args):
+    items = [hospital_item(index) for index in range(args.batch_size)]
+    body = render_xml(len(items), 1, len(items), items)
+    logger.info(f"🧪 병원정보 응답 1페이지 {len(items):,}건 ({len(body) / 1024 / 1024:.1f}MB) 파싱")
+
+    results = {}
+    for label, parse in (('ET.fromstring', parse_tree), ('스트리밍', parse_stream)):
+        elapsed, peak, count = measure_parse(parse, body)
+        results[label] = (elapsed, peak)
+        logger.info(f"{label}: {count:,}건 {elapsed:.2f}초 ({count / elapsed:,.0f}건/초), "
+                    f"최대 메모리 {peak / 1024 / 1024:.1f}MB")
+
+    (tree_seconds, tree_peak), (stream_seconds, stream_peak) = results.values()
+    logger.info(f"✅ 스트리밍: 속도 {tree_seconds / stream_seconds:.1f}배, 메모리 {tree_peak / stream_peak:.0f}분의 1")
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='공공데이터포털 XML API mock 서버')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='바인드 주소')
+    parser.add_argument('--port', type=int, default=8765, help='포트')
+    parser.add_argument('--latency', type=float, default=0.2, help='응답 지연(초)')
+    parser.add_argument('--max-rps', type=int, default=0, help='초당 허용 요청 수 (초과 시 429, 0 이면 무제한)')
+    parser.add_argument('--error-rate', type=float, default=0.0, help='임의 503 응답 비율 (0~1)')
+    parser.add_argument('--hospitals', type=int, default=2000, help='병원 전체 건수')
+    parser.add_argument('--diseases-per-letter', type=int, default=300, help='알파벳별 질병 건수')
+    parser.add_argument('--medications-per-ingredient', type=int, default=150, help='성분별 의약품 건수')
+
+    # 벤치마크 옵션
+    parser.add_argument('--benchmark', action='store_true', help='서버를 띄우고 순차/병렬 수집 시간 비교')
+    parser.add_argument('--workers', type=int, default=8, help='벤치마크 동시 요청 수')
+    parser.add_argument('--rate', type=float, default=20.0, help='벤치마크 초당 최대 요청 수')
+    parser.add_argument('--batch-size', type=int, default=100, help='벤치마크 페이지 크기')
+    parser.add_argument('--parse-benchmark', action='store_true', help='큰 페이지 하나의 XML 파싱 속도/메모리 비교')
+
+    args = parser.parse_args()
+
+    if args.benchmark:
+        run_benchmark(args)
+        return
+    if args.parse_benchmark:
+        run_parse_benchmark(args)
+        return
+
+    dataset = MockDataset(args.hospitals, args.diseases_per_letter, args.medications_per_ingredient)
+    server = start_server(args.host, args.port, dataset, args.latency, args.max_rps, args.error_rate)
+    logger.info(f"🚀 mock 서버 시작: http://{args.host}:{args.port}")
+    for path in (HOSPITAL_PATH, DISEASE_PATH, MEDICATION_PATH):
+        logger.info(f"  - http://{args.host}:{args.port}{path}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        logger.info("mock 서버 종료")
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -15,7 +15,12 @@ sys.path.append(PROJECT_ROOT)
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
 django.setup()
 
-from user.models import DiseaseCache
+from common.bulk_upsert import bulk_upsert, count_result
+from common.import_checkpoint import ImportCheckpointTracker
+from common.public_data import PublicDataFetcher, add_fetcher_arguments, fetcher_options
+from common.xml_stream import ParseStats, PublicDataXmlStream
+from user.models import DiseaseCache, ImportCheckpoint, ReferenceDataVersion
+from user.services.reference_artifacts import rebuild_reference_artifacts
 from django.db import transaction, IntegrityError
 from django.core.exceptions import ValidationError
 
@@ -34,14 +39,19 @@ logger = logging.getLogger(__name__)
 class DiseaseDataImporter:
     """질병정보 API 임포터 클래스"""
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, base_url=None, write_mode='bulk', **fetcher_options):
         self.api_key = api_key
-        self.base_url = "http://apis.data.go.kr/B551182/diseaseInfoService1/getDissNameCodeList1"
+        # bulk: 페이지 단위 upsert / row: 행마다 update_or_create
+        self.write_mode = write_mode
+        self.base_url = base_url or "http://apis.data.go.kr/B551182/diseaseInfoService1/getDissNameCodeList1"
+        self.fetcher = PublicDataFetcher(self.base_url, **fetcher_options)
+        self.parse_stats = ParseStats()
         self.stats = {
             'total_requested': 0,
             'total_received': 0,
             'created': 0,
             'updated': 0,
+            'unchanged': 0,
             'errors': 0,
             'search_letters_completed': 0,
             'search_letters_failed': 0
@@ -52,9 +62,9 @@ class DiseaseDataImporter:
         self.search_letters = list('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
         logger.info(f"A-Z 검색 모드: {len(self.search_letters)}개 알파벳으로 전체 검색 수행")
 
-    def get_disease_data(self, page_no=1, num_of_rows=100, search_text=None):
-        """API에서 질병 데이터 가져오기"""
-        params = {
+    def build_params(self, search_text, page_no, num_of_rows):
+        """API 요청 파라미터"""
+        return {
             'serviceKey': self.api_key,
             'pageNo': page_no,
             'numOfRows': num_of_rows,
@@ -64,13 +74,12 @@ class DiseaseDataImporter:
             'searchText' : search_text
         }
 
+    def get_disease_data(self, page_no=1, num_of_rows=100, search_text=None):
+        """API에서 질병 데이터 가져오기 (단일 페이지)"""
         try:
             logger.info(f"API 호출 - 페이지: {page_no}, 행수: {num_of_rows}, 검색텍스트: {search_text}")
-            response = requests.get(self.base_url, params=params, timeout=30)
-            logger.info(f"API 호출 - 페이지: {response.url}")
-            response.raise_for_status()
-
-            return self.parse_xml_response(response.text)
+            body = self.fetcher.get(self.build_params(search_text, page_no, num_of_rows))
+            return self.parse_xml_response(body)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"API 호출 실패: {e}")
@@ -79,33 +88,30 @@ class DiseaseDataImporter:
             logger.error(f"데이터 처리 실패: {e}")
             return None, 0, None
 
-    def parse_xml_response(self, xml_text):
-        """XML 응답 파싱"""
+    def parse_xml_response(self, body):
+        """XML 응답 스트리밍 파싱 (item 을 받는 대로 추출)"""
         try:
-            root = ET.fromstring(xml_text)
-
-            # 결과 코드 확인
-            result_code = root.find('.//resultCode')
-            if result_code is not None and result_code.text != '00':
-                result_msg = root.find('.//resultMsg')
-                error_msg = result_msg.text if result_msg is not None else "알 수 없는 오류"
-                logger.error(f"API 오류: {result_code.text} - {error_msg}")
-                return None, 0, error_msg
-
-            # 총 개수 확인
-            total_count_elem = root.find('.//totalCount')
-            total_count = int(total_count_elem.text) if total_count_elem is not None else 0
+            stream = PublicDataXmlStream(body)
 
             # 질병 데이터 추출
             diseases = []
-            items = root.findall('.//item')
 
-            for item in items:
-                disease_data = self.extract_disease_data(item)
+            for fields in stream:
+                disease_data = self.extract_disease_data(fields)
                 if disease_data:
                     diseases.append(disease_data)
+            self.parse_stats.add(stream)
+
+            # 결과 코드 확인 (조회 결과 없음은 빈 페이지로 - 체크포인트에 완료로 남김)
+            if stream.is_no_data:
+                return [], 0, None
+            if stream.is_error:
+                error_msg = stream.result_msg or "알 수 없는 오류"
+                logger.error(f"API 오류: {stream.result_code} - {error_msg}")
+                return None, 0, error_msg
 
-            return diseases, total_count, None
+            # 총 개수 (항목 뒤에 옴)
+            return diseases, stream.total_count, None
 
         except ET.ParseError as e:
             logger.error(f"XML 파싱 오류: {e}")
@@ -115,11 +121,10 @@ class DiseaseDataImporter:
             return None, 0, f"응답 처리 오류: {e}"
 
     def extract_disease_data(self, item):
-        """XML item에서 질병 데이터 추출"""
+        """XML item 필드({태그: 텍스트})에서 질병 데이터 추출"""
         try:
             def get_text(element_name, default=''):
-                elem = item.find(element_name)
-                return elem.text.strip() if elem is not None and elem.text else default
+                return item.get(element_name) or default
 
             disease_name_kr = get_text('sickNm')
             disease_name_en = get_text('sickEngNm')
@@ -167,82 +172,68 @@ class DiseaseDataImporter:
             logger.error(error_msg)
             return 'error'
 
-    def import_all_diseases(self, batch_size=100, delay_seconds=1):
-        """A-Z 검색으로 모든 질병 정보 임포트"""
+    def import_all_diseases(self, batch_size=100, resume=False):
+        """
+        A-Z 검색으로 모든 질병 정보 임포트 (페이지는 병렬 수집, 저장은 받은 순서대로)
+        resume: 체크포인트에서 이어서 수집 (완료된 알파벳은 건너뜀)
+        """
         logger.info("질병정보 A-Z 전체 검색 임포트 시작")
 
-        successful_letters = []
-        failed_letters = []
-
-        for letter in self.search_letters:
-            logger.info(f"🔍 '{letter}' 알파벳 검색 시작")
-
-            try:
-                # 첫 번째 호출로 총 개수 확인
-                diseases, total_count, error = self.get_disease_data(
-                    page_no=1,
-                    num_of_rows=batch_size,
-                    search_text=letter
-                )
-
-                if error:
-                    logger.error(f"'{letter}' 알파벳 검색 실패: {error}")
-                    failed_letters.append(letter)
+        checkpoint = ImportCheckpointTracker(ImportCheckpoint.DISEASE, batch_size, resume)
+        search_letters, completed = checkpoint.start(self.search_letters)
+        self.stats['search_letters_completed'] += len(self.search_letters) - len(search_letters)
+
+        failed_letters = set()
+        # 알파벳별 남은 페이지 수 (0 이 되면 완료)
+        remaining_pages = checkpoint.remaining_pages(completed)
+        started_at = time.monotonic()
+        processed_pages = 0
+
+        pages = self.fetcher.fetch_pages(
+            search_letters,
+            build_params=self.build_params,
+            parse=lambda letter, text: self.parse_xml_response(text),
+            num_of_rows=batch_size,
+            completed=completed
+        )
+        for page in pages:
+            letter = page.query
+            if page.error:
+                if page.page_no == 1:
+                    logger.error(f"'{letter}' 알파벳 검색 실패: {page.error}")
+                    failed_letters.add(letter)
                     self.stats['search_letters_failed'] += 1
-                    continue
+                else:
+                    logger.error(f"'{letter}' 알파벳 페이지 {page.page_no} 호출 실패: {page.error}")
+                    remaining_pages[letter] -= 1
+                continue
 
-                if not diseases and total_count == 0:
+            if page.page_no == 1:
+                remaining_pages[letter] = max(1, (page.total_count + batch_size - 1) // batch_size)
+                if page.total_count == 0:
                     logger.info(f"'{letter}' 알파벳에서 데이터를 찾을 수 없습니다.")
-                    successful_letters.append(letter)
-                    self.stats['search_letters_completed'] += 1
-                    continue
-
-                logger.info(f"'{letter}' 알파벳: 총 {total_count}개 질병 데이터 수집 예정")
-
-                # 첫 번째 배치 처리
-                if diseases:
-                    self.process_batch(diseases)
-
-                # 나머지 페이지 처리
-                if total_count > batch_size:
-                    total_pages = (total_count + batch_size - 1) // batch_size
-
-                    for page_no in range(2, total_pages + 1):
-                        logger.debug(f"'{letter}' 알파벳: {page_no}/{total_pages} 페이지 처리 중...")
-
-                        # API 호출 제한을 위한 딜레이
-                        time.sleep(delay_seconds)
-
-                        diseases, _, error = self.get_disease_data(
-                            page_no=page_no,
-                            num_of_rows=batch_size,
-                            search_text=letter
-                        )
+                else:
+                    logger.info(f"'{letter}' 알파벳: 총 {page.total_count}개 질병 데이터 수집 예정")
 
-                        if error:
-                            logger.error(f"'{letter}' 알파벳 페이지 {page_no} 호출 실패: {error}")
-                            continue
+            # 저장에 실패한 페이지는 체크포인트에 남기지 않음 (--resume 시 다시 수집)
+            if not page.items or self.process_batch(page.items):
+                checkpoint.page_done(letter, page.page_no, page.total_count)
 
-                        if diseases:
-                            self.process_batch(diseases)
-
-                        # 진행상황 로깅 (10페이지마다)
-                        if page_no % 10 == 0:
-                            progress = (page_no / total_pages) * 100
-                            logger.debug(f"'{letter}' 알파벳 진행률: {progress:.1f}%")
-
-                successful_letters.append(letter)
+            remaining_pages[letter] -= 1
+            if remaining_pages[letter] == 0:
                 self.stats['search_letters_completed'] += 1
-                logger.info(f"✅ '{letter}' 알파벳 검색 완료 ({total_count}개)")
+                logger.info(f"✅ '{letter}' 알파벳 검색 완료")
 
-                # 알파벳 간 딜레이
-                time.sleep(delay_seconds)
+            # 진행상황 로깅 (10페이지마다)
+            processed_pages += 1
+            if processed_pages % 10 == 0:
+                logger.debug(f"진행: {processed_pages} 페이지 ({processed_pages / (time.monotonic() - started_at):.1f} 페이지/초)")
 
-            except Exception as e:
-                logger.error(f"'{letter}' 알파벳 처리 중 예외 발생: {e}")
-                failed_letters.append(letter)
-                self.stats['search_letters_failed'] += 1
-                continue
+        self.fetcher.close()
+        logger.info(f"API 요청 통계: {self.fetcher.stats}")
+        logger.info(self.parse_stats.summary())
+        successful_letters = [letter for letter in self.search_letters if letter not in failed_letters]
+        failed_letters = sorted(failed_letters)
 
         # 최종 결과 출력
         logger.info("=" * 50)
@@ -253,8 +244,55 @@ class DiseaseDataImporter:
             logger.warning(f"실패한 알파벳: {', '.join(failed_letters)} ({len(failed_letters)}개)")
         logger.info("모든 질병정보 임포트 완료")
 
+        # 워커의 질병 자동완성 인덱스 교체 신호 (이어받은 경우 이전 실행이 저장한 분 포함)
+        if self.stats['created'] or self.stats['updated'] or checkpoint.resumed_pages:
+            generation = ReferenceDataVersion.bump(ReferenceDataVersion.DISEASE_CACHE)
+            logger.info(f"질병 참조데이터 세대 갱신: {generation}")
+            artifacts = rebuild_reference_artifacts()
+            logger.info(
+                f"참조 데이터 스냅샷 교체: {artifacts['snapshot']['size']:,} bytes, "
+                f"오프라인 번들 v{artifacts['bundle']['version']}"
+            )
+
+    def bulk_upsert_diseases(self, diseases):
+        """
+        페이지 단위 upsert (기존 행 지문 조회 1회 + INSERT ... ON CONFLICT 1회)
+        지문이 같은 질병은 쓰지 않고 unchanged 로 센다.
+        """
+        objects = []
+        for disease_data in diseases:
+            disease = DiseaseCache(
+                disease_code=disease_data['disease_code'],
+                disease_name_kr=disease_data['disease_name_kr'],
+                disease_name_en=disease_data['disease_name_en'],
+            )
+            # bulk_create 는 save() 를 거치지 않으므로 검색키/지문을 미리 채움
+            disease.refresh_search_keys()
+            disease.refresh_fingerprint()
+            objects.append(disease)
+
+        result = bulk_upsert(
+            DiseaseCache,
+            objects,
+            unique_field='disease_code',
+            update_fields=['disease_name_kr', 'disease_name_en', 'disease_name_chosung', 'disease_name_jamo'],
+            fingerprint_field='content_hash',
+        )
+        count_result(self.stats, result)
+
     def process_batch(self, diseases):
-        """배치 단위로 질병 데이터 처리"""
+        """배치 단위로 질병 데이터 처리 (저장 성공 여부 반환)"""
+        if self.write_mode == 'bulk':
+            try:
+                self.stats['total_received'] += len(diseases)
+                if diseases:
+                    self.bulk_upsert_diseases(diseases)
+                return True
+            except Exception as e:
+                logger.error(f"배치 처리 중 오류: {e}")
+                self.stats['errors'] += len(diseases)
+                return False
+
         try:
             with transaction.atomic():
                 for disease_data in diseases:
@@ -263,10 +301,12 @@ class DiseaseDataImporter:
 
                     if result in ['created', 'updated']:
                         logger.debug(f"{result}: {disease_data['disease_code']} - {disease_data['disease_name_kr']}")
+            return True
 
         except Exception as e:
             logger.error(f"배치 처리 중 오류: {e}")
             self.stats['errors'] += len(diseases)
+            return False
 
     def print_summary(self):
         """처리 결과 요약 출력"""
@@ -278,6 +318,7 @@ class DiseaseDataImporter:
         logger.info(f"총 수신 데이터: {self.stats['total_received']:,}")
         logger.info(f"생성된 데이터: {self.stats['created']:,}")
         logger.info(f"업데이트된 데이터: {self.stats['updated']:,}")
+        logger.info(f"변경 없는 데이터: {self.stats['unchanged']:,}")
         logger.info(f"오류 발생: {self.stats['errors']:,}")
 
         if self.error_details:
@@ -287,7 +328,7 @@ class DiseaseDataImporter:
 
         # 성공률 계산
         if self.stats['total_received'] > 0:
-            success_rate = (self.stats['created'] + self.stats['updated']) / self.stats['total_received'] * 100
+            success_rate = (self.stats['created'] + self.stats['updated'] + self.stats['unchanged']) / self.stats['total_received'] * 100
             logger.info(f"\n성공률: {success_rate:.2f}%")
 
         # 알파벳별 성공률
@@ -310,10 +351,13 @@ def main():
     parser = argparse.ArgumentParser(description='질병정보 API 임포트 스크립트')
     parser.add_argument('--api-key', type=str, required=True, help='공공데이터포털 API 키')
     parser.add_argument('--batch-size', type=int, default=100, help='배치 크기 (최대 1000)')
-    parser.add_argument('--delay', type=float, default=1.0, help='API 호출 간 딜레이(초)')
     parser.add_argument('--keywords', type=str, nargs='+', help='특정 검색 키워드만 수집')
     parser.add_argument('--full-import', action='store_true', help='전체 데이터 수집 (키워드 없이)')
     parser.add_argument('--letters', type=str, nargs='+', help='특정 알파벳만 검색 (예: A B C)')
+    add_fetcher_arguments(parser)
+    parser.add_argument('--write-mode', choices=['bulk', 'row'], default='bulk',
+                        help='저장 방식 (bulk: 페이지 단위 upsert, row: 행마다 update_or_create)')
+    parser.add_argument('--resume', action='store_true', help='중단된 임포트를 체크포인트부터 이어서 수집')
     args = parser.parse_args()
 
     # API 키 검증
@@ -327,7 +371,9 @@ def main():
         args.batch_size = 1000
 
     # 임포터 생성
-    importer = DiseaseDataImporter(args.api_key)
+    importer = DiseaseDataImporter(
+        args.api_key, base_url=args.base_url, write_mode=args.write_mode, **fetcher_options(args)
+    )
 
     # 기존 데이터 수 확인
     existing_count = DiseaseCache.objects.count()
@@ -349,7 +395,7 @@ def main():
     try:
         importer.import_all_diseases(
             batch_size=args.batch_size,
-            delay_seconds=args.delay
+            resume=args.resume
         )
 
         # 결과 요약 출력
@@ -399,6 +445,15 @@ python populate_disease_cache.py --api-key YOUR_API_KEY --batch-size 50 --delay
 
 # A, M, Z 알파벳만 테스트
 python populate_disease_cache.py --api-key YOUR_API_KEY --letters A M Z --delay 0.5
+
+# 동시 요청 8개, 초당 20회 이하로 수집
+python populate_disease_cache.py --api-key YOUR_API_KEY --workers 8 --rate 20
+
+# 중단된 임포트 이어서 수집 (완료된 알파벳은 건너뜀)
+python populate_disease_cache.py --api-key YOUR_API_KEY --resume
+
+# 로컬 mock 서버로 수집 (python common/scripts/mock_public_data_server.py)
+python populate_disease_cache.py --api-key TEST_API_KEY --base-url http://127.0.0.1:8765/B551182/diseaseInfoService1/getDissNameCodeList1
 """  # !/usr/bin/env python
 # -*- coding: utf-8 -*-
 """
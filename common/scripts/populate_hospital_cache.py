@@ -4,6 +4,7 @@
 건강보험심사평가원 병원정보 API를 통해 HospitalCache 테이블을 채우는 스크립트
 
 API 문서: https://www.data.go.kr/tcs/dss/selectApiDataDetailView.do?publicDataPk=15001698
+진료과목(--with-subjects): 의료기관별상세정보서비스 진료과목정보(getDgsbjtInfo2.7, 요양기관기호별 조회)
 
 사용법:
 python populate_hospital_cache.py --api-key YOUR_API_KEY
@@ -38,7 +39,11 @@ sys.path.append(PROJECT_ROOT)
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
 django.setup()
 
-from user.models import HospitalCache
+from common.bulk_upsert import bulk_upsert, count_result
+from common.import_checkpoint import ImportCheckpointTracker
+from common.public_data import PublicDataFetcher, add_fetcher_arguments, fetcher_options
+from common.xml_stream import ParseStats, PublicDataXmlStream
+from user.models import HospitalCache, ImportCheckpoint, ReferenceDataVersion
 from django.db import transaction, IntegrityError
 from django.core.exceptions import ValidationError
 
@@ -54,12 +59,26 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+SUBJECT_API_URL = "http://apis.data.go.kr/B551182/MadmDtlInfoService2.7/getDgsbjtInfo2.7"
+# 한 병원의 진료과목은 보통 수십 개 이하라 대부분 1페이지로 끝남
+SUBJECT_NUM_OF_ROWS = 100
+
+
 class HospitalDataImporter:
     """병원정보 API 임포터 클래스"""
 
-    def __init__(self, api_key, hospital_type_filters=None):
+    def __init__(self, api_key, hospital_type_filters=None, base_url=None, write_mode='bulk',
+                 subject_url=None, **fetcher_options):
         self.api_key = api_key
-        self.base_url = "http://apis.data.go.kr/B551182/hospInfoServicev2/getHospBasisList"
+        # bulk: 페이지 단위 upsert / row: 행마다 update_or_create
+        self.write_mode = write_mode
+        self.base_url = base_url or "http://apis.data.go.kr/B551182/hospInfoServicev2/getHospBasisList"
+        self.fetcher = PublicDataFetcher(self.base_url, **fetcher_options)
+        self.parse_stats = ParseStats()
+        # 진료과목 API 주소를 주면 배치마다 병원별 진료과목을 받아 medical_subjects/역색인을 채움
+        self.subject_fetcher = PublicDataFetcher(subject_url, **fetcher_options) if subject_url else None
+        # row 모드에서 진료과목 역색인을 배치 끝에 동기화할 병원
+        self.subject_pending = []
 
         # 종별코드 필터 설정 (기본값: 01,11,21 - 상급종합병원, 종합병원, 병원)
         self.hospital_type_filters = hospital_type_filters or ['01', '11', '21']
@@ -93,7 +112,9 @@ class HospitalDataImporter:
             'filtered_out': 0,
             'created': 0,
             'updated': 0,
-            'errors': 0
+            'unchanged': 0,
+            'errors': 0,
+            'subject_errors': 0
         }
         self.error_details = []
 
@@ -101,8 +122,8 @@ class HospitalDataImporter:
         filter_names = [self.hospital_type_names.get(code, f'알수없음({code})') for code in self.hospital_type_filters]
         logger.info(f"수집 대상 병원 유형: {', '.join(filter_names)}")
 
-    def get_hospital_data(self, page_no=1, num_of_rows=100, sido_cd=None, sggu_cd=None):
-        """API에서 병원 데이터 가져오기"""
+    def build_params(self, sido_cd, page_no, num_of_rows, sggu_cd=None):
+        """API 요청 파라미터"""
         params = {
             'serviceKey': self.api_key,
             'pageNo': page_no,
@@ -113,13 +134,14 @@ class HospitalDataImporter:
             params['sidoCd'] = sido_cd
         if sggu_cd:
             params['sgguCd'] = sggu_cd
+        return params
 
+    def get_hospital_data(self, page_no=1, num_of_rows=100, sido_cd=None, sggu_cd=None):
+        """API에서 병원 데이터 가져오기 (단일 페이지)"""
         try:
             logger.info(f"API 호출 - 페이지: {page_no}, 행수: {num_of_rows}")
-            response = requests.get(self.base_url, params=params, timeout=30)
-            response.raise_for_status()
-
-            return self.parse_xml_response(response.text)
+            body = self.fetcher.get(self.build_params(sido_cd, page_no, num_of_rows, sggu_cd))
+            return self.parse_xml_response(body)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"API 호출 실패: {e}")
@@ -128,34 +150,33 @@ class HospitalDataImporter:
             logger.error(f"데이터 처리 실패: {e}")
             return None, 0, None
 
-    def parse_xml_response(self, xml_text):
-        """XML 응답 파싱"""
+    def parse_xml_response(self, body):
+        """XML 응답 스트리밍 파싱 (item 을 받는 대로 추출)"""
         try:
-            root = ET.fromstring(xml_text)
-
-            # 결과 코드 확인
-            result_code = root.find('.//resultCode')
-            if result_code is not None and result_code.text != '00':
-                result_msg = root.find('.//resultMsg')
-                error_msg = result_msg.text if result_msg is not None else "알 수 없는 오류"
-                logger.error(f"API 오류: {result_code.text} - {error_msg}")
-                return None, 0, error_msg
-
-            # 총 개수 확인
-            total_count_elem = root.find('.//totalCount')
-            total_count = int(total_count_elem.text) if total_count_elem is not None else 0
+            stream = PublicDataXmlStream(body)
 
             # 병원 데이터 추출
             hospitals = []
-            items = root.findall('.//item')
             filtered_count = 0
 
-            for item in items:
-                hospital_data = self.extract_hospital_data(item)
+            for fields in stream:
+                hospital_data = self.extract_hospital_data(fields)
                 if hospital_data is None:
                     filtered_count += 1  # 필터링된 데이터 카운트
                     continue
                 hospitals.append(hospital_data)
+            self.parse_stats.add(stream)
+
+            # 결과 코드 확인 (조회 결과 없음은 빈 페이지로 - 체크포인트에 완료로 남김)
+            if stream.is_no_data:
+                return [], 0, None
+            if stream.is_error:
+                error_msg = stream.result_msg or "알 수 없는 오류"
+                logger.error(f"API 오류: {stream.result_code} - {error_msg}")
+                return None, 0, error_msg
+
+            # 총 개수 (항목 뒤에 옴)
+            total_count = stream.total_count
 
             # 필터링 통계 업데이트
             self.stats['filtered_out'] += filtered_count
@@ -173,11 +194,10 @@ class HospitalDataImporter:
             return None, 0, f"응답 처리 오류: {e}"
 
     def extract_hospital_data(self, item):
-        """XML item에서 병원 데이터 추출"""
+        """XML item 필드({태그: 텍스트})에서 병원 데이터 추출"""
         try:
             def get_text(element_name, default=''):
-                elem = item.find(element_name)
-                return elem.text.strip() if elem is not None and elem.text else default
+                return item.get(element_name) or default
 
             def get_int(element_name, default=0):
                 try:
@@ -233,35 +253,104 @@ class HospitalDataImporter:
             logger.error(f"병원 데이터 추출 오류: {e}")
             return None
 
+    def build_subject_params(self, ykiho, page_no, num_of_rows):
+        """진료과목 API 요청 파라미터"""
+        return {
+            'serviceKey': self.api_key,
+            'ykiho': ykiho,
+            'pageNo': page_no,
+            'numOfRows': num_of_rows,
+        }
+
+    def parse_subject_response(self, body):
+        """진료과목 XML 응답 -> ([{dgsbjtCd, dgsbjtCdNm}], total_count, error)"""
+        try:
+            stream = PublicDataXmlStream(body)
+            subjects = [
+                {'dgsbjtCd': fields.get('dgsbjtCd', ''), 'dgsbjtCdNm': fields.get('dgsbjtCdNm', '')}
+                for fields in stream
+                if fields.get('dgsbjtCdNm')
+            ]
+
+            if stream.is_no_data:
+                return [], 0, None
+            if stream.is_error:
+                return None, 0, stream.result_msg or "알 수 없는 오류"
+            return subjects, stream.total_count, None
+
+        except ET.ParseError as e:
+            return None, 0, f"XML 파싱 오류: {e}"
+
+    def attach_subjects(self, hospitals):
+        """
+        배치 병원의 진료과목을 받아 hospital_data['medical_subjects'] 로 채움
+        조회에 실패한 병원은 저장된 진료과목을 그대로 둔다 (빈 목록으로 덮어쓰지 않음).
+        """
+        codes = [hospital_data['hospital_code'] for hospital_data in hospitals]
+        subjects = {code: [] for code in codes}
+        failed = set()
+
+        pages = self.subject_fetcher.fetch_pages(
+            codes,
+            build_params=self.build_subject_params,
+            parse=lambda ykiho, body: self.parse_subject_response(body),
+            num_of_rows=SUBJECT_NUM_OF_ROWS
+        )
+        for page in pages:
+            if page.error:
+                logger.warning(f"진료과목 조회 실패 - 병원코드: {page.query}, 페이지 {page.page_no}: {page.error}")
+                failed.add(page.query)
+                continue
+            subjects[page.query].extend(page.items)
+
+        stored = {}
+        if failed:
+            self.stats['subject_errors'] += len(failed)
+            stored = dict(
+                HospitalCache.objects.filter(hospital_code__in=failed).values_list('hospital_code', 'medical_subjects')
+            )
+        for hospital_data in hospitals:
+            code = hospital_data['hospital_code']
+            hospital_data['medical_subjects'] = stored.get(code, []) if code in failed else subjects[code]
+
+    def build_defaults(self, hospital_data):
+        """HospitalCache 저장 필드"""
+        return {
+            'hospital_name': hospital_data['hospital_name'],
+            'hospital_phone': hospital_data['hospital_phone'],
+            'hospital_type_code': hospital_data['hospital_type_code'],
+            'hospital_type_name': hospital_data['hospital_type_name'],
+            'establishment_type_code': hospital_data['establishment_type_code'],
+            'establishment_type_name': hospital_data['establishment_type_name'],
+            'postal_code': hospital_data['postal_code'],
+            'address': hospital_data['address'],
+            'road_address': hospital_data['road_address'],
+            'sido_code': hospital_data['sido_code'],
+            'sido_name': hospital_data['sido_name'],
+            'sigungu_code': hospital_data['sigungu_code'],
+            'sigungu_name': hospital_data['sigungu_name'],
+            'latitude': hospital_data['latitude'],
+            'longitude': hospital_data['longitude'],
+            'homepage_url': hospital_data['homepage_url'],
+            'total_doctors': hospital_data['total_doctors'],
+            'total_beds': hospital_data['total_beds'],
+            'data_reference_date': date.today(),
+            'is_active': True,
+            **({'medical_subjects': hospital_data['medical_subjects']} if 'medical_subjects' in hospital_data else {}),
+        }
+
     def create_or_update_hospital(self, hospital_data):
         """병원 정보 생성 또는 업데이트"""
         try:
             hospital, created = HospitalCache.objects.update_or_create(
                 hospital_code=hospital_data['hospital_code'],
-                defaults={
-                    'hospital_name': hospital_data['hospital_name'],
-                    'hospital_phone': hospital_data['hospital_phone'],
-                    'hospital_type_code': hospital_data['hospital_type_code'],
-                    'hospital_type_name': hospital_data['hospital_type_name'],
-                    'establishment_type_code': hospital_data['establishment_type_code'],
-                    'establishment_type_name': hospital_data['establishment_type_name'],
-                    'postal_code': hospital_data['postal_code'],
-                    'address': hospital_data['address'],
-                    'road_address': hospital_data['road_address'],
-                    'sido_code': hospital_data['sido_code'],
-                    'sido_name': hospital_data['sido_name'],
-                    'sigungu_code': hospital_data['sigungu_code'],
-                    'sigungu_name': hospital_data['sigungu_name'],
-                    'latitude': hospital_data['latitude'],
-                    'longitude': hospital_data['longitude'],
-                    'homepage_url': hospital_data['homepage_url'],
-                    'total_doctors': hospital_data['total_doctors'],
-                    'total_beds': hospital_data['total_beds'],
-                    'data_reference_date': date.today(),
-                    'is_active': True,
-                }
+                defaults=self.build_defaults(hospital_data)
             )
 
+            # 진료과목 역색인은 배치 끝에 한 번에 동기화 (process_batch)
+            if 'medical_subjects' in hospital_data:
+                self.subject_pending.append(hospital)
+
             if created:
                 self.stats['created'] += 1
                 return 'created'
@@ -276,8 +365,11 @@ class HospitalDataImporter:
             logger.error(error_msg)
             return 'error'
 
-    def import_all_hospitals(self, batch_size=100, delay_seconds=1, sido_codes=None):
-        """모든 병원 정보 임포트"""
+    def import_all_hospitals(self, batch_size=100, sido_codes=None, resume=False):
+        """
+        모든 병원 정보 임포트 (페이지는 병렬 수집, 저장은 받은 순서대로)
+        resume: 체크포인트에서 이어서 수집 (완료된 시도코드는 건너뜀)
+        """
         logger.info("병원정보 API 임포트 시작")
 
         # 시도 코드가 지정되지 않으면 전국 데이터 수집
@@ -286,72 +378,123 @@ class HospitalDataImporter:
         elif isinstance(sido_codes, str):
             sido_codes = [sido_codes]
 
-        for sido_cd in sido_codes:
-            logger.info(f"시도코드 {sido_cd} 데이터 수집 시작")
-
-            # 첫 번째 호출로 총 개수 확인
-            hospitals, total_count, error = self.get_hospital_data(
-                page_no=1,
-                num_of_rows=batch_size,
-                sido_cd=sido_cd
-            )
-
-            if error:
-                logger.error(f"시도코드 {sido_cd} 데이터 수집 실패: {error}")
-                continue
-
-            if not hospitals:
-                logger.warning(f"시도코드 {sido_cd}에서 데이터를 찾을 수 없습니다.")
+        checkpoint = ImportCheckpointTracker(ImportCheckpoint.HOSPITAL, batch_size, resume)
+        sido_codes, completed = checkpoint.start(sido_codes)
+        total_pages = checkpoint.remaining_pages(completed)
+        processed_pages = 0
+        started_at = time.monotonic()
+
+        pages = self.fetcher.fetch_pages(
+            sido_codes,
+            build_params=self.build_params,
+            parse=lambda sido_cd, text: self.parse_xml_response(text),
+            num_of_rows=batch_size,
+            completed=completed
+        )
+        for page in pages:
+            if page.error:
+                logger.error(f"시도코드 {page.query} 페이지 {page.page_no} 수집 실패: {page.error}")
                 continue
 
-            logger.info(f"시도코드 {sido_cd}: 총 {total_count}개 병원 데이터 수집 예정")
-
-            # 첫 번째 배치 처리
-            self.process_batch(hospitals)
-
-            # 나머지 페이지 처리
-            total_pages = (total_count + batch_size - 1) // batch_size
-
-            for page_no in range(2, total_pages + 1):
-                logger.info(f"시도코드 {sido_cd}: {page_no}/{total_pages} 페이지 처리 중...")
-
-                # API 호출 제한을 위한 딜레이
-                time.sleep(delay_seconds)
-
-                hospitals, _, error = self.get_hospital_data(
-                    page_no=page_no,
-                    num_of_rows=batch_size,
-                    sido_cd=sido_cd
-                )
-
-                if error:
-                    logger.error(f"페이지 {page_no} 호출 실패: {error}")
+            if page.page_no == 1:
+                total_pages[page.query] = (page.total_count + batch_size - 1) // batch_size
+                if not page.items:
+                    logger.warning(f"시도코드 {page.query}에서 데이터를 찾을 수 없습니다.")
+                    checkpoint.page_done(page.query, page.page_no, page.total_count)
                     continue
+                logger.info(f"시도코드 {page.query}: 총 {page.total_count}개 병원 데이터 수집 예정")
+
+            # 저장에 실패한 페이지는 체크포인트에 남기지 않음 (--resume 시 다시 수집)
+            if not page.items or self.process_batch(page.items):
+                checkpoint.page_done(page.query, page.page_no, page.total_count)
+
+            # 진행상황 로깅
+            processed_pages += 1
+            if processed_pages % 10 == 0:
+                logger.info(
+                    f"진행: {processed_pages}/{sum(total_pages.values())} 페이지 "
+                    f"({processed_pages / (time.monotonic() - started_at):.1f} 페이지/초)"
+                )
 
-                if hospitals:
-                    self.process_batch(hospitals)
+        self.fetcher.close()
+        logger.info(f"API 요청 통계: {self.fetcher.stats}")
+        if self.subject_fetcher:
+            self.subject_fetcher.close()
+            logger.info(f"진료과목 API 요청 통계: {self.subject_fetcher.stats}")
+        logger.info(self.parse_stats.summary())
+        logger.info("모든 병원정보 임포트 완료")
 
-                # 진행상황 로깅
-                if page_no % 10 == 0:
-                    progress = (page_no / total_pages) * 100
-                    logger.info(f"시도코드 {sido_cd} 진행률: {progress:.1f}%")
+        # 워커의 병원정보 참조 데이터 캐시 무효화 신호 (이어받은 경우 이전 실행이 저장한 분 포함)
+        if self.stats['created'] or self.stats['updated'] or checkpoint.resumed_pages:
+            generation = ReferenceDataVersion.bump(ReferenceDataVersion.HOSPITAL_CACHE)
+            logger.info(f"병원 참조데이터 세대 갱신: {generation}")
+
+    def bulk_upsert_hospitals(self, hospitals):
+        """
+        페이지 단위 upsert (기존 행 지문 조회 1회 + INSERT ... ON CONFLICT 1회)
+        지문이 같은 병원은 쓰지 않고 unchanged 로 센다 (데이터기준일자만 다른 경우 포함).
+        """
+        objects = []
+        for hospital_data in hospitals:
+            hospital = HospitalCache(hospital_code=hospital_data['hospital_code'], **self.build_defaults(hospital_data))
+            # bulk_create 는 save() 를 거치지 않으므로 저장 시 계산 필드를 미리 채움
+            hospital.refresh_search_keys()
+            hospital.refresh_geohash()
+            hospital.refresh_fingerprint()
+            objects.append(hospital)
+
+        result = bulk_upsert(
+            HospitalCache,
+            objects,
+            unique_field='hospital_code',
+            update_fields=[
+                *self.build_defaults(hospitals[0]),
+                'hospital_name_chosung', 'hospital_name_jamo', 'geohash', 'last_updated',
+            ],
+            fingerprint_field='content_hash',
+        )
+        count_result(self.stats, result)
 
-        logger.info("모든 병원정보 임포트 완료")
+        # 진료과목이 있는 응답이면 바뀐 병원만 역색인 동기화
+        if 'medical_subjects' in hospitals[0] and result.written_keys:
+            HospitalCache.sync_subjects_bulk(
+                HospitalCache.objects.filter(hospital_code__in=result.written_keys).only('pk', 'medical_subjects')
+            )
 
     def process_batch(self, hospitals):
-        """배치 단위로 병원 데이터 처리"""
+        """배치 단위로 병원 데이터 처리 (저장 성공 여부 반환)"""
+        if self.write_mode == 'bulk':
+            try:
+                self.stats['total_received'] += len(hospitals)
+                if hospitals:
+                    if self.subject_fetcher:
+                        self.attach_subjects(hospitals)
+                    self.bulk_upsert_hospitals(hospitals)
+                return True
+            except Exception as e:
+                logger.error(f"배치 처리 중 오류: {e}")
+                self.stats['errors'] += len(hospitals)
+                return False
+
         try:
+            if self.subject_fetcher and hospitals:
+                self.attach_subjects(hospitals)
+
             with transaction.atomic():
+                self.subject_pending = []
                 for hospital_data in hospitals:
                     self.stats['total_received'] += 1
                     result = self.create_or_update_hospital(hospital_data)
 
                     if result in ['created', 'updated']:
                         logger.debug(f"{result}: {hospital_data['hospital_code']} - {hospital_data['hospital_name']}")
+                HospitalCache.sync_subjects_bulk(self.subject_pending)
+            return True
 
         except Exception as e:
             logger.error(f"배치 처리 중 오류: {e}")
             self.stats['errors'] += len(hospitals)
+            return False
 
     def print_summary(self):
         """처리 결과 요약 출력"""
@@ -368,7 +511,10 @@ class HospitalDataImporter:
         logger.info(f"실제 처리 데이터: {self.stats['total_received'] - self.stats['filtered_out']:,}")
         logger.info(f"생성된 데이터: {self.stats['created']:,}")
         logger.info(f"업데이트된 데이터: {self.stats['updated']:,}")
+        logger.info(f"변경 없는 데이터: {self.stats['unchanged']:,}")
         logger.info(f"오류 발생: {self.stats['errors']:,}")
+        if self.subject_fetcher:
+            logger.info(f"진료과목 조회 실패 병원: {self.stats['subject_errors']:,}")
 
         if self.error_details:
             logger.info(f"\n주요 오류 내용 (총 {len(self.error_details)}개 중 최대 10개):")
@@ -378,7 +524,7 @@ class HospitalDataImporter:
         # 성공률 계산 (필터링 제외된 데이터 기준)
         processed_count = self.stats['total_received'] - self.stats['filtered_out']
         if processed_count > 0:
-            success_rate = (self.stats['created'] + self.stats['updated']) / processed_count * 100
+            success_rate = (self.stats['created'] + self.stats['updated'] + self.stats['unchanged']) / processed_count * 100
             logger.info(f"\n성공률: {success_rate:.2f}% (필터링 제외된 데이터 기준)")
 
         # 종별코드별 통계 (가능한 경우)
@@ -398,11 +544,17 @@ def main():
     parser = argparse.ArgumentParser(description='병원정보 API 임포트 스크립트')
     parser.add_argument('--api-key', type=str, required=True, help='공공데이터포털 API 키')
     parser.add_argument('--batch-size', type=int, default=100, help='배치 크기 (최대 1000)')
-    parser.add_argument('--delay', type=float, default=1.0, help='API 호출 간 딜레이(초)')
     parser.add_argument('--sido-codes', type=str, nargs='+', help='특정 시도코드만 수집 (예: 11 26 27)')
     parser.add_argument('--hospital-types', type=str, nargs='+',
                         default=['01', '11', '21'],
                         help='수집할 종별코드 (기본값: 01 11 21 - 상급종합병원, 종합병원, 병원)')
+    add_fetcher_arguments(parser)
+    parser.add_argument('--write-mode', choices=['bulk', 'row'], default='bulk',
+                        help='저장 방식 (bulk: 페이지 단위 upsert, row: 행마다 update_or_create)')
+    parser.add_argument('--resume', action='store_true', help='중단된 임포트를 체크포인트부터 이어서 수집')
+    parser.add_argument('--with-subjects', action='store_true',
+                        help='병원별 진료과목(의료기관별상세정보 API)도 수집해 진료과목 역색인 갱신 (병원마다 요청 1회 추가)')
+    parser.add_argument('--subject-url', type=str, help='진료과목 API 주소 변경 (--with-subjects 와 함께)')
 
     args = parser.parse_args()
 
@@ -417,7 +569,11 @@ def main():
         args.batch_size = 1000
 
     # 임포터 생성 (종별코드 필터 포함)
-    importer = HospitalDataImporter(args.api_key, args.hospital_types)
+    importer = HospitalDataImporter(
+        args.api_key, args.hospital_types, base_url=args.base_url, write_mode=args.write_mode,
+        subject_url=(args.subject_url or SUBJECT_API_URL) if args.with_subjects else None,
+        **fetcher_options(args)
+    )
 
     # 기존 데이터 수 확인
     existing_count = HospitalCache.objects.count()
@@ -427,8 +583,8 @@ def main():
     try:
         importer.import_all_hospitals(
             batch_size=args.batch_size,
-            delay_seconds=args.delay,
-            sido_codes=args.sido_codes
+            sido_codes=args.sido_codes,
+            resume=args.resume
         )
 
         # 결과 요약 출력
@@ -469,4 +625,16 @@ python populate_hospital_cache.py --api-key YOUR_API_KEY --sido-codes 11 --hospi
 
 # 배치 크기와 딜레이 조정
 python populate_hospital_cache.py --api-key YOUR_API_KEY --hospital-types 01 11 21 --batch-size 50 --delay 2
+
+# 동시 요청 8개, 초당 20회 이하로 수집
+python populate_hospital_cache.py --api-key YOUR_API_KEY --workers 8 --rate 20
+
+# 진료과목까지 수집 (진료과목 필터 검색용 역색인 갱신)
+python populate_hospital_cache.py --api-key YOUR_API_KEY --with-subjects
+
+# 중단된 임포트 이어서 수집 (완료된 시도코드는 건너뜀)
+python populate_hospital_cache.py --api-key YOUR_API_KEY --sido-codes 11 26 27 --resume
+
+# 로컬 mock 서버로 수집 (python common/scripts/mock_public_data_server.py)
+python populate_hospital_cache.py --api-key TEST_API_KEY --base-url http://127.0.0.1:8765/B551182/hospInfoServicev2/getHospBasisList
 """
\ No newline at end of file
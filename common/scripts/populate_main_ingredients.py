@@ -31,9 +31,12 @@ sys.path.append(PROJECT_ROOT)
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
 django.setup()
 
-from user.models import MainIngredient
-from django.db import transaction, IntegrityError, models
-from django.core.exceptions import ValidationError
+from common.bulk_upsert import bulk_upsert, count_result
+from user.models import MainIngredient, ReferenceDataVersion
+from user.services.atc_service import rebuild_atc_classes
+from user.services.medication_barcode import replace_barcodes
+from user.services.reference_artifacts import rebuild_reference_artifacts
+from django.db import models
 
 # 로깅 설정
 logging.basicConfig(
@@ -50,8 +53,11 @@ logger = logging.getLogger(__name__)
 class MainIngredientImporter:
     """MainIngredient 임포터 클래스"""
 
-    def __init__(self, api_key=None):
+    def __init__(self, api_key=None, batch_size=500):
         self.api_key = api_key
+        # 저장 대기열 크기 (이만큼 모이면 지문 비교 후 한 번에 upsert)
+        self.batch_size = batch_size
+        self.pending = []
         self.drug_api_url = "http://apis.data.go.kr/1471000/DrugPrdtPrmsnInfoService06/getDrugPrdtPrmsnDtlInq05"
 
         self.stats = {
@@ -63,9 +69,11 @@ class MainIngredientImporter:
             'api_success': 0,
             'created': 0,
             'updated': 0,
+            'unchanged': 0,
             'errors': 0
         }
         self.error_details = []
+        self.barcode_rows = []
 
         # 단위 매핑 테이블
         self.unit_mapping = {
@@ -97,14 +105,19 @@ class MainIngredientImporter:
             df = pd.read_excel(file_path, engine='openpyxl')
 
             # 필요한 컬럼만 선택
-            required_columns = ['일반명코드(성분명코드)', 'ATC코드', '약품규격', '한글상품명', '전문_일반', '제형구분', '표준코드']
+            required_columns = ['일반명코드(성분명코드)', 'ATC코드', '약품규격', '한글상품명', '전문_일반', '제형구분', '표준코드',
+                                '품목기준코드']
             df = df[required_columns].copy()
 
             # 컬럼명 단순화
-            df.columns = ['일반명코드', 'ATC코드', '약품규격', '상품명', '전문일반', '제형구분','표준코드']
+            df.columns = ['일반명코드', 'ATC코드', '약품규격', '상품명', '전문일반', '제형구분','표준코드', '품목기준코드']
 
             logger.info(f"원본 데이터: {len(df):,}개")
 
+            # 바코드 매핑은 필터링 전 전체 품목 기준 (일반의약품 포장도 스캔되므로)
+            self.barcode_rows = self.extract_barcode_rows(df)
+            logger.info(f"표준코드(바코드) 데이터: {len(self.barcode_rows):,}개")
+
             # 일반명코드가 있는 데이터만 필터링
             df = df[df['일반명코드'].notna()].copy()
             df['일반명코드'] = df['일반명코드'].astype(str).str.strip()
@@ -132,6 +145,31 @@ class MainIngredientImporter:
             logger.error(f"의약품표준코드 파일 로드 실패: {e}")
             return None
 
+    @staticmethod
+    def code_text(value):
+        """엑셀 숫자 셀(8806469007510.0 등)도 자릿수 그대로 문자열로"""
+        if pd.isna(value):
+            return ''
+        if isinstance(value, float) and value.is_integer():
+            value = int(value)
+        return str(value).strip()
+
+    def extract_barcode_rows(self, df):
+        """표준코드 -> 품목기준코드(의약품 코드) / 일반명코드 / 상품명"""
+        rows = []
+        for barcode, item_seq, code, product_name in df[['표준코드', '품목기준코드', '일반명코드', '상품명']].itertuples(index=False):
+            barcode = self.code_text(barcode)
+            if not barcode:
+                continue
+            item_seq = self.code_text(item_seq)
+            rows.append({
+                'barcode': barcode,
+                'medication_id': int(item_seq) if item_seq.isdigit() else None,
+                'ingr_code': self.code_text(code)[:20],
+                'product_name': self.code_text(product_name),
+            })
+        return rows
+
     def load_ingredient_data(self, file_path):
         """의약품주성분 데이터 로드"""
         logger.info(f"의약품주성분 파일 로드: {file_path}")
@@ -421,30 +459,60 @@ class MainIngredientImporter:
 
         return ingredients
 
-    def save_ingredient(self, ingredient_data):
-        """주성분 정보 저장"""
-        try:
-            ingredient, created = MainIngredient.objects.update_or_create(
-                ingr_code=ingredient_data['ingr_code'],
-                defaults=ingredient_data
-            )
-
-            if created:
-                self.stats['created'] += 1
-                action = '생성'
-            else:
-                self.stats['updated'] += 1
-                action = '업데이트'
-
-            logger.debug(f"{action}: {ingredient_data['ingr_code']} - {ingredient_data['main_ingr_name_kr']}")
-            return True
+    def save_ingredients(self, ingredients_data):
+        """
+        주성분 정보 저장 대기열에 추가 (복합제 성분들은 같은 배치로 저장)
+        대기열이 batch_size 이상이면 flush_ingredients()
+        """
+        self.pending.extend(ingredients_data)
+        if len(self.pending) >= self.batch_size:
+            self.flush_ingredients()
+
+    def flush_ingredients(self):
+        """
+        대기열 upsert (기존 행 지문 조회 1회 + INSERT ... ON CONFLICT 1회)
+        지문이 같은 주성분은 쓰지 않고 unchanged 로 센다.
+        """
+        if not self.pending:
+            return
+        batch, self.pending = self.pending, []
+
+        objects = []
+        for ingredient_data in batch:
+            ingredient = MainIngredient(**ingredient_data)
+            # bulk_create 는 save() 를 거치지 않으므로 정규화 키/지문을 미리 채움
+            ingredient.refresh_normalized_fields()
+            ingredient.refresh_fingerprint()
+            objects.append(ingredient)
 
-        except (IntegrityError, ValidationError) as e:
-            self.stats['errors'] += 1
-            error_msg = f"저장 오류 - {ingredient_data['ingr_code']}: {str(e)}"
-            self.error_details.append(error_msg)
-            logger.error(error_msg)
-            return False
+        try:
+            self.upsert_ingredients(objects)
+        except Exception as e:
+            # 배치는 한 트랜잭션이라 통째로 롤백됨 - 한 건씩 다시 저장해 문제 행만 오류로 남김
+            logger.warning(f"배치 저장 실패 ({len(objects)}개), 한 건씩 다시 저장: {str(e)}")
+            for ingredient in objects:
+                try:
+                    self.upsert_ingredients([ingredient])
+                except Exception as row_error:
+                    self.stats['errors'] += 1
+                    error_msg = f"저장 오류 - {ingredient.ingr_code}: {str(row_error)}"
+                    self.error_details.append(error_msg)
+                    logger.error(error_msg)
+
+    def upsert_ingredients(self, objects):
+        """주성분 upsert 후 통계 합산"""
+        result = bulk_upsert(
+            MainIngredient,
+            objects,
+            unique_field='ingr_code',
+            update_fields=[
+                'atc_code', 'main_ingr_name_kr', 'main_ingr_name_en', 'density', 'unit',
+                'is_combination_drug', 'combination_group', 'name_kr_key', 'name_en_key', 'updated_at',
+            ],
+            fingerprint_field='content_hash',
+        )
+        count_result(self.stats, result)
+        logger.debug(f"저장: 생성 {result.created} / 업데이트 {result.updated} / 변경 없음 {result.unchanged}")
 
     def import_ingredients(self, standard_code_file, ingredient_file):
         """주성분 정보 임포트"""
@@ -477,15 +545,13 @@ class MainIngredientImporter:
                     ingredients_data = self.process_combination_drug(code, row, ingredient_df)
                     if ingredients_data:
                         self.stats['combination_drugs'] += 1
-                        with transaction.atomic():
-                            for ingredient_data in ingredients_data:
-                                self.save_ingredient(ingredient_data)
+                        self.save_ingredients(ingredients_data)
                 else:
                     # 단일 성분 처리
                     ingredient_data = self.process_single_ingredient(code, row, ingredient_df)
                     if ingredient_data:
                         self.stats['single_ingredients'] += 1
-                        self.save_ingredient(ingredient_data)
+                        self.save_ingredients([ingredient_data])
 
                 self.stats['valid_codes'] += 1
 
@@ -495,7 +561,26 @@ class MainIngredientImporter:
                 self.error_details.append(error_msg)
                 logger.error(error_msg)
 
+        self.flush_ingredients()
         logger.info("MainIngredient 임포트 완료")
+
+        barcode_stats = replace_barcodes(self.barcode_rows)
+        logger.info(
+            f"표준코드(바코드) 매핑 갱신: {barcode_stats['total']:,}개 "
+            f"(신규 {barcode_stats['created']:,}, 삭제 {barcode_stats['deleted']:,})"
+        )
+
+        # 워커의 의약품 오타 추천 인덱스 교체 신호
+        if self.stats['created'] or self.stats['updated']:
+            ReferenceDataVersion.bump(ReferenceDataVersion.MEDICATION)
+            # ATC 코드가 바뀐 성분이 있으면 노드별 성분/의약품 수도 달라짐
+            atc_stats = rebuild_atc_classes()
+            logger.info(f"ATC 분류 트리 재생성: 노드 {atc_stats['nodes']:,}개, 성분 {atc_stats['ingredients']:,}건")
+            artifacts = rebuild_reference_artifacts()
+            logger.info(
+                f"참조 데이터 스냅샷 교체: {artifacts['snapshot']['size']:,} bytes, "
+                f"오프라인 번들 v{artifacts['bundle']['version']}"
+            )
         return True
 
     def print_summary(self):
@@ -509,6 +594,7 @@ class MainIngredientImporter:
         logger.info(f"복합제: {self.stats['combination_drugs']:,}")
         logger.info(f"생성된 레코드: {self.stats['created']:,}")
         logger.info(f"업데이트된 레코드: {self.stats['updated']:,}")
+        logger.info(f"변경 없는 레코드: {self.stats['unchanged']:,}")
         logger.info(f"오류 발생: {self.stats['errors']:,}")
 
         if self.api_key:
@@ -664,6 +750,8 @@ def main():
                         help='복합제 정보 조회용 API 키 (선택사항)')
     parser.add_argument('--clear-existing', action='store_true',
                         help='기존 데이터 삭제 후 새로 생성')
+    parser.add_argument('--batch-size', type=int, default=500,
+                        help='한 번에 지문을 비교해 저장할 주성분 수')
 
     args = parser.parse_args()
 
@@ -677,7 +765,7 @@ def main():
         sys.exit(1)
 
     # 임포터 생성
-    importer = MainIngredientImporter(args.api_key)
+    importer = MainIngredientImporter(args.api_key, batch_size=args.batch_size)
 
     # 기존 데이터 삭제 옵션
     if args.clear_existing:
@@ -15,7 +15,6 @@ import django
 import requests
 import xml.etree.ElementTree as ET
 import logging
-import time
 from datetime import datetime, date
 from decimal import Decimal
 
@@ -30,7 +29,13 @@ sys.path.append(PROJECT_ROOT)
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
 django.setup()
 
-from user.models import Medication
+from common.import_checkpoint import ImportCheckpointTracker
+from common.public_data import PublicDataFetcher, add_fetcher_arguments, fetcher_options
+from common.xml_stream import ParseStats, PublicDataXmlStream
+from user.models import ImportCheckpoint, Medication, ReferenceDataVersion
+from user.services.atc_service import rebuild_atc_classes
+from user.services.medication_facets import rebuild_medication_facets
+from user.services.reference_artifacts import rebuild_reference_artifacts
 from django.db import transaction, IntegrityError
 from django.core.exceptions import ValidationError
 
@@ -49,16 +54,18 @@ logger = logging.getLogger(__name__)
 class MedicationImporter:
     """의약품 정보 API 임포터 클래스"""
 
-    def __init__(self, api_key):
+    def __init__(self, api_key, base_url=None, **fetcher_options):
         self.api_key = api_key
-        self.base_url = "http://apis.data.go.kr/1471000/DrugPrdtPrmsnInfoService06/getDrugPrdtPrmsnDtlInq05"
-
-        # requests 세션 설정
-        self.session = requests.Session()
-        self.session.verify = False
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.base_url = base_url or "http://apis.data.go.kr/1471000/DrugPrdtPrmsnInfoService06/getDrugPrdtPrmsnDtlInq05"
+
+        # 스레드별 keep-alive 세션으로 병렬 수집
+        self.fetcher = PublicDataFetcher(
+            self.base_url,
+            verify=False,
+            headers={'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'},
+            **fetcher_options
+        )
+        self.parse_stats = ParseStats()
 
         self.stats = {
             'total_ingredients': 0,
@@ -110,9 +117,9 @@ class MedicationImporter:
 
         logger.info(f"총 {len(self.medication_ingredients)}개 성분명으로 의약품 검색 예정")
 
-    def get_medication_data(self, item_name, page_no=1, num_of_rows=100):
-        """API에서 의약품 데이터 가져오기"""
-        params = {
+    def build_params(self, item_name, page_no, num_of_rows):
+        """API 요청 파라미터"""
+        return {
             'serviceKey': self.api_key,
             'pageNo': str(page_no),
             'numOfRows': str(num_of_rows),
@@ -120,20 +127,12 @@ class MedicationImporter:
             'type': 'xml'
         }
 
+    def get_medication_data(self, item_name, page_no=1, num_of_rows=100):
+        """API에서 의약품 데이터 가져오기 (단일 페이지)"""
         try:
             logger.info(f"API 호출 - 성분명: {item_name}, 페이지: {page_no}")
-            response = self.session.get(
-                self.base_url,
-                params=params,
-                timeout=30,
-                verify=False
-            )
-
-            logger.debug(f"응답 상태: {response.status_code}")
-            logger.debug(f"실제 요청 URL: {response.url}")
-
-            response.raise_for_status()
-            return self.parse_xml_response(response.text, item_name)
+            body = self.fetcher.get(self.build_params(item_name, page_no, num_of_rows))
+            return self.parse_xml_response(body, item_name)
 
         except requests.exceptions.RequestException as e:
             logger.error(f"API 호출 실패 ({item_name}): {e}")
@@ -142,33 +141,31 @@ class MedicationImporter:
             logger.error(f"데이터 처리 실패 ({item_name}): {e}")
             return None, 0, f"데이터 처리 실패: {e}"
 
-    def parse_xml_response(self, xml_text, item_name):
-        """XML 응답 파싱"""
+    def parse_xml_response(self, body, item_name):
+        """XML 응답 스트리밍 파싱 (item 을 받는 대로 추출)"""
         try:
-            root = ET.fromstring(xml_text)
-
-            # 결과 코드 확인
-            result_code = root.find('.//resultCode')
-            if result_code is not None and result_code.text != '00':
-                result_msg = root.find('.//resultMsg')
-                error_msg = result_msg.text if result_msg is not None else "알 수 없는 오류"
-                logger.warning(f"API 경고 ({item_name}): {result_code.text} - {error_msg}")
-                return [], 0, None
-
-            # 총 개수 확인
-            total_count_elem = root.find('.//totalCount')
-            total_count = int(total_count_elem.text) if total_count_elem is not None else 0
+            stream = PublicDataXmlStream(body)
 
             # 의약품 데이터 추출
             medications = []
-            items = root.findall('.//item')
 
-            for item in items:
-                medication_data = self.extract_medication_data(item, item_name)
+            for fields in stream:
+                medication_data = self.extract_medication_data(fields, item_name)
                 if medication_data:
                     medications.append(medication_data)
+            self.parse_stats.add(stream)
 
-            return medications, total_count, None
+            # 결과 코드 확인
+            if stream.is_no_data:
+                logger.warning(f"API 경고 ({item_name}): {stream.result_code} - {stream.result_msg}")
+                return [], 0, None
+            if stream.is_error:
+                error_msg = stream.result_msg or "알 수 없는 오류"
+                logger.error(f"API 오류 ({item_name}): {stream.result_code} - {error_msg}")
+                return None, 0, error_msg
+
+            # 총 개수 (항목 뒤에 옴)
+            return medications, stream.total_count, None
 
         except ET.ParseError as e:
             logger.error(f"XML 파싱 오류 ({item_name}): {e}")
@@ -178,11 +175,10 @@ class MedicationImporter:
             return None, 0, f"응답 처리 오류: {e}"
 
     def extract_medication_data(self, item, search_ingredient):
-        """XML item에서 의약품 데이터 추출"""
+        """XML item 필드({태그: 텍스트})에서 의약품 데이터 추출"""
         try:
             def get_text(element_name, default=''):
-                elem = item.find(element_name)
-                return elem.text.strip() if elem is not None and elem.text else default
+                return item.get(element_name) or default
 
             def get_decimal(element_name, default=None):
                 try:
@@ -320,69 +316,8 @@ class MedicationImporter:
             logger.error(error_msg)
             return 'error'
 
-    def import_medications_by_ingredient(self, ingredient, batch_size=100, delay_seconds=1):
-        """특정 성분명으로 의약품 정보 임포트"""
-        logger.info(f"🔍 '{ingredient}' 성분 의약품 검색 시작")
-
-        try:
-            # 첫 번째 호출로 총 개수 확인
-            medications, total_count, error = self.get_medication_data(
-                item_name=ingredient,
-                page_no=1,
-                num_of_rows=batch_size
-            )
-
-            if error:
-                logger.error(f"'{ingredient}' 성분 검색 실패: {error}")
-                self.stats['failed_ingredients'] += 1
-                return False
-
-            if total_count == 0:
-                logger.info(f"'{ingredient}' 성분으로 등록된 의약품이 없습니다.")
-                self.stats['successful_ingredients'] += 1
-                return True
-
-            logger.info(f"'{ingredient}' 성분: 총 {total_count}개 의약품 발견")
-            self.stats['total_medications_found'] += total_count
-
-            # 첫 번째 배치 처리
-            if medications:
-                self.process_batch(medications)
-
-            # 나머지 페이지 처리
-            if total_count > batch_size:
-                total_pages = (total_count + batch_size - 1) // batch_size
-
-                for page_no in range(2, total_pages + 1):
-                    logger.debug(f"'{ingredient}' 성분: {page_no}/{total_pages} 페이지 처리 중...")
-
-                    # API 호출 제한을 위한 딜레이
-                    time.sleep(delay_seconds)
-
-                    medications, _, error = self.get_medication_data(
-                        item_name=ingredient,
-                        page_no=page_no,
-                        num_of_rows=batch_size
-                    )
-
-                    if error:
-                        logger.error(f"'{ingredient}' 성분 페이지 {page_no} 호출 실패: {error}")
-                        continue
-
-                    if medications:
-                        self.process_batch(medications)
-
-            self.stats['successful_ingredients'] += 1
-            logger.info(f"✅ '{ingredient}' 성분 검색 완료")
-            return True
-
-        except Exception as e:
-            logger.error(f"'{ingredient}' 성분 처리 중 예외 발생: {e}")
-            self.stats['failed_ingredients'] += 1
-            return False
-
     def process_batch(self, medications):
-        """배치 단위로 의약품 데이터 처리"""
+        """배치 단위로 의약품 데이터 처리 (저장 성공 여부 반환)"""
         try:
             with transaction.atomic():
                 for medication_data in medications:
@@ -390,13 +325,18 @@ class MedicationImporter:
 
                     if result in ['created', 'updated']:
                         logger.debug(f"{result}: {medication_data['item_name']} ({medication_data['entp_name']})")
+            return True
 
         except Exception as e:
             logger.error(f"배치 처리 중 오류: {e}")
             self.stats['errors'] += len(medications)
+            return False
 
-    def import_all_medications(self, batch_size=100, delay_seconds=1, specific_ingredients=None):
-        """모든 성분명으로 의약품 정보 임포트"""
+    def import_all_medications(self, batch_size=100, specific_ingredients=None, resume=False):
+        """
+        모든 성분명으로 의약품 정보 임포트 (페이지는 병렬 수집, 저장은 받은 순서대로)
+        resume: 체크포인트에서 이어서 수집 (완료된 성분은 건너뜀)
+        """
         logger.info("정신건강의학과 의약품 정보 임포트 시작")
 
         # 특정 성분만 지정된 경우
@@ -408,21 +348,66 @@ class MedicationImporter:
 
         self.stats['total_ingredients'] = len(ingredients_to_search)
 
-        for i, ingredient in enumerate(ingredients_to_search, 1):
-            logger.info(f"📋 진행률: {i}/{len(ingredients_to_search)} ({(i / len(ingredients_to_search) * 100):.1f}%)")
-
-            success = self.import_medications_by_ingredient(
-                ingredient=ingredient,
-                batch_size=batch_size,
-                delay_seconds=delay_seconds
-            )
-
-            # 성분 간 딜레이
-            if i < len(ingredients_to_search):
-                time.sleep(delay_seconds)
+        checkpoint = ImportCheckpointTracker(ImportCheckpoint.MEDICATION, batch_size, resume)
+        pending_ingredients, completed = checkpoint.start(ingredients_to_search)
+        self.stats['successful_ingredients'] += len(ingredients_to_search) - len(pending_ingredients)
+        # 성분별 남은 페이지 수 (0 이 되면 완료)
+        remaining_pages = checkpoint.remaining_pages(completed)
+
+        pages = self.fetcher.fetch_pages(
+            pending_ingredients,
+            build_params=self.build_params,
+            parse=lambda ingredient, text: self.parse_xml_response(text, ingredient),
+            num_of_rows=batch_size,
+            completed=completed
+        )
+        for page in pages:
+            ingredient = page.query
+            if page.error:
+                if page.page_no == 1:
+                    logger.error(f"'{ingredient}' 성분 검색 실패: {page.error}")
+                    self.stats['failed_ingredients'] += 1
+                else:
+                    logger.error(f"'{ingredient}' 성분 페이지 {page.page_no} 호출 실패: {page.error}")
+                    remaining_pages[ingredient] -= 1
+                continue
+
+            if page.page_no == 1:
+                remaining_pages[ingredient] = max(1, (page.total_count + batch_size - 1) // batch_size)
+                if page.total_count == 0:
+                    logger.info(f"'{ingredient}' 성분으로 등록된 의약품이 없습니다.")
+                else:
+                    logger.info(f"'{ingredient}' 성분: 총 {page.total_count}개 의약품 발견")
+                    self.stats['total_medications_found'] += page.total_count
+
+            # 저장에 실패한 페이지는 체크포인트에 남기지 않음 (--resume 시 다시 수집)
+            if not page.items or self.process_batch(page.items):
+                checkpoint.page_done(ingredient, page.page_no, page.total_count)
+
+            remaining_pages[ingredient] -= 1
+            if remaining_pages[ingredient] == 0:
+                self.stats['successful_ingredients'] += 1
+                done = self.stats['successful_ingredients'] + self.stats['failed_ingredients']
+                logger.info(f"✅ '{ingredient}' 성분 검색 완료 (📋 진행률: {done}/{len(ingredients_to_search)})")
 
+        self.fetcher.close()
+        logger.info(f"API 요청 통계: {self.fetcher.stats}")
+        logger.info(self.parse_stats.summary())
         logger.info("모든 의약품 정보 임포트 완료")
 
+        # 워커의 의약품 오타 추천 인덱스 교체 신호
+        if self.stats['medications_created'] or self.stats['medications_updated'] or checkpoint.resumed_pages:
+            ReferenceDataVersion.bump(ReferenceDataVersion.MEDICATION)
+            facet_stats = rebuild_medication_facets()
+            logger.info(f"의약품 패싯 재생성: 패싯 값 {facet_stats['facet_values']:,}개")
+            atc_stats = rebuild_atc_classes()
+            logger.info(f"ATC 분류 트리 재생성: 노드 {atc_stats['nodes']:,}개, 의약품 {atc_stats['medications']:,}건")
+            artifacts = rebuild_reference_artifacts()
+            logger.info(
+                f"참조 데이터 스냅샷 교체: {artifacts['snapshot']['size']:,} bytes, "
+                f"오프라인 번들 v{artifacts['bundle']['version']}"
+            )
+
     def print_summary(self):
         """처리 결과 요약 출력"""
         logger.info("=" * 50)
@@ -461,8 +446,9 @@ def main():
     parser = argparse.ArgumentParser(description='정신건강의학과 의약품 정보 임포트 스크립트')
     parser.add_argument('--api-key', type=str, required=True, help='공공데이터포털 API 키')
     parser.add_argument('--batch-size', type=int, default=100, help='배치 크기 (최대 1000)')
-    parser.add_argument('--delay', type=float, default=1.0, help='API 호출 간 딜레이(초)')
     parser.add_argument('--ingredients', type=str, nargs='+', help='특정 성분만 검색 (예: Fluoxetine Sertraline)')
+    add_fetcher_arguments(parser)
+    parser.add_argument('--resume', action='store_true', help='중단된 임포트를 체크포인트부터 이어서 수집')
 
     args = parser.parse_args()
 
@@ -477,7 +463,7 @@ def main():
         args.batch_size = 1000
 
     # 임포터 생성
-    importer = MedicationImporter(args.api_key)
+    importer = MedicationImporter(args.api_key, base_url=args.base_url, **fetcher_options(args))
 
     # 기존 데이터 수 확인
     existing_count = Medication.objects.count()
@@ -487,8 +473,8 @@ def main():
     try:
         importer.import_all_medications(
             batch_size=args.batch_size,
-            delay_seconds=args.delay,
-            specific_ingredients=args.ingredients
+            specific_ingredients=args.ingredients,
+            resume=args.resume
         )
 
         # 결과 요약 출력
@@ -523,4 +509,13 @@ python populate_medication.py --api-key YOUR_API_KEY --batch-size 50 --delay 2
 
 # 몇 개 성분으로 테스트
 python populate_medication.py --api-key YOUR_API_KEY --ingredients Fluoxetine Paroxetine --delay 0.5
+
+# 동시 요청 8개, 초당 20회 이하로 수집
+python populate_medication.py --api-key YOUR_API_KEY --workers 8 --rate 20
+
+# 중단된 임포트 이어서 수집 (완료된 성분은 건너뜀)
+python populate_medication.py --api-key YOUR_API_KEY --resume
+
+# 로컬 mock 서버로 수집 (python common/scripts/mock_public_data_server.py)
+python populate_medication.py --api-key TEST_API_KEY --base-url http://127.0.0.1:8765/1471000/DrugPrdtPrmsnInfoService06/getDrugPrdtPrmsnDtlInq05
 """
\ No newline at end of file
@@ -13,8 +13,8 @@ os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
 django.setup()
 
 from django.db import transaction
-from user.models.main_ingredient import MainIngredient
 from user.models import Medication  # 실제 앱 이름으로 변경
+from user.services.ingredient_lookup import IngredientNameLookup
 
 
 class MedicationAPICollector:
@@ -24,6 +24,8 @@ class MedicationAPICollector:
         self.collected_count = 0
         self.target_count = 5000
         self.delay = 0.1  # API 호출 간격 (초)
+        # 정규화 성분명 사전 (실행당 한 번 적재)
+        self.ingredient_lookup = IngredientNameLookup()
 
     def get_medication_data(self, page_no=1, num_of_rows=100):
         """의약품 정보 API 호출"""
@@ -80,29 +82,11 @@ class MedicationAPICollector:
         pass
 
     def find_matching_main_ingredient(self, main_ingr_eng):
-        """API의 MAIN_INGR_ENG와 완전히 일치하는 MainIngredient 찾기"""
+        """API의 MAIN_INGR_ENG와 정규화 키가 일치하는 MainIngredient 찾기 (없으면 영문명 부분 일치)"""
         if not main_ingr_eng or not main_ingr_eng.strip():
             return None
 
-        try:
-            # main_ingr_name_en 컬럼에 API의 MAIN_INGR_ENG 문자열이 전체가 포함되어 있는지 확인
-            # 대소문자 구분 없이 검색하고, 공백 제거 후 비교
-            clean_main_ingr_eng = main_ingr_eng.strip()
-
-            matching_ingredients = MainIngredient.objects.filter(
-                main_ingr_name_en__icontains=clean_main_ingr_eng,
-                is_active=True
-            )
-
-            # 정확한 일치 확인 (전체 문자열이 포함되어야 함)
-            for ingredient in matching_ingredients:
-                if clean_main_ingr_eng.lower() in ingredient.main_ingr_name_en.lower():
-                    return ingredient
-
-            return None
-        except Exception as e:
-            print(f"주성분 매칭 오류 ({main_ingr_eng}): {e}")
-            return None
+        return self.ingredient_lookup.find(main_ingr_eng, partial_field='main_ingr_name_en')
 
     def save_medication_data(self, medication_data):
         """의약품 데이터를 데이터베이스에 저장"""
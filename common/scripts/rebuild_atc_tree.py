@@ -0,0 +1,52 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+ATC 분류 트리(AtcClass) 재생성 스크립트
+
+주성분/의약품 임포트와 의약품-성분 매칭 스크립트는 끝날 때 트리를 자동으로 재생성한다.
+이 스크립트는 수동으로 다시 집계할 때 실행 - 1~5단계 노드와 노드별 성분/의약품 수를 다시 집계하고 트리 세대를 올린다.
+
+사용법:
+python rebuild_atc_tree.py
+"""
+
+import os
+import sys
+import time
+import django
+import logging
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from user.services.atc_service import rebuild_atc_classes
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """메인 실행 함수"""
+    logger.info("🌳 ATC 분류 트리 재생성 시작")
+    started = time.monotonic()
+
+    stats = rebuild_atc_classes()
+
+    logger.info(
+        f"✅ 완료: 노드 {stats['nodes']:,}개, 성분 {stats['ingredients']:,}건, "
+        f"의약품 {stats['medications']:,}건 ({time.monotonic() - started:.1f}초)"
+    )
+
+
+if __name__ == "__main__":
+    main()
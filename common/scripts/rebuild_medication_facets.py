@@ -0,0 +1,52 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+의약품 패싯(제조사/약효분류/제형/복합제 여부) 재생성 스크립트
+
+의약품 임포트(populate_medication.py)와 의약품-성분 매칭(medication_ingredient_matcher.py)이
+끝나면 자동으로 호출되며, ATC 분류명을 갱신한 뒤 등 수동으로 다시 집계할 때 실행한다.
+
+사용법:
+python rebuild_medication_facets.py
+"""
+
+import os
+import sys
+import time
+import django
+import logging
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from user.services.medication_facets import rebuild_medication_facets
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+
+def main():
+    """메인 실행 함수"""
+    logger.info("🗂️ 의약품 패싯 재생성 시작")
+    started = time.monotonic()
+
+    stats = rebuild_medication_facets()
+
+    logger.info(
+        f"✅ 완료: 패싯 값 {stats['facet_values']:,}개, 의약품 연결 {stats['members']:,}건 "
+        f"({time.monotonic() - started:.1f}초)"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+# !/usr/bin/env python
+# -*- coding: utf-8 -*-
+"""
+의약품/병원/질병 캐시 테이블의 한글 검색키(초성/자모)를 일괄 재생성하는 스크립트
+
+임포터는 update_or_create(save) 경로로 검색키를 함께 갱신하므로 평소에는 필요 없고,
+raw SQL/bulk 작업으로 이름이 바뀌었거나 분해 규칙(common/hangul.py)이 바뀐 경우 실행한다.
+
+사용법:
+python rebuild_search_keys.py
+python rebuild_search_keys.py --models medication hospital
+"""
+
+import os
+import sys
+import django
+import logging
+import argparse
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'ayak.settings')
+django.setup()
+
+from django.db import transaction
+from user.models import Medication, HospitalCache, DiseaseCache
+
+# 로깅 설정
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+logger = logging.getLogger(__name__)
+
+SEARCH_KEY_MODELS = {
+    'medication': Medication,
+    'hospital': HospitalCache,
+    'disease': DiseaseCache,
+}
+
+
+class SearchKeyRebuilder:
+    """한글 검색키 일괄 재생성기"""
+
+    def __init__(self, batch_size=1000):
+        self.batch_size = batch_size
+        self.stats = {
+            'total_processed': 0,
+            'updated': 0,
+        }
+
+    def rebuild(self, model):
+        """모델 하나의 검색키 재생성 (값이 바뀐 행만 저장)"""
+        source_fields = list(model.search_key_fields)
+        key_fields = [field for fields in model.search_key_fields.values() for field in fields]
+        logger.info(f"🔤 {model._meta.db_table} 검색키 재생성 시작")
+
+        batch = []
+        queryset = model.objects.only('pk', *source_fields, *key_fields).order_by('pk')
+        for obj in queryset.iterator(chunk_size=self.batch_size):
+            self.stats['total_processed'] += 1
+            before = [getattr(obj, field) for field in key_fields]
+            obj.refresh_search_keys()
+            if before != [getattr(obj, field) for field in key_fields]:
+                batch.append(obj)
+
+            if len(batch) >= self.batch_size:
+                self.flush(model, batch, key_fields)
+                batch = []
+
+        if batch:
+            self.flush(model, batch, key_fields)
+
+        logger.info(f"✅ {model._meta.db_table} 완료 (누적 갱신 {self.stats['updated']:,}건)")
+
+    def flush(self, model, batch, key_fields):
+        with transaction.atomic():
+            model.objects.bulk_update(batch, key_fields)
+        self.stats['updated'] += len(batch)
+
+
+def main():
+    """메인 실행 함수"""
+    parser = argparse.ArgumentParser(description='한글 검색키(초성/자모) 재생성 스크립트')
+    parser.add_argument('--models', type=str, nargs='+', choices=list(SEARCH_KEY_MODELS),
+                        default=list(SEARCH_KEY_MODELS), help='재생성할 대상')
+    parser.add_argument('--batch-size', type=int, default=1000, help='배치 크기')
+    args = parser.parse_args()
+
+    rebuilder = SearchKeyRebuilder(batch_size=args.batch_size)
+    for name in args.models:
+        rebuilder.rebuild(SEARCH_KEY_MODELS[name])
+
+    logger.info(f"처리: {rebuilder.stats['total_processed']:,}건, 갱신: {rebuilder.stats['updated']:,}건")
+
+
+if __name__ == "__main__":
+    main()
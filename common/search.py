@@ -0,0 +1,97 @@
+# common/search.py
+"""검색 공통 유틸리티 (매칭 등급, 하이라이트)"""
+import re
+
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, When
+
+# 매칭 등급 - 낮을수록 상위 노출
+MATCH_PREFIX = 0     # 이름이 검색어로 시작
+MATCH_WORD = 1       # 단어(또는 성분명)가 검색어로 시작
+MATCH_SUBSTRING = 2  # 이름 중간에 포함
+
+# match_rank_expression 의 단어 구분자 (match_rank 의 분리 정규식 중 단어 앞에 올 수 있는 문자)
+WORD_SEPARATORS = (' ', '(', ')', ',', '/', '[', ']')
+
+HIGHLIGHT_PRE = '<b>'
+HIGHLIGHT_POST = '</b>'
+
+
+def escape_like(value: str, escape_char: str = '\\') -> str:
+    """LIKE 패턴용 특수문자 이스케이프"""
+    return (
+        value.replace(escape_char, escape_char * 2)
+        .replace('%', f'{escape_char}%')
+        .replace('_', f'{escape_char}_')
+    )
+
+
+def prefix_filter(field: str, prefix: str) -> Q:
+    """
+    인덱스를 타는 접두 검색 조건
+    - SQLite: LIKE 는 BINARY 콜레이션 인덱스를 못 타므로 범위 조건(>= prefix, < prefix + U+FFFF)
+    - PostgreSQL: db_index 필드에 자동 생성되는 varchar_pattern_ops(_like) 인덱스로 startswith
+    """
+    if connection.vendor == 'sqlite':
+        return Q(**{f'{field}__gte': prefix, f'{field}__lt': prefix + '\uffff'})
+    return Q(**{f'{field}__startswith': prefix})
+
+
+def match_rank(text: str, keyword: str) -> int:
+    """검색어와 텍스트의 매칭 등급 계산"""
+    if not text or not keyword:
+        return MATCH_SUBSTRING
+
+    text = text.lower()
+    keyword = keyword.lower()
+
+    if text.startswith(keyword):
+        return MATCH_PREFIX
+    if any(word.startswith(keyword) for word in re.split(r'[\s(),/\[\]]+', text)):
+        return MATCH_WORD
+    return MATCH_SUBSTRING
+
+
+def match_rank_expression(field: str, keyword: str) -> Case:
+    """
+    match_rank() 의 DB 버전 - 정렬/슬라이싱 전에 등급순으로 자르기 위한 annotate 식
+    (단어 시작은 WORD_SEPARATORS 뒤에 오는 경우로 판단)
+    """
+    word_start = Q()
+    for separator in WORD_SEPARATORS:
+        word_start |= Q(**{f'{field}__icontains': f'{separator}{keyword}'})
+    return Case(
+        When(**{f'{field}__istartswith': keyword}, then=MATCH_PREFIX),
+        When(word_start, then=MATCH_WORD),
+        default=MATCH_SUBSTRING,
+        output_field=IntegerField(),
+    )
+
+
+def highlight(text: str, keyword: str, pre: str = HIGHLIGHT_PRE, post: str = HIGHLIGHT_POST) -> str:
+    """텍스트 내 첫 번째 검색어 위치를 마커로 감싸기 (대소문자 무시)"""
+    if not text or not keyword:
+        return text or ''
+
+    index = text.lower().find(keyword.lower())
+    if index < 0:
+        return text
+
+    end = index + len(keyword)
+    return f'{text[:index]}{pre}{text[index:end]}{post}{text[end:]}'
+
+
+def highlight_key_prefix(text: str, key: str, to_key, pre: str = HIGHLIGHT_PRE, post: str = HIGHLIGHT_POST) -> str:
+    """
+    검색키(초성/자모) 접두 매칭 시 원문에서 대응하는 앞부분을 마커로 감싸기
+    to_key 는 글자 단위로 분해되는 함수여야 한다 (common.hangul.to_chosung / to_jamo)
+    """
+    if not text or not key:
+        return text or ''
+
+    matched = ''
+    for end, char in enumerate(text, start=1):
+        matched += to_key(char)
+        if len(matched) >= len(key):
+            return f'{pre}{text[:end]}{post}{text[end:]}'
+    return text
@@ -0,0 +1,257 @@
+# common/snapshot.py
+"""
+읽기 전용 바이너리 스냅샷 (mmap)
+
+참조 데이터 조회표를 파일 하나에 써 두고 각 워커가 mmap 으로 연다.
+페이지 캐시를 모든 워커가 공유하므로 워커 수만큼 메모리가 늘지 않고,
+키 배열/오프셋 배열은 memoryview 로 그대로 읽어 복사하지 않는다.
+
+파일 구조 (정수는 모두 little-endian uint32)
+    MAGIC(8) | 헤더 길이(4) | 헤더 JSON | 8바이트 정렬 | 테이블별 구역...
+테이블별 구역
+    key_offsets  (n + 1)  키 풀 안의 시작 위치 (정렬된 키 순서)
+    keys         키 풀 (UTF-8)
+    record_offsets (n + 1) 레코드 풀 안의 시작 위치
+    records      레코드 풀 (UTF-8 JSON)
+
+교체는 임시 파일에 쓴 뒤 os.replace() 로 바꿔치기하며, 워커는 파일 inode 가
+바뀐 것을 보고 새로 연다. 이전 mmap 은 참조가 끝나면 해제된다.
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+import time
+from array import array
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b'AYKSNAP1'
+_HEADER_LENGTH = struct.Struct('<I')
+_ALIGNMENT = 8
+_MAX_POOL_SIZE = 2 ** 32 - 1
+
+# 파일 교체 확인 주기 (초)
+FILE_CHECK_INTERVAL = 30
+
+
+def _aligned(position: int) -> int:
+    return (position + _ALIGNMENT - 1) // _ALIGNMENT * _ALIGNMENT
+
+
+def _encode_table(rows: Iterable[Tuple[str, Any]]) -> Tuple[int, bytes, bytes, bytes, bytes]:
+    """(키, 레코드) 목록 -> 키 순 정렬된 (건수, key_offsets, keys, record_offsets, records)"""
+    encoded = sorted(
+        (str(key).encode('utf-8'), json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+        for key, record in rows
+    )
+
+    key_offsets = array('I', [0])
+    record_offsets = array('I', [0])
+    keys = bytearray()
+    records = bytearray()
+    previous_key = None
+    for key, record in encoded:
+        if key == previous_key:
+            raise ValueError(f'스냅샷 키 중복: {key.decode("utf-8")}')
+        previous_key = key
+        keys += key
+        records += record
+        if len(records) > _MAX_POOL_SIZE or len(keys) > _MAX_POOL_SIZE:
+            raise ValueError('스냅샷 테이블이 4GB 를 넘습니다.')
+        key_offsets.append(len(keys))
+        record_offsets.append(len(records))
+
+    if sys.byteorder != 'little':
+        key_offsets.byteswap()
+        record_offsets.byteswap()
+    return len(encoded), key_offsets.tobytes(), bytes(keys), record_offsets.tobytes(), bytes(records)
+
+
+def write_snapshot(path: str, tables: Dict[str, Tuple[int, Iterable[Tuple[str, Any]]]]) -> Dict[str, int]:
+    """
+    스냅샷 파일 작성 (원자적 교체)
+    :param tables: {테이블명: (세대 번호, (키, JSON 직렬화 가능한 레코드) 목록)}
+    :return: 테이블별 건수
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+
+    header = {'created_at': int(time.time()), 'tables': {}}
+    sections = []
+    counts = {}
+    position = 0
+    for name, (generation, rows) in tables.items():
+        count, *parts = _encode_table(rows)
+        counts[name] = count
+        table_header = {'count': count, 'generation': generation}
+        for part_name, part in zip(('key_offsets', 'keys', 'record_offsets', 'records'), parts):
+            position = _aligned(position)
+            table_header[part_name] = [position, len(part)]
+            sections.append((position, part))
+            position += len(part)
+        header['tables'][name] = table_header
+
+    header_bytes = json.dumps(header, ensure_ascii=False).encode('utf-8')
+    data_start = _aligned(len(MAGIC) + _HEADER_LENGTH.size + len(header_bytes))
+
+    fd, temp_path = tempfile.mkstemp(prefix='.snapshot-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(MAGIC)
+            file.write(_HEADER_LENGTH.pack(len(header_bytes)))
+            file.write(header_bytes)
+            for offset, part in sections:
+                file.write(b'\0' * (data_start + offset - file.tell()))
+                file.write(part)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return counts
+
+
+class SnapshotTable:
+    """정렬된 키 배열 이진 탐색 (mmap 위 memoryview, 복사 없음)"""
+
+    def __init__(self, buffer: memoryview, data_start: int, meta: Dict[str, Any]):
+        def section(name):
+            offset, length = meta[name]
+            return buffer[data_start + offset:data_start + offset + length]
+
+        self.count = meta['count']
+        self.generation = meta['generation']
+        self.key_offsets = section('key_offsets').cast('I')
+        self.keys = section('keys')
+        self.record_offsets = section('record_offsets').cast('I')
+        self.records = section('records')
+
+    def __len__(self):
+        return self.count
+
+    def find(self, key: Any) -> int:
+        """키 위치 (없으면 -1)"""
+        target = str(key).encode('utf-8')
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            candidate = self.keys[self.key_offsets[middle]:self.key_offsets[middle + 1]]
+            if candidate == target:
+                return middle
+            if bytes(candidate) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return -1
+
+    def get_raw(self, key: Any) -> Optional[memoryview]:
+        position = self.find(key)
+        if position < 0:
+            return None
+        return self.records[self.record_offsets[position]:self.record_offsets[position + 1]]
+
+    def get(self, key: Any) -> Optional[Any]:
+        raw = self.get_raw(key)
+        return None if raw is None else json.loads(bytes(raw))
+
+
+class Snapshot:
+    """mmap 으로 연 스냅샷 파일"""
+
+    def __init__(self, path: str, mapped: mmap.mmap, identity: Tuple[int, int, int]):
+        self.path = path
+        self.mapped = mapped
+        self.identity = identity
+        buffer = memoryview(mapped)
+
+        if bytes(buffer[:len(MAGIC)]) != MAGIC:
+            raise ValueError(f'스냅샷 형식이 아닙니다: {path}')
+        header_start = len(MAGIC) + _HEADER_LENGTH.size
+        (header_length,) = _HEADER_LENGTH.unpack(buffer[len(MAGIC):header_start])
+        self.header = json.loads(bytes(buffer[header_start:header_start + header_length]))
+        data_start = _aligned(header_start + header_length)
+
+        self.tables = {
+            name: SnapshotTable(buffer, data_start, meta)
+            for name, meta in self.header['tables'].items()
+        }
+
+    @classmethod
+    def open(cls, path: str) -> 'Snapshot':
+        if sys.byteorder != 'little':
+            raise RuntimeError('big-endian 환경에서는 스냅샷을 열 수 없습니다.')
+        with open(path, 'rb') as file:
+            stat = os.fstat(file.fileno())
+            mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(path, mapped, (stat.st_dev, stat.st_ino, stat.st_mtime_ns))
+
+    def __len__(self):
+        return sum(len(table) for table in self.tables.values())
+
+    def table(self, name: str) -> Optional[SnapshotTable]:
+        return self.tables.get(name)
+
+
+def _file_identity(path: str) -> Optional[Tuple[int, int, int]]:
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_dev, stat.st_ino, stat.st_mtime_ns
+
+
+class MappedSnapshotHolder:
+    """
+    프로세스 단위 스냅샷 보관소
+    FILE_CHECK_INTERVAL 마다 파일 inode/수정시각을 확인해 교체된 파일을 새로 연다.
+    파일이 없거나 깨졌으면 None (호출 측은 DB/캐시 조회로 대체)
+    """
+
+    def __init__(self, path_getter):
+        self.path_getter = path_getter
+        self.snapshot = None
+        self.checked_at = 0.0
+        self.lock = threading.Lock()
+
+    def get(self) -> Optional[Snapshot]:
+        if time.monotonic() - self.checked_at > FILE_CHECK_INTERVAL and self.lock.acquire(blocking=False):
+            try:
+                self.checked_at = time.monotonic()
+                self.reload_if_changed()
+            finally:
+                self.lock.release()
+        return self.snapshot
+
+    def reload_if_changed(self):
+        path = self.path_getter()
+        identity = _file_identity(path)
+        if identity is None:
+            self.snapshot = None
+            return
+        if self.snapshot is not None and self.snapshot.identity == identity:
+            return
+
+        try:
+            snapshot = Snapshot.open(path)
+        except (OSError, ValueError, RuntimeError) as e:
+            logger.warning(f"스냅샷 열기 실패, DB 조회로 대체합니다: {path} ({e})")
+            self.snapshot = None
+            return
+
+        # 이전 mmap 은 사용 중인 memoryview 가 사라지면 GC 가 해제
+        self.snapshot = snapshot
+        logger.info(f"스냅샷 교체: {path} ({len(snapshot):,}건, {os.path.getsize(path):,} bytes)")
+
+    def invalidate(self):
+        """다음 접근 시 파일을 즉시 확인하도록 표시"""
+        self.checked_at = 0.0
@@ -0,0 +1,143 @@
+# common/xml_stream.py
+"""
+공공데이터포털 XML 응답 스트리밍 파서
+
+ET.fromstring 은 응답 전체를 트리로 만든 뒤 findall/findtext 로 다시 훑으므로
+numOfRows 가 크면 트리 메모리가 페이지 크기에 비례해 커진다.
+PublicDataXmlStream 은 XMLPullParser 에 본문을 조각(chunk_size)씩 넣으면서
+<item> 이 닫히는 즉시 {태그: 텍스트} dict 로 내보내고 그 요소를 부모에서 떼어 내므로
+파서가 들고 있는 트리는 항목 하나 크기로 유지된다.
+
+응답 구조 (헤더가 먼저, totalCount 는 항목 뒤에 온다)
+    <response><header><resultCode/><resultMsg/></header>
+    <body><items><item>...</item>...</items><numOfRows/><pageNo/><totalCount/></body></response>
+resultCode 가 00 이 아니면 항목 없이 끝나고, result_code/result_msg/total_count 는 반복이 끝난 뒤 읽는다.
+
+서비스키/트래픽 초과 등 게이트웨이 오류는 HTTP 200 에 다른 구조로 온다 (resultCode 없음)
+    <OpenAPI_ServiceResponse><cmmMsgHeader><errMsg/><returnAuthMsg/><returnReasonCode/></cmmMsgHeader></OpenAPI_ServiceResponse>
+returnReasonCode/returnAuthMsg 를 result_code/result_msg 로 읽고, resultCode 00 을 보지 못한 응답은 모두 오류로 본다
+(빈 페이지로 보고 체크포인트에 완료로 남기면 --resume 이 그 조건을 다시 받지 않음).
+"""
+import time
+import xml.etree.ElementTree as ET
+from typing import Dict, Iterable, Iterator, Optional, Union
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+SUCCESS_CODE = '00'
+# 조회 결과 없음 (일부 API 는 빈 items 대신 이 코드로 응답)
+NO_DATA_CODE = '03'
+HEADER_TAGS = {
+    'resultCode': 'result_code',
+    'resultMsg': 'result_msg',
+    'totalCount': 'total_count',
+    # OpenAPI_ServiceResponse (게이트웨이 오류)
+    'returnReasonCode': 'result_code',
+    'returnAuthMsg': 'result_msg',
+}
+
+
+def _chunks(source: Union[bytes, str, Iterable[bytes]], chunk_size: int) -> Iterator[Union[bytes, str]]:
+    if isinstance(source, (bytes, str)):
+        for start in range(0, len(source), chunk_size):
+            yield source[start:start + chunk_size]
+    elif hasattr(source, 'read'):
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+    else:
+        yield from source
+
+
+class PublicDataXmlStream:
+    """
+    응답 본문(bytes/str/파일/bytes 조각 iterable) -> <item> 항목 dict 순차 반환
+
+        stream = PublicDataXmlStream(body)
+        for fields in stream:
+            fields.get('ykiho', '')
+        stream.result_code, stream.total_count
+    """
+
+    def __init__(self, source, item_tag: str = 'item', chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.source = source
+        self.item_tag = item_tag
+        self.chunk_size = chunk_size
+        self.result_code: Optional[str] = None
+        self.result_msg: Optional[str] = None
+        self.total_count = 0
+        self.items = 0
+        self.seconds = 0.0
+
+    @property
+    def is_error(self) -> bool:
+        """resultCode 00 이 아닌 응답 (resultCode 가 없는 응답 포함)"""
+        return self.result_code != SUCCESS_CODE
+
+    @property
+    def is_no_data(self) -> bool:
+        return self.result_code == NO_DATA_CODE
+
+    def __iter__(self) -> Iterator[Dict[str, str]]:
+        parser = ET.XMLPullParser(events=('start', 'end'))
+        # 항목 바깥의 열린 요소 스택 (닫힌 항목을 부모에서 떼어 내기 위함)
+        stack = []
+        in_item = False
+        started = time.perf_counter()
+        try:
+            for chunk in _chunks(self.source, self.chunk_size):
+                parser.feed(chunk)
+                for event, elem in parser.read_events():
+                    if in_item:
+                        # 항목 하위 태그는 항목이 닫힐 때 한꺼번에 읽음
+                        if event == 'start' or elem.tag != self.item_tag:
+                            continue
+                        in_item = False
+                        stack.pop()
+                        record = {child.tag: (child.text or '').strip() for child in elem}
+                        if stack:
+                            stack[-1].remove(elem)
+                        self.items += 1
+                        # 호출 측 처리 시간은 파싱 시간에서 뺌
+                        self.seconds += time.perf_counter() - started
+                        yield record
+                        started = time.perf_counter()
+                    elif event == 'start':
+                        stack.append(elem)
+                        in_item = elem.tag == self.item_tag
+                    else:
+                        stack.pop()
+                        if elem.tag in HEADER_TAGS:
+                            self._read_header(elem)
+                        elif elem.tag in ('header', 'cmmMsgHeader') and self.is_error:
+                            # 오류 응답은 헤더(resultCode/resultMsg)까지만 읽음
+                            return
+            parser.close()
+        finally:
+            self.seconds += time.perf_counter() - started
+
+    def _read_header(self, elem):
+        text = (elem.text or '').strip()
+        if elem.tag == 'totalCount':
+            self.total_count = int(text) if text.isdigit() else 0
+        else:
+            setattr(self, HEADER_TAGS[elem.tag], text)
+
+
+class ParseStats:
+    """페이지별 PublicDataXmlStream 누적 (임포트 종료 시 items/sec 보고)"""
+
+    def __init__(self):
+        self.pages = 0
+        self.items = 0
+        self.seconds = 0.0
+
+    def add(self, stream: PublicDataXmlStream):
+        self.pages += 1
+        self.items += stream.items
+        self.seconds += stream.seconds
+
+    def summary(self) -> str:
+        rate = self.items / self.seconds if self.seconds else 0
+        return f"XML 파싱: {self.pages:,}페이지 {self.items:,}건 {self.seconds:.2f}초 ({rate:,.0f}건/초)"
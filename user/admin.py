@@ -55,6 +55,10 @@ class HospitalCacheAdmin(admin.ModelAdmin):
     list_filter = ['hospital_name', 'sido_name']
     search_fields = ['hospital_name', 'hospital_type_name', 'sido_name', 'sigungu_name']
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        obj.sync_subjects()
+
 @admin.register(DiseaseCache)
 class DiseaseCacheAdmin(admin.ModelAdmin):
     list_display = ['disease_code', 'disease_name_kr', 'disease_name_en']
@@ -102,26 +102,51 @@ def format_main_ingredient(ingredient) -> Dict[str, Any]:
     """주성분 정보 포맷팅"""
     return {
         'ingr_code': ingredient.ingr_code,
-        'original_code': ingredient.original_code,
-        'dosage_form_code': ingredient.dosage_form_code,
-        'dosage_form': ingredient.dosage_form,
+        'atc_code': ingredient.atc_code,
         'main_ingr_name_kr': ingredient.main_ingr_name_kr,
         'main_ingr_name_en': ingredient.main_ingr_name_en,
-        'classification': ingredient.classification,
-        'route': ingredient.route,
-        'main_ingr_density': float(ingredient.main_ingr_density) if ingredient.main_ingr_density else None,
-        'main_ingr_unit': ingredient.main_ingr_unit,
-        'original_density_notation': ingredient.original_density_notation,
+        'density': float(ingredient.density) if ingredient.density is not None else None,
+        'unit': ingredient.unit,
         'is_combination_drug': ingredient.is_combination_drug,
         'combination_group': ingredient.combination_group,
-        'is_active': ingredient.is_active,
-        'notes': ingredient.notes,
-        'data_quality_score': ingredient.data_quality_score,
         'created_at': ingredient.created_at.isoformat() if ingredient.created_at else None,
         'updated_at': ingredient.updated_at.isoformat() if ingredient.updated_at else None,
     }
 
 
+def format_main_ingredient_summary(ingredient) -> Dict[str, Any]:
+    """주성분 목록용 요약 포맷팅"""
+    return {
+        'ingr_code': ingredient.ingr_code,
+        'atc_code': ingredient.atc_code,
+        'main_ingr_name_kr': ingredient.main_ingr_name_kr,
+        'main_ingr_name_en': ingredient.main_ingr_name_en,
+        'is_combination_drug': ingredient.is_combination_drug,
+    }
+
+
+def format_atc_class(atc_class) -> Dict[str, Any]:
+    """ATC 분류 노드 포맷팅"""
+    return {
+        'code': atc_class.code,
+        'name': atc_class.name,
+        'level': atc_class.level,
+        'parent_code': atc_class.parent_id,
+        'ingredient_count': atc_class.ingredient_count,
+        'medication_count': atc_class.medication_count,
+    }
+
+
+def format_medication_facet(medication_facet) -> Dict[str, Any]:
+    """의약품 패싯 값 포맷팅"""
+    return {
+        'facet': medication_facet.facet,
+        'value': medication_facet.value,
+        'label': medication_facet.label or medication_facet.value,
+        'medication_count': medication_facet.medication_count,
+    }
+
+
 def format_medication(medication) -> Dict[str, Any]:
     """의약품 정보 포맷팅"""
     return {
@@ -129,7 +154,7 @@ def format_medication(medication) -> Dict[str, Any]:
         'medication_name': medication.medication_name,
         'main_item_ingr': medication.main_item_ingr,
         'main_ingr_eng': medication.main_ingr_eng,
-        'ingredient': format_main_ingredient(medication.ingredient) if medication.ingredient else None,
+        'ingredients': [format_main_ingredient_summary(ingredient) for ingredient in medication.ingredients.all()],
         'manufacturer': medication.manufacturer,
         'item_image': medication.item_image.url if medication.item_image else None,
         'created_at': medication.created_at.isoformat() if medication.created_at else None,
@@ -137,6 +162,31 @@ def format_medication(medication) -> Dict[str, Any]:
     }
 
 
+def format_medication_summary(medication) -> Dict[str, Any]:
+    """의약품 검색 결과용 요약 포맷팅"""
+    return {
+        'medication_id': medication.medication_id,
+        'medication_name': medication.medication_name,
+        'main_item_ingr': medication.main_item_ingr,
+        'main_ingr_eng': medication.main_ingr_eng,
+        'manufacturer': medication.manufacturer,
+        'item_image': medication.item_image.url if medication.item_image else None,
+        'prescription_count': medication.prescription_count,
+    }
+
+
+def format_medication_barcode(medication_barcode) -> Dict[str, Any]:
+    """표준코드(바코드) 조회 결과 포맷팅 (select_related('medication') 조회, 의약품 미임포트 품목은 None)"""
+    medication = medication_barcode.medication
+    return {
+        'barcode': medication_barcode.barcode,
+        'medication_id': medication_barcode.medication_id,
+        'ingr_code': medication_barcode.ingr_code,
+        'product_name': medication_barcode.product_name,
+        'medication': format_medication_summary(medication) if medication else None,
+    }
+
+
 def format_medication_ingredient(med_ingredient) -> Dict[str, Any]:
     """의약품-주성분 연결 정보 포맷팅"""
     return {
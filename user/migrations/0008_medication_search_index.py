@@ -0,0 +1,85 @@
+# Generated by Django 4.2.22 on 2026-10-18 22:45
+
+from django.db import migrations, models
+
+
+SQLITE_FTS_TABLE = "medication_fts"
+
+# 이 시점의 전문검색 인덱스 DDL (서비스 코드가 바뀌어도 마이그레이션 결과가 달라지지 않도록 고정)
+SQLITE_INSTALL_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        medication_name, main_item_ingr,
+        content='medications', content_rowid='medication_id',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai AFTER INSERT ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, medication_name, main_item_ingr)
+        VALUES (new.medication_id, new.medication_name, new.main_item_ingr);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad AFTER DELETE ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, medication_name, main_item_ingr)
+        VALUES ('delete', old.medication_id, old.medication_name, old.main_item_ingr);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au AFTER UPDATE ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, medication_name, main_item_ingr)
+        VALUES ('delete', old.medication_id, old.medication_name, old.main_item_ingr);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, medication_name, main_item_ingr)
+        VALUES (new.medication_id, new.medication_name, new.main_item_ingr);
+    END
+    """,
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+POSTGRES_INSTALL_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_med_name_trgm ON medications USING gin (medication_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_med_ingr_trgm ON medications USING gin (main_item_ingr gin_trgm_ops)",
+]
+
+SQLITE_UNINSTALL_SQL = [
+    f"DROP TRIGGER IF EXISTS {SQLITE_FTS_TABLE}_ai",
+    f"DROP TRIGGER IF EXISTS {SQLITE_FTS_TABLE}_ad",
+    f"DROP TRIGGER IF EXISTS {SQLITE_FTS_TABLE}_au",
+    f"DROP TABLE IF EXISTS {SQLITE_FTS_TABLE}",
+]
+
+POSTGRES_UNINSTALL_SQL = [
+    "DROP INDEX IF EXISTS idx_med_name_trgm",
+    "DROP INDEX IF EXISTS idx_med_ingr_trgm",
+]
+
+
+def install_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_INSTALL_SQL, "postgresql": POSTGRES_INSTALL_SQL}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def uninstall_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_UNINSTALL_SQL, "postgresql": POSTGRES_UNINSTALL_SQL}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0007_alter_ayakuser_is_active"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="medication",
+            index=models.Index(fields=["medication_name"], name="idx_medication_name"),
+        ),
+        migrations.RunPython(install_search_index, uninstall_search_index),
+    ]
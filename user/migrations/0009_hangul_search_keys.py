@@ -0,0 +1,154 @@
+# Generated by Django 4.2.22 on 2026-10-18 22:48
+
+from django.db import migrations, models
+
+SEARCH_KEY_SOURCES = [
+    ("DiseaseCache", "disease_name_kr", "disease_name_chosung", "disease_name_jamo"),
+    ("HospitalCache", "hospital_name", "hospital_name_chosung", "hospital_name_jamo"),
+    ("Medication", "medication_name", "medication_name_chosung", "medication_name_jamo"),
+]
+
+
+SQLITE_FTS_TABLE = "medication_fts"
+
+# 이 시점의 전문검색 인덱스 DDL (서비스 코드가 바뀌어도 마이그레이션 결과가 달라지지 않도록 고정)
+SQLITE_INSTALL_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        medication_name, main_item_ingr,
+        content='medications', content_rowid='medication_id',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai AFTER INSERT ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, medication_name, main_item_ingr)
+        VALUES (new.medication_id, new.medication_name, new.main_item_ingr);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad AFTER DELETE ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, medication_name, main_item_ingr)
+        VALUES ('delete', old.medication_id, old.medication_name, old.main_item_ingr);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au AFTER UPDATE ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, medication_name, main_item_ingr)
+        VALUES ('delete', old.medication_id, old.medication_name, old.main_item_ingr);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, medication_name, main_item_ingr)
+        VALUES (new.medication_id, new.medication_name, new.main_item_ingr);
+    END
+    """,
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+POSTGRES_INSTALL_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_med_name_trgm ON medications USING gin (medication_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_med_ingr_trgm ON medications USING gin (main_item_ingr gin_trgm_ops)",
+]
+
+
+def reinstall_search_index(apps, schema_editor):
+    # SQLite 는 AddField 시 medications 테이블을 재생성하면서 FTS 트리거가 사라진다
+    vendor = schema_editor.connection.vendor
+    statements = {"sqlite": SQLITE_INSTALL_SQL, "postgresql": POSTGRES_INSTALL_SQL}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def populate_search_keys(apps, schema_editor):
+    from common.hangul import to_chosung, to_jamo
+
+    for model_name, source, chosung_field, jamo_field in SEARCH_KEY_SOURCES:
+        model = apps.get_model("user", model_name)
+        batch = []
+        for obj in model.objects.only("pk", source).iterator(chunk_size=1000):
+            value = getattr(obj, source) or ""
+            setattr(obj, chosung_field, to_chosung(value))
+            setattr(obj, jamo_field, to_jamo(value))
+            batch.append(obj)
+            if len(batch) >= 1000:
+                model.objects.bulk_update(batch, [chosung_field, jamo_field])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, [chosung_field, jamo_field])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0008_medication_search_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="diseasecache",
+            name="disease_name_chosung",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=255,
+                verbose_name="질병명 초성",
+            ),
+        ),
+        migrations.AddField(
+            model_name="diseasecache",
+            name="disease_name_jamo",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=255,
+                verbose_name="질병명 자모",
+            ),
+        ),
+        migrations.AddField(
+            model_name="hospitalcache",
+            name="hospital_name_chosung",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=255,
+                verbose_name="요양기관명 초성",
+            ),
+        ),
+        migrations.AddField(
+            model_name="hospitalcache",
+            name="hospital_name_jamo",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=255,
+                verbose_name="요양기관명 자모",
+            ),
+        ),
+        migrations.AddField(
+            model_name="medication",
+            name="medication_name_chosung",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=255,
+                verbose_name="의약품명 초성",
+            ),
+        ),
+        migrations.AddField(
+            model_name="medication",
+            name="medication_name_jamo",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=255,
+                verbose_name="의약품명 자모",
+            ),
+        ),
+        migrations.RunPython(reinstall_search_index, migrations.RunPython.noop),
+        migrations.RunPython(populate_search_keys, migrations.RunPython.noop),
+    ]
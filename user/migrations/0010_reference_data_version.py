@@ -0,0 +1,46 @@
+# Generated by Django 4.2.22 on 2026-10-18 22:53
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0009_hangul_search_keys"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferenceDataVersion",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        max_length=50, unique=True, verbose_name="데이터명"
+                    ),
+                ),
+                (
+                    "generation",
+                    models.PositiveBigIntegerField(default=0, verbose_name="세대"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="최종수정일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "참조데이터버전",
+                "verbose_name_plural": "참조데이터버전",
+                "db_table": "reference_data_version",
+            },
+        ),
+    ]
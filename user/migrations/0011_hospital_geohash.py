@@ -0,0 +1,46 @@
+# Generated by Django 4.2.22 on 2026-10-18 22:54
+
+from django.db import migrations, models
+
+
+def populate_geohash(apps, schema_editor):
+    from common.geo import geohash_encode
+    from user.models.cache import GEOHASH_PRECISION
+
+    HospitalCache = apps.get_model("user", "HospitalCache")
+    batch = []
+    hospitals = HospitalCache.objects.filter(
+        latitude__isnull=False, longitude__isnull=False
+    ).only("pk", "latitude", "longitude")
+    for hospital in hospitals.iterator(chunk_size=1000):
+        hospital.geohash = geohash_encode(
+            float(hospital.latitude), float(hospital.longitude), GEOHASH_PRECISION
+        )
+        batch.append(hospital)
+        if len(batch) >= 1000:
+            HospitalCache.objects.bulk_update(batch, ["geohash"])
+            batch = []
+    if batch:
+        HospitalCache.objects.bulk_update(batch, ["geohash"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0010_reference_data_version"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="hospitalcache",
+            name="geohash",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=12,
+                verbose_name="지오해시",
+            ),
+        ),
+        migrations.RunPython(populate_geohash, migrations.RunPython.noop),
+    ]
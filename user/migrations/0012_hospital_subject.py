@@ -0,0 +1,79 @@
+# Generated by Django 4.2.22 on 2026-10-18 22:57
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def populate_hospital_subjects(apps, schema_editor):
+    from user.models.cache import normalize_subjects
+
+    HospitalCache = apps.get_model("user", "HospitalCache")
+    HospitalSubject = apps.get_model("user", "HospitalSubject")
+
+    batch = []
+    hospitals = HospitalCache.objects.exclude(medical_subjects=[]).only("pk", "medical_subjects")
+    for hospital in hospitals.iterator(chunk_size=1000):
+        for name, code in dict(normalize_subjects(hospital.medical_subjects)).items():
+            batch.append(
+                HospitalSubject(hospital_id=hospital.pk, subject_name=name, subject_code=code)
+            )
+        if len(batch) >= 1000:
+            HospitalSubject.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        HospitalSubject.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0011_hospital_geohash"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="HospitalSubject",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "subject_name",
+                    models.CharField(max_length=50, verbose_name="진료과목명"),
+                ),
+                (
+                    "subject_code",
+                    models.CharField(
+                        blank=True, max_length=10, verbose_name="진료과목코드"
+                    ),
+                ),
+                (
+                    "hospital",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="subjects",
+                        to="user.hospitalcache",
+                        verbose_name="병원",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "병원진료과목",
+                "verbose_name_plural": "병원진료과목",
+                "db_table": "hospital_subject",
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="hospitalsubject",
+            constraint=models.UniqueConstraint(
+                fields=("subject_name", "hospital"), name="uniq_hospital_subject"
+            ),
+        ),
+        migrations.RunPython(populate_hospital_subjects, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,53 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:02
+
+from django.db import migrations, models
+
+
+def populate_name_keys(apps, schema_editor):
+    from common.ingredient_names import normalize_ingredient_name
+
+    MainIngredient = apps.get_model("user", "MainIngredient")
+    batch = []
+    ingredients = MainIngredient.objects.only("pk", "main_ingr_name_kr", "main_ingr_name_en")
+    for ingredient in ingredients.iterator(chunk_size=1000):
+        ingredient.name_kr_key = normalize_ingredient_name(ingredient.main_ingr_name_kr)
+        ingredient.name_en_key = normalize_ingredient_name(ingredient.main_ingr_name_en)
+        batch.append(ingredient)
+        if len(batch) >= 1000:
+            MainIngredient.objects.bulk_update(batch, ["name_kr_key", "name_en_key"])
+            batch = []
+    if batch:
+        MainIngredient.objects.bulk_update(batch, ["name_kr_key", "name_en_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0012_hospital_subject"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="mainingredient",
+            name="name_en_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=200,
+                verbose_name="주성분명 정규화 키(영문)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="mainingredient",
+            name="name_kr_key",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                default="",
+                max_length=200,
+                verbose_name="주성분명 정규화 키(한글)",
+            ),
+        ),
+        migrations.RunPython(populate_name_keys, migrations.RunPython.noop),
+    ]
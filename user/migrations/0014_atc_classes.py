@@ -0,0 +1,103 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:06
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+def normalize_atc_codes(apps, schema_editor):
+    from user.models.atc_class import normalize_atc_code
+
+    MainIngredient = apps.get_model("user", "MainIngredient")
+    batch = []
+    ingredients = MainIngredient.objects.exclude(atc_code="").only("pk", "atc_code")
+    for ingredient in ingredients.iterator(chunk_size=1000):
+        atc_code = normalize_atc_code(ingredient.atc_code)
+        if atc_code != ingredient.atc_code:
+            ingredient.atc_code = atc_code
+            batch.append(ingredient)
+        if len(batch) >= 1000:
+            MainIngredient.objects.bulk_update(batch, ["atc_code"])
+            batch = []
+    if batch:
+        MainIngredient.objects.bulk_update(batch, ["atc_code"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0013_main_ingredient_name_keys"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="mainingredient",
+            name="atc_code",
+            field=models.CharField(
+                blank=True,
+                db_index=True,
+                help_text="ATC 코드",
+                max_length=50,
+                verbose_name="ATC 코드",
+            ),
+        ),
+        migrations.CreateModel(
+            name="AtcClass",
+            fields=[
+                (
+                    "code",
+                    models.CharField(
+                        max_length=7,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ATC 코드",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(blank=True, max_length=200, verbose_name="분류명"),
+                ),
+                (
+                    "level",
+                    models.PositiveSmallIntegerField(
+                        help_text="1(해부학적 분류) ~ 5(화학물질)", verbose_name="단계"
+                    ),
+                ),
+                ("lft", models.PositiveIntegerField(verbose_name="중첩집합 왼쪽 번호")),
+                (
+                    "rgt",
+                    models.PositiveIntegerField(verbose_name="중첩집합 오른쪽 번호"),
+                ),
+                (
+                    "ingredient_count",
+                    models.PositiveIntegerField(default=0, verbose_name="성분 수"),
+                ),
+                (
+                    "medication_count",
+                    models.PositiveIntegerField(default=0, verbose_name="의약품 수"),
+                ),
+                (
+                    "parent",
+                    models.ForeignKey(
+                        blank=True,
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="children",
+                        to="user.atcclass",
+                        verbose_name="상위 분류",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "ATC 분류",
+                "verbose_name_plural": "ATC 분류들",
+                "db_table": "atc_classes",
+                "ordering": ["lft"],
+                "indexes": [
+                    models.Index(fields=["lft", "rgt"], name="idx_atc_nested_set"),
+                    models.Index(fields=["level"], name="idx_atc_level"),
+                ],
+            },
+        ),
+        migrations.RunPython(normalize_atc_codes, migrations.RunPython.noop),
+    ]
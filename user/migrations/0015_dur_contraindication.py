@@ -0,0 +1,75 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0014_atc_classes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DurContraindication",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+                (
+                    "ingredient_code_a",
+                    models.CharField(max_length=4, verbose_name="성분코드A"),
+                ),
+                (
+                    "ingredient_name_a",
+                    models.CharField(
+                        blank=True, max_length=200, verbose_name="성분명A"
+                    ),
+                ),
+                (
+                    "ingredient_code_b",
+                    models.CharField(max_length=4, verbose_name="성분코드B"),
+                ),
+                (
+                    "ingredient_name_b",
+                    models.CharField(
+                        blank=True, max_length=200, verbose_name="성분명B"
+                    ),
+                ),
+                ("reason", models.TextField(blank=True, verbose_name="금기 사유")),
+                (
+                    "notice_date",
+                    models.DateField(blank=True, null=True, verbose_name="고시일자"),
+                ),
+            ],
+            options={
+                "verbose_name": "DUR 병용금기",
+                "verbose_name_plural": "DUR 병용금기들",
+                "db_table": "dur_contraindications",
+                "indexes": [
+                    models.Index(fields=["ingredient_code_b"], name="idx_dur_code_b")
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="durcontraindication",
+            constraint=models.UniqueConstraint(
+                fields=("ingredient_code_a", "ingredient_code_b"),
+                name="unique_dur_pair",
+            ),
+        ),
+    ]
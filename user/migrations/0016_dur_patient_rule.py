@@ -0,0 +1,102 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:13
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0015_dur_contraindication"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DurPatientRule",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일"),
+                ),
+                (
+                    "rule_type",
+                    models.CharField(
+                        choices=[
+                            ("AGE", "연령금기"),
+                            ("PREGNANCY", "임부금기"),
+                            ("ELDERLY", "노인주의"),
+                        ],
+                        max_length=10,
+                        verbose_name="규칙 유형",
+                    ),
+                ),
+                (
+                    "ingredient_code",
+                    models.CharField(max_length=4, verbose_name="성분코드"),
+                ),
+                (
+                    "ingredient_name",
+                    models.CharField(blank=True, max_length=200, verbose_name="성분명"),
+                ),
+                (
+                    "min_age_months",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="적용 최소 나이(개월, 포함)"
+                    ),
+                ),
+                (
+                    "max_age_months",
+                    models.PositiveIntegerField(
+                        blank=True,
+                        null=True,
+                        verbose_name="적용 최대 나이(개월, 미포함)",
+                    ),
+                ),
+                (
+                    "gender",
+                    models.CharField(
+                        blank=True,
+                        help_text="빈 값이면 성별 무관",
+                        max_length=10,
+                        verbose_name="적용 성별",
+                    ),
+                ),
+                (
+                    "grade",
+                    models.CharField(
+                        blank=True, max_length=20, verbose_name="금기 등급"
+                    ),
+                ),
+                ("reason", models.TextField(blank=True, verbose_name="금기 사유")),
+            ],
+            options={
+                "verbose_name": "DUR 환자특성 규칙",
+                "verbose_name_plural": "DUR 환자특성 규칙들",
+                "db_table": "dur_patient_rules",
+                "indexes": [
+                    models.Index(
+                        fields=["ingredient_code", "rule_type"],
+                        name="idx_dur_rule_code_type",
+                    )
+                ],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name="durpatientrule",
+            constraint=models.UniqueConstraint(
+                fields=("rule_type", "ingredient_code"), name="unique_dur_patient_rule"
+            ),
+        ),
+    ]
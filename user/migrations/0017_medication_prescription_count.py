@@ -0,0 +1,93 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:17
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+SQLITE_FTS_TABLE = "medication_fts"
+
+# 이 시점의 전문검색 인덱스 DDL (서비스 코드가 바뀌어도 마이그레이션 결과가 달라지지 않도록 고정)
+SQLITE_INSTALL_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SQLITE_FTS_TABLE} USING fts5(
+        medication_name, main_item_ingr,
+        content='medications', content_rowid='medication_id',
+        tokenize='trigram'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ai AFTER INSERT ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, medication_name, main_item_ingr)
+        VALUES (new.medication_id, new.medication_name, new.main_item_ingr);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_ad AFTER DELETE ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, medication_name, main_item_ingr)
+        VALUES ('delete', old.medication_id, old.medication_name, old.main_item_ingr);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SQLITE_FTS_TABLE}_au AFTER UPDATE OF medication_name, main_item_ingr ON medications BEGIN
+        INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}, rowid, medication_name, main_item_ingr)
+        VALUES ('delete', old.medication_id, old.medication_name, old.main_item_ingr);
+        INSERT INTO {SQLITE_FTS_TABLE}(rowid, medication_name, main_item_ingr)
+        VALUES (new.medication_id, new.medication_name, new.main_item_ingr);
+    END
+    """,
+    f"INSERT INTO {SQLITE_FTS_TABLE}({SQLITE_FTS_TABLE}) VALUES ('rebuild')",
+]
+
+POSTGRES_INSTALL_SQL = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS idx_med_name_trgm ON medications USING gin (medication_name gin_trgm_ops)",
+    "CREATE INDEX IF NOT EXISTS idx_med_ingr_trgm ON medications USING gin (main_item_ingr gin_trgm_ops)",
+]
+
+
+def reinstall_search_index(apps, schema_editor):
+    # SQLite 는 AddField 시 medications 테이블을 재생성하면서 FTS 트리거가 사라지고,
+    # 수정 트리거는 검색 대상 컬럼에만 동작하도록 바뀌었으므로 다시 만든다
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        schema_editor.execute(f"DROP TRIGGER IF EXISTS {SQLITE_FTS_TABLE}_au")
+    statements = {"sqlite": SQLITE_INSTALL_SQL, "postgresql": POSTGRES_INSTALL_SQL}.get(vendor, [])
+    for sql in statements:
+        schema_editor.execute(sql)
+
+
+def populate_prescription_counts(apps, schema_editor):
+    Medication = apps.get_model("user", "Medication")
+    PrescriptionMedication = apps.get_model("bokyak", "PrescriptionMedication")
+
+    counts = dict(
+        PrescriptionMedication.objects.values("medication_id")
+        .annotate(count=Count("id"))
+        .values_list("medication_id", "count")
+    )
+    medication_ids = sorted(counts)
+    for start in range(0, len(medication_ids), 1000):
+        batch = list(
+            Medication.objects.filter(medication_id__in=medication_ids[start:start + 1000]).only("pk")
+        )
+        for medication in batch:
+            medication.prescription_count = counts[medication.pk]
+        Medication.objects.bulk_update(batch, ["prescription_count"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0016_dur_patient_rule"),
+        ("bokyak", "0002_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="medication",
+            name="prescription_count",
+            field=models.PositiveIntegerField(default=0, verbose_name="처방 건수"),
+        ),
+        migrations.RunPython(reinstall_search_index, migrations.RunPython.noop),
+        migrations.RunPython(populate_prescription_counts, migrations.RunPython.noop),
+    ]
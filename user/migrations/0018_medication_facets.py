@@ -0,0 +1,107 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:20
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0017_medication_prescription_count"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MedicationFacet",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "facet",
+                    models.CharField(
+                        choices=[
+                            ("manufacturer", "제조사"),
+                            ("drug_class", "약효분류"),
+                            ("dosage_form", "제형"),
+                            ("combination", "복합제 여부"),
+                        ],
+                        max_length=20,
+                        verbose_name="패싯",
+                    ),
+                ),
+                ("value", models.CharField(max_length=200, verbose_name="값")),
+                (
+                    "label",
+                    models.CharField(blank=True, max_length=200, verbose_name="표시명"),
+                ),
+                (
+                    "medication_count",
+                    models.PositiveIntegerField(default=0, verbose_name="의약품 수"),
+                ),
+            ],
+            options={
+                "verbose_name": "의약품 패싯",
+                "verbose_name_plural": "의약품 패싯들",
+                "db_table": "medication_facets",
+            },
+        ),
+        migrations.CreateModel(
+            name="MedicationFacetMember",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "facet_value",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="members",
+                        to="user.medicationfacet",
+                        verbose_name="패싯 값",
+                    ),
+                ),
+                (
+                    "medication",
+                    models.ForeignKey(
+                        db_constraint=False,
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facet_members",
+                        to="user.medication",
+                        verbose_name="의약품",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "의약품 패싯 연결",
+                "verbose_name_plural": "의약품 패싯 연결들",
+                "db_table": "medication_facet_members",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="medicationfacet",
+            index=models.Index(
+                fields=["facet", "-medication_count"], name="idx_med_facet_count"
+            ),
+        ),
+        migrations.AlterUniqueTogether(
+            name="medicationfacet",
+            unique_together={("facet", "value")},
+        ),
+        migrations.AlterUniqueTogether(
+            name="medicationfacetmember",
+            unique_together={("facet_value", "medication")},
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:26
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0018_medication_facets"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferenceBundle",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "version",
+                    models.PositiveIntegerField(unique=True, verbose_name="버전"),
+                ),
+                ("file_name", models.CharField(max_length=255, verbose_name="파일명")),
+                (
+                    "size",
+                    models.PositiveBigIntegerField(verbose_name="파일 크기(bytes)"),
+                ),
+                ("sha256", models.CharField(max_length=64, verbose_name="SHA-256")),
+                (
+                    "row_counts",
+                    models.JSONField(default=dict, verbose_name="테이블별 행 수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "참조 데이터 번들",
+                "verbose_name_plural": "참조 데이터 번들들",
+                "db_table": "reference_bundles",
+                "ordering": ["-version"],
+            },
+        ),
+        migrations.CreateModel(
+            name="ReferenceBundlePatch",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("from_version", models.PositiveIntegerField(verbose_name="이전 버전")),
+                ("to_version", models.PositiveIntegerField(verbose_name="대상 버전")),
+                ("file_name", models.CharField(max_length=255, verbose_name="파일명")),
+                (
+                    "size",
+                    models.PositiveBigIntegerField(verbose_name="파일 크기(bytes)"),
+                ),
+                ("sha256", models.CharField(max_length=64, verbose_name="SHA-256")),
+                (
+                    "change_counts",
+                    models.JSONField(default=dict, verbose_name="테이블별 변경 수"),
+                ),
+                (
+                    "created_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="생성일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "참조 데이터 번들 패치",
+                "verbose_name_plural": "참조 데이터 번들 패치들",
+                "db_table": "reference_bundle_patches",
+                "ordering": ["from_version"],
+                "unique_together": {("from_version", "to_version")},
+            },
+        ),
+    ]
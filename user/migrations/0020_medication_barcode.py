@@ -0,0 +1,62 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:31
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0019_reference_bundles"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MedicationBarcode",
+            fields=[
+                (
+                    "barcode",
+                    models.CharField(
+                        max_length=13,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="표준코드",
+                    ),
+                ),
+                (
+                    "ingr_code",
+                    models.CharField(
+                        blank=True,
+                        db_index=True,
+                        max_length=20,
+                        verbose_name="일반명코드",
+                    ),
+                ),
+                (
+                    "product_name",
+                    models.CharField(blank=True, max_length=200, verbose_name="상품명"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="수정일시"),
+                ),
+                (
+                    "medication",
+                    models.ForeignKey(
+                        blank=True,
+                        db_constraint=False,
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="barcodes",
+                        to="user.medication",
+                        verbose_name="의약품",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "의약품 표준코드",
+                "verbose_name_plural": "의약품 표준코드들",
+                "db_table": "medication_barcodes",
+            },
+        ),
+    ]
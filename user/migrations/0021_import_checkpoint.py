@@ -0,0 +1,66 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0020_medication_barcode"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ImportCheckpoint",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("importer", models.CharField(max_length=50, verbose_name="임포터")),
+                (
+                    "partition",
+                    models.CharField(
+                        blank=True, default="", max_length=100, verbose_name="검색 조건"
+                    ),
+                ),
+                (
+                    "num_of_rows",
+                    models.PositiveIntegerField(verbose_name="페이지 크기"),
+                ),
+                (
+                    "total_count",
+                    models.PositiveIntegerField(
+                        blank=True, null=True, verbose_name="전체 건수"
+                    ),
+                ),
+                (
+                    "completed_pages",
+                    models.JSONField(default=list, verbose_name="완료 페이지"),
+                ),
+                (
+                    "is_completed",
+                    models.BooleanField(default=False, verbose_name="완료 여부"),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(auto_now_add=True, verbose_name="시작일시"),
+                ),
+                (
+                    "updated_at",
+                    models.DateTimeField(auto_now=True, verbose_name="최종수정일시"),
+                ),
+            ],
+            options={
+                "verbose_name": "임포트 체크포인트",
+                "verbose_name_plural": "임포트 체크포인트들",
+                "db_table": "import_checkpoints",
+                "unique_together": {("importer", "partition")},
+            },
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.22 on 2026-10-18 23:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0021_import_checkpoint"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="diseasecache",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, default="", max_length=32, verbose_name="내용지문"
+            ),
+        ),
+        migrations.AddField(
+            model_name="hospitalcache",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, default="", max_length=32, verbose_name="내용지문"
+            ),
+        ),
+        migrations.AddField(
+            model_name="mainingredient",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, default="", max_length=32, verbose_name="내용 지문"
+            ),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 4.2.22 on 2026-10-19 00:01
+
+from django.db import migrations
+
+
+def recompute_name_keys(apps, schema_editor):
+    # 짝이온 제거 규칙 변경 (탄산칼슘/탄산마그네슘 등이 같은 키로 합쳐지던 문제) - 저장 시 계산과 같은 함수로 다시 채운다
+    from common.ingredient_names import normalize_ingredient_name
+
+    MainIngredient = apps.get_model("user", "MainIngredient")
+    batch = []
+    ingredients = MainIngredient.objects.only("pk", "main_ingr_name_kr", "main_ingr_name_en", "name_kr_key", "name_en_key")
+    for ingredient in ingredients.iterator(chunk_size=1000):
+        name_kr_key = normalize_ingredient_name(ingredient.main_ingr_name_kr)
+        name_en_key = normalize_ingredient_name(ingredient.main_ingr_name_en)
+        if (name_kr_key, name_en_key) == (ingredient.name_kr_key, ingredient.name_en_key):
+            continue
+        ingredient.name_kr_key = name_kr_key
+        ingredient.name_en_key = name_en_key
+        batch.append(ingredient)
+        if len(batch) >= 1000:
+            MainIngredient.objects.bulk_update(batch, ["name_kr_key", "name_en_key"])
+            batch = []
+    if batch:
+        MainIngredient.objects.bulk_update(batch, ["name_kr_key", "name_en_key"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("user", "0022_content_hash"),
+    ]
+
+    operations = [
+        migrations.RunPython(recompute_name_keys, migrations.RunPython.noop),
+    ]
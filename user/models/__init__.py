@@ -4,7 +4,13 @@ from .illness import Illness
 from .medication import Medication, MainIngredient
 from .medication_ingredient import MedicationIngredient
 from .user_medical_info import UserMedicalInfo
-from .cache import HospitalCache, DiseaseCache
+from .cache import HospitalCache, HospitalSubject, DiseaseCache, ReferenceDataVersion
+from .atc_class import AtcClass
+from .dur import DurContraindication, DurPatientRule
+from .medication_facet import MedicationFacet, MedicationFacetMember
+from .reference_bundle import ReferenceBundle, ReferenceBundlePatch
+from .medication_barcode import MedicationBarcode
+from .import_checkpoint import ImportCheckpoint
 
 # 시그널 임포트 (signals.py가 있는 경우)
 try:
@@ -15,5 +21,7 @@ except ImportError:
 __all__ = [
     'AyakUser', 'Hospital', 'Illness', 'Medication',
     'MainIngredient', 'MedicationIngredient', 'UserMedicalInfo',
-    'HospitalCache', 'HospitalCache'
+    'HospitalCache', 'HospitalCache', 'HospitalSubject', 'ReferenceDataVersion',
+    'AtcClass', 'DurContraindication', 'DurPatientRule', 'MedicationFacet', 'MedicationFacetMember',
+    'ReferenceBundle', 'ReferenceBundlePatch', 'MedicationBarcode', 'ImportCheckpoint'
 ]
\ No newline at end of file
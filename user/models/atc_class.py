@@ -0,0 +1,72 @@
+from django.db import models
+
+# ATC 단계별 코드 길이 (N / N06 / N06A / N06AB / N06AB06)
+ATC_LEVEL_LENGTHS = (1, 3, 4, 5, 7)
+ATC_CODE_MAX_LENGTH = ATC_LEVEL_LENGTHS[-1]
+
+
+def normalize_atc_code(code):
+    """ATC 코드 정규화 (대문자, 공백 제거, 7자리 초과분 제거)"""
+    return ''.join((code or '').split()).upper()[:ATC_CODE_MAX_LENGTH]
+
+
+def atc_ancestors(code):
+    """ATC 코드의 1~5단계 상위 코드 목록 (자기 자신 포함)"""
+    code = normalize_atc_code(code)
+    return [code[:length] for length in ATC_LEVEL_LENGTHS if len(code) >= length]
+
+
+class AtcClass(models.Model):
+    """
+    ATC 분류 트리 (MainIngredient.atc_code 에서 재생성하는 집계 테이블)
+    - ATC 코드 자체가 물질화 경로이므로 하위 분류 = 코드 접두 범위
+    - lft/rgt 중첩 집합 번호로 하위 노드를 범위 조건 하나로 조회
+    - 노드별 성분 수/의약품 수는 하위 분류 전체 기준 (의약품은 중복 제거)
+    """
+
+    class Meta:
+        db_table = 'atc_classes'
+        verbose_name = 'ATC 분류'
+        verbose_name_plural = 'ATC 분류들'
+        ordering = ['lft']
+        indexes = [
+            models.Index(fields=['lft', 'rgt'], name='idx_atc_nested_set'),
+            models.Index(fields=['level'], name='idx_atc_level'),
+        ]
+
+    code = models.CharField(
+        primary_key=True,
+        max_length=ATC_CODE_MAX_LENGTH,
+        verbose_name='ATC 코드'
+    )
+    name = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name='분류명'
+    )
+    level = models.PositiveSmallIntegerField(
+        verbose_name='단계',
+        help_text='1(해부학적 분류) ~ 5(화학물질)'
+    )
+    parent = models.ForeignKey(
+        'self',
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+        related_name='children',
+        db_constraint=False,
+        verbose_name='상위 분류'
+    )
+    lft = models.PositiveIntegerField(verbose_name='중첩집합 왼쪽 번호')
+    rgt = models.PositiveIntegerField(verbose_name='중첩집합 오른쪽 번호')
+    ingredient_count = models.PositiveIntegerField(default=0, verbose_name='성분 수')
+    medication_count = models.PositiveIntegerField(default=0, verbose_name='의약품 수')
+
+    def __str__(self):
+        return f"{self.code} {self.name}".strip()
+
+    def get_descendants(self, include_self=False):
+        """하위 분류 전체 (중첩 집합 범위 조회)"""
+        if include_self:
+            return AtcClass.objects.filter(lft__gte=self.lft, rgt__lte=self.rgt)
+        return AtcClass.objects.filter(lft__gt=self.lft, rgt__lt=self.rgt)
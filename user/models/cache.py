@@ -1,14 +1,35 @@
 # user/models.py에 추가할 모델들
 
 from django.db import models
+from django.utils import timezone
 
-class HospitalCache(models.Model):
+from common.geo import geohash_encode
+from common.hangul import SEARCH_KEY_MAX_LENGTH
+from common.models.base_model import FINGERPRINT_LENGTH, ContentFingerprintMixin, HangulSearchKeyMixin
+
+# 저장 정밀도 (약 5m 격자) - 검색 시에는 더 짧은 접두로 범위 스캔
+GEOHASH_PRECISION = 9
+
+
+class HospitalCache(HangulSearchKeyMixin, ContentFingerprintMixin, models.Model):
     """병원정보 캐시 테이블"""
+    search_key_fields = {'hospital_name': ('hospital_name_chosung', 'hospital_name_jamo')}
+    fingerprint_fields = (
+        'hospital_name', 'hospital_phone', 'hospital_type_code', 'hospital_type_name',
+        'establishment_type_code', 'establishment_type_name', 'postal_code', 'address', 'road_address',
+        'sido_code', 'sido_name', 'sigungu_code', 'sigungu_name', 'latitude', 'longitude', 'homepage_url',
+        'total_doctors', 'total_beds', 'medical_subjects', 'is_active',
+    )
+
     # 기본 식별 정보
     hospital_code = models.CharField(max_length=20, unique=True, verbose_name="요양기관기호")
     hospital_name = models.CharField(max_length=200, verbose_name="요양기관명")
     hospital_phone = models.CharField(max_length=20, blank=True, verbose_name="전화번호")
 
+    # 한글 검색키 (초성/자모 접두 검색용, 저장 시 자동 갱신)
+    hospital_name_chosung = models.CharField(max_length=SEARCH_KEY_MAX_LENGTH, blank=True, default='', db_index=True, verbose_name="요양기관명 초성")
+    hospital_name_jamo = models.CharField(max_length=SEARCH_KEY_MAX_LENGTH, blank=True, default='', db_index=True, verbose_name="요양기관명 자모")
+
     # 분류 정보
     hospital_type_code = models.CharField(max_length=10, blank=True, verbose_name="종별코드")
     hospital_type_name = models.CharField(max_length=50, blank=True, verbose_name="종별코드명")
@@ -29,6 +50,7 @@ class HospitalCache(models.Model):
     # 위치 정보 (선택사항)
     latitude = models.DecimalField(max_digits=10, decimal_places=7, null=True, blank=True, verbose_name="위도")
     longitude = models.DecimalField(max_digits=10, decimal_places=7, null=True, blank=True, verbose_name="경도")
+    geohash = models.CharField(max_length=12, blank=True, default='', db_index=True, verbose_name="지오해시")  # 저장 시 위경도로 자동 계산
 
     # 운영 정보
     homepage_url = models.URLField(blank=True, verbose_name="홈페이지")
@@ -45,6 +67,7 @@ class HospitalCache(models.Model):
     # 데이터 관리
     data_reference_date = models.DateField(null=True, blank=True, verbose_name="데이터기준일자")
     is_active = models.BooleanField(default=True, verbose_name="활성화여부")
+    content_hash = models.CharField(max_length=FINGERPRINT_LENGTH, blank=True, default='', verbose_name="내용지문")  # 저장 시 자동 계산
     last_updated = models.DateTimeField(auto_now=True, verbose_name="최종수정일시")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="생성일시")
 
@@ -64,14 +87,118 @@ class HospitalCache(models.Model):
     def __str__(self):
         return f"{self.hospital_code} - {self.hospital_name}"
 
+    def refresh_geohash(self):
+        if self.latitude is not None and self.longitude is not None:
+            self.geohash = geohash_encode(float(self.latitude), float(self.longitude), GEOHASH_PRECISION)
+        else:
+            self.geohash = ''
+
+    def save(self, *args, **kwargs):
+        self.refresh_geohash()
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and {'latitude', 'longitude'} & set(update_fields):
+            kwargs['update_fields'] = [*update_fields, 'geohash']
+
+        super().save(*args, **kwargs)
+
+    def sync_subjects(self):
+        """진료과목 역색인(HospitalSubject)을 medical_subjects 와 맞춤 (변경분만 반영)"""
+        HospitalCache.sync_subjects_bulk([self])
+
+    @staticmethod
+    def sync_subjects_bulk(hospitals):
+        """
+        여러 병원의 진료과목 역색인 동기화 - 임포트 배치용
+        기존 과목 조회/삭제/추가를 병원마다 하지 않고 배치 전체에 한 번씩 한다.
+        """
+        hospitals = [hospital for hospital in hospitals if hospital.pk is not None]
+        if not hospitals:
+            return
+
+        existing = {}
+        rows = HospitalSubject.objects.filter(
+            hospital_id__in=[hospital.pk for hospital in hospitals]
+        ).values_list('hospital_id', 'pk', 'subject_name', 'subject_code')
+        for hospital_id, pk, name, code in rows:
+            existing.setdefault(hospital_id, {})[name] = (pk, code)
+
+        removed = []
+        added = []
+        for hospital in hospitals:
+            subjects = dict(normalize_subjects(hospital.medical_subjects))
+            current = existing.get(hospital.pk, {})
+            removed += [pk for name, (pk, _) in current.items() if name not in subjects]
+            added += [
+                HospitalSubject(hospital=hospital, subject_name=name, subject_code=code)
+                for name, code in subjects.items()
+                if current.get(name, (None, None))[1] != code
+            ]
+
+        if removed:
+            HospitalSubject.objects.filter(pk__in=removed).delete()
+        if added:
+            HospitalSubject.objects.bulk_create(
+                added,
+                update_conflicts=True,
+                unique_fields=['hospital', 'subject_name'],
+                update_fields=['subject_code'],
+            )
+
+
+def normalize_subjects(medical_subjects):
+    """
+    medical_subjects JSON 정규화 -> [(과목명, 과목코드)]
+    문자열 목록 또는 심평원 진료과목 API 형식(dgsbjtCd/dgsbjtCdNm) dict 목록을 받는다.
+    """
+    result = []
+    for item in medical_subjects or []:
+        if isinstance(item, dict):
+            name = item.get('dgsbjtCdNm') or item.get('name') or ''
+            code = item.get('dgsbjtCd') or item.get('code') or ''
+        else:
+            name, code = item, ''
+        name = str(name).strip()
+        if name:
+            result.append((name, str(code).strip()))
+    return result
+
+
+class HospitalSubject(models.Model):
+    """병원 진료과목 역색인 (진료과목 -> 병원)"""
+    hospital = models.ForeignKey(HospitalCache, on_delete=models.CASCADE, related_name='subjects', verbose_name="병원")
+    subject_name = models.CharField(max_length=50, verbose_name="진료과목명")
+    subject_code = models.CharField(max_length=10, blank=True, verbose_name="진료과목코드")
+
+    class Meta:
+        db_table = 'hospital_subject'
+        verbose_name = "병원진료과목"
+        verbose_name_plural = "병원진료과목"
+        constraints = [
+            models.UniqueConstraint(fields=['subject_name', 'hospital'], name='uniq_hospital_subject'),
+        ]
+
+    def __str__(self):
+        return f"{self.hospital_id} - {self.subject_name}"
 
-class DiseaseCache(models.Model):
+
+class DiseaseCache(HangulSearchKeyMixin, ContentFingerprintMixin, models.Model):
     """질병정보 캐시 테이블"""
+    search_key_fields = {'disease_name_kr': ('disease_name_chosung', 'disease_name_jamo')}
+    fingerprint_fields = ('disease_name_kr', 'disease_name_en')
+
     # 기본 식별 정보
     disease_code = models.CharField(max_length=20, unique=True, verbose_name="질병코드")
     disease_name_kr = models.CharField(max_length=500, verbose_name="질병명(한글)")
     disease_name_en = models.CharField(max_length=500, blank=True, verbose_name="질병명(영문)")
 
+    # 한글 검색키 (초성/자모 접두 검색용, 저장 시 자동 갱신)
+    disease_name_chosung = models.CharField(max_length=SEARCH_KEY_MAX_LENGTH, blank=True, default='', db_index=True, verbose_name="질병명 초성")
+    disease_name_jamo = models.CharField(max_length=SEARCH_KEY_MAX_LENGTH, blank=True, default='', db_index=True, verbose_name="질병명 자모")
+
+    # 데이터 관리
+    content_hash = models.CharField(max_length=FINGERPRINT_LENGTH, blank=True, default='', verbose_name="내용지문")  # 저장 시 자동 계산
+
     class Meta:
         db_table = 'disease_cache'
         verbose_name = "질병정보캐시"
@@ -79,4 +206,42 @@ class DiseaseCache(models.Model):
         ordering = ['disease_code']
 
     def __str__(self):
-        return f"{self.disease_code} - {self.disease_name_kr}"
\ No newline at end of file
+        return f"{self.disease_code} - {self.disease_name_kr}"
+
+class ReferenceDataVersion(models.Model):
+    """
+    참조 데이터(캐시 테이블) 세대 번호
+    임포트가 끝나면 세대를 올리고, 각 워커는 메모리 인덱스의 세대와 비교해 교체한다.
+    """
+    DISEASE_CACHE = 'disease_cache'
+    HOSPITAL_CACHE = 'hospital_cache'
+    MEDICATION = 'medication'
+    ATC_TREE = 'atc_tree'
+    DUR_CONTRAINDICATION = 'dur_contraindication'
+    MEDICATION_FACET = 'medication_facet'
+
+    name = models.CharField(max_length=50, unique=True, verbose_name="데이터명")
+    generation = models.PositiveBigIntegerField(default=0, verbose_name="세대")
+    updated_at = models.DateTimeField(auto_now=True, verbose_name="최종수정일시")
+
+    class Meta:
+        db_table = 'reference_data_version'
+        verbose_name = "참조데이터버전"
+        verbose_name_plural = "참조데이터버전"
+
+    def __str__(self):
+        return f"{self.name} - {self.generation}"
+
+    @classmethod
+    def get_generation(cls, name):
+        return cls.objects.filter(name=name).values_list('generation', flat=True).first() or 0
+
+    @classmethod
+    def bump(cls, name):
+        """세대 번호 증가 (임포트 완료 시 호출)"""
+        version, _ = cls.objects.get_or_create(name=name)
+        cls.objects.filter(pk=version.pk).update(
+            generation=models.F('generation') + 1,
+            updated_at=timezone.now()
+        )
+        return cls.get_generation(name)
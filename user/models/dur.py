@@ -0,0 +1,168 @@
+import calendar
+from datetime import date
+
+from django.db import models
+
+from common.models.base_model import BaseModel
+
+# 일반명코드 앞 4자리 = 주성분 일련번호 (함량/투여경로/제형과 무관)
+DUR_INGREDIENT_CODE_LENGTH = 4
+
+
+def dur_ingredient_code(code):
+    """
+    DUR 비교용 성분 코드 (일반명코드 앞 4자리)
+    일반명코드 형식(숫자 4자리로 시작)이 아니면 빈 문자열 - DUR성분코드(D000027 등)를 잘라 쓰면 모두 'D000' 이 된다
+    """
+    prefix = (code or '').strip().upper()[:DUR_INGREDIENT_CODE_LENGTH]
+    if len(prefix) == DUR_INGREDIENT_CODE_LENGTH and prefix.isdigit():
+        return prefix
+    return ''
+
+
+def age_in_months(birth_date: date, on_date: date) -> int:
+    """만 나이(개월)"""
+    months = (on_date.year - birth_date.year) * 12 + (on_date.month - birth_date.month)
+    return months - (on_date.day < birth_date.day)
+
+
+def latest_birth_date(months: int, on_date: date) -> date:
+    """on_date 기준 만 months 개월 이상이 되는 가장 늦은 생년월일 (없는 날짜는 그 달 말일)"""
+    total = on_date.year * 12 + (on_date.month - 1) - months
+    year, month = divmod(total, 12)
+    month += 1
+    return date(year, month, min(on_date.day, calendar.monthrange(year, month)[1]))
+
+
+class DurContraindication(BaseModel):
+    """
+    DUR 병용금기 성분 쌍 (공공데이터 DUR 병용금기 파일에서 임포트)
+    성분 코드는 dur_ingredient_code() 로 정규화하고 (a, b) 는 a < b 로 정렬해 한 쌍당 한 행만 둔다.
+    """
+
+    class Meta:
+        db_table = 'dur_contraindications'
+        verbose_name = 'DUR 병용금기'
+        verbose_name_plural = 'DUR 병용금기들'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['ingredient_code_a', 'ingredient_code_b'],
+                name='unique_dur_pair'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['ingredient_code_b'], name='idx_dur_code_b'),
+        ]
+
+    ingredient_code_a = models.CharField(
+        max_length=DUR_INGREDIENT_CODE_LENGTH,
+        verbose_name='성분코드A'
+    )
+    ingredient_name_a = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name='성분명A'
+    )
+    ingredient_code_b = models.CharField(
+        max_length=DUR_INGREDIENT_CODE_LENGTH,
+        verbose_name='성분코드B'
+    )
+    ingredient_name_b = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name='성분명B'
+    )
+    reason = models.TextField(
+        blank=True,
+        verbose_name='금기 사유'
+    )
+    notice_date = models.DateField(
+        null=True,
+        blank=True,
+        verbose_name='고시일자'
+    )
+
+    def __str__(self):
+        return f"{self.ingredient_name_a}({self.ingredient_code_a}) + {self.ingredient_name_b}({self.ingredient_code_b})"
+
+
+class DurPatientRule(BaseModel):
+    """
+    환자 특성 DUR 규칙 (연령금기 / 임부금기 / 노인주의) - 성분 코드 기준
+    나이 조건은 개월 단위 [min_age_months, max_age_months) 로 저장한다. (null 은 제한 없음)
+    임부금기는 임신 여부를 알 수 없으므로 가임기 여성에게 주의로 적용한다.
+    """
+
+    class RuleType(models.TextChoices):
+        AGE = 'AGE', '연령금기'
+        PREGNANCY = 'PREGNANCY', '임부금기'
+        ELDERLY = 'ELDERLY', '노인주의'
+
+    class Meta:
+        db_table = 'dur_patient_rules'
+        verbose_name = 'DUR 환자특성 규칙'
+        verbose_name_plural = 'DUR 환자특성 규칙들'
+        constraints = [
+            models.UniqueConstraint(
+                fields=['rule_type', 'ingredient_code'],
+                name='unique_dur_patient_rule'
+            )
+        ]
+        indexes = [
+            models.Index(fields=['ingredient_code', 'rule_type'], name='idx_dur_rule_code_type'),
+        ]
+
+    rule_type = models.CharField(
+        max_length=10,
+        choices=RuleType.choices,
+        verbose_name='규칙 유형'
+    )
+    ingredient_code = models.CharField(
+        max_length=DUR_INGREDIENT_CODE_LENGTH,
+        verbose_name='성분코드'
+    )
+    ingredient_name = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name='성분명'
+    )
+    min_age_months = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='적용 최소 나이(개월, 포함)'
+    )
+    max_age_months = models.PositiveIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='적용 최대 나이(개월, 미포함)'
+    )
+    gender = models.CharField(
+        max_length=10,
+        blank=True,
+        verbose_name='적용 성별',
+        help_text='빈 값이면 성별 무관'
+    )
+    grade = models.CharField(
+        max_length=20,
+        blank=True,
+        verbose_name='금기 등급'
+    )
+    reason = models.TextField(
+        blank=True,
+        verbose_name='금기 사유'
+    )
+
+    def __str__(self):
+        return f"[{self.get_rule_type_display()}] {self.ingredient_name}({self.ingredient_code})"
+
+    def applies_to(self, age_months, gender) -> bool:
+        """환자 나이(개월, 모르면 None)/성별에 규칙이 적용되는지"""
+        if self.gender and self.gender != gender:
+            return False
+        if self.min_age_months is None and self.max_age_months is None:
+            return True
+        if age_months is None:
+            return False
+        if self.min_age_months is not None and age_months < self.min_age_months:
+            return False
+        return self.max_age_months is None or age_months < self.max_age_months
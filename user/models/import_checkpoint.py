@@ -0,0 +1,37 @@
+from django.db import models
+
+
+class ImportCheckpoint(models.Model):
+    """
+    공공데이터 API 임포트 진행 상황 (임포터 + 검색 조건별)
+    페이지를 저장할 때마다 완료한 페이지 번호를 기록해 두고, 중단된 임포트를 --resume 으로 이어서 수행한다.
+    """
+    HOSPITAL = 'hospital'
+    DISEASE = 'disease'
+    MEDICATION = 'medication'
+
+    class Meta:
+        db_table = 'import_checkpoints'
+        verbose_name = '임포트 체크포인트'
+        verbose_name_plural = '임포트 체크포인트들'
+        unique_together = [['importer', 'partition']]
+
+    importer = models.CharField(max_length=50, verbose_name='임포터')
+    # 시도코드 / 검색 알파벳 / 성분명 (전국 조회는 빈 문자열)
+    partition = models.CharField(max_length=100, blank=True, default='', verbose_name='검색 조건')
+    # 페이지 크기가 다르면 페이지 번호가 맞지 않으므로 이어받지 않음
+    num_of_rows = models.PositiveIntegerField(verbose_name='페이지 크기')
+    total_count = models.PositiveIntegerField(null=True, blank=True, verbose_name='전체 건수')
+    completed_pages = models.JSONField(default=list, verbose_name='완료 페이지')
+    is_completed = models.BooleanField(default=False, verbose_name='완료 여부')
+    started_at = models.DateTimeField(auto_now_add=True, verbose_name='시작일시')
+    updated_at = models.DateTimeField(auto_now=True, verbose_name='최종수정일시')
+
+    def __str__(self):
+        return f"{self.importer}:{self.partition or '전체'} ({len(self.completed_pages)}/{self.total_pages or '?'})"
+
+    @property
+    def total_pages(self):
+        if self.total_count is None:
+            return None
+        return max(1, (self.total_count + self.num_of_rows - 1) // self.num_of_rows)
@@ -1,12 +1,18 @@
 import hashlib
 from decimal import Decimal
 from django.db import models
-from common.models.base_model import BaseModel
+from common.ingredient_names import NORMALIZED_NAME_MAX_LENGTH, normalize_ingredient_name
+from common.models.base_model import FINGERPRINT_LENGTH, BaseModel, ContentFingerprintMixin
+from user.models.atc_class import normalize_atc_code
 #from user.models.medication import Medication
 
 
-class MainIngredient(BaseModel):
+class MainIngredient(ContentFingerprintMixin, BaseModel):
     """주성분 모델 - 건강보험심사평가원 약가마스터 데이터 기반"""
+    fingerprint_fields = (
+        'atc_code', 'main_ingr_name_kr', 'main_ingr_name_en', 'density', 'unit',
+        'is_combination_drug', 'combination_group',
+    )
 
     class Meta:
         db_table = 'main_ingredients'
@@ -29,6 +35,7 @@ class MainIngredient(BaseModel):
     atc_code = models.CharField(
         max_length=50,
         blank=True,
+        db_index=True,
         verbose_name='ATC 코드',
         help_text='ATC 코드'
     )
@@ -44,6 +51,21 @@ class MainIngredient(BaseModel):
         db_index=True,
         verbose_name='주성분명(영문)'
     )
+    # 성분명 정규화 키 (염/수화물 형태 제거, 저장 시 자동 계산) - 성분 매칭용
+    name_kr_key = models.CharField(
+        max_length=NORMALIZED_NAME_MAX_LENGTH,
+        blank=True,
+        default='',
+        db_index=True,
+        verbose_name='주성분명 정규화 키(한글)'
+    )
+    name_en_key = models.CharField(
+        max_length=NORMALIZED_NAME_MAX_LENGTH,
+        blank=True,
+        default='',
+        db_index=True,
+        verbose_name='주성분명 정규화 키(영문)'
+    )
     # 함량 정보
     density = models.DecimalField(
         max_digits=12,
@@ -70,7 +92,22 @@ class MainIngredient(BaseModel):
         verbose_name='복합제 그룹',
         help_text='같은 복합제에 속한 성분들의 그룹 식별자'
     )
+    # 원본 데이터 지문 (저장 시 자동 계산) - 재임포트 시 바뀐 행만 쓰기 위함
+    content_hash = models.CharField(
+        max_length=FINGERPRINT_LENGTH,
+        blank=True,
+        default='',
+        verbose_name='내용 지문'
+    )
+
+    def refresh_normalized_fields(self):
+        """ATC 코드 정규화와 성분명 정규화 키 계산 (bulk_create 전에도 호출)"""
+        # ATC 코드 정규화 (분류 트리 접두 범위 조회용)
+        self.atc_code = normalize_atc_code(self.atc_code)
 
+        # 성분명 정규화 키
+        self.name_kr_key = normalize_ingredient_name(self.main_ingr_name_kr)
+        self.name_en_key = normalize_ingredient_name(self.main_ingr_name_en)
 
     def save(self, *args, **kwargs):
         """저장시 자동 처리"""
@@ -78,6 +115,11 @@ class MainIngredient(BaseModel):
 
         # 복합제 여부 자동 판단
 
+        self.refresh_normalized_fields()
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None:
+            kwargs['update_fields'] = [*update_fields, 'name_kr_key', 'name_en_key']
+
         super().save(*args, **kwargs)
 
     @classmethod
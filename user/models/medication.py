@@ -1,15 +1,20 @@
 from django.db import models
-from common.models.base_model import BaseModel
+from common.hangul import SEARCH_KEY_MAX_LENGTH
+from common.models.base_model import BaseModel, HangulSearchKeyMixin
 from user.models.main_ingredient import MainIngredient
 
 
-class Medication(BaseModel):
+class Medication(HangulSearchKeyMixin, BaseModel):
     """의약품 모델"""
+    search_key_fields = {'medication_name': ('medication_name_chosung', 'medication_name_jamo')}
 
     class Meta:
         db_table = 'medications'
         verbose_name = '의약품'
         verbose_name_plural = '의약품들'
+        indexes = [
+            models.Index(fields=['medication_name'], name='idx_medication_name'),
+        ]
 
     medication_id = models.BigIntegerField(
         primary_key=True,
@@ -19,6 +24,21 @@ class Medication(BaseModel):
         max_length=200,
         verbose_name='의약품명'
     )
+    # 한글 검색키 (초성/자모 접두 검색용, 저장 시 자동 갱신)
+    medication_name_chosung = models.CharField(
+        max_length=SEARCH_KEY_MAX_LENGTH,
+        blank=True,
+        default='',
+        db_index=True,
+        verbose_name='의약품명 초성'
+    )
+    medication_name_jamo = models.CharField(
+        max_length=SEARCH_KEY_MAX_LENGTH,
+        blank=True,
+        default='',
+        db_index=True,
+        verbose_name='의약품명 자모'
+    )
     main_item_ingr = models.CharField(
         max_length=100,
         null=True,
@@ -40,6 +60,11 @@ class Medication(BaseModel):
         max_length=100, 
         help_text='제조사'
     )
+    # 검색 순위 가중치 (처방 의약품 수, 조회 시 조인 없이 정렬하도록 비정규화)
+    prescription_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='처방 건수'
+    )
     item_image = models.ImageField(
         upload_to='medications/',
         blank=True,
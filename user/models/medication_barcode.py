@@ -0,0 +1,49 @@
+from django.db import models
+
+from user.models.medication import Medication
+
+
+class MedicationBarcode(models.Model):
+    """
+    의약품 표준코드(13자리 바코드) -> 의약품/성분 매핑
+    의약품표준코드 파일 임포트(populate_main_ingredients) 시 함께 갱신
+    """
+
+    class Meta:
+        db_table = 'medication_barcodes'
+        verbose_name = '의약품 표준코드'
+        verbose_name_plural = '의약품 표준코드들'
+
+    barcode = models.CharField(
+        primary_key=True,
+        max_length=13,
+        verbose_name='표준코드'
+    )
+    # 품목기준코드 (의약품 테이블에 아직 없는 품목도 매핑은 유지)
+    medication = models.ForeignKey(
+        Medication,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='barcodes',
+        db_constraint=False,
+        verbose_name='의약품'
+    )
+    ingr_code = models.CharField(
+        max_length=20,
+        blank=True,
+        db_index=True,
+        verbose_name='일반명코드'
+    )
+    product_name = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name='상품명'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='수정일시'
+    )
+
+    def __str__(self):
+        return f"{self.barcode} - {self.product_name}"
@@ -0,0 +1,72 @@
+from django.db import models
+
+from user.models.medication import Medication
+
+
+class MedicationFacet(models.Model):
+    """
+    의약품 패싯 값별 의약품 수 (의약품/성분 임포트 후 재생성하는 집계 테이블)
+    - 제조사 / 약효분류(ATC 2단계) / 제형 / 복합제 여부
+    - 필터 조합별 건수는 MedicationFacetMember 로 만든 메모리 인덱스에서 계산
+    """
+
+    class Facet(models.TextChoices):
+        MANUFACTURER = 'manufacturer', '제조사'
+        DRUG_CLASS = 'drug_class', '약효분류'
+        DOSAGE_FORM = 'dosage_form', '제형'
+        COMBINATION = 'combination', '복합제 여부'
+
+    class Meta:
+        db_table = 'medication_facets'
+        verbose_name = '의약품 패싯'
+        verbose_name_plural = '의약품 패싯들'
+        unique_together = [['facet', 'value']]
+        indexes = [
+            models.Index(fields=['facet', '-medication_count'], name='idx_med_facet_count'),
+        ]
+
+    facet = models.CharField(
+        max_length=20,
+        choices=Facet.choices,
+        verbose_name='패싯'
+    )
+    value = models.CharField(
+        max_length=200,
+        verbose_name='값'
+    )
+    label = models.CharField(
+        max_length=200,
+        blank=True,
+        verbose_name='표시명'
+    )
+    medication_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='의약품 수'
+    )
+
+    def __str__(self):
+        return f"{self.get_facet_display()}: {self.label or self.value} ({self.medication_count})"
+
+
+class MedicationFacetMember(models.Model):
+    """의약품-패싯 값 연결 (의약품 한 건은 패싯마다 0개 이상의 값에 속함)"""
+
+    class Meta:
+        db_table = 'medication_facet_members'
+        verbose_name = '의약품 패싯 연결'
+        verbose_name_plural = '의약품 패싯 연결들'
+        unique_together = [['facet_value', 'medication']]
+
+    facet_value = models.ForeignKey(
+        MedicationFacet,
+        on_delete=models.CASCADE,
+        related_name='members',
+        verbose_name='패싯 값'
+    )
+    medication = models.ForeignKey(
+        Medication,
+        on_delete=models.CASCADE,
+        related_name='facet_members',
+        db_constraint=False,
+        verbose_name='의약품'
+    )
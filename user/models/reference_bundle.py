@@ -0,0 +1,46 @@
+from django.db import models
+
+
+class ReferenceBundle(models.Model):
+    """
+    모바일 앱 오프라인용 참조 데이터 번들 (의약품/주성분/질병정보 전체, gzip 압축 열 단위 JSON)
+    임포트 후 데이터가 바뀐 경우에만 버전이 하나씩 올라간다.
+    """
+
+    class Meta:
+        db_table = 'reference_bundles'
+        verbose_name = '참조 데이터 번들'
+        verbose_name_plural = '참조 데이터 번들들'
+        ordering = ['-version']
+
+    version = models.PositiveIntegerField(unique=True, verbose_name='버전')
+    file_name = models.CharField(max_length=255, verbose_name='파일명')
+    size = models.PositiveBigIntegerField(verbose_name='파일 크기(bytes)')
+    sha256 = models.CharField(max_length=64, verbose_name='SHA-256')
+    row_counts = models.JSONField(default=dict, verbose_name='테이블별 행 수')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+
+    def __str__(self):
+        return f"v{self.version} ({self.size:,} bytes)"
+
+
+class ReferenceBundlePatch(models.Model):
+    """연속한 두 번들 버전 사이의 행 단위 변경분 (테이블별 upsert/delete)"""
+
+    class Meta:
+        db_table = 'reference_bundle_patches'
+        verbose_name = '참조 데이터 번들 패치'
+        verbose_name_plural = '참조 데이터 번들 패치들'
+        unique_together = [['from_version', 'to_version']]
+        ordering = ['from_version']
+
+    from_version = models.PositiveIntegerField(verbose_name='이전 버전')
+    to_version = models.PositiveIntegerField(verbose_name='대상 버전')
+    file_name = models.CharField(max_length=255, verbose_name='파일명')
+    size = models.PositiveBigIntegerField(verbose_name='파일 크기(bytes)')
+    sha256 = models.CharField(max_length=64, verbose_name='SHA-256')
+    change_counts = models.JSONField(default=dict, verbose_name='테이블별 변경 수')
+    created_at = models.DateTimeField(auto_now_add=True, verbose_name='생성일시')
+
+    def __str__(self):
+        return f"v{self.from_version} -> v{self.to_version} ({self.size:,} bytes)"
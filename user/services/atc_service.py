@@ -0,0 +1,168 @@
+# user/services/atc_service.py
+"""
+ATC 분류 트리 (MainIngredient.atc_code 기준)
+
+- rebuild_atc_classes(): 성분/의약품-성분 연결에서 AtcClass 집계 테이블 재생성 (1~5단계, 노드별 건수)
+- atc_tree: AtcClass 전체를 메모리에 올린 읽기 전용 트리 (ReferenceDataVersion 세대로 교체)
+- "N06A 하위 전체" 성분/의약품 조회는 atc_code 인덱스 접두 범위 조건 하나로 처리
+"""
+import logging
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+from django.db import transaction
+
+from common.autocomplete import VersionedIndexHolder
+from common.pagination import paginate_search
+from common.search import prefix_filter
+from user.formatters import format_atc_class, format_main_ingredient_summary, format_medication_summary
+from user.models import AtcClass, MainIngredient, Medication, MedicationIngredient, ReferenceDataVersion
+from user.models.atc_class import ATC_LEVEL_LENGTHS, atc_ancestors, normalize_atc_code
+
+logger = logging.getLogger(__name__)
+
+
+def rebuild_atc_classes() -> Dict[str, int]:
+    """
+    AtcClass 테이블 재생성
+    ATC 코드는 사전순 정렬이 곧 전위 순회 순서이므로 정렬 후 스택 한 번으로 lft/rgt 를 매긴다.
+    기존 분류명(name)은 코드 기준으로 유지한다.
+    """
+    ingredient_counts = defaultdict(int)
+    ingredient_atc = {}
+    ingredients = MainIngredient.objects.exclude(atc_code='').values_list('ingr_code', 'atc_code')
+    for ingr_code, atc_code in ingredients.iterator(chunk_size=5000):
+        ingredient_atc[ingr_code] = atc_code
+        for code in atc_ancestors(atc_code):
+            ingredient_counts[code] += 1
+
+    # 의약품 한 건이 같은 분류의 성분을 여러 개 가져도 한 번만 센다
+    medication_codes = defaultdict(set)
+    links = MedicationIngredient.objects.values_list('medication_id', 'main_ingredient_id')
+    for medication_id, ingr_code in links.iterator(chunk_size=5000):
+        atc_code = ingredient_atc.get(ingr_code)
+        if atc_code:
+            medication_codes[medication_id].update(atc_ancestors(atc_code))
+    medication_counts = defaultdict(int)
+    for codes in medication_codes.values():
+        for code in codes:
+            medication_counts[code] += 1
+
+    names = dict(AtcClass.objects.exclude(name='').values_list('code', 'name'))
+
+    nodes = []
+    stack = []
+    counter = 0
+    for code in sorted(ingredient_counts):
+        while stack and not code.startswith(stack[-1].code):
+            counter += 1
+            stack.pop().rgt = counter
+        counter += 1
+        node = AtcClass(
+            code=code,
+            name=names.get(code, ''),
+            level=ATC_LEVEL_LENGTHS.index(len(code)) + 1,
+            parent_id=stack[-1].code if stack else None,
+            lft=counter,
+            rgt=0,
+            ingredient_count=ingredient_counts[code],
+            medication_count=medication_counts[code],
+        )
+        nodes.append(node)
+        stack.append(node)
+    while stack:
+        counter += 1
+        stack.pop().rgt = counter
+
+    with transaction.atomic():
+        AtcClass.objects.all().delete()
+        AtcClass.objects.bulk_create(nodes, batch_size=1000)
+        ReferenceDataVersion.bump(ReferenceDataVersion.ATC_TREE)
+
+    return {
+        'nodes': len(nodes),
+        'ingredients': len(ingredient_atc),
+        'medications': len(medication_codes),
+    }
+
+
+class AtcTree:
+    """읽기 전용 ATC 트리 (코드 -> 노드, 노드별 자식 코드 목록)"""
+
+    def __init__(self, nodes: Dict[str, Dict[str, Any]], children: Dict[Optional[str], List[str]]):
+        self.nodes = nodes
+        self.children = children
+
+    @classmethod
+    def build(cls) -> 'AtcTree':
+        nodes = {}
+        children = defaultdict(list)
+        for atc_class in AtcClass.objects.order_by('lft').iterator(chunk_size=2000):
+            nodes[atc_class.code] = format_atc_class(atc_class)
+            children[atc_class.parent_id].append(atc_class.code)
+        return cls(nodes, dict(children))
+
+    def __len__(self):
+        return len(self.nodes)
+
+    def render(self, code: Optional[str] = None, depth: int = 1) -> List[Dict[str, Any]]:
+        """code 의 자식 노드들을 depth 단계까지 중첩 목록으로 반환 (code 가 없으면 1단계부터)"""
+        result = []
+        for child_code in self.children.get(code, []):
+            node = dict(self.nodes[child_code])
+            node['has_children'] = child_code in self.children
+            if depth > 1 and node['has_children']:
+                node['children'] = self.render(child_code, depth - 1)
+            result.append(node)
+        return result
+
+
+atc_tree = VersionedIndexHolder(
+    ReferenceDataVersion.ATC_TREE,
+    builder=AtcTree.build,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
+
+
+class AtcService:
+    """ATC 분류 탐색 서비스"""
+
+    @staticmethod
+    def get_tree(code: str = None, depth: int = 1) -> Dict[str, Any]:
+        """ATC 트리 조회 (code 하위 depth 단계)"""
+        tree = atc_tree.get()
+        code = normalize_atc_code(code) or None
+        if code and code not in tree.nodes:
+            raise ValueError(f'ATC 분류를 찾을 수 없습니다: {code}')
+
+        return {
+            'node': tree.nodes[code] if code else None,
+            'children': tree.render(code, depth),
+        }
+
+    @staticmethod
+    def get_ingredients(code: str, limit: int = 20, offset: int = 0, cursor: str = None) -> Dict[str, Any]:
+        """ATC 분류 하위 전체 성분 (atc_code 접두 범위 조회)"""
+        code = normalize_atc_code(code)
+        ingredients = MainIngredient.objects.filter(prefix_filter('atc_code', code))
+        ingredients, page = paginate_search(ingredients, ['atc_code'], limit, offset, cursor)
+
+        return {
+            **page,
+            'ingredients': [format_main_ingredient_summary(ingredient) for ingredient in ingredients]
+        }
+
+    @staticmethod
+    def get_medications(code: str, limit: int = 20, offset: int = 0, cursor: str = None) -> Dict[str, Any]:
+        """ATC 분류 하위 성분을 포함한 의약품"""
+        code = normalize_atc_code(code)
+        medication_ids = MedicationIngredient.objects.filter(
+            prefix_filter('main_ingredient__atc_code', code)
+        ).values('medication_id')
+        medications = Medication.objects.filter(medication_id__in=medication_ids)
+        medications, page = paginate_search(medications, ['medication_name'], limit, offset, cursor)
+
+        return {
+            **page,
+            'medications': [format_medication_summary(medication) for medication in medications]
+        }
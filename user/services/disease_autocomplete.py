@@ -0,0 +1,78 @@
+# user/services/disease_autocomplete.py
+"""
+질병 자동완성 인덱스 (DiseaseCache 전체를 메모리에 적재)
+
+질병코드, 한글명, 영문명과 한글명의 초성/자모 키를 PrefixIndex 로 만들어
+질병 등록 화면의 자동완성을 DB 조회 없이 처리한다.
+질병 임포트가 끝나면 ReferenceDataVersion 세대가 올라가고 각 워커가 인덱스를 교체한다.
+"""
+import re
+from typing import Any, Dict, List
+
+from common.autocomplete import PrefixIndex, VersionedIndexHolder
+from common.hangul import has_hangul, is_chosung_query, to_chosung, to_jamo
+from user.formatters import format_disease_cache
+from user.models import DiseaseCache, ReferenceDataVersion
+
+TIER_NAME = 0  # 코드/이름 전체 접두
+TIER_WORD = 1  # 이름 중간 단어 접두
+
+_WORD_SEPARATOR = re.compile(r'[\s(),/\[\]-]+')
+
+
+def word_suffixes(text: str) -> List[str]:
+    """이름 중간 단어부터 시작하는 접미 문자열 ("급성 비인두염[감기]" -> ["비인두염[감기]", "감기]"])"""
+    return [text[match.end():] for match in _WORD_SEPARATOR.finditer(text or '') if match.end() < len(text)]
+
+
+def build_disease_index() -> PrefixIndex:
+    documents = []
+    entries = []
+
+    diseases = DiseaseCache.objects.only(
+        'disease_code', 'disease_name_kr', 'disease_name_en'
+    ).order_by('disease_code')
+
+    for doc_id, disease in enumerate(diseases.iterator(chunk_size=2000)):
+        documents.append(format_disease_cache(disease))
+        name_kr = disease.disease_name_kr or ''
+
+        entries.append((TIER_NAME, disease.disease_code, doc_id))
+        for name in (name_kr, disease.disease_name_en):
+            entries.append((TIER_NAME, name, doc_id))
+        entries.append((TIER_NAME, to_chosung(name_kr), doc_id))
+        entries.append((TIER_NAME, to_jamo(name_kr), doc_id))
+
+        for suffix in word_suffixes(name_kr):
+            entries.append((TIER_WORD, suffix, doc_id))
+            entries.append((TIER_WORD, to_chosung(suffix), doc_id))
+            entries.append((TIER_WORD, to_jamo(suffix), doc_id))
+        for suffix in word_suffixes(disease.disease_name_en):
+            entries.append((TIER_WORD, suffix, doc_id))
+
+    return PrefixIndex.build(documents, entries)
+
+
+disease_index = VersionedIndexHolder(
+    ReferenceDataVersion.DISEASE_CACHE,
+    builder=build_disease_index,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
+
+
+def autocomplete_diseases(keyword: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """
+    질병 자동완성 상위 limit 건
+    - 초성만 입력: 초성 키
+    - 그 외: 코드/이름 키, 부족하면 자모 키로 채움 (입력 중인 글자)
+    """
+    index = disease_index.get()
+
+    if is_chosung_query(keyword):
+        doc_ids = index.search_ids(to_chosung(keyword), limit)
+    else:
+        doc_ids = index.search_ids(keyword, limit)
+        if has_hangul(keyword) and len(doc_ids) < limit:
+            doc_ids += index.search_ids(to_jamo(keyword), limit - len(doc_ids), exclude=set(doc_ids))
+
+    return [index.documents[doc_id] for doc_id in doc_ids]
@@ -0,0 +1,99 @@
+# user/services/dur_index.py
+"""
+DUR 병용금기 쌍 인덱스 (DurContraindication 전체를 메모리에 적재)
+
+성분 코드마다 정수 번호를 매기고 (작은 번호 << 32 | 큰 번호) 를 키로 하는 dict 하나에 금기 행 번호를 둔다.
+n 개 성분의 검사는 금기 목록에 한 번도 나오지 않는 성분을 먼저 걸러낸 뒤 n(n-1)/2 번의 해시 조회로 끝난다.
+DUR 임포트가 끝나면 ReferenceDataVersion 세대가 올라가고 각 워커가 인덱스를 교체한다.
+"""
+from typing import Any, Dict, Iterable, List, Tuple
+
+from common.autocomplete import VersionedIndexHolder
+from user.models import DurContraindication, ReferenceDataVersion
+from user.models.dur import dur_ingredient_code
+
+_ID_BITS = 32
+
+
+def _pair_key(id_a: int, id_b: int) -> int:
+    if id_a > id_b:
+        id_a, id_b = id_b, id_a
+    return (id_a << _ID_BITS) | id_b
+
+
+class DurPairIndex:
+    """읽기 전용 병용금기 쌍 인덱스"""
+
+    def __init__(self, code_ids: Dict[str, int], pairs: Dict[int, int], rows: List[tuple]):
+        self.code_ids = code_ids
+        self.pairs = pairs
+        self.rows = rows
+
+    @classmethod
+    def build(cls, rows: Iterable[tuple]) -> 'DurPairIndex':
+        """
+        :param rows: (성분코드A, 성분명A, 성분코드B, 성분명B, 금기사유) 목록
+        """
+        code_ids = {}
+        pairs = {}
+        stored = []
+        reasons = {}  # 같은 사유 문자열은 한 번만 보관
+        for code_a, name_a, code_b, name_b, reason in rows:
+            code_a, code_b = dur_ingredient_code(code_a), dur_ingredient_code(code_b)
+            if not code_a or not code_b or code_a == code_b:
+                continue
+            id_a = code_ids.setdefault(code_a, len(code_ids))
+            id_b = code_ids.setdefault(code_b, len(code_ids))
+            key = _pair_key(id_a, id_b)
+            if key in pairs:
+                continue
+            pairs[key] = len(stored)
+            stored.append((code_a, name_a, code_b, name_b, reasons.setdefault(reason, reason)))
+        return cls(code_ids, pairs, stored)
+
+    def __len__(self):
+        return len(self.pairs)
+
+    def find_pairs(self, codes: Iterable[str]) -> List[Tuple[str, str, int]]:
+        """성분 코드 목록 안의 병용금기 쌍 (코드 a, 코드 b, 금기 행 번호)"""
+        code_ids = self.code_ids
+        present = {}
+        for code in codes:
+            code = dur_ingredient_code(code)
+            code_id = code_ids.get(code)
+            if code_id is not None:
+                present[code_id] = code
+
+        ids = sorted(present)
+        found = []
+        for index, id_a in enumerate(ids):
+            base = id_a << _ID_BITS
+            for id_b in ids[index + 1:]:
+                row = self.pairs.get(base | id_b)
+                if row is not None:
+                    found.append((present[id_a], present[id_b], row))
+        return found
+
+    def describe(self, row: int) -> Dict[str, Any]:
+        code_a, name_a, code_b, name_b, reason = self.rows[row]
+        return {
+            'ingredient_code_a': code_a,
+            'ingredient_name_a': name_a,
+            'ingredient_code_b': code_b,
+            'ingredient_name_b': name_b,
+            'reason': reason,
+        }
+
+
+def build_dur_index() -> DurPairIndex:
+    rows = DurContraindication.objects.values_list(
+        'ingredient_code_a', 'ingredient_name_a', 'ingredient_code_b', 'ingredient_name_b', 'reason'
+    )
+    return DurPairIndex.build(rows.iterator(chunk_size=5000))
+
+
+dur_index = VersionedIndexHolder(
+    ReferenceDataVersion.DUR_CONTRAINDICATION,
+    builder=build_dur_index,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
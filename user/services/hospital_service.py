@@ -1,8 +1,20 @@
-from typing import Dict, Any
+import math
+from functools import reduce
+from operator import or_
+from typing import Dict, Any, List, Optional
+
 from django.db.models import Q
 
+from common.geo import bounding_box, cover_radius, haversine_km, validate_coordinates
+from common.hangul import has_hangul, is_chosung_query, to_chosung, to_jamo
+from common.pagination import paginate_search
+from common.search import match_rank_expression, prefix_filter
 from user.models import Hospital, HospitalCache
-from user.formatters import format_hospital
+from user.formatters import format_hospital, format_hospital_cache
+
+# 반경 미지정(k-최근접) 시 결과가 limit 개 모일 때까지 넓혀가는 반경 (km)
+NEARBY_SEARCH_RADII = [1, 2, 5, 10, 20, 50]
+MAX_NEARBY_RADIUS_KM = 50
 
 
 class HospitalService:
@@ -12,46 +24,161 @@ class HospitalService:
     def search_hospitals(
         keyword: str = None,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        sido_code: str = None,
+        sigungu_code: str = None,
+        medical_subject: str = None,
+        cursor: str = None,
+        with_total: bool = False,
+        rank_matches: bool = False
     ) -> Dict[str, Any]:
         """
         등록할 병원 검색
         HospitalCache 에서 없으면 API 호출
-        :param keyword: 병원 이름
+        :param keyword: 병원 이름 (초성 "ㅅㅇㄷ", 입력 중인 글자 "서울대벼" 도 가능)
+        :param sido_code/sigungu_code: 지역 (시도/시군구 인덱스)
+        :param medical_subject: 진료과목명 (HospitalSubject 역색인)
+        :param cursor: 이전 응답의 next_cursor (OFFSET 대신 이어서 조회)
+        :param with_total: 건수 포함 여부 (SEARCH_TOTAL_COUNT_CAP 까지만 셈)
+        :param rank_matches: 이름 검색 시 매칭 등급(접두 > 단어 > 부분일치) 순으로 정렬 (결과에 match_rank 포함)
         """
-        query = Q()
+        filters = Q()
+        if sido_code:
+            filters &= Q(sido_code=sido_code)
+        if sigungu_code:
+            filters &= Q(sigungu_code=sigungu_code)
+        if medical_subject:
+            filters &= Q(subjects__subject_name=medical_subject)
+
+        hospitals = HospitalCache.objects.filter(filters)
+        ordering = ['hospital_name']
+        ranked = False
 
-        # 키워드 검색
-        if keyword:
-            query |= Q(hospital_name__icontains=keyword)
+        if keyword and is_chosung_query(keyword):
+            # 초성 검색키 인덱스 접두 검색
+            hospitals = hospitals.filter(prefix_filter('hospital_name_chosung', to_chosung(keyword)))
+            ordering = ['hospital_name_chosung', 'hospital_name']
+        elif keyword:
+            hospitals = hospitals.filter(hospital_name__icontains=keyword)
 
-        # 기본 쿼리셋
-        hospitals = HospitalCache.objects.filter(query)
+            # 결과가 없으면 자모 검색키로 재시도 (입력 중인 글자)
+            if has_hangul(keyword) and not hospitals.exists():
+                hospitals = HospitalCache.objects.filter(
+                    filters, prefix_filter('hospital_name_jamo', to_jamo(keyword))
+                )
+                ordering = ['hospital_name_jamo', 'hospital_name']
+            elif rank_matches:
+                # 가나다순 상위 N 건을 자른 뒤 등급을 매기면 범위 밖의 접두 일치가 빠지므로 DB 에서 등급순 정렬
+                hospitals = hospitals.annotate(match_rank=match_rank_expression('hospital_name', keyword))
+                ordering = ['match_rank', 'hospital_name']
+                ranked = True
 
-        # 페이지네이션
-        total_count = hospitals.count()
-        hospitals = hospitals[offset:offset + limit]
+        # 페이지네이션 (count 없이 limit + 1 조회)
+        hospitals, page = paginate_search(hospitals, ordering, limit, offset, cursor, with_total)
 
         return {
-            'total_count': total_count,
-            'hospitals': [format_hospital(hospital) for hospital in hospitals]
+            **page,
+            'hospitals': [
+                {**format_hospital_cache(hospital), 'match_rank': hospital.match_rank} if ranked
+                else format_hospital_cache(hospital)
+                for hospital in hospitals
+            ]
         }
 
     @staticmethod
     def search_by_name(
         name: str,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        cursor: str = None,
+        with_total: bool = False
     ) -> Dict[str, Any]:
         """병원명으로 검색"""
         hospitals = Hospital.objects.filter(
             hosp_name__icontains=name
-        ).order_by('hosp_name')
+        ).select_related('user')
 
-        total_count = hospitals.count()
-        hospitals = hospitals[offset:offset + limit]
+        hospitals, page = paginate_search(hospitals, ['hosp_name'], limit, offset, cursor, with_total)
 
         return {
-            'total_count': total_count,
+            **page,
             'hospitals': [format_hospital(hospital) for hospital in hospitals]
         }
+
+    @staticmethod
+    def search_nearby(
+        latitude: float,
+        longitude: float,
+        radius_km: Optional[float] = None,
+        limit: int = 20,
+        hospital_type_code: str = None,
+        medical_subject: str = None
+    ) -> Dict[str, Any]:
+        """
+        내 주변 병원 검색
+        - radius_km 지정: 반경 내 가까운 순 limit 개
+        - 미지정: 가까운 병원 limit 개 (반경을 넓혀가며 검색)
+        geohash 접두 범위 스캔 + 경계 상자로 후보를 추린 뒤 하버사인 거리로 정렬한다.
+        좌표가 NaN/inf/범위 밖이거나 반경이 0 이하면 ValueError
+        """
+        validate_coordinates(latitude, longitude)
+        if radius_km is not None and not (math.isfinite(radius_km) and radius_km > 0):
+            raise ValueError(f'반경은 0보다 큰 숫자여야 합니다: {radius_km}')
+
+        if radius_km is not None:
+            radii = [min(radius_km, MAX_NEARBY_RADIUS_KM)]
+        else:
+            radii = NEARBY_SEARCH_RADII
+
+        nearest = []
+        for radius in radii:
+            nearest = HospitalService._find_within(
+                latitude, longitude, radius, hospital_type_code, medical_subject
+            )
+            if len(nearest) >= limit:
+                break
+        nearest = nearest[:limit]
+
+        hospitals = HospitalCache.objects.in_bulk([pk for _, pk in nearest])
+        return {
+            'radius_km': radius,
+            'hospitals': [
+                {**format_hospital_cache(hospitals[pk]), 'distance_km': round(distance, 3)}
+                for distance, pk in nearest
+                if pk in hospitals
+            ]
+        }
+
+    @staticmethod
+    def _find_within(
+        latitude: float,
+        longitude: float,
+        radius_km: float,
+        hospital_type_code: str = None,
+        medical_subject: str = None
+    ) -> List[tuple]:
+        """반경 내 (거리, pk) 목록 - 가까운 순"""
+        min_lat, max_lat, min_lon, max_lon = bounding_box(latitude, longitude, radius_km)
+
+        query = reduce(or_, (prefix_filter('geohash', cell) for cell in cover_radius(latitude, longitude, radius_km)))
+        query &= Q(
+            latitude__gte=min_lat, latitude__lte=max_lat,
+            longitude__gte=min_lon, longitude__lte=max_lon,
+            is_active=True
+        )
+        if hospital_type_code:
+            query &= Q(hospital_type_code=hospital_type_code)
+
+        if medical_subject:
+            query &= Q(subjects__subject_name=medical_subject)
+
+        result = []
+        # 기본 정렬(hospital_name)을 제거해야 geohash 인덱스를 탄다
+        rows = HospitalCache.objects.filter(query).order_by().values_list('pk', 'latitude', 'longitude')
+        for pk, hospital_latitude, hospital_longitude in rows:
+            distance = haversine_km(latitude, longitude, float(hospital_latitude), float(hospital_longitude))
+            if distance <= radius_km:
+                result.append((distance, pk))
+
+        result.sort()
+        return result
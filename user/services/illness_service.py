@@ -1,8 +1,16 @@
+import re
 from typing import Dict, Any, List
 from django.db.models import Q
 
-from user.models import Illness
-from user.formatters import format_illness
+from common.hangul import has_hangul, is_chosung_query, to_chosung, to_jamo
+from common.pagination import paginate_search
+from common.search import prefix_filter
+from user.models import DiseaseCache, Illness
+from user.formatters import format_disease_cache, format_illness
+from user.services.disease_autocomplete import autocomplete_diseases
+
+# KCD 질병코드 형태 (예: J00, E11.9)
+DISEASE_CODE_PATTERN = re.compile(r'^[A-Za-z]\d[\d.]*$')
 
 
 class IllnessService:
@@ -45,17 +53,66 @@ class IllnessService:
     def search_by_name(
         name: str,
         limit: int = 20,
-        offset: int = 0
+        offset: int = 0,
+        cursor: str = None,
+        with_total: bool = False
     ) -> Dict[str, Any]:
         """질병명으로 검색"""
         illnesses = Illness.objects.filter(
             ill_name__icontains=name
-        ).order_by('name')
+        ).select_related('user')
 
-        total_count = illnesses.count()
-        illnesses = illnesses[offset:offset + limit]
+        illnesses, page = paginate_search(illnesses, ['ill_name'], limit, offset, cursor, with_total)
 
         return {
-            'total_count': total_count,
+            **page,
             'illnesses': [format_illness(illness) for illness in illnesses]
-        } 
\ No newline at end of file
+        }
+
+    @staticmethod
+    def search_diseases(
+        keyword: str,
+        limit: int = 20,
+        offset: int = 0,
+        cursor: str = None,
+        with_total: bool = False
+    ) -> Dict[str, Any]:
+        """
+        질병 캐시(DiseaseCache) 검색
+        - 질병코드("J0"): 코드 접두 검색
+        - 초성("ㄱㅁ"): 초성 검색키 접두 검색
+        - 그 외: 한글/영문명 검색, 결과가 없으면 자모 검색키 접두 검색 (입력 중인 글자)
+        """
+        keyword = (keyword or '').strip()
+        diseases = DiseaseCache.objects.all()
+        ordering = ['disease_code']
+
+        if DISEASE_CODE_PATTERN.match(keyword):
+            diseases = diseases.filter(prefix_filter('disease_code', keyword.upper()))
+        elif is_chosung_query(keyword):
+            diseases = diseases.filter(prefix_filter('disease_name_chosung', to_chosung(keyword)))
+            ordering = ['disease_name_chosung', 'disease_code']
+        else:
+            diseases = diseases.filter(
+                Q(disease_name_kr__icontains=keyword) | Q(disease_name_en__icontains=keyword)
+            )
+
+            if has_hangul(keyword) and not diseases.exists():
+                diseases = DiseaseCache.objects.filter(
+                    prefix_filter('disease_name_jamo', to_jamo(keyword))
+                )
+                ordering = ['disease_name_jamo', 'disease_code']
+
+        diseases, page = paginate_search(diseases, ordering, limit, offset, cursor, with_total)
+
+        return {
+            **page,
+            'diseases': [format_disease_cache(disease) for disease in diseases]
+        }
+
+    @staticmethod
+    def autocomplete_diseases(keyword: str, limit: int = 10) -> Dict[str, Any]:
+        """질병 자동완성 (메모리 인덱스, DB 조회 없음)"""
+        return {
+            'diseases': autocomplete_diseases((keyword or '').strip(), limit)
+        }
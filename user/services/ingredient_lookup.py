@@ -0,0 +1,99 @@
+# user/services/ingredient_lookup.py
+"""
+성분명 -> MainIngredient 매칭 (정규화 키 메모리 사전)
+
+임포트/매칭 스크립트에서 의약품마다 LIKE/iexact 쿼리를 여러 번 던지는 대신
+실행 시작 시 MainIngredient 를 한 번 읽어 정규화 키 사전을 만들고 O(1) 로 찾는다.
+같은 키에 서로 다른 주성분(일반명코드 앞 4자리, 함량/제형 무관)이 둘 이상 걸리면
+모호한 키로 보고 매칭하지 않는다.
+정규화 키로 못 찾으면 부분 일치(icontains)로 찾되, 결과 성분이 하나일 때만 쓴다.
+"""
+from typing import Dict, Optional, Set
+
+from common.ingredient_names import normalize_ingredient_name
+from user.models import MainIngredient
+from user.models.dur import dur_ingredient_code
+
+
+def active_ingredient_id(ingr_code: str) -> str:
+    """같은 주성분 판단용 코드 (일반명코드면 앞 4자리, 아니면 코드 전체)"""
+    code = (ingr_code or '').strip().upper()
+    return code[:4] if code[:4].isdigit() else code
+
+
+class IngredientNameLookup:
+    """정규화 성분명 -> MainIngredient"""
+
+    def __init__(self):
+        self.by_key: Dict[str, MainIngredient] = {}
+        self.ambiguous_keys: Set[str] = set()
+
+        ingredients = MainIngredient.objects.order_by('is_combination_drug', 'ingr_code')
+
+        # name_kr_key / name_en_key 는 저장 시 normalize_ingredient_name() 으로 채워진다
+        for ingredient in ingredients.iterator(chunk_size=2000):
+            for key in {ingredient.name_kr_key, ingredient.name_en_key}:
+                if not key or key in self.ambiguous_keys:
+                    continue
+                current = self.by_key.get(key)
+                if current is None:
+                    self.by_key[key] = ingredient
+                elif active_ingredient_id(current.ingr_code) != active_ingredient_id(ingredient.ingr_code):
+                    self.ambiguous_keys.add(key)
+                    del self.by_key[key]
+
+    def __len__(self):
+        return len(self.by_key)
+
+    def find(self, name: str, partial_field: str = 'main_ingr_name_kr') -> Optional[MainIngredient]:
+        """
+        정규화 키로 찾고, 키가 없으면 partial_field 부분 일치로 찾는다
+        (모호한 키이거나 부분 일치 성분이 여럿이면 None)
+        """
+        key = normalize_ingredient_name(name)
+        if not key or key in self.ambiguous_keys:
+            return None
+
+        ingredient = self.by_key.get(key)
+        if ingredient is not None or not partial_field:
+            return ingredient
+        return self.find_partial(name, partial_field)
+
+    @staticmethod
+    def find_partial(name: str, field: str) -> Optional[MainIngredient]:
+        """부분 일치 성분이 주성분 하나로 모일 때만 반환"""
+        matches = list(
+            MainIngredient.objects.filter(**{f'{field}__icontains': name.strip()})
+            .order_by('is_combination_drug', 'ingr_code')[:20]
+        )
+        if len({active_ingredient_id(ingredient.ingr_code) for ingredient in matches}) != 1:
+            return None
+        return matches[0]
+
+
+class DurCodeResolver:
+    """
+    DUR CSV 성분코드 -> DUR 비교용 코드
+    일반명코드는 앞 4자리로, DUR성분코드(D000027 등)는 성분명으로 MainIngredient 를 찾아 그 일반명코드로 바꾼다.
+    """
+
+    def __init__(self):
+        self.lookup: Optional[IngredientNameLookup] = None
+        self.mapped = 0
+        self.unmapped = 0
+
+    def resolve(self, code: str, name: str = '') -> str:
+        """변환할 수 없으면 빈 문자열"""
+        resolved = dur_ingredient_code(code)
+        if resolved or not (code or '').strip():
+            return resolved
+
+        if self.lookup is None:
+            self.lookup = IngredientNameLookup()
+        ingredient = self.lookup.find(name, partial_field=None) if name else None
+        resolved = dur_ingredient_code(ingredient.ingr_code) if ingredient else ''
+        if resolved:
+            self.mapped += 1
+        else:
+            self.unmapped += 1
+        return resolved
@@ -0,0 +1,108 @@
+# user/services/medication_barcode.py
+"""
+의약품 표준코드(바코드) 조회
+
+- 약 포장의 EAN-13(880...) 과 GS1 DataMatrix((01) + GTIN-14) 스캔 값을 13자리 표준코드로 정규화
+- 여러 코드를 한 번의 IN 쿼리(PK 인덱스)로 조회
+- replace_barcodes(): 의약품표준코드 파일 전체로 매핑 테이블 갱신 (파일에 없는 코드는 삭제)
+"""
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+
+from user.formatters import format_medication_barcode
+from user.models import MedicationBarcode
+
+BARCODE_LENGTH = 13
+# 한 번에 조회할 수 있는 코드 수
+BATCH_LOOKUP_LIMIT = 100
+UPSERT_BATCH_SIZE = 1000
+
+_NON_DIGIT = re.compile(r'\D')
+
+
+def normalize_barcode(code: Any) -> Optional[str]:
+    """
+    스캔 값 -> 13자리 표준코드 (형식이 맞지 않으면 None)
+    "8806469007510", "(01)08806469007510(17)...", "08806469007510" 모두 같은 코드
+    """
+    digits = _NON_DIGIT.sub('', str(code or ''))
+    # GS1 응용식별자 (01) 뒤 14자리 GTIN
+    if len(digits) > 14 and digits.startswith('01'):
+        digits = digits[2:16]
+    if len(digits) == BARCODE_LENGTH + 1 and digits.startswith('0'):
+        digits = digits[1:]
+    return digits if len(digits) == BARCODE_LENGTH else None
+
+
+def replace_barcodes(rows: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """
+    표준코드 매핑 전체 갱신
+    :param rows: {'barcode', 'medication_id', 'ingr_code', 'product_name'} 목록 (같은 코드는 마지막 행 사용)
+    """
+    barcodes = {}
+    for row in rows:
+        barcode = normalize_barcode(row.get('barcode'))
+        if barcode:
+            barcodes[barcode] = MedicationBarcode(
+                barcode=barcode,
+                medication_id=row.get('medication_id'),
+                ingr_code=row.get('ingr_code') or '',
+                product_name=(row.get('product_name') or '')[:200],
+            )
+
+    with transaction.atomic():
+        existing = set(MedicationBarcode.objects.values_list('barcode', flat=True))
+        MedicationBarcode.objects.bulk_create(
+            barcodes.values(),
+            batch_size=UPSERT_BATCH_SIZE,
+            update_conflicts=True,
+            unique_fields=['barcode'],
+            update_fields=['medication', 'ingr_code', 'product_name', 'updated_at'],
+        )
+        stale = list(existing - set(barcodes))
+        for start in range(0, len(stale), UPSERT_BATCH_SIZE):
+            MedicationBarcode.objects.filter(barcode__in=stale[start:start + UPSERT_BATCH_SIZE]).delete()
+
+    return {
+        'total': len(barcodes),
+        'created': len(set(barcodes) - existing),
+        'deleted': len(stale),
+    }
+
+
+class MedicationBarcodeService:
+    """표준코드 조회 서비스"""
+
+    @staticmethod
+    def lookup(codes: List[str]) -> Dict[str, Any]:
+        """
+        스캔 코드 목록 조회 (한 번의 쿼리)
+        :return: results 는 요청 순서 그대로, 형식 오류/미등록 코드는 found False
+        """
+        if len(codes) > BATCH_LOOKUP_LIMIT:
+            raise ValueError(f'한 번에 최대 {BATCH_LOOKUP_LIMIT}개까지 조회할 수 있습니다.')
+
+        normalized = {code: normalize_barcode(code) for code in codes}
+        barcodes = {barcode for barcode in normalized.values() if barcode}
+        found = {
+            medication_barcode.barcode: format_medication_barcode(medication_barcode)
+            for medication_barcode in MedicationBarcode.objects.filter(barcode__in=barcodes).select_related('medication')
+        } if barcodes else {}
+
+        results = []
+        for code in codes:
+            barcode = normalized[code]
+            data = found.get(barcode)
+            results.append({
+                'code': code,
+                'barcode': barcode,
+                'found': data is not None,
+                'data': data,
+            })
+        return {
+            'total': len(results),
+            'found': sum(1 for result in results if result['found']),
+            'results': results,
+        }
@@ -0,0 +1,265 @@
+# user/services/medication_facets.py
+"""
+의약품 패싯 탐색 (제조사 / 약효분류 / 제형 / 복합제 여부)
+
+- rebuild_medication_facets(): 의약품/성분 연결에서 MedicationFacet(값별 건수)와
+  MedicationFacetMember(의약품-값 연결)를 재생성 (의약품 임포트, 성분 매칭 후 실행)
+- facet_index: 패싯 값별 의약품 비트셋(파이썬 정수)을 메모리에 올린 읽기 전용 인덱스
+  필터 조합은 비트 AND/OR, 건수는 popcount 라서 요청마다 medications 를 GROUP BY 하지 않는다.
+- 비트 순번은 인덱스 빌드 시점의 (처방 건수 내림차순, 의약품명) 순서라 비트 순서가 곧 목록 순서
+"""
+import logging
+from collections import defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+
+from common.autocomplete import VersionedIndexHolder
+from user.formatters import format_medication_facet, format_medication_summary
+from user.models import (
+    AtcClass, MainIngredient, Medication, MedicationFacet, MedicationFacetMember, MedicationIngredient,
+    ReferenceDataVersion,
+)
+from user.services.medication_search import get_search_backend
+from user.services.medication_suggest import DOSAGE_FORM_SUFFIXES, product_base_name
+
+logger = logging.getLogger(__name__)
+
+Facet = MedicationFacet.Facet
+
+# 약효분류는 ATC 2단계(치료군, 예: N06) 기준
+DRUG_CLASS_CODE_LENGTH = 3
+DOSAGE_FORM_OTHER = '기타'
+COMBINATION_LABELS = {'Y': '복합제', 'N': '단일제'}
+
+# 패싯별 응답에 싣는 값 개수 (선택된 값은 항상 포함)
+FACET_VALUE_LIMIT = 30
+# 검색어 매칭 집합 상한 - 넘으면 건수는 상위 매칭 기준 (keyword_truncated)
+KEYWORD_MATCH_LIMIT = 5000
+MEMBER_BATCH_SIZE = 5000
+
+
+def dosage_form_of(medication_name: str) -> str:
+    """제품명 기본 이름의 제형 접미어 ("타이레놀정500밀리그램" -> "정")"""
+    base_name = product_base_name(medication_name)
+    for suffix in DOSAGE_FORM_SUFFIXES:
+        if base_name.endswith(suffix) and len(base_name) > len(suffix):
+            return suffix
+    return DOSAGE_FORM_OTHER
+
+
+def rebuild_medication_facets() -> Dict[str, int]:
+    """MedicationFacet / MedicationFacetMember 재생성 후 패싯 세대 증가"""
+    members = defaultdict(set)
+    labels = {}
+
+    medications = Medication.objects.values_list('medication_id', 'medication_name', 'manufacturer')
+    for medication_id, medication_name, manufacturer in medications.iterator(chunk_size=5000):
+        manufacturer = (manufacturer or '').strip()
+        if manufacturer:
+            members[(Facet.MANUFACTURER, manufacturer)].add(medication_id)
+        members[(Facet.DOSAGE_FORM, dosage_form_of(medication_name))].add(medication_id)
+
+    ingredient_atc = dict(MainIngredient.objects.exclude(atc_code='').values_list('ingr_code', 'atc_code'))
+    class_names = dict(AtcClass.objects.filter(level=2).exclude(name='').values_list('code', 'name'))
+    ingredient_counts = defaultdict(int)
+    links = MedicationIngredient.objects.values_list('medication_id', 'main_ingredient_id')
+    for medication_id, ingr_code in links.iterator(chunk_size=5000):
+        ingredient_counts[medication_id] += 1
+        atc_code = ingredient_atc.get(ingr_code, '')
+        if len(atc_code) >= DRUG_CLASS_CODE_LENGTH:
+            code = atc_code[:DRUG_CLASS_CODE_LENGTH]
+            members[(Facet.DRUG_CLASS, code)].add(medication_id)
+            labels[(Facet.DRUG_CLASS, code)] = class_names.get(code, code)
+
+    for medication_id, count in ingredient_counts.items():
+        members[(Facet.COMBINATION, 'Y' if count > 1 else 'N')].add(medication_id)
+    for value, label in COMBINATION_LABELS.items():
+        labels[(Facet.COMBINATION, value)] = label
+
+    facets = [
+        MedicationFacet(facet=facet, value=value, label=labels.get((facet, value), value),
+                        medication_count=len(medication_ids))
+        for (facet, value), medication_ids in members.items()
+    ]
+
+    with transaction.atomic():
+        MedicationFacetMember.objects.all().delete()
+        MedicationFacet.objects.all().delete()
+        MedicationFacet.objects.bulk_create(facets, batch_size=1000)
+
+        facet_ids = {
+            (facet, value): pk
+            for pk, facet, value in MedicationFacet.objects.values_list('pk', 'facet', 'value')
+        }
+        rows = [
+            MedicationFacetMember(facet_value_id=facet_ids[key], medication_id=medication_id)
+            for key, medication_ids in members.items()
+            for medication_id in medication_ids
+        ]
+        MedicationFacetMember.objects.bulk_create(rows, batch_size=MEMBER_BATCH_SIZE)
+        ReferenceDataVersion.bump(ReferenceDataVersion.MEDICATION_FACET)
+
+    return {'facet_values': len(facets), 'members': len(rows)}
+
+
+def _to_bits(ordinals: Iterable[int], size: int) -> int:
+    """순번 목록 -> 비트셋 정수"""
+    bitmap = bytearray((size + 7) // 8)
+    for ordinal in ordinals:
+        bitmap[ordinal >> 3] |= 1 << (ordinal & 7)
+    return int.from_bytes(bitmap, 'little')
+
+
+class FacetIndex:
+    """읽기 전용 패싯 비트셋 인덱스"""
+
+    def __init__(self, medication_ids: List[int], values: Dict[str, List[Tuple[str, str]]],
+                 bits: Dict[Tuple[str, str], int]):
+        self.medication_ids = medication_ids
+        self.ordinals = {medication_id: ordinal for ordinal, medication_id in enumerate(medication_ids)}
+        self.values = values
+        self.bits = bits
+        self.all_bits = (1 << len(medication_ids)) - 1
+
+    @classmethod
+    def build(cls) -> 'FacetIndex':
+        medication_ids = list(
+            Medication.objects.order_by('-prescription_count', 'medication_name').values_list('medication_id', flat=True)
+        )
+        ordinals = {medication_id: ordinal for ordinal, medication_id in enumerate(medication_ids)}
+
+        facet_values = {
+            pk: (facet, value, label)
+            for pk, facet, value, label in MedicationFacet.objects.order_by(
+                'facet', '-medication_count', 'value'
+            ).values_list('pk', 'facet', 'value', 'label')
+        }
+        member_ordinals = defaultdict(list)
+        members = MedicationFacetMember.objects.values_list('facet_value_id', 'medication_id')
+        for facet_value_id, medication_id in members.iterator(chunk_size=MEMBER_BATCH_SIZE):
+            ordinal = ordinals.get(medication_id)
+            if ordinal is not None:
+                member_ordinals[facet_value_id].append(ordinal)
+
+        values = defaultdict(list)
+        bits = {}
+        for pk, (facet, value, label) in facet_values.items():
+            values[facet].append((value, label))
+            bits[(facet, value)] = _to_bits(member_ordinals.get(pk, ()), len(medication_ids))
+        return cls(medication_ids, dict(values), bits)
+
+    def __len__(self):
+        return len(self.medication_ids)
+
+    def ids_to_bits(self, medication_ids: Iterable[int]) -> int:
+        ordinals = (self.ordinals.get(medication_id) for medication_id in medication_ids)
+        return _to_bits((ordinal for ordinal in ordinals if ordinal is not None), len(self.medication_ids))
+
+    def filter_bits(self, filters: Dict[str, List[str]], skip_facet: Optional[str] = None) -> int:
+        """같은 패싯 안의 값은 OR, 패싯끼리는 AND"""
+        result = self.all_bits
+        for facet, selected in filters.items():
+            if facet == skip_facet or not selected:
+                continue
+            union = 0
+            for value in selected:
+                union |= self.bits.get((facet, value), 0)
+            result &= union
+        return result
+
+    def facet_counts(self, filters: Dict[str, List[str]], base_bits: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        패싯 값별 건수 - 각 패싯은 자기 패싯의 선택을 뺀 나머지 필터 기준으로 센다
+        (제조사를 하나 골라도 다른 제조사 건수가 0 이 되지 않도록)
+        """
+        result = {}
+        for facet, values in self.values.items():
+            selected = set(filters.get(facet, ()))
+            scope = self.filter_bits(filters, skip_facet=facet) & base_bits
+            counted = []
+            for value, label in values:
+                count = (self.bits[(facet, value)] & scope).bit_count()
+                if count or value in selected:
+                    counted.append((count, value, label))
+            counted.sort(key=lambda item: -item[0])
+
+            shown = counted[:FACET_VALUE_LIMIT]
+            shown += [item for item in counted[FACET_VALUE_LIMIT:] if item[1] in selected]
+            result[facet] = [
+                {'value': value, 'label': label, 'count': count, 'selected': value in selected}
+                for count, value, label in shown
+            ]
+        return result
+
+    def page_ids(self, bits: int, limit: int, offset: int) -> List[int]:
+        """비트셋에서 offset 번째부터 limit 개 의약품 id (낮은 비트 = 앞 순서)"""
+        result = []
+        skipped = 0
+        while bits and len(result) < limit:
+            lowest = bits & -bits
+            if skipped < offset:
+                skipped += 1
+            else:
+                result.append(self.medication_ids[lowest.bit_length() - 1])
+            bits ^= lowest
+        return result
+
+
+facet_index = VersionedIndexHolder(
+    ReferenceDataVersion.MEDICATION_FACET,
+    builder=FacetIndex.build,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
+
+
+class MedicationFacetService:
+    """의약품 패싯 탐색 서비스"""
+
+    @staticmethod
+    def get_facet_values(facet: str) -> List[Dict[str, Any]]:
+        """패싯 값 목록과 전체 의약품 수 (집계 테이블 조회)"""
+        if facet not in Facet.values:
+            raise ValueError(f'지원하지 않는 패싯입니다: {facet}')
+
+        facets = MedicationFacet.objects.filter(facet=facet).order_by('-medication_count', 'value')
+        return [format_medication_facet(medication_facet) for medication_facet in facets]
+
+    @staticmethod
+    def browse(filters: Dict[str, List[str]], keyword: str = None, limit: int = 20,
+               offset: int = 0) -> Dict[str, Any]:
+        """
+        패싯 필터(+검색어) 조건의 의약품 목록과 조건 반영 패싯 건수
+        :param filters: {패싯: [값, ...]}
+        """
+        unknown = set(filters) - set(Facet.values)
+        if unknown:
+            raise ValueError(f'지원하지 않는 패싯입니다: {", ".join(sorted(unknown))}')
+
+        index = facet_index.get()
+        base_bits = index.all_bits
+        keyword = (keyword or '').strip()
+        keyword_truncated = False
+        if keyword:
+            matched_ids = get_search_backend().match_ids(keyword, KEYWORD_MATCH_LIMIT)
+            keyword_truncated = len(matched_ids) >= KEYWORD_MATCH_LIMIT
+            base_bits = index.ids_to_bits(matched_ids)
+
+        result_bits = index.filter_bits(filters) & base_bits
+        total = result_bits.bit_count()
+        page_ids = index.page_ids(result_bits, limit, offset)
+        medications = Medication.objects.in_bulk(page_ids)
+        has_more = offset + limit < total
+
+        return {
+            'total': total,
+            'has_more': has_more,
+            'next_offset': offset + limit if has_more else None,
+            'keyword_truncated': keyword_truncated,
+            'medications': [
+                format_medication_summary(medications[medication_id])
+                for medication_id in page_ids
+                if medication_id in medications
+            ],
+            'facets': index.facet_counts(filters, base_bits),
+        }
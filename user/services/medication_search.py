@@ -0,0 +1,274 @@
+# user/services/medication_search.py
+"""
+의약품 전문검색(full-text) 백엔드
+
+- SQLite: FTS5 (trigram 토크나이저) 가상 테이블 + 동기화 트리거
+- PostgreSQL: pg_trgm GIN 인덱스 (icontains 가 인덱스를 타도록)
+인덱스 DDL 은 마이그레이션(0008/0009/0017)에 고정되어 있다.
+
+두 백엔드 모두 매칭 등급(접두 > 단어 > 부분일치) 순, 같은 등급 안에서는 처방 건수
+(Medication.prescription_count) 많은 순으로 정렬된 상위 k개만 가져오며 전체 매칭 건수는 세지 않는다.
+
+초성("ㅌㅇㄹㄴ")과 입력 중인 글자("타일", "타이ㄹ")는 Medication 의
+초성/자모 검색키 컬럼 인덱스로 접두 검색한다.
+trigram 이 다루지 못하는 3글자 미만 검색어는 자모 검색키(영문 소문자화) 인덱스로
+대소문자 구분 없이 의약품명을 접두 검색하고, PostgreSQL 에서는 주성분명 접두 일치
+(pg_trgm GIN 이 ILIKE 'ab%' 를 처리)도 단어 일치로 함께 찾는다.
+"""
+import logging
+import time
+from typing import List, NamedTuple, Optional
+
+from django.db import DatabaseError, connection
+from django.db.models import Case, IntegerField, Q, When
+
+from common.hangul import has_hangul, is_chosung_query, to_chosung, to_jamo
+from common.search import (
+    HIGHLIGHT_POST, HIGHLIGHT_PRE, MATCH_PREFIX, MATCH_SUBSTRING, MATCH_WORD,
+    escape_like, highlight, highlight_key_prefix, prefix_filter,
+)
+from user.models import Medication
+
+logger = logging.getLogger(__name__)
+
+# trigram 토크나이저는 3글자 미만 검색어를 매칭하지 못함
+MIN_FTS_KEYWORD_LENGTH = 3
+
+SQLITE_FTS_TABLE = 'medication_fts'
+
+# FTS 테이블이 없을 때(마이그레이션 미적용 등) 다시 확인하기까지 ORM 검색으로 대체하는 시간 (초)
+FTS_RETRY_INTERVAL = 60
+
+
+class SearchHit(NamedTuple):
+    """검색 결과 1건"""
+    medication: Medication
+    match_rank: int
+    highlight: str
+
+
+class OrmSearchBackend:
+    """
+    ORM 기반 검색 백엔드
+    PostgreSQL 에서는 pg_trgm GIN 인덱스가 icontains 를 처리한다.
+    """
+
+    def search(self, keyword: str, limit: int, offset: int) -> List[SearchHit]:
+        """
+        검색 진입점
+        - 초성만 입력: 초성 검색키 접두 검색
+        - 그 외: 전문검색, 결과가 없고 한글이 포함되면 자모 검색키 접두 검색으로 재시도
+        """
+        if is_chosung_query(keyword):
+            return self.search_key_prefix('medication_name_chosung', to_chosung(keyword), to_chosung, limit, offset)
+
+        hits = self.search_text(keyword, limit, offset)
+        if hits or not has_hangul(keyword):
+            return hits
+
+        # 앞 페이지까지 전문검색 결과가 있었다면 전문검색 결과의 끝
+        if offset and self.search_text(keyword, 1, 0):
+            return hits
+
+        return self.search_key_prefix('medication_name_jamo', to_jamo(keyword), to_jamo, limit, offset)
+
+    def match_ids(self, keyword: str, limit: int) -> List[int]:
+        """
+        검색어에 매칭되는 의약품 id (정렬 없이 최대 limit 개)
+        패싯 건수 계산처럼 순위는 필요 없고 매칭 집합만 필요할 때 사용 - 매칭 규칙은 search() 와 같다
+        """
+        if is_chosung_query(keyword):
+            return self.key_prefix_ids('medication_name_chosung', to_chosung(keyword), limit)
+
+        ids = self.text_match_ids(keyword, limit)
+        if ids or not has_hangul(keyword):
+            return ids
+        return self.key_prefix_ids('medication_name_jamo', to_jamo(keyword), limit)
+
+    def text_match_ids(self, keyword: str, limit: int) -> List[int]:
+        """search_text() 와 같은 조건의 id"""
+        if len(keyword) < MIN_FTS_KEYWORD_LENGTH:
+            key = to_jamo(keyword)
+            if not key:
+                return []
+            condition = self.prefix_condition(keyword, key)
+        else:
+            condition = Q(medication_name__icontains=keyword) | Q(main_item_ingr__icontains=keyword)
+
+        return list(Medication.objects.filter(condition).values_list('medication_id', flat=True)[:limit])
+
+    @staticmethod
+    def key_prefix_ids(field: str, key: str, limit: int) -> List[int]:
+        """search_key_prefix() 와 같은 조건의 id"""
+        if not key:
+            return []
+        return list(Medication.objects.filter(prefix_filter(field, key)).values_list('medication_id', flat=True)[:limit])
+
+    @staticmethod
+    def prefix_condition(keyword: str, key: str) -> Q:
+        """짧은 검색어 조건 (자모 검색키 접두, PostgreSQL 에서는 주성분명 접두 포함)"""
+        condition = prefix_filter('medication_name_jamo', key)
+        if connection.vendor == 'postgresql':
+            condition |= Q(main_item_ingr__istartswith=keyword)
+        return condition
+
+    def search_text(self, keyword: str, limit: int, offset: int) -> List[SearchHit]:
+        if len(keyword) < MIN_FTS_KEYWORD_LENGTH:
+            return self.search_prefix(keyword, limit, offset)
+
+        medications = Medication.objects.filter(
+            Q(medication_name__icontains=keyword) | Q(main_item_ingr__icontains=keyword)
+        ).annotate(
+            match_rank=Case(
+                When(medication_name__istartswith=keyword, then=MATCH_PREFIX),
+                When(
+                    Q(medication_name__icontains=f' {keyword}') | Q(main_item_ingr__istartswith=keyword),
+                    then=MATCH_WORD
+                ),
+                default=MATCH_SUBSTRING,
+                output_field=IntegerField(),
+            )
+        ).order_by('match_rank', '-prescription_count', 'medication_name')[offset:offset + limit]
+
+        return [
+            SearchHit(medication, medication.match_rank, highlight(medication.medication_name, keyword))
+            for medication in medications
+        ]
+
+    def search_prefix(self, keyword: str, limit: int, offset: int) -> List[SearchHit]:
+        """짧은 검색어 - 자모 검색키 인덱스 범위 스캔으로 대소문자 구분 없이 접두 검색"""
+        key = to_jamo(keyword)
+        if not key:
+            return []
+
+        name_prefix = prefix_filter('medication_name_jamo', key)
+
+        medications = Medication.objects.filter(self.prefix_condition(keyword, key)).annotate(
+            match_rank=Case(
+                When(name_prefix, then=MATCH_PREFIX),
+                default=MATCH_WORD,
+                output_field=IntegerField(),
+            )
+        ).order_by('match_rank', '-prescription_count', 'medication_name')[offset:offset + limit]
+
+        return [
+            SearchHit(
+                medication,
+                medication.match_rank,
+                highlight_key_prefix(medication.medication_name, key, to_jamo)
+                if medication.match_rank == MATCH_PREFIX else medication.medication_name
+            )
+            for medication in medications
+        ]
+
+    def search_key_prefix(self, field: str, key: str, to_key, limit: int, offset: int) -> List[SearchHit]:
+        """초성/자모 검색키 컬럼 인덱스 범위 스캔으로 접두 검색"""
+        if not key:
+            return []
+
+        medications = Medication.objects.filter(
+            prefix_filter(field, key)
+        ).order_by('-prescription_count', field, 'medication_name')[offset:offset + limit]
+
+        return [
+            SearchHit(medication, MATCH_PREFIX, highlight_key_prefix(medication.medication_name, key, to_key))
+            for medication in medications
+        ]
+
+
+class SqliteFtsSearchBackend(OrmSearchBackend):
+    """SQLite FTS5 trigram 인덱스 기반 검색 백엔드"""
+
+    def __init__(self):
+        # FTS 테이블이 없다고 확인된 경우 이 시각까지 ORM 검색 사용
+        self.unavailable_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self.unavailable_until
+
+    def fts_failed(self, error: DatabaseError) -> None:
+        """
+        FTS 조회 실패 - 이번 조회만 ORM 검색으로 대체
+        (잠금 등 일시적 오류로 FTS 를 끄지 않도록, 테이블/모듈이 없을 때만 FTS_RETRY_INTERVAL 동안 건너뜀)
+        """
+        message = str(error).lower()
+        if 'no such table' in message or 'no such module' in message:
+            self.unavailable_until = time.monotonic() + FTS_RETRY_INTERVAL
+            logger.error(f"FTS 인덱스 없음, {FTS_RETRY_INTERVAL}초 동안 ORM 검색으로 대체합니다: {error}")
+        else:
+            logger.warning(f"FTS 검색 실패, 이번 조회는 ORM 검색으로 대체합니다: {error}")
+
+    def search_text(self, keyword: str, limit: int, offset: int) -> List[SearchHit]:
+        if not self.available or len(keyword) < MIN_FTS_KEYWORD_LENGTH:
+            return super().search_text(keyword, limit, offset)
+
+        escaped = escape_like(keyword)
+        sql = f"""
+            SELECT m.medication_id,
+                   highlight({SQLITE_FTS_TABLE}, 0, %s, %s) AS name_highlight,
+                   CASE
+                       WHEN m.medication_name LIKE %s ESCAPE '\\' THEN {MATCH_PREFIX}
+                       WHEN m.medication_name LIKE %s ESCAPE '\\'
+                            OR m.main_item_ingr LIKE %s ESCAPE '\\' THEN {MATCH_WORD}
+                       ELSE {MATCH_SUBSTRING}
+                   END AS match_rank
+            FROM {SQLITE_FTS_TABLE}
+            JOIN medications m ON m.medication_id = {SQLITE_FTS_TABLE}.rowid
+            WHERE {SQLITE_FTS_TABLE} MATCH %s
+            ORDER BY match_rank, m.prescription_count DESC, bm25({SQLITE_FTS_TABLE}), m.medication_name
+            LIMIT %s OFFSET %s
+        """
+        params = [
+            HIGHLIGHT_PRE, HIGHLIGHT_POST,
+            f'{escaped}%', f'% {escaped}%', f'{escaped}%',
+            self.fts_phrase(keyword),
+            limit, offset,
+        ]
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+                rows = cursor.fetchall()
+        except DatabaseError as e:
+            self.fts_failed(e)
+            return super().search_text(keyword, limit, offset)
+
+        medications = Medication.objects.in_bulk([row[0] for row in rows])
+        return [
+            SearchHit(medications[medication_id], rank, name_highlight)
+            for medication_id, name_highlight, rank in rows
+            if medication_id in medications
+        ]
+
+    def text_match_ids(self, keyword: str, limit: int) -> List[int]:
+        if not self.available or len(keyword) < MIN_FTS_KEYWORD_LENGTH:
+            return super().text_match_ids(keyword, limit)
+
+        sql = f"SELECT rowid FROM {SQLITE_FTS_TABLE} WHERE {SQLITE_FTS_TABLE} MATCH %s LIMIT %s"
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql, [self.fts_phrase(keyword), limit])
+                return [row[0] for row in cursor.fetchall()]
+        except DatabaseError as e:
+            self.fts_failed(e)
+            return super().text_match_ids(keyword, limit)
+
+    @staticmethod
+    def fts_phrase(keyword: str) -> str:
+        """FTS5 구문 검색어로 변환 (따옴표 이스케이프)"""
+        return '"{}"'.format(keyword.replace('"', '""'))
+
+
+_backend: Optional[OrmSearchBackend] = None
+
+
+def get_search_backend() -> OrmSearchBackend:
+    """DB 벤더에 맞는 검색 백엔드 반환 (프로세스 단위 싱글톤)"""
+    global _backend
+    if _backend is None:
+        if connection.vendor == 'sqlite':
+            _backend = SqliteFtsSearchBackend()
+        else:
+            _backend = OrmSearchBackend()
+    return _backend
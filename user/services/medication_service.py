@@ -1,8 +1,11 @@
 from typing import Dict, Any, List
-from django.db.models import Q
 
-from user.models import Medication
-from user.formatters import format_medication
+from user.models import MedicationFacet
+from user.formatters import format_medication_summary
+from user.services.medication_facets import MedicationFacetService
+from user.services.medication_search import get_search_backend
+from user.services.medication_suggest import suggest_medication_names
+from user.services.reference_data import ReferenceDataService
 
 
 class MedicationService:
@@ -14,27 +17,61 @@ class MedicationService:
         limit: int = 20,
         offset: int = 0
     ) -> Dict[str, Any]:
-        """약물 검색"""
-        query = Q()
+        """
+        약물 검색
+        전문검색 인덱스로 매칭 등급(접두 > 단어 > 부분일치) 순 상위 limit 개를 조회
+        전체 건수는 세지 않고 limit + 1 개를 가져와 다음 페이지 여부만 판단
+        """
+        keyword = (keyword or '').strip()
+        if not keyword:
+            return {
+                'has_more': False,
+                'next_offset': None,
+                'medications': []
+            }
 
-        if keyword:
-            query |= Q(medication_name__icontains=keyword)
-            query |= Q(main_item_ingr__icontains=keyword)
+        hits = get_search_backend().search(keyword, limit=limit + 1, offset=offset)
+        has_more = len(hits) > limit
+        hits = hits[:limit]
 
-        medications = Medication.objects.filter(query).order_by('medication_name')
+        result = {
+            'has_more': has_more,
+            'next_offset': offset + limit if has_more else None,
+            'medications': [
+                {
+                    **format_medication_summary(hit.medication),
+                    'match_rank': hit.match_rank,
+                    'highlight': hit.highlight,
+                }
+                for hit in hits
+            ]
+        }
+
+        # 결과가 없으면 오타 추천 ("이것을 찾으셨나요?")
+        if not hits and offset == 0:
+            result['suggestions'] = suggest_medication_names(keyword)
 
-        total_count = medications.count()
-        medications = medications[offset:offset + limit]
+        return result
 
+    @staticmethod
+    def suggest_medications(keyword: str, limit: int = 5) -> Dict[str, Any]:
+        """의약품/성분명 오타 추천 (메모리 인덱스, DB 조회 없음)"""
         return {
-            'total_count': total_count,
-            'medications': [format_medication(medication) for medication in medications]
+            'suggestions': suggest_medication_names((keyword or '').strip(), limit)
         }
 
+    @staticmethod
+    def get_medication_classes() -> List[Dict[str, Any]]:
+        """약효분류(ATC 2단계) 목록과 분류별 의약품 수"""
+        return MedicationFacetService.get_facet_values(MedicationFacet.Facet.DRUG_CLASS)
+
+    @staticmethod
+    def get_drug_forms() -> List[Dict[str, Any]]:
+        """제형 목록과 제형별 의약품 수"""
+        return MedicationFacetService.get_facet_values(MedicationFacet.Facet.DOSAGE_FORM)
 
     @staticmethod
     def get_medication_detail(medication_id: str) -> Dict[str, Any]:
-        """약물 상세 정보 조회"""
-        medication = Medication.objects.get(medication_id=medication_id)
-        return format_medication(medication)
+        """약물 상세 정보 조회 (참조 데이터 캐시 경유)"""
+        return ReferenceDataService.get_medication(medication_id)
 
@@ -0,0 +1,97 @@
+# user/services/medication_suggest.py
+"""
+의약품/주성분명 오타 추천 ("이것을 찾으셨나요?")
+
+Medication 제품명(함량/괄호 앞부분)과 MainIngredient 한글/영문명으로 SymSpellIndex 를 만들어
+검색 결과가 없을 때 편집거리 순 추천어를 돌려준다.
+의약품/주성분 임포트가 끝나면 ReferenceDataVersion 세대가 올라가고 각 워커가 인덱스를 교체한다.
+"""
+import re
+from typing import Any, Dict, Iterator, List, Tuple
+
+from common.autocomplete import VersionedIndexHolder
+from common.fuzzy import SymSpellIndex
+from common.ingredient_names import strip_kr_salt
+from user.models import MainIngredient, Medication, ReferenceDataVersion
+
+SOURCE_MEDICATION = 'medication'
+SOURCE_INGREDIENT = 'ingredient'
+
+# 제품명에서 함량/괄호 이후를 잘라 기본 이름만 사용 ("타이레놀정500밀리그램" -> "타이레놀정")
+_PRODUCT_NAME_END = re.compile(r'[\d(\[]')
+# 영문 성분명은 단어 단위로도 등록 ("sertraline hydrochloride" -> "sertraline")
+_WORD_SEPARATOR = re.compile(r'[\s,/()\[\]-]+')
+MIN_WORD_LENGTH = 4
+
+# 제형 접미어 - "렉사프로정" 은 "렉사프로" 로도 등록 (긴 것부터 비교)
+DOSAGE_FORM_SUFFIXES = sorted([
+    '정', '서방정', '장용정', '필름코팅정', '구강붕해정', '츄어블정',
+    '캡슐', '연질캡슐', '서방캡슐', '시럽', '현탁액', '과립', '주', '주사액',
+    '패취', '크림', '연고', '겔', '점안액', '액',
+], key=len, reverse=True)
+
+
+def product_base_name(name: str) -> str:
+    return _PRODUCT_NAME_END.split(name or '', 1)[0].strip()
+
+
+def strip_suffixes(name: str, suffixes: List[str], min_length: int = 2) -> str:
+    """접미어를 반복 제거 (남는 길이가 min_length 미만이면 중단)"""
+    stripped = True
+    while stripped:
+        stripped = False
+        for suffix in suffixes:
+            if name.endswith(suffix) and len(name) - len(suffix) >= min_length:
+                name = name[:-len(suffix)].rstrip()
+                stripped = True
+                break
+    return name
+
+
+def _suggest_entries() -> Iterator[Tuple[str, str]]:
+    for name in Medication.objects.values_list('medication_name', flat=True).iterator(chunk_size=2000):
+        base_name = product_base_name(name)
+        if base_name:
+            yield base_name, SOURCE_MEDICATION
+            stem = strip_suffixes(base_name, DOSAGE_FORM_SUFFIXES)
+            if stem != base_name:
+                yield stem, SOURCE_MEDICATION
+
+    ingredients = MainIngredient.objects.values_list('main_ingr_name_kr', 'main_ingr_name_en')
+    for name_kr, name_en in ingredients.iterator(chunk_size=2000):
+        if name_kr:
+            yield name_kr.strip(), SOURCE_INGREDIENT
+            stem = strip_kr_salt(name_kr.strip())
+            if stem != name_kr.strip():
+                yield stem, SOURCE_INGREDIENT
+        if name_en:
+            yield name_en.strip().lower(), SOURCE_INGREDIENT
+            words = [word for word in _WORD_SEPARATOR.split(name_en.lower()) if len(word) >= MIN_WORD_LENGTH]
+            if len(words) > 1:
+                for word in words:
+                    yield word, SOURCE_INGREDIENT
+
+
+def build_suggest_index() -> SymSpellIndex:
+    return SymSpellIndex.build(_suggest_entries())
+
+
+suggest_index = VersionedIndexHolder(
+    ReferenceDataVersion.MEDICATION,
+    builder=build_suggest_index,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
+
+
+def suggest_medication_names(keyword: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """편집거리 순 추천어 (검색어와 같은 용어는 제외)"""
+    suggestions = suggest_index.get().lookup(keyword, limit + 1)
+    return [
+        {
+            'term': suggestion.term,
+            'distance': suggestion.distance,
+            'source': suggestion.source,
+        }
+        for suggestion in suggestions
+        if suggestion.distance > 0
+    ][:limit]
@@ -0,0 +1,22 @@
+# user/services/reference_artifacts.py
+"""
+임포트 후 참조 데이터 파생물 일괄 재생성
+
+- mmap 스냅샷 (reference_snapshot)
+- 모바일 오프라인 번들/패치 (reference_bundle)
+- 목록 전체 내보내기 gzip 파일 (table_export)
+"""
+from typing import Any, Dict
+
+from user.services.reference_bundle import build_reference_bundle
+from user.services.reference_snapshot import build_reference_snapshot
+from user.services.table_export import build_table_exports
+
+
+def rebuild_reference_artifacts() -> Dict[str, Any]:
+    """임포트 스크립트가 세대를 올린 뒤 호출"""
+    return {
+        'snapshot': build_reference_snapshot(),
+        'bundle': build_reference_bundle(),
+        'exports': build_table_exports(),
+    }
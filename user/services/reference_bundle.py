@@ -0,0 +1,276 @@
+# user/services/reference_bundle.py
+"""
+모바일 앱 오프라인 참조 데이터 번들
+
+- build_reference_bundle(): 의약품/주성분/질병정보를 열 단위 JSON(gzip)으로 묶어 새 버전을 만들고,
+  직전 버전과 비교한 행 단위 패치(테이블별 upsert 행 / delete 키)를 함께 만든다.
+  데이터가 그대로면 버전을 올리지 않는다.
+- plan_update(): 클라이언트 버전에서 최신 버전까지 연속 패치 체인과 전체 번들 중 작은 쪽을 고른다.
+
+번들 형식
+    {"format": 1, "version": N, "tables": {테이블: {"columns": [...], "rows": [[...], ...]}}}
+    행은 첫 번째 열(키) 기준 정렬
+패치 형식
+    {"format": 1, "from_version": A, "to_version": B,
+     "tables": {테이블: {"columns": [...], "upsert": [[...], ...], "delete": [키, ...]}}}
+"""
+import gzip
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.db import transaction
+
+from user.models import (
+    DiseaseCache, MainIngredient, Medication, MedicationIngredient, ReferenceBundle, ReferenceBundlePatch,
+)
+
+BUNDLE_FORMAT = 1
+# 보관할 전체 번들 수 (패치는 체인 계산용으로 계속 보관)
+BUNDLE_RETENTION = 5
+
+
+def _medication_table() -> Dict[str, Any]:
+    ingredient_codes = {}
+    links = MedicationIngredient.objects.order_by('main_ingredient_id').values_list('medication_id', 'main_ingredient_id')
+    for medication_id, ingr_code in links.iterator(chunk_size=5000):
+        ingredient_codes.setdefault(medication_id, []).append(ingr_code)
+
+    columns = ['medication_id', 'medication_name', 'medication_name_chosung', 'main_item_ingr',
+               'main_ingr_eng', 'manufacturer']
+    rows = [
+        [*row, ingredient_codes.get(row[0], [])]
+        for row in Medication.objects.order_by('medication_id').values_list(*columns).iterator(chunk_size=5000)
+    ]
+    return {'columns': columns + ['ingr_codes'], 'rows': rows}
+
+
+def _main_ingredient_table() -> Dict[str, Any]:
+    columns = ['ingr_code', 'atc_code', 'main_ingr_name_kr', 'main_ingr_name_en', 'density', 'unit',
+               'is_combination_drug']
+    rows = [
+        [ingr_code, atc_code, name_kr, name_en, str(density), unit, is_combination_drug]
+        for ingr_code, atc_code, name_kr, name_en, density, unit, is_combination_drug
+        in MainIngredient.objects.order_by('ingr_code').values_list(*columns).iterator(chunk_size=5000)
+    ]
+    return {'columns': columns, 'rows': rows}
+
+
+def _disease_table() -> Dict[str, Any]:
+    columns = ['disease_code', 'disease_name_kr', 'disease_name_en', 'disease_name_chosung']
+    rows = [
+        list(row)
+        for row in DiseaseCache.objects.order_by('disease_code').values_list(*columns).iterator(chunk_size=5000)
+    ]
+    return {'columns': columns, 'rows': rows}
+
+
+BUNDLE_TABLES = {
+    'medication': _medication_table,
+    'main_ingredient': _main_ingredient_table,
+    'disease': _disease_table,
+}
+
+
+def get_bundle_dir() -> str:
+    return str(settings.REFERENCE_BUNDLE_DIR)
+
+
+def bundle_file_name(version: int) -> str:
+    return f'reference-bundle-v{version}.json.gz'
+
+
+def patch_file_name(from_version: int, to_version: int) -> str:
+    return f'reference-patch-v{from_version}-v{to_version}.json.gz'
+
+
+def _write_gzip_json(file_name: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """gzip JSON 파일 작성 (임시 파일 후 원자적 교체, mtime 고정으로 같은 내용이면 같은 바이트)"""
+    directory = get_bundle_dir()
+    os.makedirs(directory, exist_ok=True)
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    compressed = gzip.compress(data, compresslevel=9, mtime=0)
+
+    fd, temp_path = tempfile.mkstemp(prefix='.bundle-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            file.write(compressed)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, os.path.join(directory, file_name))
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    return {'file_name': file_name, 'size': len(compressed), 'sha256': hashlib.sha256(compressed).hexdigest()}
+
+
+def _read_bundle_tables(bundle: ReferenceBundle) -> Optional[Dict[str, Any]]:
+    path = os.path.join(get_bundle_dir(), bundle.file_name)
+    if not os.path.exists(path):
+        return None
+    with gzip.open(path, 'rb') as file:
+        payload = json.loads(file.read())
+    return payload['tables'] if payload.get('format') == BUNDLE_FORMAT else None
+
+
+def diff_tables(previous: Dict[str, Any], current: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """
+    테이블별 행 단위 변경분 (열 구성이 바뀌었거나 테이블이 추가/삭제됐으면 None - 전체 번들만 제공)
+    """
+    if set(previous) != set(current):
+        return None
+
+    changes = {}
+    for name, table in current.items():
+        old_table = previous[name]
+        if old_table['columns'] != table['columns']:
+            return None
+        old_rows = {row[0]: row for row in old_table['rows']}
+        new_keys = set()
+        upsert = []
+        for row in table['rows']:
+            new_keys.add(row[0])
+            if old_rows.get(row[0]) != row:
+                upsert.append(row)
+        delete = sorted(key for key in old_rows if key not in new_keys)
+        changes[name] = {'columns': table['columns'], 'upsert': upsert, 'delete': delete}
+    return changes
+
+
+def build_reference_bundle() -> Dict[str, Any]:
+    """현재 참조 데이터로 새 번들 버전(+ 직전 버전 패치) 생성"""
+    tables = {name: builder() for name, builder in BUNDLE_TABLES.items()}
+    latest = ReferenceBundle.objects.order_by('-version').first()
+    previous = _read_bundle_tables(latest) if latest else None
+
+    if previous is not None and previous == tables:
+        return {'version': latest.version, 'created': False}
+
+    version = latest.version + 1 if latest else 1
+    row_counts = {name: len(table['rows']) for name, table in tables.items()}
+    bundle_file = _write_gzip_json(bundle_file_name(version), {
+        'format': BUNDLE_FORMAT, 'version': version, 'tables': tables,
+    })
+
+    patch_file = None
+    changes = diff_tables(previous, tables) if previous is not None else None
+    if changes is not None:
+        patch_file = _write_gzip_json(patch_file_name(latest.version, version), {
+            'format': BUNDLE_FORMAT, 'from_version': latest.version, 'to_version': version, 'tables': changes,
+        })
+
+    with transaction.atomic():
+        ReferenceBundle.objects.create(version=version, row_counts=row_counts, **bundle_file)
+        if patch_file:
+            ReferenceBundlePatch.objects.create(
+                from_version=latest.version,
+                to_version=version,
+                change_counts={
+                    name: {'upsert': len(change['upsert']), 'delete': len(change['delete'])}
+                    for name, change in changes.items()
+                },
+                **patch_file
+            )
+
+    prune_bundles()
+    return {
+        'version': version,
+        'created': True,
+        'size': bundle_file['size'],
+        'patch_size': patch_file['size'] if patch_file else None,
+        'row_counts': row_counts,
+    }
+
+
+def prune_bundles(retention: int = BUNDLE_RETENTION) -> int:
+    """오래된 전체 번들 파일 정리 (패치는 작으므로 유지)"""
+    stale = list(ReferenceBundle.objects.order_by('-version')[retention:])
+    for bundle in stale:
+        path = os.path.join(get_bundle_dir(), bundle.file_name)
+        if os.path.exists(path):
+            os.unlink(path)
+    ReferenceBundle.objects.filter(pk__in=[bundle.pk for bundle in stale]).delete()
+    return len(stale)
+
+
+def _bundle_file_info(bundle: ReferenceBundle) -> Dict[str, Any]:
+    return {'kind': 'bundle', 'version': bundle.version, 'size': bundle.size, 'sha256': bundle.sha256}
+
+
+def _patch_file_info(patch: ReferenceBundlePatch) -> Dict[str, Any]:
+    return {
+        'kind': 'patch',
+        'from_version': patch.from_version,
+        'to_version': patch.to_version,
+        'size': patch.size,
+        'sha256': patch.sha256,
+    }
+
+
+class ReferenceBundleService:
+    """오프라인 번들 배포 서비스"""
+
+    @staticmethod
+    def plan_update(client_version: Optional[int]) -> Dict[str, Any]:
+        """
+        클라이언트 버전 -> 최신 버전 갱신 계획
+        - current: 이미 최신
+        - patch: 연속 패치 체인 (합계 크기가 전체 번들보다 작을 때)
+        - full: 전체 번들
+        """
+        latest = ReferenceBundle.objects.order_by('-version').first()
+        if latest is None:
+            raise ValueError('생성된 참조 데이터 번들이 없습니다.')
+
+        result = {'latest_version': latest.version, 'client_version': client_version}
+        if client_version == latest.version:
+            return {**result, 'mode': 'current', 'total_size': 0, 'files': []}
+
+        chain = ReferenceBundleService.patch_chain(client_version, latest.version)
+        if chain is not None and sum(patch.size for patch in chain) < latest.size:
+            return {
+                **result,
+                'mode': 'patch',
+                'total_size': sum(patch.size for patch in chain),
+                'files': [_patch_file_info(patch) for patch in chain],
+            }
+
+        return {**result, 'mode': 'full', 'total_size': latest.size, 'files': [_bundle_file_info(latest)]}
+
+    @staticmethod
+    def patch_chain(from_version: Optional[int], to_version: int) -> Optional[List[ReferenceBundlePatch]]:
+        """from_version 부터 to_version 까지 끊김 없는 패치 목록 (없으면 None)"""
+        if from_version is None or from_version >= to_version:
+            return None
+
+        patches = {
+            patch.from_version: patch
+            for patch in ReferenceBundlePatch.objects.filter(
+                from_version__gte=from_version, to_version__lte=to_version
+            )
+        }
+        chain = []
+        version = from_version
+        while version < to_version:
+            patch = patches.get(version)
+            if patch is None:
+                return None
+            chain.append(patch)
+            version = patch.to_version
+        return chain
+
+    @staticmethod
+    def get_bundle_path(version: int) -> str:
+        bundle = ReferenceBundle.objects.get(version=version)
+        return os.path.join(get_bundle_dir(), bundle.file_name)
+
+    @staticmethod
+    def get_patch_path(from_version: int, to_version: int) -> str:
+        patch = ReferenceBundlePatch.objects.get(from_version=from_version, to_version=to_version)
+        return os.path.join(get_bundle_dir(), patch.file_name)
@@ -0,0 +1,101 @@
+# user/services/reference_data.py
+"""
+참조 데이터 상세 조회 캐시 (의약품/주성분/병원정보/질병정보)
+
+임포트 스크립트만 바꾸는 테이블이므로 상세 조회는 common.reference_cache.ReferenceCache
+(프로세스 LRU -> 공유 캐시 -> DB)를 거친다. 키에는 테이블별 ReferenceDataVersion 세대가 들어가며
+임포트가 세대를 올리면 이전 항목은 한꺼번에 무효화된다.
+의약품/주성분/질병정보는 세대가 맞는 mmap 스냅샷(reference_snapshot)이 있으면 그쪽을 먼저 본다.
+"""
+from typing import Any, Dict
+
+from common.reference_cache import ReferenceCache
+from user.formatters import format_disease_cache, format_hospital_cache, format_main_ingredient, format_medication
+from user.models import DiseaseCache, HospitalCache, MainIngredient, Medication, ReferenceDataVersion
+from user.services.reference_snapshot import (
+    TABLE_DISEASE_CACHE, TABLE_MAIN_INGREDIENT, TABLE_MEDICATION, get_snapshot_info, snapshot_lookup,
+)
+
+
+def _load_medication(medication_id) -> Dict[str, Any]:
+    return format_medication(Medication.objects.prefetch_related('ingredients').get(medication_id=medication_id))
+
+
+def _load_main_ingredient(ingr_code) -> Dict[str, Any]:
+    return format_main_ingredient(MainIngredient.objects.get(ingr_code=ingr_code))
+
+
+def _load_hospital_cache(hospital_code) -> Dict[str, Any]:
+    return format_hospital_cache(HospitalCache.objects.get(hospital_code=hospital_code))
+
+
+def _load_disease_cache(disease_code) -> Dict[str, Any]:
+    return format_disease_cache(DiseaseCache.objects.get(disease_code=disease_code))
+
+
+medication_cache = ReferenceCache(
+    'medication', ReferenceDataVersion.MEDICATION,
+    loader=_load_medication,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
+main_ingredient_cache = ReferenceCache(
+    'main_ingredient', ReferenceDataVersion.MEDICATION,
+    loader=_load_main_ingredient,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
+hospital_cache = ReferenceCache(
+    'hospital_cache', ReferenceDataVersion.HOSPITAL_CACHE,
+    loader=_load_hospital_cache,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
+disease_cache = ReferenceCache(
+    'disease_cache', ReferenceDataVersion.DISEASE_CACHE,
+    loader=_load_disease_cache,
+    generation_getter=ReferenceDataVersion.get_generation,
+)
+
+REFERENCE_CACHES = [medication_cache, main_ingredient_cache, hospital_cache, disease_cache]
+
+snapshot_stats = {'hits': 0, 'misses': 0}
+
+
+def _snapshot_or_cache(table_name: str, cache: ReferenceCache, key: Any) -> Dict[str, Any]:
+    record = snapshot_lookup(table_name, key, cache.current_generation())
+    if record is not None:
+        snapshot_stats['hits'] += 1
+        return record
+    snapshot_stats['misses'] += 1
+    return cache.get(key)
+
+
+class ReferenceDataService:
+    """참조 데이터 상세 조회 서비스 (캐시 경유)"""
+
+    @staticmethod
+    def get_medication(medication_id) -> Dict[str, Any]:
+        return _snapshot_or_cache(TABLE_MEDICATION, medication_cache, int(medication_id))
+
+    @staticmethod
+    def get_main_ingredient(ingr_code: str) -> Dict[str, Any]:
+        return _snapshot_or_cache(TABLE_MAIN_INGREDIENT, main_ingredient_cache, ingr_code)
+
+    @staticmethod
+    def get_hospital_cache(hospital_code: str) -> Dict[str, Any]:
+        return hospital_cache.get(hospital_code)
+
+    @staticmethod
+    def get_disease_cache(disease_code: str) -> Dict[str, Any]:
+        return _snapshot_or_cache(TABLE_DISEASE_CACHE, disease_cache, disease_code)
+
+    @staticmethod
+    def get_cache_stats() -> Dict[str, Any]:
+        """스냅샷/캐시별 적중률 (현재 프로세스 기준)"""
+        lookups = snapshot_stats['hits'] + snapshot_stats['misses']
+        return {
+            'snapshot': {
+                **snapshot_stats,
+                'hit_rate': round(snapshot_stats['hits'] / lookups, 4) if lookups else None,
+                'file': get_snapshot_info(),
+            },
+            'caches': [cache.get_stats() for cache in REFERENCE_CACHES],
+        }
@@ -0,0 +1,89 @@
+# user/services/reference_snapshot.py
+"""
+참조 데이터 mmap 스냅샷 (의약품/주성분/질병정보 상세)
+
+build_reference_snapshot() 이 상세 포맷팅 결과를 common.snapshot 파일로 써 두면
+워커들은 같은 파일을 mmap 으로 공유해 조회한다 (워커별 사본 없음).
+테이블마다 빌드 시점의 ReferenceDataVersion 세대를 기록하고, 현재 세대와 다르면
+(스냅샷 재생성 전 임포트) 해당 테이블은 건너뛰고 참조 데이터 캐시/DB 로 조회한다.
+"""
+import os
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+from django.conf import settings
+
+from common.snapshot import MappedSnapshotHolder, write_snapshot
+from user.formatters import format_disease_cache, format_main_ingredient, format_medication
+from user.models import DiseaseCache, MainIngredient, Medication, ReferenceDataVersion
+
+TABLE_MEDICATION = 'medication'
+TABLE_MAIN_INGREDIENT = 'main_ingredient'
+TABLE_DISEASE_CACHE = 'disease_cache'
+
+
+def _medication_rows() -> Iterator[Tuple[int, Dict[str, Any]]]:
+    medications = Medication.objects.prefetch_related('ingredients').order_by('medication_id')
+    for medication in medications.iterator(chunk_size=2000):
+        yield medication.medication_id, format_medication(medication)
+
+
+def _main_ingredient_rows() -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for ingredient in MainIngredient.objects.iterator(chunk_size=2000):
+        yield ingredient.ingr_code, format_main_ingredient(ingredient)
+
+
+def _disease_cache_rows() -> Iterator[Tuple[str, Dict[str, Any]]]:
+    for disease in DiseaseCache.objects.iterator(chunk_size=2000):
+        yield disease.disease_code, format_disease_cache(disease)
+
+
+# 테이블명: (세대 이름, 행 생성 함수)
+SNAPSHOT_TABLES: Dict[str, Tuple[str, Callable[[], Iterator]]] = {
+    TABLE_MEDICATION: (ReferenceDataVersion.MEDICATION, _medication_rows),
+    TABLE_MAIN_INGREDIENT: (ReferenceDataVersion.MEDICATION, _main_ingredient_rows),
+    TABLE_DISEASE_CACHE: (ReferenceDataVersion.DISEASE_CACHE, _disease_cache_rows),
+}
+
+
+def get_snapshot_path() -> str:
+    return str(settings.REFERENCE_SNAPSHOT_PATH)
+
+
+def build_reference_snapshot(path: str = None) -> Dict[str, Any]:
+    """스냅샷 파일 재생성 (임시 파일 작성 후 원자적 교체)"""
+    path = path or get_snapshot_path()
+    # 세대는 행을 읽기 전에 기록 - 빌드 중 임포트가 끝나면 다음 확인 때 낡은 것으로 판정된다
+    tables = {
+        name: (ReferenceDataVersion.get_generation(generation_name), rows())
+        for name, (generation_name, rows) in SNAPSHOT_TABLES.items()
+    }
+    counts = write_snapshot(path, tables)
+    reference_snapshot.invalidate()
+    return {'path': path, 'size': os.path.getsize(path), 'counts': counts}
+
+
+reference_snapshot = MappedSnapshotHolder(get_snapshot_path)
+
+
+def snapshot_lookup(table_name: str, key: Any, current_generation: int) -> Optional[Dict[str, Any]]:
+    """스냅샷 조회 - 파일/테이블이 없거나 세대가 다르면 None"""
+    snapshot = reference_snapshot.get()
+    table = snapshot.table(table_name) if snapshot else None
+    if table is None or table.generation != current_generation:
+        return None
+    return table.get(key)
+
+
+def get_snapshot_info() -> Optional[Dict[str, Any]]:
+    """현재 프로세스가 연 스냅샷 정보"""
+    snapshot = reference_snapshot.get()
+    if snapshot is None:
+        return None
+    return {
+        'path': snapshot.path,
+        'created_at': snapshot.header['created_at'],
+        'tables': {
+            name: {'count': len(table), 'generation': table.generation}
+            for name, table in snapshot.tables.items()
+        },
+    }
@@ -0,0 +1,110 @@
+# user/services/table_export.py
+"""
+참조 테이블 전체 목록 내보내기 (미리 압축한 gzip JSON 파일)
+
+목록 API 는 페이지 단위로만 응답하고, 전체가 필요한 클라이언트는 export 액션으로
+이 파일을 받는다. 파일은 ReferenceDataVersion 세대마다 한 번만 만들어지며
+(임포트 후 rebuild_reference_artifacts() 또는 세대가 바뀐 뒤 첫 요청),
+ETag 는 "테이블-세대" 라서 세대가 같으면 304 로 응답한다.
+"""
+import gzip
+import json
+import os
+import tempfile
+import threading
+from typing import Any, Callable, Dict, Iterator, Tuple
+
+from django.conf import settings
+
+from user.formatters import format_main_ingredient, format_medication
+from user.models import MainIngredient, Medication, ReferenceDataVersion
+from user.services.reference_data import main_ingredient_cache, medication_cache
+
+EXPORT_MEDICATIONS = 'medications'
+EXPORT_MAIN_INGREDIENTS = 'main_ingredients'
+
+
+def _medication_items() -> Iterator[Dict[str, Any]]:
+    medications = Medication.objects.prefetch_related('ingredients').order_by('medication_id')
+    for medication in medications.iterator(chunk_size=2000):
+        yield format_medication(medication)
+
+
+def _main_ingredient_items() -> Iterator[Dict[str, Any]]:
+    # 주성분 목록 API 와 같이 복합제 성분만
+    ingredients = MainIngredient.objects.filter(is_combination_drug=True).order_by('ingr_code')
+    for ingredient in ingredients.iterator(chunk_size=2000):
+        yield format_main_ingredient(ingredient)
+
+
+# 내보내기 이름: (세대 확인용 참조 데이터 캐시, 항목 생성 함수)
+TABLE_EXPORTS: Dict[str, Tuple[Any, Callable[[], Iterator[Dict[str, Any]]]]] = {
+    EXPORT_MEDICATIONS: (medication_cache, _medication_items),
+    EXPORT_MAIN_INGREDIENTS: (main_ingredient_cache, _main_ingredient_items),
+}
+
+_build_lock = threading.Lock()
+
+
+def get_export_dir() -> str:
+    return str(settings.REFERENCE_EXPORT_DIR)
+
+
+def export_file_name(name: str, generation: int) -> str:
+    return f'{name}-g{generation}.json.gz'
+
+
+def write_table_export(name: str, generation: int) -> str:
+    """항목을 스트리밍으로 gzip JSON 배열에 기록 (임시 파일 후 원자적 교체), 이전 세대 파일 삭제"""
+    _, items = TABLE_EXPORTS[name]
+    directory = get_export_dir()
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, export_file_name(name, generation))
+
+    fd, temp_path = tempfile.mkstemp(prefix=f'.{name}-', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as file:
+            with gzip.GzipFile(fileobj=file, mode='wb', compresslevel=9, mtime=0) as compressed:
+                compressed.write(f'{{"generation":{generation},"results":['.encode('utf-8'))
+                for index, item in enumerate(items()):
+                    if index:
+                        compressed.write(b',')
+                    compressed.write(json.dumps(item, ensure_ascii=False, separators=(',', ':')).encode('utf-8'))
+                compressed.write(b']}')
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+    current = os.path.basename(path)
+    for file_name in os.listdir(directory):
+        if file_name.startswith(f'{name}-g') and file_name != current:
+            os.unlink(os.path.join(directory, file_name))
+    return path
+
+
+def build_table_exports() -> Dict[str, str]:
+    """모든 내보내기 파일을 현재 세대로 생성 (임포트 후 호출)"""
+    return {
+        name: write_table_export(name, ReferenceDataVersion.get_generation(cache.generation_name))
+        for name, (cache, _) in TABLE_EXPORTS.items()
+    }
+
+
+def get_table_export(name: str) -> Tuple[str, str]:
+    """
+    현재 세대 내보내기 파일 경로와 ETag
+    파일이 없으면 (세대가 바뀐 뒤 첫 요청) 이 자리에서 만든다.
+    """
+    cache, _ = TABLE_EXPORTS[name]
+    generation = cache.current_generation()
+    path = os.path.join(get_export_dir(), export_file_name(name, generation))
+    if not os.path.exists(path):
+        with _build_lock:
+            if not os.path.exists(path):
+                write_table_export(name, generation)
+    return path, f'"{name}-g{generation}"'
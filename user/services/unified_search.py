@@ -0,0 +1,148 @@
+# user/services/unified_search.py
+"""
+통합 검색 (의약품 + 병원 + 질병 동시 조회)
+
+등록 화면에서 세 검색을 따로 부르던 것을 한 요청으로 합친다.
+각 소스는 전용 스레드 풀(sync_to_async, thread_sensitive=False)에서 동시에 실행되므로
+응답 시간은 세 소스의 합이 아니라 가장 느린 소스(최대 소스별 타임아웃)로 정해진다.
+타임아웃/오류가 난 소스는 결과에서 빠지고 timed_out / failed 에 이름만 남는다.
+"""
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List
+
+from asgiref.sync import sync_to_async
+from django.db import connections
+
+from common.search import MATCH_PREFIX, match_rank
+from user.services.hospital_service import HospitalService
+from user.services.illness_service import IllnessService
+from user.services.medication_service import MedicationService
+
+logger = logging.getLogger(__name__)
+
+SOURCE_MEDICATION = 'medication'
+SOURCE_HOSPITAL = 'hospital'
+SOURCE_DISEASE = 'disease'
+
+# 소스별 타임아웃 (초) - 질병은 메모리 인덱스라 짧게
+SEARCH_SOURCE_TIMEOUTS = {
+    SOURCE_MEDICATION: 1.5,
+    SOURCE_HOSPITAL: 1.5,
+    SOURCE_DISEASE: 0.5,
+}
+# 같은 매칭 등급이면 이 순서로 노출
+SEARCH_SOURCES = (SOURCE_MEDICATION, SOURCE_HOSPITAL, SOURCE_DISEASE)
+
+# 전용 스레드 풀 - 기본 executor 를 쓰면 WSGI 에서 요청 이벤트 루프 종료 시
+# 타임아웃 난 작업까지 기다리게 되어 타임아웃이 응답 시간을 제한하지 못한다
+SEARCH_EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix='unified-search')
+
+
+def _search_medications(keyword: str, limit: int) -> List[Dict[str, Any]]:
+    result = MedicationService.search_medications(keyword=keyword, limit=limit)
+    return [
+        {
+            'type': SOURCE_MEDICATION,
+            'id': medication['medication_id'],
+            'title': medication['medication_name'],
+            'subtitle': medication['manufacturer'],
+            'match_rank': medication['match_rank'],
+            'data': medication,
+        }
+        for medication in result['medications']
+    ]
+
+
+def _search_hospitals(keyword: str, limit: int) -> List[Dict[str, Any]]:
+    result = HospitalService.search_hospitals(keyword=keyword, limit=limit, rank_matches=True)
+    return [
+        {
+            'type': SOURCE_HOSPITAL,
+            'id': hospital['hospital_code'],
+            'title': hospital['hospital_name'],
+            'subtitle': hospital['address'],
+            'match_rank': hospital.get('match_rank', match_rank(hospital['hospital_name'], keyword)),
+            'data': hospital,
+        }
+        for hospital in result['hospitals']
+    ]
+
+
+def _search_diseases(keyword: str, limit: int) -> List[Dict[str, Any]]:
+    result = IllnessService.autocomplete_diseases(keyword=keyword, limit=limit)
+    return [
+        {
+            'type': SOURCE_DISEASE,
+            'id': disease['disease_code'],
+            'title': disease['disease_name_kr'],
+            'subtitle': disease['disease_code'],
+            'match_rank': MATCH_PREFIX if disease['disease_code'].lower().startswith(keyword.lower())
+            else match_rank(disease['disease_name_kr'], keyword),
+            'data': disease,
+        }
+        for disease in result['diseases']
+    ]
+
+
+SOURCE_SEARCHES: Dict[str, Callable[[str, int], List[Dict[str, Any]]]] = {
+    SOURCE_MEDICATION: _search_medications,
+    SOURCE_HOSPITAL: _search_hospitals,
+    SOURCE_DISEASE: _search_diseases,
+}
+
+
+def _in_worker_thread(search: Callable) -> Callable:
+    """작업 스레드의 DB 연결은 요청 종료 시그널로 닫히지 않으므로 조회 후 직접 닫는다"""
+
+    def run(*args):
+        try:
+            return search(*args)
+        finally:
+            connections.close_all()
+
+    return sync_to_async(run, thread_sensitive=False, executor=SEARCH_EXECUTOR)
+
+
+async def unified_search(keyword: str, limit: int = 10, sources: Iterable[str] = SEARCH_SOURCES) -> Dict[str, Any]:
+    """
+    소스별 상위 limit 건을 동시에 조회해 하나의 목록으로 병합
+    정렬: 매칭 등급(접두 > 단어 > 부분일치) -> 소스 순서 -> 소스 내 순위
+    """
+    sources = [source for source in SEARCH_SOURCES if source in set(sources)]
+    tasks = [
+        asyncio.wait_for(
+            _in_worker_thread(SOURCE_SEARCHES[source])(keyword, limit),
+            timeout=SEARCH_SOURCE_TIMEOUTS[source]
+        )
+        for source in sources
+    ]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    merged = []
+    counts = {}
+    timed_out = []
+    failed = []
+    for source_order, (source, result) in enumerate(zip(sources, results)):
+        if isinstance(result, asyncio.TimeoutError):
+            timed_out.append(source)
+            logger.warning(f"통합 검색 {source} 타임아웃 ({SEARCH_SOURCE_TIMEOUTS[source]}초): {keyword}")
+            continue
+        if isinstance(result, Exception):
+            failed.append(source)
+            logger.error(f"통합 검색 {source} 오류: {result}")
+            continue
+
+        counts[source] = len(result)
+        for position, item in enumerate(result):
+            merged.append(((item['match_rank'], source_order, position), item))
+
+    merged.sort(key=lambda entry: entry[0])
+
+    return {
+        'results': [item for _, item in merged],
+        'counts': counts,
+        'timed_out': timed_out,
+        'failed': failed,
+    }
@@ -10,6 +10,10 @@ from .views import (
 from user.views.user_register_view import register_user, login_user, logout_user, get_user_profile, update_user_profile, \
     deactivate_user, check_user_exists
 from .views.user import social_login
+from .views.search import unified_search_view
+from .views.reference_data import (
+    reference_cache_stats, reference_bundle_manifest, download_reference_bundle, download_reference_patch
+)
 
 app_name = 'user'
 
@@ -28,6 +32,15 @@ urlpatterns = [
     path('auth/login/', social_login, name='social_login'),
     path('auth/logout/', logout_user, name='logout_user'),
     path('apikey/', apikey, name='apikey'),
+    # 통합 검색 (의약품/병원/질병)
+    path('search/', unified_search_view, name='unified_search'),
+    # 참조 데이터 캐시 적중률 (관리자)
+    path('reference-cache/stats/', reference_cache_stats, name='reference_cache_stats'),
+    # 모바일 오프라인 참조 데이터 번들 (갱신 계획 / 전체 번들 / 패치)
+    path('reference-bundle/', reference_bundle_manifest, name='reference_bundle_manifest'),
+    path('reference-bundle/v<int:version>/', download_reference_bundle, name='reference_bundle_download'),
+    path('reference-bundle/patches/v<int:from_version>-v<int:to_version>/', download_reference_patch,
+         name='reference_patch_download'),
     ]
 # urlpatterns = [
 #     # 카카오 로그인
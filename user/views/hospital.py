@@ -5,10 +5,13 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from common.pagination import MAX_SEARCH_LIMIT, MAX_SEARCH_OFFSET, bounded_int_param
 from user.models.ayakuser import AyakUser
 from user.models.hospital import Hospital
 from user.models.user_medical_info import UserMedicalInfo
+from user.models.cache import HospitalCache
 from user.services.hospital_service import HospitalService
+from user.services.reference_data import ReferenceDataService
 
 
 class HospitalViewSet(viewsets.ModelViewSet):
@@ -54,6 +57,96 @@ class HospitalViewSet(viewsets.ModelViewSet):
                 'message': f'병원 목록 조회 중 오류가 발생했습니다: {str(e)}'
             }, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['get'])
+    def search_cache(self, request):
+        """병원정보 캐시 검색 (병원명/초성/입력 중인 글자 + 지역/진료과목)"""
+        try:
+            keyword = request.query_params.get('keyword', '').strip()
+            if not keyword and not request.query_params.get('medical_subject'):
+                return Response({
+                    'success': False,
+                    'message': '검색어를 입력해주세요.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            result = HospitalService.search_hospitals(
+                keyword=keyword,
+                limit=bounded_int_param(request.query_params.get('limit'), 20, 1, MAX_SEARCH_LIMIT, 'limit'),
+                offset=bounded_int_param(request.query_params.get('offset'), 0, 0, MAX_SEARCH_OFFSET, 'offset'),
+                sido_code=request.query_params.get('sido_code'),
+                sigungu_code=request.query_params.get('sigungu_code'),
+                medical_subject=request.query_params.get('medical_subject'),
+                cursor=request.query_params.get('cursor'),
+                with_total=request.query_params.get('with_total') in ('1', 'true')
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'병원 검색 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'], url_path=r'cache/(?P<hospital_code>[^/]+)')
+    def cache_detail(self, request, hospital_code=None):
+        """병원정보 캐시 상세 (요양기관기호, 참조 데이터 캐시 경유)"""
+        try:
+            return Response({
+                'success': True,
+                'data': ReferenceDataService.get_hospital_cache(hospital_code)
+            })
+
+        except HospitalCache.DoesNotExist:
+            return Response({
+                'success': False,
+                'message': '해당 병원을 찾을 수 없습니다.'
+            }, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'병원 상세 정보 조회 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'])
+    def nearby(self, request):
+        """내 주변 병원 검색 (반경 또는 가까운 순 k개)"""
+        try:
+            params = request.query_params
+            if not params.get('latitude') or not params.get('longitude'):
+                return Response({
+                    'success': False,
+                    'message': '위도와 경도를 입력해주세요.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            radius_km = params.get('radius_km')
+            result = HospitalService.search_nearby(
+                latitude=float(params['latitude']),
+                longitude=float(params['longitude']),
+                radius_km=float(radius_km) if radius_km else None,
+                limit=bounded_int_param(params.get('limit'), 20, 1, MAX_SEARCH_LIMIT, 'limit'),
+                hospital_type_code=params.get('hospital_type_code'),
+                medical_subject=params.get('medical_subject')
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except ValueError as e:
+            return Response({
+                'success': False,
+                'message': str(e)
+            }, status=status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'주변 병원 검색 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
     @action(detail=True, methods=['get'])
     def hospital_detail(self, request, hospital_id=None):
         """선택한 병원의 상세 정보 조회"""
@@ -5,8 +5,15 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 
+from common.pagination import MAX_SEARCH_LIMIT, MAX_SEARCH_OFFSET, bounded_int_param
 from user.models.illness import Illness
 from user.models.user_medical_info import UserMedicalInfo
+from user.models.cache import DiseaseCache
+from user.services.illness_service import IllnessService
+from user.services.reference_data import ReferenceDataService
+
+# 자동완성 최대 건수
+AUTOCOMPLETE_MAX_LIMIT = 50
 
 
 class IllnessViewSet(viewsets.ModelViewSet):
@@ -48,6 +55,83 @@ class IllnessViewSet(viewsets.ModelViewSet):
                 'message': f'질병/증상 목록 조회 중 오류가 발생했습니다: {str(e)}'
             }, status=status.HTTP_400_BAD_REQUEST)
 
+    @action(detail=False, methods=['get'])
+    def search_diseases(self, request):
+        """질병정보 캐시 검색 (질병코드/질병명/초성/입력 중인 글자)"""
+        try:
+            keyword = request.query_params.get('keyword', '').strip()
+            if not keyword:
+                return Response({
+                    'success': False,
+                    'message': '검색어를 입력해주세요.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            result = IllnessService.search_diseases(
+                keyword=keyword,
+                limit=bounded_int_param(request.query_params.get('limit'), 20, 1, MAX_SEARCH_LIMIT, 'limit'),
+                offset=bounded_int_param(request.query_params.get('offset'), 0, 0, MAX_SEARCH_OFFSET, 'offset'),
+                cursor=request.query_params.get('cursor'),
+                with_total=request.query_params.get('with_total') in ('1', 'true')
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'질병 검색 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'])
+    def autocomplete(self, request):
+        """질병 자동완성 (질병코드/질병명/초성 접두)"""
+        try:
+            keyword = request.query_params.get('keyword', '').strip()
+            if not keyword:
+                return Response({
+                    'success': True,
+                    'data': {'diseases': []}
+                })
+
+            result = IllnessService.autocomplete_diseases(
+                keyword=keyword,
+                limit=bounded_int_param(request.query_params.get('limit'), 10, 1, AUTOCOMPLETE_MAX_LIMIT, 'limit')
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'질병 자동완성 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'], url_path=r'diseases/(?P<disease_code>[^/]+)')
+    def disease_detail(self, request, disease_code=None):
+        """질병정보 캐시 상세 (질병코드, 참조 데이터 캐시 경유)"""
+        try:
+            return Response({
+                'success': True,
+                'data': ReferenceDataService.get_disease_cache(disease_code)
+            })
+
+        except DiseaseCache.DoesNotExist:
+            return Response({
+                'success': False,
+                'message': '해당 질병을 찾을 수 없습니다.'
+            }, status=status.HTTP_404_NOT_FOUND)
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'질병 상세 정보 조회 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
     @action(detail=False, methods=['post'])
     def save_illness(self, request):
         """질병/증상 정보를 저장 (캐시테이블 또는 수기 등록)"""
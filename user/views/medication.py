@@ -1,10 +1,42 @@
 # user/views/medication.py
+import gzip
+
+from django.http import FileResponse, HttpResponseNotModified
+from django.utils.cache import patch_vary_headers
 from rest_framework import viewsets, status
 from rest_framework.decorators import action, api_view
+from rest_framework.exceptions import NotFound
 from rest_framework.response import Response
+from common.pagination import MAX_SEARCH_LIMIT, MAX_SEARCH_OFFSET, bounded_int_param
 from user.models.medication import MainIngredient, Medication
+from user.models.medication_facet import MedicationFacet
+from user.services.atc_service import AtcService
+from user.services.medication_barcode import MedicationBarcodeService
+from user.services.medication_facets import MedicationFacetService
+from user.services.reference_data import ReferenceDataService
 from user.services.medication_service import MedicationService
-from user.formatters import format_api_response
+from user.services.table_export import EXPORT_MAIN_INGREDIENTS, EXPORT_MEDICATIONS, get_table_export
+from user.formatters import format_api_response, format_main_ingredient, format_medication
+
+
+def table_export_response(request, name):
+    """
+    미리 압축한 전체 목록 파일 응답
+    If-None-Match 가 현재 세대 ETag 와 같으면 304, gzip 을 받지 않는 클라이언트에는 풀어서 전송
+    """
+    path, etag = get_table_export(name)
+    if etag in request.headers.get('If-None-Match', ''):
+        response = HttpResponseNotModified()
+    elif 'gzip' in request.headers.get('Accept-Encoding', ''):
+        response = FileResponse(open(path, 'rb'), content_type='application/json')
+        response['Content-Encoding'] = 'gzip'
+    else:
+        response = FileResponse(gzip.open(path, 'rb'), content_type='application/json')
+    response['ETag'] = etag
+    # 임포트로 세대가 바뀌면 ETag 도 바뀌므로 매번 재검증
+    response['Cache-Control'] = 'no-cache'
+    patch_vary_headers(response, ['Accept-Encoding'])
+    return response
 
 
 class MainIngredientViewSet(viewsets.ReadOnlyModelViewSet):
@@ -25,13 +57,24 @@ class MainIngredientViewSet(viewsets.ReadOnlyModelViewSet):
         }
 
     def list(self, request):
-        ingredients = self.get_queryset()
-        data = [self.get_ingredient_data(ingredient) for ingredient in ingredients]
-        return Response(data)
+        """복합제 주성분 목록 (페이지 단위, 전체 목록은 export)"""
+        page = self.paginate_queryset(self.get_queryset().order_by('ingr_code'))
+        return self.get_paginated_response([format_main_ingredient(ingredient) for ingredient in page])
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """복합제 주성분 전체 목록 (gzip JSON, 임포트 세대별 ETag)"""
+        return table_export_response(request, EXPORT_MAIN_INGREDIENTS)
 
     def retrieve(self, request, pk=None):
-        ingredient = self.get_object()
-        data = self.get_ingredient_data(ingredient)
+        """주성분 상세 (참조 데이터 캐시 경유)"""
+        try:
+            data = ReferenceDataService.get_main_ingredient(pk)
+        except MainIngredient.DoesNotExist:
+            data = None
+        # 목록과 같이 복합제 성분만 노출
+        if not data or not data['is_combination_drug']:
+            raise NotFound('해당 주성분을 찾을 수 없습니다.')
         return Response(data)
 
     @action(detail=False, methods=['get'])
@@ -53,46 +96,78 @@ class MainIngredientViewSet(viewsets.ReadOnlyModelViewSet):
         data = [self.get_ingredient_data(combination) for combination in combinations]
         return Response(data)
 
+    @action(detail=False, methods=['get'])
+    def atc_tree(self, request):
+        """ATC 분류 트리 조회 (code 하위 depth 단계, 노드별 성분/의약품 수)"""
+        try:
+            result = AtcService.get_tree(
+                code=request.query_params.get('code'),
+                depth=min(int(request.query_params.get('depth', 1)), 5)
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'ATC 분류 조회 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'])
+    def by_atc(self, request):
+        """ATC 분류 하위 전체 성분 또는 의약품 조회 (target=ingredients|medications)"""
+        try:
+            code = request.query_params.get('code', '').strip()
+            if not code:
+                return Response({
+                    'success': False,
+                    'message': 'ATC 코드를 입력해주세요.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+
+            target = request.query_params.get('target', 'ingredients')
+            search = AtcService.get_medications if target == 'medications' else AtcService.get_ingredients
+            result = search(
+                code=code,
+                limit=bounded_int_param(request.query_params.get('limit'), 20, 1, MAX_SEARCH_LIMIT, 'limit'),
+                offset=bounded_int_param(request.query_params.get('offset'), 0, 0, MAX_SEARCH_OFFSET, 'offset'),
+                cursor=request.query_params.get('cursor')
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'ATC 분류별 조회 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
 
 class MedicationViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = Medication.objects.all()
 
-    def get_medication_data(self, medication):
-        return {
-            'id': medication.id,
-            'item_name': medication.item_name,
-            'item_seq': medication.item_seq,
-            'entp_name': medication.entp_name,
-            'chart': medication.chart,
-            'class_no': medication.class_no,
-            'class_name': medication.class_name,
-            'etc_otc_code': medication.etc_otc_code,
-            'etc_otc_name': medication.etc_otc_name,
-            'created_at': medication.created_at.isoformat() if medication.created_at else None,
-            'updated_at': medication.updated_at.isoformat() if medication.updated_at else None,
-            'ingredient_details': [
-                {
-                    'id': detail.id,
-                    'ingredient': {
-                        'id': detail.ingredient.id,
-                        'name': detail.ingredient.name,
-                        'english_name': detail.ingredient.english_name,
-                        'code': detail.ingredient.code
-                    },
-                    'unit': detail.unit,
-                    'amount': detail.amount
-                } for detail in medication.ingredient_details.select_related('ingredient').all()
-            ]
-        }
-
     def list(self, request):
-        medications = self.get_queryset()
-        data = [self.get_medication_data(medication) for medication in medications]
-        return Response(data)
+        """의약품 목록 (페이지 단위, 성분은 페이지당 한 번 prefetch, 전체 목록은 export)"""
+        medications = self.get_queryset().prefetch_related('ingredients').order_by('medication_id')
+        page = self.paginate_queryset(medications)
+        return self.get_paginated_response([format_medication(medication) for medication in page])
+
+    @action(detail=False, methods=['get'])
+    def export(self, request):
+        """의약품 전체 목록 (gzip JSON, 임포트 세대별 ETag)"""
+        return table_export_response(request, EXPORT_MEDICATIONS)
 
     def retrieve(self, request, pk=None):
-        medication = self.get_object()
-        data = self.get_medication_data(medication)
+        """의약품 상세 (참조 데이터 캐시 경유)"""
+        try:
+            data = ReferenceDataService.get_medication(pk)
+        except (Medication.DoesNotExist, ValueError):
+            raise NotFound('해당 의약품을 찾을 수 없습니다.')
         return Response(data)
 
     @action(detail=False, methods=['get'])
@@ -102,12 +177,92 @@ class MedicationViewSet(viewsets.ReadOnlyModelViewSet):
         if not name:
             return Response({'error': '검색어를 입력해주세요.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        medications = Medication.objects.filter(
-            item_name__icontains=name
-        ).prefetch_related('ingredient_details__ingredient')[:20]
+        try:
+            limit = bounded_int_param(request.query_params.get('limit'), 20, 1, MAX_SEARCH_LIMIT, 'limit')
+            offset = bounded_int_param(request.query_params.get('offset'), 0, 0, MAX_SEARCH_OFFSET, 'offset')
+        except ValueError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
 
-        data = [self.get_medication_data(medication) for medication in medications]
-        return Response(data)
+        result = MedicationService.search_medications(
+            keyword=name,
+            limit=limit,
+            offset=offset
+        )
+        return Response(result)
+
+    @action(detail=False, methods=['get', 'post'])
+    def barcode(self, request):
+        """
+        표준코드(바코드) 조회
+        GET ?code=8806469007510 (쉼표 구분 여러 개 가능) / POST {"codes": [...]} 일괄 조회
+        """
+        try:
+            if request.method == 'POST':
+                codes = request.data.get('codes') or []
+                if not isinstance(codes, list):
+                    raise ValueError('codes 는 목록이어야 합니다.')
+                codes = [str(code).strip() for code in codes if str(code).strip()]
+            else:
+                codes = [
+                    code.strip()
+                    for param in request.query_params.getlist('code')
+                    for code in param.split(',')
+                    if code.strip()
+                ]
+            if not codes:
+                return Response({'error': '표준코드를 입력해주세요.'}, status=status.HTTP_400_BAD_REQUEST)
+
+            return Response({
+                'success': True,
+                'data': MedicationBarcodeService.lookup(codes)
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'표준코드 조회 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'])
+    def facets(self, request):
+        """
+        패싯 탐색 - 제조사/약효분류/제형/복합제 여부 필터와 검색어(keyword) 조건의 의약품 목록 및 조건 반영 패싯별 건수
+        다중 선택은 파라미터 반복 (?manufacturer=A&manufacturer=B) - 제조사명("…Co., Ltd.")에 쉼표가 들어가므로 쉼표로 나누지 않는다
+        """
+        try:
+            filters = {}
+            for facet in MedicationFacet.Facet.values:
+                values = [value.strip() for value in request.query_params.getlist(facet) if value.strip()]
+                if values:
+                    filters[facet] = values
+
+            result = MedicationFacetService.browse(
+                filters=filters,
+                keyword=request.query_params.get('keyword'),
+                limit=bounded_int_param(request.query_params.get('limit'), 20, 1, MAX_SEARCH_LIMIT, 'limit'),
+                offset=bounded_int_param(request.query_params.get('offset'), 0, 0, MAX_SEARCH_OFFSET, 'offset')
+            )
+
+            return Response({
+                'success': True,
+                'data': result
+            })
+
+        except Exception as e:
+            return Response({
+                'success': False,
+                'message': f'의약품 패싯 조회 중 오류가 발생했습니다: {str(e)}'
+            }, status=status.HTTP_400_BAD_REQUEST)
+
+    @action(detail=False, methods=['get'])
+    def suggest(self, request):
+        """의약품/성분명 오타 추천"""
+        name = request.query_params.get('name')
+        if not name:
+            return Response({'error': '검색어를 입력해주세요.'}, status=status.HTTP_400_BAD_REQUEST)
+
+        limit = min(int(request.query_params.get('limit', 5)), 20)
+        return Response(MedicationService.suggest_medications(name, limit))
 
 
 @api_view(['GET'])
@@ -0,0 +1,81 @@
+# user/views/reference_data.py
+from django.http import FileResponse
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
+from django.views.decorators.http import require_GET
+from rest_framework import status
+from rest_framework.decorators import api_view, permission_classes
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+from user.models import ReferenceBundle, ReferenceBundlePatch
+from user.services.reference_bundle import ReferenceBundleService
+from user.services.reference_data import ReferenceDataService
+
+
+@api_view(['GET'])
+@permission_classes([IsAdminUser])
+def reference_cache_stats(request):
+    """참조 데이터 캐시 적중률 (요청을 처리한 워커 프로세스 기준)"""
+    try:
+        return Response({
+            'success': True,
+            'data': ReferenceDataService.get_cache_stats()
+        })
+
+    except Exception as e:
+        return Response({
+            'success': False,
+            'message': f'캐시 통계 조회 중 오류가 발생했습니다: {str(e)}'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+
+@api_view(['GET'])
+def reference_bundle_manifest(request):
+    """
+    오프라인 참조 데이터 갱신 계획 (version: 앱이 가진 번들 버전, 없으면 전체 번들)
+    연속 패치 체인과 전체 번들 중 내려받을 크기가 작은 쪽의 파일 목록을 반환
+    """
+    try:
+        version = request.query_params.get('version')
+        plan = ReferenceBundleService.plan_update(int(version) if version else None)
+
+        for file in plan['files']:
+            if file['kind'] == 'bundle':
+                path = reverse('user:reference_bundle_download', args=[file['version']])
+            else:
+                path = reverse('user:reference_patch_download', args=[file['from_version'], file['to_version']])
+            file['url'] = request.build_absolute_uri(path)
+
+        return Response({
+            'success': True,
+            'data': plan
+        })
+
+    except Exception as e:
+        return Response({
+            'success': False,
+            'message': f'참조 데이터 번들 조회 중 오류가 발생했습니다: {str(e)}'
+        }, status=status.HTTP_400_BAD_REQUEST)
+
+
+def _gzip_file_response(path: str, sha256: str) -> FileResponse:
+    response = FileResponse(open(path, 'rb'), as_attachment=True, content_type='application/gzip')
+    # 버전별 파일은 바뀌지 않으므로 오래 캐시
+    response['ETag'] = f'"{sha256}"'
+    response['Cache-Control'] = 'public, max-age=31536000, immutable'
+    return response
+
+
+@require_GET
+def download_reference_bundle(request, version):
+    """전체 번들 파일 다운로드"""
+    bundle = get_object_or_404(ReferenceBundle, version=version)
+    return _gzip_file_response(ReferenceBundleService.get_bundle_path(bundle.version), bundle.sha256)
+
+
+@require_GET
+def download_reference_patch(request, from_version, to_version):
+    """패치 파일 다운로드"""
+    patch = get_object_or_404(ReferenceBundlePatch, from_version=from_version, to_version=to_version)
+    return _gzip_file_response(ReferenceBundleService.get_patch_path(from_version, to_version), patch.sha256)
@@ -0,0 +1,85 @@
+# user/views/search.py
+from asgiref.sync import sync_to_async
+from django.http import JsonResponse
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework.request import Request
+from rest_framework.settings import api_settings
+
+from common.pagination import bounded_int_param
+from user.services.unified_search import SEARCH_SOURCES, unified_search
+
+UNIFIED_SEARCH_MAX_LIMIT = 30
+
+
+@sync_to_async
+def _authenticate(request):
+    """
+    DRF 기본 인증(Token/Session)으로 사용자 확인 - 병원/질병 ViewSet 의 IsAuthenticated 와 같은 기준
+    비동기 뷰는 APIView 를 거치지 않으므로 직접 인증한다
+    """
+    drf_request = Request(
+        request,
+        authenticators=[authenticator() for authenticator in api_settings.DEFAULT_AUTHENTICATION_CLASSES]
+    )
+    return drf_request.user
+
+
+async def unified_search_view(request):
+    """
+    통합 검색 API (의약품/병원/질병 동시 조회)
+
+    Query Parameters:
+    - q: 검색어
+    - limit: 소스별 최대 건수 (기본 10, 1~30)
+    - types: 검색할 소스 (쉼표 구분, 기본 medication,hospital,disease)
+    """
+    # Django 4.2 의 require_GET 데코레이터는 비동기 뷰를 감싸지 못해 직접 확인
+    if request.method != 'GET':
+        return JsonResponse({
+            'success': False,
+            'message': 'GET 요청만 지원합니다.'
+        }, status=405, json_dumps_params={'ensure_ascii': False})
+
+    auth_error = None
+    try:
+        user = await _authenticate(request)
+        if not user.is_authenticated:
+            auth_error = '인증이 필요합니다.'
+    except AuthenticationFailed as e:
+        auth_error = str(e.detail)
+    if auth_error:
+        return JsonResponse({
+            'success': False,
+            'message': auth_error
+        }, status=401, json_dumps_params={'ensure_ascii': False})
+
+    try:
+        keyword = request.GET.get('q', '').strip()
+        if not keyword:
+            return JsonResponse({
+                'success': False,
+                'message': '검색어를 입력해주세요.'
+            }, status=400, json_dumps_params={'ensure_ascii': False})
+
+        limit = bounded_int_param(request.GET.get('limit'), 10, 1, UNIFIED_SEARCH_MAX_LIMIT, 'limit')
+        types = request.GET.get('types')
+        sources = [source.strip() for source in types.split(',')] if types else SEARCH_SOURCES
+
+        result = await unified_search(keyword, limit, sources)
+
+        return JsonResponse({
+            'success': True,
+            'data': result
+        }, json_dumps_params={'ensure_ascii': False})
+
+    except ValueError as e:
+        return JsonResponse({
+            'success': False,
+            'message': str(e)
+        }, status=400, json_dumps_params={'ensure_ascii': False})
+
+    except Exception as e:
+        return JsonResponse({
+            'success': False,
+            'message': f'통합 검색 중 오류가 발생했습니다: {str(e)}'
+        }, status=400, json_dumps_params={'ensure_ascii': False})